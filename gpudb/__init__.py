@@ -9,32 +9,42 @@ from .protocol import Record
 if (sys.version_info[0] == 3): # checking the major component
     from gpudb.gpudb import GPUdb
     from gpudb.gpudb import GPUdbException
+    from gpudb.gpudb import GPUdbJob
+    from gpudb.gpudb import GPUdbRetryPolicy
     from gpudb.gpudb import GPUdbRecordColumn
     from gpudb.gpudb import GPUdbRecordType
     from gpudb.gpudb import GPUdbRecord
     from gpudb.gpudb import GPUdbColumnProperty
     from gpudb.gpudb import GPUdbTable
     from gpudb.gpudb import GPUdbTableIterator
+    from gpudb.gpudb import GPUdbTableStreamIterator
     from gpudb.gpudb import GPUdbTableOptions
 
     from gpudb.gpudb import AttrDict
 
-    from gpudb.gpudb_multihead_io import GPUdbWorkerList, GPUdbIngestor, InsertionException, RecordRetriever
+    from gpudb.gpudb_multihead_io import GPUdbWorkerList, GPUdbIngestor, InsertionException, InsertionFuture, RecordRetriever, MultiHeadScanIterator
+
+    # The asyncio client requires Python 3.5+
+    if (sys.version_info >= (3, 5)):
+        from gpudb.gpudb_async import AsyncGPUdb
 
     from gpudb.gpudb import collections
 else:
     from gpudb import GPUdb
     from gpudb import GPUdbException
+    from gpudb import GPUdbJob
+    from gpudb import GPUdbRetryPolicy
     from gpudb import GPUdbRecordColumn
     from gpudb import GPUdbRecordType
     from gpudb import GPUdbRecord
     from gpudb import GPUdbColumnProperty
     from gpudb import GPUdbTable
     from gpudb import GPUdbTableIterator
+    from gpudb import GPUdbTableStreamIterator
     from gpudb import GPUdbTableOptions
 
     from gpudb import AttrDict
 
-    from gpudb_multihead_io import GPUdbWorkerList, GPUdbIngestor, InsertionException, RecordRetriever
+    from gpudb_multihead_io import GPUdbWorkerList, GPUdbIngestor, InsertionException, InsertionFuture, RecordRetriever, MultiHeadScanIterator
 
     from gpudb import collections
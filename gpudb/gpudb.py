@@ -21,17 +21,30 @@ try:
     import httplib
 except:
     import http.client as httplib
+try:
+    import Queue as queue
+except:
+    import queue
 import base64
+import contextlib
+import copy
 import os, sys
 import datetime
+import heapq
 import json
 import random
 import re
+import select
+import socket
+import struct
+import threading
 import time
 import uuid
+import weakref
 
-from collections import Iterator
+from collections import Iterator, deque
 from decimal import Decimal
+from multiprocessing.pool import ThreadPool
 
 
 if sys.version_info.major >= 3: # checking the major component
@@ -91,6 +104,13 @@ try:
 except ImportError:
     have_snappy = False
 
+have_numpy = False
+try:
+    import numpy
+    have_numpy = True
+except ImportError:
+    have_numpy = False
+
 from tabulate import tabulate
 
 
@@ -114,6 +134,11 @@ class C:
     _property_map = "property_map"
     _gaia_version = "version.gpudb_core_version"
 
+    # /get/job response
+    _job_cancelled = "CANCELLED"
+    _job_error     = "ERROR"
+    _job_error_msg = "error_message"
+
 # end class C
 
 
@@ -152,6 +177,164 @@ class GPUdbConnectionException( GPUdbException ):
 # end class GPUdbConnectionException
 
 
+# ---------------------------------------------------------------------------
+# _GPUdbUnsentRequestException - Exception for requests that were not sent
+# ---------------------------------------------------------------------------
+class _GPUdbUnsentRequestException( GPUdbConnectionException ):
+    """Internal exception for a request that failed before being fully sent
+    to any server, which therefore cannot have acted upon it (unlike a
+    request whose connection failed while waiting for the response).
+    """
+
+    @staticmethod
+    def chain( previous_error, error ):
+        """Returns the error to report for an attempt at a request failing
+        with *error*, an earlier attempt having failed with *previous_error*
+        (if not None); a request that was not sent this time may have been
+        applied by the earlier attempt.
+        """
+        if ( isinstance( error, _GPUdbUnsentRequestException )
+             and (previous_error is not None)
+             and not isinstance( previous_error, _GPUdbUnsentRequestException ) ):
+            return GPUdbConnectionException( error.value )
+        return error
+    # end chain
+
+# end class _GPUdbUnsentRequestException
+
+
+# ---------------------------------------------------------------------------
+# GPUdbRetryPolicy - Policy for retrying requests that failed in transit
+# ---------------------------------------------------------------------------
+class GPUdbRetryPolicy(object):
+    """Policy for retrying requests that could not be delivered to the
+    server, or whose response got lost (e.g. a connection reset).  Each
+    attempt tries all the hosts once; between attempts, the client sleeps
+    for an exponentially growing, randomly jittered backoff.  Errors
+    reported by the server itself are never retried.
+
+    A request whose response got lost may have been applied already, so by
+    default it is only sent again if it has no effect on the server (see
+    :meth:`.is_retryable`); e.g. records are never inserted twice.
+
+    A policy can be set for a :class:`GPUdb` client as a whole, or for the
+    calls made within a block with :meth:`GPUdb.using_retry_policy`.
+    """
+
+    def __init__( self, max_attempts = 3, initial_backoff = 0.1,
+                  max_backoff = 5, backoff_multiplier = 2, jitter = 0.5,
+                  deadline = None ):
+        """Create a retry policy.
+
+        Parameters:
+
+            max_attempts (int)
+                Maximum number of times a request is tried, including the
+                first time.  Default is 3.
+
+            initial_backoff (float)
+                Number of seconds to wait before the first retry.  Default
+                is 0.1.
+
+            max_backoff (float)
+                Maximum number of seconds to wait between two attempts.
+                Default is 5.
+
+            backoff_multiplier (float)
+                Factor by which the backoff grows after every retry.
+                Default is 2.
+
+            jitter (float)
+                Fraction of the backoff, between 0 and 1, by which it is
+                randomly shortened so that clients do not retry in
+                lockstep.  Default is 0.5.
+
+            deadline (float)
+                Number of seconds after which a request is given up on,
+                counted from its first attempt: no host is tried, and no
+                socket operation waits, past the deadline.  None means no
+                deadline.  Default is None.
+        """
+        if ( not isinstance( max_attempts, (int, long) ) or (max_attempts < 1) ):
+            raise GPUdbException( "Expected a positive integer for 'max_attempts', "
+                                  "got: '" + str(max_attempts) + "'" )
+        if ( (initial_backoff < 0) or (max_backoff < 0) ):
+            raise GPUdbException( "Expected non-negative backoffs, got: '{}' and '{}'"
+                                  "".format( initial_backoff, max_backoff ) )
+        if (backoff_multiplier < 1):
+            raise GPUdbException( "Expected a 'backoff_multiplier' of at least 1, "
+                                  "got: '" + str(backoff_multiplier) + "'" )
+        if not (0 <= jitter <= 1):
+            raise GPUdbException( "Expected a 'jitter' between 0 and 1, got: '"
+                                  + str(jitter) + "'" )
+        if ( (deadline is not None) and (deadline <= 0) ):
+            raise GPUdbException( "Expected a positive 'deadline' or None, got: '"
+                                  + str(deadline) + "'" )
+
+        self.max_attempts       = max_attempts
+        self.initial_backoff    = initial_backoff
+        self.max_backoff        = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.jitter             = jitter
+        self.deadline           = deadline
+    # end __init__
+
+
+    def is_retryable( self, error, endpoint = None ):
+        """Returns whether a request to the given endpoint that failed with
+        the given exception may be tried again.  By default, a request that
+        could not be sent at all is, and so is a read-only request (to a
+        /get/, /has/ or /show/ endpoint) that failed with any other
+        connection error; a request that may have been applied already is
+        not.  Override to change that.
+        """
+        if isinstance( error, _GPUdbUnsentRequestException ):
+            return True
+
+        return ( isinstance( error, GPUdbConnectionException )
+                 and (endpoint is not None)
+                 and endpoint.startswith( _HostSelector._READ_ONLY_PREFIXES ) )
+    # end is_retryable
+
+
+    def get_backoff( self, attempt ):
+        """Returns the number of seconds to wait after the given (1-based)
+        failed attempt.
+        """
+        backoff = min( self.max_backoff,
+                       self.initial_backoff * (self.backoff_multiplier ** (attempt - 1)) )
+        return backoff * (1 - self.jitter * random.random())
+    # end get_backoff
+
+
+    def get_retry_delay( self, attempt, error, deadline, endpoint = None ):
+        """Returns the number of seconds to wait before retrying a request
+        whose given attempt failed with *error*, or None if the request
+        should not be retried.
+
+        Parameters:
+            attempt (int)
+                The (1-based) number of the failed attempt.
+            error (Exception)
+                The exception with which the attempt failed.
+            deadline (float)
+                The time by which the request must be done, or None.
+            endpoint (str)
+                The endpoint the request was made to, if known.
+        """
+        if ( (attempt >= self.max_attempts)
+             or not self.is_retryable( error, endpoint ) ):
+            return None
+
+        delay = self.get_backoff( attempt )
+        if ( (deadline is not None) and (time.time() + delay >= deadline) ):
+            return None
+        return delay
+    # end get_retry_delay
+# end class GPUdbRetryPolicy
+
+
+
 # ---------------------------------------------------------------------------
 # _ConnectionToken - Private wrapper class to manage connection logic
 # ---------------------------------------------------------------------------
@@ -230,10 +413,646 @@ class _ConnectionToken(object):
         self._host_manager_port = int(host_manager_port)
         self._connection        = str( connection )
         self._gpudb_url_path    = str( url_path )
+
+        # Keep-alive connection pools, one per port (head node and host manager)
+        self._pools      = {}
+        self._pools_lock = threading.Lock()
     # end __init__
+
+
+    def get_connection_pool( self, port, max_connections, idle_timeout ):
+        """Returns the keep-alive connection pool for the given port on this
+        host, creating it if needed."""
+        with self._pools_lock:
+            pool = self._pools.get( port )
+            if pool is None:
+                pool = _ConnectionPool( self._host, port, self._connection,
+                                        max_connections, idle_timeout )
+                self._pools[ port ] = pool
+            return pool
+    # end get_connection_pool
+
+
+    def close_connections( self ):
+        """Closes all idle keep-alive connections to this host."""
+        with self._pools_lock:
+            for pool in self._pools.values():
+                pool.clear()
+    # end close_connections
 # end class _ConnectionToken
 
 
+
+# ---------------------------------------------------------------------------
+# _ConnectionPool - Private thread-safe pool of keep-alive HTTP connections
+# ---------------------------------------------------------------------------
+class _ConnectionPool(object):
+    """Internal thread-safe pool of persistent HTTP(S) connections to a
+    single host and port.  At most *max_connections* connections are open at
+    once, whether in use or idle; a request made while all of them are in
+    use waits for one to be released.  Connections left idle for more than
+    *idle_timeout* seconds, or closed by the server while idle, are closed
+    instead of being reused.
+    """
+    def __init__( self, host, port, connection, max_connections, idle_timeout ):
+        self._host            = host
+        self._port            = port
+        self._connection      = connection
+        self._max_connections = max_connections
+        self._idle_timeout    = idle_timeout
+        self._idle            = [] # list of (connection, last used time)
+        self._num_open        = 0  # number of connections in use or idle
+        self._cond            = threading.Condition()
+    # end __init__
+
+
+    def new_connection( self, timeout ):
+        """Creates a new (not yet connected) HTTP(S) connection."""
+        if (self._connection == 'HTTPS'):
+            return httplib.HTTPSConnection( host = self._host,
+                                            port = self._port,
+                                            timeout = timeout )
+        return httplib.HTTPConnection( host = self._host,
+                                       port = self._port,
+                                       timeout = timeout )
+    # end new_connection
+
+
+    @staticmethod
+    def __is_dropped( conn ):
+        """Returns whether an idle connection can no longer be used, i.e. the
+        server has closed it (or sent something unexpected)."""
+        if conn.sock is None:
+            return True
+        try:
+            return bool( select.select( [ conn.sock ], [], [], 0 )[ 0 ] )
+        except (select.error, ValueError, socket.error):
+            return True
+    # end __is_dropped
+
+
+    def acquire( self, timeout ):
+        """Returns a tuple of a connection and whether it is a reused
+        keep-alive connection, waiting up to *timeout* seconds (forever if
+        None) for one to be available.  The connection must be handed back
+        with :meth:`release` or :meth:`discard`.
+        """
+        deadline = None if (timeout is None) else (time.time() + timeout)
+        stale = []
+        conn = None
+        with self._cond:
+            while True:
+                now = time.time()
+                while self._idle:
+                    ( idle_conn, last_used ) = self._idle.pop()
+                    if ( ( (self._idle_timeout is not None)
+                           and ((now - last_used) > self._idle_timeout) )
+                         or self.__is_dropped( idle_conn ) ):
+                        stale.append( idle_conn )
+                        self._num_open -= 1
+                        continue
+                    conn = idle_conn
+                    break
+                # end while
+
+                if ( (conn is not None) or (self._num_open < self._max_connections) ):
+                    break
+
+                # All connections are in use; wait for one to be released
+                if deadline is None:
+                    self._cond.wait()
+                elif (now >= deadline):
+                    break
+                else:
+                    self._cond.wait( deadline - now )
+            # end while
+
+            if ( (conn is None) and (self._num_open < self._max_connections) ):
+                self._num_open += 1
+                is_new = True
+            else:
+                is_new = False
+        # end with
+
+        for idle_conn in stale:
+            idle_conn.close()
+
+        if conn is None:
+            if not is_new:
+                raise GPUdbConnectionException( "Timed out waiting for one of the {} "
+                                                "connections to {}:{} to be free"
+                                                "".format( self._max_connections,
+                                                           self._host, self._port ) )
+            return ( self.new_connection( timeout ), False )
+
+        conn.timeout = timeout
+        conn.sock.settimeout( timeout )
+        return ( conn, True )
+    # end acquire
+
+
+    def release( self, conn ):
+        """Returns a connection whose response has been fully read back to
+        the pool."""
+        if conn.sock is None:
+            self.discard( conn )
+            return
+
+        with self._cond:
+            self._idle.append( (conn, time.time()) )
+            self._cond.notify()
+    # end release
+
+
+    def discard( self, conn ):
+        """Closes a connection that must not be reused, freeing its place in
+        the pool."""
+        conn.close()
+        with self._cond:
+            self._num_open -= 1
+            self._cond.notify()
+    # end discard
+
+
+    def clear( self ):
+        """Closes all idle connections."""
+        with self._cond:
+            idle = self._idle
+            self._idle = []
+            self._num_open -= len( idle )
+            self._cond.notify_all()
+        for ( conn, last_used ) in idle:
+            conn.close()
+    # end clear
+# end class _ConnectionPool
+
+
+
+class _Cancellation(object):
+    """Internal handle through which another thread can cancel a request in
+    flight, by shutting down the socket of its connection."""
+    def __init__( self ):
+        self._lock        = threading.Lock()
+        self._sock        = None
+        self.is_cancelled = False
+    # end __init__
+
+
+    def attach( self, sock ):
+        """Sets the socket the request is sent over; raises a
+        GPUdbConnectionException if the request is already cancelled."""
+        with self._lock:
+            if self.is_cancelled:
+                raise GPUdbConnectionException( "The request was cancelled" )
+            self._sock = sock
+    # end attach
+
+
+    def detach( self ):
+        """Lets go of the socket of the request, which is done with it;
+        returns whether the request was cancelled."""
+        with self._lock:
+            self._sock = None
+            return self.is_cancelled
+    # end detach
+
+
+    def cancel( self ):
+        """Cancels the request, if it is not done yet."""
+        with self._lock:
+            self.is_cancelled = True
+            sock = self._sock
+
+        if sock is not None:
+            try:
+                sock.shutdown( socket.SHUT_RDWR )
+            except (socket.error, OSError):
+                pass # already closed
+    # end cancel
+# end class _Cancellation
+
+
+
+# ---------------------------------------------------------------------------
+# _HostSelector - Private latency and health tracker of the HA hosts
+# ---------------------------------------------------------------------------
+class _HostSelector(object):
+    """Internal tracker of the health of each host of a (possibly HA)
+    cluster, which decides the order in which the hosts are tried for a
+    request.
+
+    For every host, moving averages of the request round trip time and of
+    the error rate are kept.  After a number of consecutive failures, the
+    circuit of the host is opened: it is tried only after all other hosts
+    for a while, after which a single request (or health check) is let
+    through to find out whether it has recovered.
+
+    Read-only requests are sent to the fastest healthy host; all other
+    requests stick to the current host for as long as it is healthy.
+    """
+    # Weight of the newest sample in the moving averages
+    _EWMA_WEIGHT = 0.2
+
+    # Number of consecutive failures that open the circuit of a host
+    _FAILURE_THRESHOLD = 3
+
+    # Seconds for which the circuit of a failing host stays open
+    _CIRCUIT_OPEN_TIME = 30
+
+    # How much the error rate of a host inflates its latency when ranking
+    # the hosts for read-only requests
+    _ERROR_RATE_PENALTY = 10
+
+    # Endpoints that don't modify anything, and so may go to any host;
+    # job status is only known to the host the job was submitted to
+    _READ_ONLY_PREFIXES = ( "/get/", "/has/", "/show/" )
+    _HOST_BOUND_ENDPOINTS = ( "/get/job", )
+
+    # Number of recent latencies kept per endpoint for hedging requests, and
+    # the number needed before any request to the endpoint is hedged
+    _LATENCY_SAMPLES     = 1000
+    _MIN_LATENCY_SAMPLES = 20
+
+    def __init__( self, num_hosts ):
+        self._num_hosts   = num_hosts
+        self._latencies   = [ None ] * num_hosts # None until first measured
+        self._error_rates = [ 0.0 ] * num_hosts
+        self._failures    = [ 0 ] * num_hosts # consecutive failures
+        self._open_until  = [ None ] * num_hosts # None if circuit is closed
+        self._endpoint_latencies = {} # endpoint to its recent latencies
+        self._lock        = threading.Lock()
+    # end __init__
+
+
+    @classmethod
+    def is_read_only( cls, endpoint ):
+        """Returns whether the endpoint may be served by any of the hosts."""
+        return ( endpoint.startswith( cls._READ_ONLY_PREFIXES )
+                 and (endpoint not in cls._HOST_BOUND_ENDPOINTS) )
+    # end is_read_only
+
+
+    def get_host_order( self, current_index, read_only ):
+        """Returns the indices of all the hosts, in the order in which they
+        should be tried for a request.  Hosts whose circuit is open come
+        last.  The remaining ones are ordered by latency for read-only
+        requests, and start with *current_index* otherwise.
+        """
+        with self._lock:
+            now = time.time()
+            available   = []
+            unavailable = []
+            for i in range( self._num_hosts ):
+                index = (current_index + i) % self._num_hosts
+                open_until = self._open_until[ index ]
+                if (open_until is None):
+                    available.append( index )
+                elif (open_until <= now):
+                    # Half-open: let this request through as a trial, but
+                    # keep others away until it has succeeded
+                    self._open_until[ index ] = now + self._CIRCUIT_OPEN_TIME
+                    available.append( index )
+                else:
+                    unavailable.append( index )
+            # end for
+
+            if read_only:
+                # Hosts never measured go first so that they get measured
+                available.sort( key = self.__get_score )
+
+            return (available + unavailable)
+    # end get_host_order
+
+
+    def __get_score( self, index ):
+        """Returns the ranking score of a host for read-only requests; lower
+        is better.  Must be called while holding the lock.
+        """
+        latency = self._latencies[ index ]
+        if latency is None:
+            return 0
+        return latency * (1 + self._ERROR_RATE_PENALTY * self._error_rates[ index ])
+    # end __get_score
+
+
+    def record_success( self, index, latency ):
+        """Records a request to the host that took *latency* seconds, and
+        closes its circuit."""
+        with self._lock:
+            previous = self._latencies[ index ]
+            if previous is None:
+                self._latencies[ index ] = latency
+            else:
+                self._latencies[ index ] = ( previous + self._EWMA_WEIGHT
+                                             * (latency - previous) )
+            self._error_rates[ index ] *= (1 - self._EWMA_WEIGHT)
+            self._failures[ index ]   = 0
+            self._open_until[ index ] = None
+    # end record_success
+
+
+    def record_failure( self, index ):
+        """Records a failed request to the host, opening its circuit if it
+        has failed too many times in a row."""
+        with self._lock:
+            self._error_rates[ index ] += ( self._EWMA_WEIGHT
+                                            * (1 - self._error_rates[ index ]) )
+            self._failures[ index ] += 1
+            if (self._failures[ index ] >= self._FAILURE_THRESHOLD):
+                self._open_until[ index ] = time.time() + self._CIRCUIT_OPEN_TIME
+    # end record_failure
+
+
+    def record_latency( self, endpoint, latency ):
+        """Records the latency of a (hedgeable) request to the endpoint."""
+        with self._lock:
+            samples = self._endpoint_latencies.get( endpoint )
+            if samples is None:
+                samples = deque( maxlen = self._LATENCY_SAMPLES )
+                self._endpoint_latencies[ endpoint ] = samples
+            samples.append( latency )
+    # end record_latency
+
+
+    def get_latency_percentile( self, endpoint, percentile ):
+        """Returns the given percentile of the recent latencies of requests to
+        the endpoint, or None if too few have been recorded.
+        """
+        with self._lock:
+            samples = sorted( self._endpoint_latencies.get( endpoint, () ) )
+
+        if (len( samples ) < self._MIN_LATENCY_SAMPLES):
+            return None
+
+        rank = int( percentile / 100.0 * len( samples ) )
+        return samples[ min( rank, len( samples ) - 1 ) ]
+    # end get_latency_percentile
+
+
+    def start_health_checks( self, interval, probe ):
+        """Starts a background thread that checks all the hosts every
+        *interval* seconds by calling *probe* with the host index.  The probe
+        raises an exception if the host is unhealthy, and returns False once
+        the checks are no longer needed, which stops the thread.
+        """
+        thread = threading.Thread( target = self.__check_health,
+                                   args = ( interval, probe ),
+                                   name = "GPUdbHealthCheck" )
+        thread.daemon = True
+        thread.start()
+    # end start_health_checks
+
+
+    def __check_health( self, interval, probe ):
+        """Probe the hosts periodically (run on the health check thread)."""
+        while True:
+            time.sleep( interval )
+
+            for index in range( self._num_hosts ):
+                start_time = time.time()
+                try:
+                    if not probe( index ):
+                        return
+                except Exception:
+                    self.record_failure( index )
+                    continue
+
+                self.record_success( index, time.time() - start_time )
+            # end for
+        # end while
+    # end __check_health
+# end class _HostSelector
+
+
+
+# ---------------------------------------------------------------------------
+# _StreamingBody - Private request body sent in chunks
+# ---------------------------------------------------------------------------
+class _StreamingBody(object):
+    """Internal request body that is produced a chunk at a time and sent
+    with HTTP chunked transfer encoding, so that it never has to be held in
+    memory as a whole.  *get_chunks* is called every time the body is sent
+    (e.g. again when the request is retried) and returns an iterable of
+    byte strings.
+    """
+
+    class EncodingError( Exception ):
+        """Wraps an error raised while producing a chunk, so that it can
+        be told apart from errors sending it."""
+        def __init__( self, error ):
+            self.error = error
+    # end class EncodingError
+
+
+    def __init__( self, get_chunks ):
+        self._get_chunks = get_chunks
+    # end __init__
+
+
+    def send( self, conn, url_path, headers ):
+        """POST the body over the given HTTP(S) connection."""
+        conn.putrequest( "POST", url_path )
+        for ( name, value ) in headers.items():
+            conn.putheader( name, value )
+        conn.endheaders()
+
+        chunks = iter( self._get_chunks() )
+        while True:
+            try:
+                chunk = next( chunks )
+            except StopIteration:
+                break
+            except Exception as ex:
+                raise _StreamingBody.EncodingError( ex )
+
+            # An empty chunk would mark the end of the body
+            if chunk:
+                conn.send( ("%x\r\n" % len( chunk )).encode( "ascii" )
+                           + chunk + b"\r\n" )
+        # end while
+
+        conn.send( b"0\r\n\r\n" )
+    # end send
+# end class _StreamingBody
+
+
+# Schemas of the pieces of a streamed /insert/records request; arrays are
+# sent as a sequence of blocks, each of which ends with a (dropped) empty
+# block when encoded on its own
+_insert_records_head_schema    = Schema( "record", [ ("table_name", "string") ] )
+_insert_records_objects_schema = Schema( "record", [ ("list", "object_array") ] )
+_insert_records_bytes_schema   = Schema( "record", [ ("list", "array", [("bytes")]) ] )
+_insert_records_strings_schema = Schema( "record", [ ("list_str", "array", [("string")]) ] )
+_insert_records_tail_schema    = Schema( "record", [ ("list_encoding", "string"),
+                                                     ("options", "map", [("string")]) ] )
+
+
+
+# ---------------------------------------------------------------------------
+# _PrefetchingIterator - Private base of iterators fetching pages in threads
+# ---------------------------------------------------------------------------
+class _PrefetchingIterator( Iterator ):
+    """Internal base class of iterators over records that are fetched a page
+    at a time by background threads, one per source of pages.  The pages of
+    all the sources are handed over to the caller through one bounded queue,
+    in the order they arrive.
+
+    The background threads only hold the queue, the event signalling that
+    the iterator is closed and their page source, never the iterator itself.
+    So an iterator that is dropped without being exhausted or closed (e.g.
+    by breaking out of a loop) is garbage collected, which closes it and
+    stops the threads.  The iterator can also be used as a context manager.
+    """
+    # Seconds to wait on the page queue before re-checking if the iterator
+    # has been closed
+    _QUEUE_POLL_INTERVAL = 0.5
+
+    def __init__( self, page_sources, prefetch_depth ):
+        """Start fetching the pages.
+
+        Parameters:
+            page_sources (list of functions)
+                Functions, called on the background threads, each returning
+                an iterable over the pages (lists of records) of one source.
+                They must not refer to the iterator.
+            prefetch_depth (int)
+                The maximum number of fetched pages, per source, held ahead
+                of the page being consumed.
+        """
+        self.records = []
+        self.cursor  = 0
+        self._done   = False
+
+        # The end of each source's pages is marked by None, and an error by
+        # the exception raised while fetching
+        self._num_sources_left = len( page_sources )
+        self._pages  = queue.Queue( maxsize = prefetch_depth * max( 1, len( page_sources ) ) )
+        self._closed = threading.Event()
+
+        self._fetch_threads = []
+        for (index, get_pages) in enumerate( page_sources ):
+            fetch_thread = threading.Thread( target = _PrefetchingIterator.__fetch_pages,
+                                             args = ( get_pages, self._pages,
+                                                      self._closed ),
+                                             name = "%s-%d" % ( type( self ).__name__,
+                                                                index ) )
+            fetch_thread.daemon = True
+            fetch_thread.start()
+            self._fetch_threads.append( fetch_thread )
+        # end loop
+    # end __init__
+
+
+    @staticmethod
+    def __put_page( pages, closed, page ):
+        """Put a page in the queue, waiting for space.  Returns False if the
+        iterator was closed in the meantime.
+        """
+        while not closed.is_set():
+            try:
+                pages.put( page, timeout = _PrefetchingIterator._QUEUE_POLL_INTERVAL )
+                return True
+            except queue.Full:
+                pass
+        # end while
+
+        return False
+    # end __put_page
+
+
+    @staticmethod
+    def __fetch_pages( get_pages, pages, closed ):
+        """Fetch the pages of one source until there are no more, or the
+        iterator is closed (run on a background thread).
+        """
+        put_page = _PrefetchingIterator.__put_page
+        try:
+            for page in get_pages():
+                if closed.is_set():
+                    return
+
+                if page and not put_page( pages, closed, page ):
+                    return
+            # end loop
+
+            put_page( pages, closed, None )
+        except Exception as ex:
+            put_page( pages, closed, ex )
+    # end __fetch_pages
+
+
+    def close( self ):
+        """Stop fetching records.  Any records already fetched are
+        discarded, and further iteration stops.
+        """
+        self._closed.set()
+        self._done    = True
+        self.records  = []
+        self.cursor   = 0
+
+        # Unblock the background threads if they are waiting for queue space
+        try:
+            while True:
+                self._pages.get_nowait()
+        except queue.Empty:
+            pass
+    # end close
+
+
+    def __del__( self ):
+        # The constructor may have failed before the queue was created
+        if hasattr( self, "_closed" ):
+            self.close()
+    # end __del__
+
+
+    def __enter__( self ):
+        return self
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+
+
+    def __iter__( self ):
+        return self
+
+
+    def next( self ):
+        return self.__next__()
+    # end next
+
+
+    def __next__( self ): # For python3
+        while (self.cursor == len( self.records ) ):
+            if ( self._done or (self._num_sources_left == 0) ):
+                self._done = True
+                raise StopIteration()
+
+            # Wait for the next page of any source
+            page = self._pages.get()
+
+            if page is None:
+                self._num_sources_left -= 1
+                continue
+
+            if isinstance( page, Exception ):
+                # The records of the other sources would be incomplete
+                self.close()
+                raise page
+
+            self.records = page
+            self.cursor  = 0
+        # end while
+
+        cursor = self.cursor
+        self.cursor += 1
+        return self.records[ cursor ]
+    # end __next__
+
+# end class _PrefetchingIterator
+
+
 # ---------------------------------------------------------------------------
 # Utility Functions
 # ---------------------------------------------------------------------------
@@ -385,13 +1204,6 @@ class _Util(object):
 
 
 
-    # Regular expression needed for converting records to protocol.Record objects
-    re_datetime_full  = re.compile("^\d{4}-\d{2}-\d{2}\s+\d{1,2}:\d{2}:\d{2}\.\d{1,3}\Z")
-    re_datetime_noMS  = re.compile("^\d{4}-\d{2}-\d{2}\s+\d{1,2}:\d{2}:\d{2}\Z")
-    re_date_only      = re.compile("^\d{4}-\d{2}-\d{2}\Z")
-    re_time_only_ms   = re.compile("^\d{1,2}:\d{2}:\d{2}\.\d{1,3}\Z")
-    re_time_only_noMS = re.compile("^\d{1,2}:\d{2}:\d{2}\Z")
-
     @staticmethod
     def convert_binary_data_to_cext_records( db, table_name, records, record_type = None ):
         """Given a list of objects, convert them to either bytes or Record objects.
@@ -486,77 +1298,11 @@ class _Util(object):
                     if (col_data_type == "string"):
                         if (sys.version_info.major == 2): # checking the major component
                             col_value = _Util.ensure_str( col_value )
-                    # Handle datetime
-                    elif (col_data_type == "datetime"):
-                        # Conversion needed if it is NOT already a datetime struct
-                        if not isinstance( col_value, datetime.datetime ):
-                            # Better be a string if not a datetime object
-                            if not isinstance( col_value, basestring ):
-                                raise GPUdbException( "'datetime' type column value must be a datetime "
-                                                      "object or a string, given {}".format( str( type( col_value ) ) ) )
-
-                            col_value = col_value.strip()
-                        
-                            if _Util.re_datetime_full.match( col_value ):
-                                # Full datetime with time (including milliseconds)
-                                col_value = datetime.datetime.strptime( col_value, "%Y-%m-%d %H:%M:%S.%f" )
-                            elif _Util.re_datetime_noMS.match( col_value ):
-                                # Date and time, but no milliseconds
-                                col_value = datetime.datetime.strptime( col_value, "%Y-%m-%d %H:%M:%S" )
-                            elif _Util.re_date_only.match( col_value ):
-                                # Date only (no time)
-                                col_value = datetime.datetime.strptime( col_value, "%Y-%m-%d" )
-                            else:
-                                raise GPUdbException( "Could not convert value to datetime pattern ('YYYY-MM-DD [HH:MM:SS[.mmm]]'); "
-                                                      "given '{}'".format( col_value ) )
-                            # end if
-                        # end if
-                    elif (col_data_type == "date"): # Handle date
-                        # Conversion needed if it is NOT already a date struct
-                        if not isinstance( col_value, datetime.date ):
-                            # Better be a string if not a date object
-                            if not isinstance( col_value, basestring ):
-                                raise GPUdbException( "'date' type column value must be a datetime.date "
-                                                      "object or a string, given {}".format( str( type( col_value ) ) ) )
-
-                            col_value = col_value.strip()
-
-                            # Check that it matches the date pattern
-                            if _Util.re_date_only.match( col_value ):
-                                col_value = datetime.datetime.strptime( col_value, "%Y-%m-%d" ).date()
-                            else:
-                                raise GPUdbException( "Could not convert value to date pattern ('YYYY-MM-DD'); "
-                                                      "given '{}'".format( col_value ) )
-                            # end if
-                        # end if
-                    elif (col_data_type == "time"): # Handle time
-                        # Conversion needed if it is NOT already a time struct
-                        if not isinstance( col_value, datetime.time ):
-                            # Better be a string if not a time object
-                            if not isinstance( col_value, basestring ):
-                                raise GPUdbException( "'time' type column value must be a datetime.time "
-                                                      "object or a string, given {}".format( str( type( col_value ) ) ) )
-
-                            col_value = col_value.strip()
-
-                            # Check that it matches the allowed time patterns
-                            if _Util.re_time_only_ms.match( col_value ):
-                                # Time with milliseconds
-                                col_value = datetime.datetime.strptime( col_value, "%H:%M:%S.%f" ).time()
-                            elif _Util.re_time_only_noMS.match( col_value ):
-                                # Time without milliseconds
-                                col_value = datetime.datetime.strptime( col_value, "%H:%M:%S" ).time()
-                            else:
-                                raise GPUdbException( "Could not convert value to date pattern ('HH:MM:SS[.mmm]'); "
-                                                      "given '{}'".format( col_value ) )
-                            # end if
-                        # end if
-                    elif (col_data_type == "decimal"): # Handle decimal
-                        raise GPUdbException("TODO: *********type 'decimal' not supported yet*********")
-                    elif (col_data_type == "ipv4"): # Handle IPv4
-                        raise GPUdbException("TODO: *********type 'ipv4' not supported yet*********")
                     # end handling special data type conversions
-                
+
+                    # Date, datetime, and time strings (and epoch millisecond
+                    # integers), decimal strings or numbers, and IPv4 strings
+                    # (or integers) are parsed by the Record itself
                     record[ col_name ] = col_value
                 # end inner loop
             
@@ -573,6 +1319,119 @@ class _Util(object):
         return (True, converted_records)
     # end convert_binary_data_to_cext_records
 
+
+    # NumPy types of the typed column buffers accepted by
+    # :meth:`RecordType.encode_records_columnar`, by column data type
+    _NUMPY_CEXT_COLUMN_DTYPES = { "int"      : "i4",
+                                  "int8"     : "i1",
+                                  "int16"    : "i2",
+                                  "long"     : "i8",
+                                  "timestamp": "i8",
+                                  "float"    : "f4",
+                                  "double"   : "f8",
+                                  "date"     : "i8",
+                                  "datetime" : "i8",
+                                  "time"     : "i8" }
+
+
+    @staticmethod
+    def convert_columns_to_cext_columns( record_type, data, null_masks = None ):
+        """Given column-major data keyed by column name, convert it to the
+        column and null flag sequences accepted by
+        :meth:`RecordType.encode_records_columnar`.
+
+        NumPy arrays of numeric, datetime64 and timedelta64 types are passed
+        to the C-extension as typed buffers (date columns as days since the
+        epoch, datetime and timestamp columns as milliseconds since the
+        epoch, and time columns as milliseconds since midnight); the masks of
+        NumPy masked arrays are used as null masks.  Any other sequence is
+        passed as is, and must contain values accepted by :class:`Record`.
+
+        Parameters:
+            record_type (RecordType)
+                The type for the records.
+
+            data (dict of str to sequence or NumPy array)
+                The values of each column of the record type, keyed by column
+                name.  All columns must have the same number of values.
+
+            null_masks (dict of str to sequence, optional)
+                Null masks for any nullable column, keyed by column name.  A
+                true value in a mask indicates that the column value in that
+                row is null.  Default None.
+
+        Returns:
+            A tuple containing the list of column values and the list of null
+            masks (or None), both in column order.
+        """
+        null_masks = null_masks if null_masks else {}
+
+        unknown_columns = set( data.keys() ).union( null_masks.keys() ).difference( record_type.keys() )
+        if unknown_columns:
+            raise GPUdbException( "Unknown column(s) given: {}"
+                                  "".format( ", ".join( sorted( unknown_columns ) ) ) )
+
+        columns = []
+        nulls   = []
+        for column in record_type:
+            col_name = column.name
+            if col_name not in data:
+                raise GPUdbException( "Missing column values for '{}'".format( col_name ) )
+
+            col_values = data[ col_name ]
+            col_nulls  = null_masks.get( col_name, None )
+
+            if have_numpy and isinstance( col_values, numpy.ndarray ):
+                # Use the masked array's mask as (part of) the null mask
+                if isinstance( col_values, numpy.ma.MaskedArray ):
+                    mask = numpy.ma.getmaskarray( col_values )
+                    col_nulls = mask if (col_nulls is None) else (mask | numpy.asarray( col_nulls, dtype = bool ))
+                    col_values = col_values.data
+
+                dtype = _Util._NUMPY_CEXT_COLUMN_DTYPES.get( column.data_type )
+
+                if (col_values.dtype.kind == "M") and (column.data_type == "date"):
+                    col_values = col_values.astype( "datetime64[D]" ).view( "i8" )
+                elif (col_values.dtype.kind == "M") and (column.data_type in ("datetime", "timestamp")):
+                    col_values = col_values.astype( "datetime64[ms]" ).view( "i8" )
+                elif (col_values.dtype.kind == "m") and (column.data_type == "time"):
+                    col_values = col_values.astype( "timedelta64[ms]" ).view( "i8" )
+
+                if (dtype is None) or (col_values.dtype.kind not in "biuf"):
+                    # Not a typed column; pass the values as Python objects
+                    col_values = col_values.tolist()
+                else:
+                    if ( (col_values.dtype.kind in "biu") and (dtype[0] == "i")
+                         and not numpy.can_cast( col_values.dtype, dtype )
+                         and len( col_values ) ):
+                        # Make sure that narrowing the integers loses nothing
+                        limits = numpy.iinfo( dtype )
+                        if ( (col_values.min() < limits.min)
+                             or (col_values.max() > limits.max) ):
+                            raise GPUdbException( "Values out of range for column '{}' "
+                                                  "of type '{}'".format( col_name, column.data_type ) )
+                    elif (col_values.dtype.kind == "f") and (dtype[0] == "i"):
+                        raise GPUdbException( "Floating point values given for column '{}' "
+                                              "of type '{}'".format( col_name, column.data_type ) )
+
+                    col_values = numpy.ascontiguousarray( col_values, dtype = dtype )
+                # end if
+            # end if
+
+            if col_nulls is not None:
+                if have_numpy and isinstance( col_nulls, numpy.ndarray ):
+                    col_nulls = numpy.ascontiguousarray( col_nulls, dtype = numpy.uint8 )
+                else:
+                    col_nulls = bytearray( [ (1 if is_null else 0) for is_null in col_nulls ] )
+            # end if
+
+            columns.append( col_values )
+            nulls.append( col_nulls )
+        # end loop
+
+        return (columns, nulls)
+    # end convert_columns_to_cext_columns
+
     
     # ----------- Begin override of strftime ------------------
     # Override datetime's strftime which in python does not accept
@@ -659,11 +1518,59 @@ class _Util(object):
     # ----------- end override ------------------
 
 
+    # Minimum number of records decoded by each thread when decoding records
+    # in parallel; smaller responses are not worth splitting up
+    _MIN_DECODE_CHUNK_SIZE = 10000
+
+    @staticmethod
+    def decode_cext_records_in_chunks( record_type, buffer, ranges,
+                                       thread_pool = None, num_threads = 1 ):
+        """Decode binary encoded records using the c-extension, splitting
+        the list of buffer ranges into chunks that are decoded in parallel on
+        the given thread pool.  The c-extension releases the GIL while
+        decoding, so the chunks are decoded concurrently.  The decoded
+        records are returned in the same order as the ranges.
+
+        Parameters:
+            record_type (RecordType)
+                The type of the records.
+            buffer (bytes)
+                The buffer containing the binary encoded records.
+            ranges (list of BufferRange)
+                The ranges within *buffer* of the records to decode.
+            thread_pool (ThreadPool)
+                The thread pool to decode the chunks on.  If None, all
+                records are decoded on the calling thread.  Default None.
+            num_threads (int)
+                The maximum number of chunks to split the records into.  Each
+                chunk has at least :attr:`_MIN_DECODE_CHUNK_SIZE` records.
+                Default 1.
+
+        Returns:
+            A list of :class:`Record` objects.
+        """
+        num_chunks = min( num_threads, len( ranges ) // _Util._MIN_DECODE_CHUNK_SIZE )
+
+        if (thread_pool is None) or (num_chunks < 2):
+            return record_type.decode_records( buffer, ranges )
+
+        chunk_size = (len( ranges ) + num_chunks - 1) // num_chunks
+        chunks = [ ranges[ i : i + chunk_size ] for i in range( 0, len( ranges ), chunk_size ) ]
+
+        records = []
+        for chunk_records in thread_pool.map( lambda chunk: record_type.decode_records( buffer, chunk ),
+                                              chunks ):
+            records.extend( chunk_records )
+
+        return records
+    # end decode_cext_records_in_chunks
+
+
     @staticmethod
     def convert_cext_records_to_ordered_dicts( records ):
         """Given a list of Record objects, convert them to OrderedDicts if the
-        record type contains any date, time, datetime types. Otherwise,
-        the records (of Record type) will be returned without
+        record type contains any date, time, datetime, or decimal types.
+        Otherwise, the records (of Record type) will be returned without
         any conversion since they are equivalent to OrderedDicts.
 
         If the records are already of type GPUdbRecord or OrderedDicts, do
@@ -675,8 +1582,8 @@ class _Util(object):
                 a dict, an OrderedDict, or a Record.
 
         Returns:
-            If the record type contains any date, time, datetime, then they will
-            be converted to strings and a list of OrderedDicts will be returned.
+            If the record type contains any date, time, datetime, or decimal,
+            then they will be converted to strings and a list of OrderedDicts will be returned.
             Otherwise, the records (of Record type) will be returned without
             any conversion since they are equivalent to OrderedDicts.
         """
@@ -692,8 +1599,9 @@ class _Util(object):
             raise GPUdbException( "Either all records must be Record objects or none; "
                                   "a mix is given." )
 
-        # Check if the record contains any date, time, and datetime types
-        types_needing_conversion = ["datetime", "date", "time", "decimal", "ipv4"]
+        # Check if the record contains any date, time, datetime, and decimal
+        # types (IPv4 values are already strings)
+        types_needing_conversion = ["datetime", "date", "time", "decimal"]
         record_type = records[ 0 ].type
         columns_needing_conversion = [ column for column in record_type
                                        if (column.data_type in types_needing_conversion) ]
@@ -730,9 +1638,7 @@ class _Util(object):
                 elif (col_data_type == "time"): # Handle time
                     col_value = col_value.strftime( "%H:%M:%S.%f" )[ : -3 ]
                 elif (col_data_type == "decimal"): # Handle decimal
-                    raise GPUdbException("TODO: *********type 'decimal' not supported yet*********")
-                elif (col_data_type == "ipv4"): # Handle IPv4
-                    raise GPUdbException("TODO: *********type 'ipv4' not supported yet*********")
+                    col_value = str( col_value )
                 # end handling special data type conversions
                 
                 record[ col_name ] = col_value
@@ -743,6 +1649,127 @@ class _Util(object):
 
         return converted_records
     # end convert_cext_records_to_ordered_dicts
+
+
+    # Epoch used for converting the columnar date/time values
+    _EPOCH_DATE     = datetime.date( 1970, 1, 1 )
+    _EPOCH_DATETIME = datetime.datetime( 1970, 1, 1 )
+
+    # NumPy types used for the columnar date/time values
+    _NUMPY_COLUMN_DTYPES = { "date"    : "datetime64[D]",
+                             "datetime": "datetime64[ms]",
+                             "time"    : "timedelta64[ms]" }
+
+
+    @staticmethod
+    def convert_cext_columns_to_column_major( record_type, columns,
+                                              force_primitive_return_types = True,
+                                              use_numpy = False ):
+        """Given the output of :meth:`RecordType.decode_records_columnar` or
+        :meth:`RecordType.decode_dynamic_records_columnar`, convert it to
+        column-major data keyed by column name.
+
+        If *use_numpy* is True and NumPy is available, each column is returned as a NumPy array that
+        shares the buffer filled in by the C-extension (no per-value Python
+        objects are created for numeric, date and time columns).  Date,
+        datetime and time columns are returned as 'datetime64[D]',
+        'datetime64[ms]' and 'timedelta64[ms]' arrays, respectively, and
+        string and bytes columns as object arrays.  Nullable columns are
+        returned as NumPy masked arrays whose boolean mask is set for null
+        values.
+
+        Otherwise, each column is returned as a list, with None for null
+        values; if there are no records, an empty list is returned instead
+        of a dict of empty columns, as with
+        :meth:`GPUdbRecord.transpose_data_to_col_major`.
+
+        Parameters:
+            record_type (:class:`RecordType`)
+                The record type of the decoded records.
+
+            columns (list of tuples)
+                The (values, typecode, nulls) tuples returned by
+                :meth:`RecordType.decode_records_columnar` or
+                :meth:`RecordType.decode_dynamic_records_columnar`.
+
+            force_primitive_return_types (bool)
+                Only used if lists are returned.  If True, date, datetime,
+                time and decimal values are converted to strings; otherwise,
+                they are returned as Python `date`, `datetime`, `time` and
+                `Decimal` objects.  Default value is True.
+
+            use_numpy (bool)
+                If True, NumPy arrays are returned when NumPy is available.
+                Otherwise, lists are always returned.  Default value is False.
+
+        Returns:
+            An OrderedDict of column name to NumPy array or list of values,
+            or an empty list.
+        """
+        if ( not (use_numpy and have_numpy)
+             and all( (len( values ) == 0) for (values, typecode, nulls) in columns ) ):
+            return []
+
+        column_major_data = collections.OrderedDict()
+
+        for column, (values, typecode, nulls) in zip( record_type, columns ):
+            data_type = column.data_type
+
+            if use_numpy and have_numpy:
+                if typecode is not None:
+                    column_values = numpy.frombuffer( values, dtype = typecode )
+                    if data_type in _Util._NUMPY_COLUMN_DTYPES:
+                        column_values = column_values.view( _Util._NUMPY_COLUMN_DTYPES[ data_type ] )
+                else:
+                    column_values = numpy.empty( len( values ), dtype = object )
+                    column_values[ : ] = values
+                # end if
+
+                if nulls is not None:
+                    column_values = numpy.ma.masked_array( column_values,
+                                                           mask = numpy.frombuffer( nulls, dtype = numpy.bool_ ) )
+
+                column_major_data[ column.name ] = column_values
+                continue
+            # end if
+
+            if typecode is None:
+                # Decimal values are returned as strings, as with the other
+                # decoding paths
+                if (data_type == "decimal") and force_primitive_return_types:
+                    values = [ (None if v is None else str( v )) for v in values ]
+
+                column_major_data[ column.name ] = values
+                continue
+
+            column_values = list( struct.unpack( "%d%s" % (len( values ) // struct.calcsize( typecode ), typecode),
+                                                 bytes( values ) ) )
+
+            # Convert the date/time offsets to python objects (or strings)
+            if (data_type == "date"):
+                column_values = [ _Util._EPOCH_DATE + datetime.timedelta( days = v ) for v in column_values ]
+                if force_primitive_return_types:
+                    column_values = [ _Util.strftime( v, "%Y-%m-%d" ) for v in column_values ]
+            elif (data_type == "datetime"):
+                column_values = [ _Util._EPOCH_DATETIME + datetime.timedelta( milliseconds = v ) for v in column_values ]
+                if force_primitive_return_types:
+                    column_values = [ _Util.strftime( v, "%Y-%m-%d %H:%M:%S.%f" )[ : -3 ] for v in column_values ]
+            elif (data_type == "time"):
+                column_values = [ (_Util._EPOCH_DATETIME + datetime.timedelta( milliseconds = v )).time() for v in column_values ]
+                if force_primitive_return_types:
+                    column_values = [ v.strftime( "%H:%M:%S.%f" )[ : -3 ] for v in column_values ]
+            # end if
+
+            # Handle nulls
+            if nulls is not None:
+                column_values = [ (None if is_null else v)
+                                  for (v, is_null) in zip( column_values, bytearray( nulls ) ) ]
+
+            column_major_data[ column.name ] = column_values
+        # end loop
+
+        return column_major_data
+    # end convert_cext_columns_to_column_major
     
     
 # end class _Util
@@ -2049,29 +3076,1218 @@ class GPUdbRecord( object ):
                     return False
         # end if-else checking type-correctness
 
-        # The value checks out; it is valid
-        return True
-    # end __is_valid_column_value
+        # The value checks out; it is valid
+        return True
+    # end __is_valid_column_value
+
+
+    def __eq__( self, other ):
+        if isinstance(other, self.__class__):
+            return self.__dict__ == other.__dict__
+        else:
+            return False
+    # end __eq__
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+    # end __ne__
+
+
+# end class GPUdbRecord
+
+
+
+
+
+
+
+
+# ---------------------------------------------------------------------------
+# _GPUdbSchemaRegistry - Private process-wide registry of endpoint schemas
+# ---------------------------------------------------------------------------
+class _GPUdbSchemaRegistry(object):
+    """Internal read-only mapping of endpoint names (e.g. "/get/records") to
+    their request and response schemas, shared by all GPUdb instances.  The
+    c-extension Schema objects for an endpoint are only built the first time
+    the endpoint is looked up.
+    """
+    def __init__( self, definitions ):
+        # Maps name to a dict of schema strings, Schema constructor
+        # arguments and the endpoint
+        self._definitions = definitions
+        self._schemas     = {}
+        self._lock        = threading.Lock()
+    # end __init__
+
+
+    def __getitem__( self, name ):
+        try:
+            return self._schemas[ name ]
+        except KeyError:
+            pass
+
+        definition = self._definitions[ name ]
+        with self._lock:
+            if name not in self._schemas:
+                schemas = {}
+                for ( key, value ) in definition.items():
+                    if key.endswith( "_SCHEMA" ) or key.endswith( "_SCHEMA_CEXT" ):
+                        value = Schema( *value )
+                    schemas[ key ] = value
+                self._schemas[ name ] = schemas
+            # end if
+            return self._schemas[ name ]
+    # end __getitem__
+
+
+    def __contains__( self, name ):
+        return name in self._definitions
+
+    def __iter__( self ):
+        return iter( self._definitions )
+
+    def __len__( self ):
+        return len( self._definitions )
+
+    def keys( self ):
+        return self._definitions.keys()
+# end class _GPUdbSchemaRegistry
+
+
+# Request and response schemas for all endpoints; the Schema entries hold
+# the arguments for constructing the c-extension Schema objects
+_gpudb_schema_definitions = {}
+_gpudb_schema_definitions[ "gpudb_response" ] = {
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"gpudb_response","fields":[{"name":"status","type":"string"},{"name":"message","type":"string"},{"name":"data_type","type":"string"},{"name":"data","type":"bytes"},{"name":"data_str","type":"string"}]}""",
+    "RSP_SCHEMA" : ( "record", [("status", "string"), ("message", "string"), ("data_type", "string"), ("data", "object"), ("data_str", "string")] ) }
+_gpudb_schema_definitions[ "trigger_notification" ] = {
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"trigger_notification","fields":[{"name":"trigger_id","type":"string"},{"name":"set_id","type":"string"},{"name":"object_id","type":"string"},{"name":"object_data","type":"bytes"}]}""",
+    "RSP_SCHEMA" : ( "record", [("trigger_id", "string"), ("set_id", "string"), ("object_id", "string"), ("object_data", "bytes")] ) }
+_gpudb_schema_definitions[ "/admin/add/ranks" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_add_ranks_request","fields":[{"name":"hosts","type":{"type":"array","items":"string"}},{"name":"config_params","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_add_ranks_response","fields":[{"name":"added_ranks","type":{"type":"array","items":"int"}},{"name":"results","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("hosts", "array", [("string")]), ("config_params", "array", [("map", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("added_ranks", "array", [("int")]), ("results", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/add/ranks" }
+_gpudb_schema_definitions[ "/admin/alter/configuration" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_alter_configuration_request","fields":[{"name":"config_string","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_alter_configuration_response","fields":[{"name":"status","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("config_string", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("status", "string")] ),
+    "ENDPOINT" : "/admin/alter/configuration" }
+_gpudb_schema_definitions[ "/admin/alter/jobs" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_alter_jobs_request","fields":[{"name":"job_ids","type":{"type":"array","items":"int"}},{"name":"action","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_alter_jobs_response","fields":[{"name":"job_ids","type":{"type":"array","items":"int"}},{"name":"action","type":"string"},{"name":"status","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("job_ids", "array", [("int")]), ("action", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("job_ids", "array", [("int")]), ("action", "string"), ("status", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/alter/jobs" }
+_gpudb_schema_definitions[ "/admin/alter/shards" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_alter_shards_request","fields":[{"name":"version","type":"long"},{"name":"use_index","type":"boolean"},{"name":"rank","type":{"type":"array","items":"int"}},{"name":"tom","type":{"type":"array","items":"int"}},{"name":"index","type":{"type":"array","items":"int"}},{"name":"backup_map_list","type":{"type":"array","items":"int"}},{"name":"backup_map_values","type":{"type":"array","items":{"type":"array","items":"int"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_alter_shards_response","fields":[{"name":"version","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("version", "long"), ("use_index", "boolean"), ("rank", "array", [("int")]), ("tom", "array", [("int")]), ("index", "array", [("int")]), ("backup_map_list", "array", [("int")]), ("backup_map_values", "array", [("array", [("int")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("version", "long")] ),
+    "ENDPOINT" : "/admin/alter/shards" }
+_gpudb_schema_definitions[ "/admin/offline" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_offline_request","fields":[{"name":"offline","type":"boolean"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_offline_response","fields":[{"name":"is_offline","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("offline", "boolean"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("is_offline", "boolean")] ),
+    "ENDPOINT" : "/admin/offline" }
+_gpudb_schema_definitions[ "/admin/rebalance" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_rebalance_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"action","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_rebalance_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"message","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("action", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("message", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/rebalance" }
+_gpudb_schema_definitions[ "/admin/remove/ranks" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_remove_ranks_request","fields":[{"name":"ranks","type":{"type":"array","items":"int"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_remove_ranks_response","fields":[{"name":"removed_ranks","type":{"type":"array","items":"int"}},{"name":"results","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("ranks", "array", [("int")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("removed_ranks", "array", [("int")]), ("results", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/remove/ranks" }
+_gpudb_schema_definitions[ "/admin/show/alerts" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_show_alerts_request","fields":[{"name":"num_alerts","type":"int"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_show_alerts_response","fields":[{"name":"timestamps","type":{"type":"array","items":"string"}},{"name":"types","type":{"type":"array","items":"string"}},{"name":"params","type":{"type":"array","items":{"type":"map","values":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("num_alerts", "int"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("timestamps", "array", [("string")]), ("types", "array", [("string")]), ("params", "array", [("map", [("string")])])] ),
+    "ENDPOINT" : "/admin/show/alerts" }
+_gpudb_schema_definitions[ "/admin/show/configuration" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_show_configuration_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_show_configuration_response","fields":[{"name":"config_string","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("config_string", "string")] ),
+    "ENDPOINT" : "/admin/show/configuration" }
+_gpudb_schema_definitions[ "/admin/show/jobs" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_show_jobs_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_show_jobs_response","fields":[{"name":"job_id","type":{"type":"array","items":"int"}},{"name":"status","type":{"type":"array","items":"string"}},{"name":"endpoint_name","type":{"type":"array","items":"string"}},{"name":"time_received","type":{"type":"array","items":"long"}},{"name":"auth_id","type":{"type":"array","items":"string"}},{"name":"user_data","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("job_id", "array", [("int")]), ("status", "array", [("string")]), ("endpoint_name", "array", [("string")]), ("time_received", "array", [("long")]), ("auth_id", "array", [("string")]), ("user_data", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/show/jobs" }
+_gpudb_schema_definitions[ "/admin/show/shards" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_show_shards_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_show_shards_response","fields":[{"name":"version","type":"long"},{"name":"rank","type":{"type":"array","items":"int"}},{"name":"tom","type":{"type":"array","items":"int"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("version", "long"), ("rank", "array", [("int")]), ("tom", "array", [("int")])] ),
+    "ENDPOINT" : "/admin/show/shards" }
+_gpudb_schema_definitions[ "/admin/shutdown" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_shutdown_request","fields":[{"name":"exit_type","type":"string"},{"name":"authorization","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_shutdown_response","fields":[{"name":"exit_status","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("exit_type", "string"), ("authorization", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("exit_status", "string")] ),
+    "ENDPOINT" : "/admin/shutdown" }
+_gpudb_schema_definitions[ "/admin/verifydb" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_verify_db_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_verify_db_response","fields":[{"name":"verified_ok","type":"boolean"},{"name":"error_list","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("verified_ok", "boolean"), ("error_list", "array", [("string")])] ),
+    "ENDPOINT" : "/admin/verifydb" }
+_gpudb_schema_definitions[ "/aggregate/convexhull" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_convex_hull_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_convex_hull_response","fields":[{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"count","type":"int"},{"name":"is_valid","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("x_column_name", "string"), ("y_column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("x_vector", "array", [("double")]), ("y_vector", "array", [("double")]), ("count", "int"), ("is_valid", "boolean")] ),
+    "ENDPOINT" : "/aggregate/convexhull" }
+_gpudb_schema_definitions[ "/aggregate/groupby" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_group_by_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_group_by_response","fields":[{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "ENDPOINT" : "/aggregate/groupby" }
+_gpudb_schema_definitions[ "/aggregate/histogram" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_histogram_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"start","type":"double"},{"name":"end","type":"double"},{"name":"interval","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_histogram_response","fields":[{"name":"counts","type":{"type":"array","items":"double"}},{"name":"start","type":"double"},{"name":"end","type":"double"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("start", "double"), ("end", "double"), ("interval", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("counts", "array", [("double")]), ("start", "double"), ("end", "double")] ),
+    "ENDPOINT" : "/aggregate/histogram" }
+_gpudb_schema_definitions[ "/aggregate/kmeans" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_k_means_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"k","type":"int"},{"name":"tolerance","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_k_means_response","fields":[{"name":"means","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"counts","type":{"type":"array","items":"long"}},{"name":"rms_dists","type":{"type":"array","items":"double"}},{"name":"count","type":"long"},{"name":"rms_dist","type":"double"},{"name":"tolerance","type":"double"},{"name":"num_iters","type":"int"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("k", "int"), ("tolerance", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("means", "array", [("array", [("double")])]), ("counts", "array", [("long")]), ("rms_dists", "array", [("double")]), ("count", "long"), ("rms_dist", "double"), ("tolerance", "double"), ("num_iters", "int")] ),
+    "ENDPOINT" : "/aggregate/kmeans" }
+_gpudb_schema_definitions[ "/aggregate/minmax" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_min_max_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_min_max_response","fields":[{"name":"min","type":"double"},{"name":"max","type":"double"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("min", "double"), ("max", "double")] ),
+    "ENDPOINT" : "/aggregate/minmax" }
+_gpudb_schema_definitions[ "/aggregate/minmax/geometry" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_min_max_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_min_max_geometry_response","fields":[{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double")] ),
+    "ENDPOINT" : "/aggregate/minmax/geometry" }
+_gpudb_schema_definitions[ "/aggregate/statistics" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"stats","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_statistics_response","fields":[{"name":"stats","type":{"type":"map","values":"double"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("stats", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("stats", "map", [("double")])] ),
+    "ENDPOINT" : "/aggregate/statistics" }
+_gpudb_schema_definitions[ "/aggregate/statistics/byrange" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_statistics_by_range_request","fields":[{"name":"table_name","type":"string"},{"name":"select_expression","type":"string"},{"name":"column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"stats","type":"string"},{"name":"start","type":"double"},{"name":"end","type":"double"},{"name":"interval","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_statistics_by_range_response","fields":[{"name":"stats","type":{"type":"map","values":{"type":"array","items":"double"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("select_expression", "string"), ("column_name", "string"), ("value_column_name", "string"), ("stats", "string"), ("start", "double"), ("end", "double"), ("interval", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("stats", "map", [("array", [("double")])])] ),
+    "ENDPOINT" : "/aggregate/statistics/byrange" }
+_gpudb_schema_definitions[ "/aggregate/unique" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_unique_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_unique_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"has_more_records","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("has_more_records", "boolean")] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("has_more_records", "boolean")] ),
+    "ENDPOINT" : "/aggregate/unique" }
+_gpudb_schema_definitions[ "/aggregate/unpivot" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"aggregate_unpivot_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"variable_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"pivoted_columns","type":{"type":"array","items":"string"}},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"aggregate_unpivot_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("variable_column_name", "string"), ("value_column_name", "string"), ("pivoted_columns", "array", [("string")]), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "ENDPOINT" : "/aggregate/unpivot" }
+_gpudb_schema_definitions[ "/alter/system/properties" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"alter_system_properties_request","fields":[{"name":"property_updates_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"alter_system_properties_response","fields":[{"name":"updated_properties_map","type":{"type":"map","values":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("property_updates_map", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("updated_properties_map", "map", [("string")])] ),
+    "ENDPOINT" : "/alter/system/properties" }
+_gpudb_schema_definitions[ "/alter/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"alter_table_request","fields":[{"name":"table_name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"alter_table_response","fields":[{"name":"table_name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"type_id","type":"string"},{"name":"type_definition","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"label","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("action", "string"), ("value", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("action", "string"), ("value", "string"), ("type_id", "string"), ("type_definition", "string"), ("properties", "map", [("array", [("string")])]), ("label", "string")] ),
+    "ENDPOINT" : "/alter/table" }
+_gpudb_schema_definitions[ "/alter/table/metadata" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"alter_table_metadata_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"alter_table_metadata_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_map","type":{"type":"map","values":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("metadata_map", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("metadata_map", "map", [("string")])] ),
+    "ENDPOINT" : "/alter/table/metadata" }
+_gpudb_schema_definitions[ "/alter/user" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"alter_user_request","fields":[{"name":"name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"alter_user_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("action", "string"), ("value", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/alter/user" }
+_gpudb_schema_definitions[ "/append/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"append_records_request","fields":[{"name":"table_name","type":"string"},{"name":"source_table_name","type":"string"},{"name":"field_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"append_records_response","fields":[{"name":"table_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("source_table_name", "string"), ("field_map", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string")] ),
+    "ENDPOINT" : "/append/records" }
+_gpudb_schema_definitions[ "/clear/statistics" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"clear_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"clear_statistics_response","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("column_name", "string")] ),
+    "ENDPOINT" : "/clear/statistics" }
+_gpudb_schema_definitions[ "/clear/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"clear_table_request","fields":[{"name":"table_name","type":"string"},{"name":"authorization","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"clear_table_response","fields":[{"name":"table_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("authorization", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string")] ),
+    "ENDPOINT" : "/clear/table" }
+_gpudb_schema_definitions[ "/clear/tablemonitor" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"clear_table_monitor_request","fields":[{"name":"topic_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"clear_table_monitor_response","fields":[{"name":"topic_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("topic_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("topic_id", "string")] ),
+    "ENDPOINT" : "/clear/tablemonitor" }
+_gpudb_schema_definitions[ "/clear/trigger" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"clear_trigger_request","fields":[{"name":"trigger_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"clear_trigger_response","fields":[{"name":"trigger_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("trigger_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("trigger_id", "string")] ),
+    "ENDPOINT" : "/clear/trigger" }
+_gpudb_schema_definitions[ "/collect/statistics" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"collect_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"collect_statistics_response","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")])] ),
+    "ENDPOINT" : "/collect/statistics" }
+_gpudb_schema_definitions[ "/create/job" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_job_request","fields":[{"name":"endpoint","type":"string"},{"name":"request_encoding","type":"string"},{"name":"data","type":"bytes"},{"name":"data_str","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_job_response","fields":[{"name":"job_id","type":"int"}]}""",
+    "REQ_SCHEMA" : ( "record", [("endpoint", "string"), ("request_encoding", "string"), ("data", "bytes"), ("data_str", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("job_id", "int")] ),
+    "ENDPOINT" : "/create/job" }
+_gpudb_schema_definitions[ "/create/jointable" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_join_table_request","fields":[{"name":"join_table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_join_table_response","fields":[{"name":"join_table_name","type":"string"},{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("join_table_name", "string"), ("table_names", "array", [("string")]), ("column_names", "array", [("string")]), ("expressions", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("join_table_name", "string"), ("count", "long")] ),
+    "ENDPOINT" : "/create/jointable" }
+_gpudb_schema_definitions[ "/create/materializedview" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_materialized_view_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_materialized_view_response","fields":[{"name":"table_name","type":"string"},{"name":"view_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("view_id", "string")] ),
+    "ENDPOINT" : "/create/materializedview" }
+_gpudb_schema_definitions[ "/create/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"execution_mode","type":"string"},{"name":"files","type":{"type":"map","values":"bytes"}},{"name":"command","type":"string"},{"name":"args","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_proc_response","fields":[{"name":"proc_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("proc_name", "string"), ("execution_mode", "string"), ("files", "map", [("bytes")]), ("command", "string"), ("args", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("proc_name", "string")] ),
+    "ENDPOINT" : "/create/proc" }
+_gpudb_schema_definitions[ "/create/projection" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_projection_request","fields":[{"name":"table_name","type":"string"},{"name":"projection_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_projection_response","fields":[{"name":"projection_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("projection_name", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("projection_name", "string")] ),
+    "ENDPOINT" : "/create/projection" }
+_gpudb_schema_definitions[ "/create/role" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_role_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_role_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/create/role" }
+_gpudb_schema_definitions[ "/create/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_table_request","fields":[{"name":"table_name","type":"string"},{"name":"type_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_table_response","fields":[{"name":"table_name","type":"string"},{"name":"type_id","type":"string"},{"name":"is_collection","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("type_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("type_id", "string"), ("is_collection", "boolean")] ),
+    "ENDPOINT" : "/create/table" }
+_gpudb_schema_definitions[ "/create/tablemonitor" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_table_monitor_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_table_monitor_response","fields":[{"name":"topic_id","type":"string"},{"name":"table_name","type":"string"},{"name":"type_schema","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("topic_id", "string"), ("table_name", "string"), ("type_schema", "string")] ),
+    "ENDPOINT" : "/create/tablemonitor" }
+_gpudb_schema_definitions[ "/create/trigger/byarea" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_trigger_by_area_request","fields":[{"name":"request_id","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_column_name","type":"string"},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_trigger_by_area_response","fields":[{"name":"trigger_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("request_id", "string"), ("table_names", "array", [("string")]), ("x_column_name", "string"), ("x_vector", "array", [("double")]), ("y_column_name", "string"), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("trigger_id", "string")] ),
+    "ENDPOINT" : "/create/trigger/byarea" }
+_gpudb_schema_definitions[ "/create/trigger/byrange" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_trigger_by_range_request","fields":[{"name":"request_id","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"column_name","type":"string"},{"name":"min","type":"double"},{"name":"max","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_trigger_by_range_response","fields":[{"name":"trigger_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("request_id", "string"), ("table_names", "array", [("string")]), ("column_name", "string"), ("min", "double"), ("max", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("trigger_id", "string")] ),
+    "ENDPOINT" : "/create/trigger/byrange" }
+_gpudb_schema_definitions[ "/create/type" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_type_request","fields":[{"name":"type_definition","type":"string"},{"name":"label","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_type_response","fields":[{"name":"type_id","type":"string"},{"name":"type_definition","type":"string"},{"name":"label","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("type_definition", "string"), ("label", "string"), ("properties", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("type_id", "string"), ("type_definition", "string"), ("label", "string"), ("properties", "map", [("array", [("string")])])] ),
+    "ENDPOINT" : "/create/type" }
+_gpudb_schema_definitions[ "/create/union" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_union_request","fields":[{"name":"table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"input_column_names","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"output_column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_union_response","fields":[{"name":"table_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("table_names", "array", [("string")]), ("input_column_names", "array", [("array", [("string")])]), ("output_column_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string")] ),
+    "ENDPOINT" : "/create/union" }
+_gpudb_schema_definitions[ "/create/user/external" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_user_external_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_user_external_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/create/user/external" }
+_gpudb_schema_definitions[ "/create/user/internal" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"create_user_internal_request","fields":[{"name":"name","type":"string"},{"name":"password","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"create_user_internal_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("password", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/create/user/internal" }
+_gpudb_schema_definitions[ "/delete/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"delete_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"delete_proc_response","fields":[{"name":"proc_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("proc_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("proc_name", "string")] ),
+    "ENDPOINT" : "/delete/proc" }
+_gpudb_schema_definitions[ "/delete/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"delete_records_request","fields":[{"name":"table_name","type":"string"},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"delete_records_response","fields":[{"name":"count_deleted","type":"long"},{"name":"counts_deleted","type":{"type":"array","items":"long"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count_deleted", "long"), ("counts_deleted", "array", [("long")])] ),
+    "ENDPOINT" : "/delete/records" }
+_gpudb_schema_definitions[ "/delete/role" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"delete_role_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"delete_role_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/delete/role" }
+_gpudb_schema_definitions[ "/delete/user" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"delete_user_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"delete_user_response","fields":[{"name":"name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string")] ),
+    "ENDPOINT" : "/delete/user" }
+_gpudb_schema_definitions[ "/execute/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"execute_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"params","type":{"type":"map","values":"string"}},{"name":"bin_params","type":{"type":"map","values":"bytes"}},{"name":"input_table_names","type":{"type":"array","items":"string"}},{"name":"input_column_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"output_table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"execute_proc_response","fields":[{"name":"run_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("proc_name", "string"), ("params", "map", [("string")]), ("bin_params", "map", [("bytes")]), ("input_table_names", "array", [("string")]), ("input_column_names", "map", [("array", [("string")])]), ("output_table_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("run_id", "string")] ),
+    "ENDPOINT" : "/execute/proc" }
+_gpudb_schema_definitions[ "/execute/sql" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"execute_sql_request","fields":[{"name":"Query","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"execute_sql_response","fields":[{"name":"query_execution_plan","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("Query", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("query_execution_plan", "string")] ),
+    "ENDPOINT" : "/execute/sql" }
+_gpudb_schema_definitions[ "/filter" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"expression","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("expression", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter" }
+_gpudb_schema_definitions[ "/filter/byarea" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_area_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_column_name","type":"string"},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_area_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("x_vector", "array", [("double")]), ("y_column_name", "string"), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byarea" }
+_gpudb_schema_definitions[ "/filter/byarea/geometry" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_area_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_area_geometry_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("x_vector", "array", [("double")]), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byarea/geometry" }
+_gpudb_schema_definitions[ "/filter/bybox" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_box_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"y_column_name","type":"string"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_box_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("y_column_name", "string"), ("min_y", "double"), ("max_y", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bybox" }
+_gpudb_schema_definitions[ "/filter/bybox/geometry" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_box_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_box_geometry_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bybox/geometry" }
+_gpudb_schema_definitions[ "/filter/bygeometry" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"input_wkt","type":"string"},{"name":"operation","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_geometry_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("input_wkt", "string"), ("operation", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bygeometry" }
+_gpudb_schema_definitions[ "/filter/bylist" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_list_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_values_map","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_list_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_values_map", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bylist" }
+_gpudb_schema_definitions[ "/filter/byradius" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_radius_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"x_center","type":"double"},{"name":"y_column_name","type":"string"},{"name":"y_center","type":"double"},{"name":"radius","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_radius_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("x_center", "double"), ("y_column_name", "string"), ("y_center", "double"), ("radius", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byradius" }
+_gpudb_schema_definitions[ "/filter/byradius/geometry" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_radius_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"x_center","type":"double"},{"name":"y_center","type":"double"},{"name":"radius","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_radius_geometry_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("x_center", "double"), ("y_center", "double"), ("radius", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byradius/geometry" }
+_gpudb_schema_definitions[ "/filter/byrange" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_range_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"lower_bound","type":"double"},{"name":"upper_bound","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_range_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("lower_bound", "double"), ("upper_bound", "double"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byrange" }
+_gpudb_schema_definitions[ "/filter/byseries" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"track_id","type":"string"},{"name":"target_track_ids","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_series_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("track_id", "string"), ("target_track_ids", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byseries" }
+_gpudb_schema_definitions[ "/filter/bystring" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_string_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"expression","type":"string"},{"name":"mode","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_string_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("expression", "string"), ("mode", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bystring" }
+_gpudb_schema_definitions[ "/filter/bytable" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_table_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"source_table_name","type":"string"},{"name":"source_table_column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_table_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("source_table_name", "string"), ("source_table_column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/bytable" }
+_gpudb_schema_definitions[ "/filter/byvalue" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"filter_by_value_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"is_string","type":"boolean"},{"name":"value","type":"double"},{"name":"value_str","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"filter_by_value_response","fields":[{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("view_name", "string"), ("is_string", "boolean"), ("value", "double"), ("value_str", "string"), ("column_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "long")] ),
+    "ENDPOINT" : "/filter/byvalue" }
+_gpudb_schema_definitions[ "/get/job" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"get_job_request","fields":[{"name":"job_id","type":"int"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"get_job_response","fields":[{"name":"endpoint","type":"string"},{"name":"job_status","type":"string"},{"name":"running","type":"boolean"},{"name":"progress","type":"int"},{"name":"successful","type":"boolean"},{"name":"response_encoding","type":"string"},{"name":"job_response","type":"bytes"},{"name":"job_response_str","type":"string"},{"name":"status_map","type":{"type":"map","values":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("job_id", "int"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("endpoint", "string"), ("job_status", "string"), ("running", "boolean"), ("progress", "int"), ("successful", "boolean"), ("response_encoding", "string"), ("job_response", "bytes"), ("job_response_str", "string"), ("status_map", "map", [("string")])] ),
+    "ENDPOINT" : "/get/job" }
+_gpudb_schema_definitions[ "/get/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"get_records_request","fields":[{"name":"table_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"get_records_response","fields":[{"name":"table_name","type":"string"},{"name":"type_name","type":"string"},{"name":"type_schema","type":"string"},{"name":"records_binary","type":{"type":"array","items":"bytes"}},{"name":"records_json","type":{"type":"array","items":"string"}},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("type_name", "string"), ("type_schema", "string"), ("records_binary", "array", [("bytes")]), ("records_json", "array", [("string")]), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("type_name", "string"), ("type_schema", "string"), ("records_binary", "object_array"), ("records_json", "array", [("string")]), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "ENDPOINT" : "/get/records" }
+_gpudb_schema_definitions[ "/get/records/bycolumn" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"get_records_by_column_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"get_records_by_column_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] ),
+    "ENDPOINT" : "/get/records/bycolumn" }
+_gpudb_schema_definitions[ "/get/records/byseries" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"get_records_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"world_table_name","type":"string"},{"name":"offset","type":"int"},{"name":"limit","type":"int"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"get_records_by_series_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"type_names","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"list_records_binary","type":{"type":"array","items":{"type":"array","items":"bytes"}}},{"name":"list_records_json","type":{"type":"array","items":{"type":"array","items":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("world_table_name", "string"), ("offset", "int"), ("limit", "int"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("type_names", "array", [("string")]), ("type_schemas", "array", [("string")]), ("list_records_binary", "array", [("array", [("bytes")])]), ("list_records_json", "array", [("array", [("string")])])] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_names", "array", [("string")]), ("type_names", "array", [("string")]), ("type_schemas", "array", [("string")]), ("list_records_binary", "array", [("object_array")]), ("list_records_json", "array", [("array", [("string")])])] ),
+    "ENDPOINT" : "/get/records/byseries" }
+_gpudb_schema_definitions[ "/get/records/fromcollection" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"get_records_from_collection_request","fields":[{"name":"table_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"get_records_from_collection_response","fields":[{"name":"table_name","type":"string"},{"name":"type_names","type":{"type":"array","items":"string"}},{"name":"records_binary","type":{"type":"array","items":"bytes"}},{"name":"records_json","type":{"type":"array","items":"string"}},{"name":"record_ids","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("type_names", "array", [("string")]), ("records_binary", "array", [("bytes")]), ("records_json", "array", [("string")]), ("record_ids", "array", [("string")])] ),
+    "RSP_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("type_names", "array", [("string")]), ("records_binary", "object_array"), ("records_json", "array", [("string")]), ("record_ids", "array", [("string")])] ),
+    "ENDPOINT" : "/get/records/fromcollection" }
+_gpudb_schema_definitions[ "/grant/permission/system" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"grant_permission_system_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"grant_permission_system_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string"), ("permission", "string")] ),
+    "ENDPOINT" : "/grant/permission/system" }
+_gpudb_schema_definitions[ "/grant/permission/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"grant_permission_table_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"filter_expression","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"grant_permission_table_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"filter_expression","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("filter_expression", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("filter_expression", "string")] ),
+    "ENDPOINT" : "/grant/permission/table" }
+_gpudb_schema_definitions[ "/grant/role" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"grant_role_request","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"grant_role_response","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("role", "string"), ("member", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("role", "string"), ("member", "string")] ),
+    "ENDPOINT" : "/grant/role" }
+_gpudb_schema_definitions[ "/has/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"has_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"has_proc_response","fields":[{"name":"proc_name","type":"string"},{"name":"proc_exists","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("proc_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("proc_name", "string"), ("proc_exists", "boolean")] ),
+    "ENDPOINT" : "/has/proc" }
+_gpudb_schema_definitions[ "/has/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"has_table_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"has_table_response","fields":[{"name":"table_name","type":"string"},{"name":"table_exists","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("table_exists", "boolean")] ),
+    "ENDPOINT" : "/has/table" }
+_gpudb_schema_definitions[ "/has/type" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"has_type_request","fields":[{"name":"type_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"has_type_response","fields":[{"name":"type_id","type":"string"},{"name":"type_exists","type":"boolean"}]}""",
+    "REQ_SCHEMA" : ( "record", [("type_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("type_id", "string"), ("type_exists", "boolean")] ),
+    "ENDPOINT" : "/has/type" }
+_gpudb_schema_definitions[ "/insert/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"insert_records_request","fields":[{"name":"table_name","type":"string"},{"name":"list","type":{"type":"array","items":"bytes"}},{"name":"list_str","type":{"type":"array","items":"string"}},{"name":"list_encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"insert_records_response","fields":[{"name":"record_ids","type":{"type":"array","items":"string"}},{"name":"count_inserted","type":"int"},{"name":"count_updated","type":"int"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("list", "array", [("bytes")]), ("list_str", "array", [("string")]), ("list_encoding", "string"), ("options", "map", [("string")])] ),
+    "REQ_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("list", "object_array"), ("list_str", "array", [("string")]), ("list_encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("record_ids", "array", [("string")]), ("count_inserted", "int"), ("count_updated", "int")] ),
+    "ENDPOINT" : "/insert/records" }
+_gpudb_schema_definitions[ "/insert/records/random" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"insert_records_random_request","fields":[{"name":"table_name","type":"string"},{"name":"count","type":"long"},{"name":"options","type":{"type":"map","values":{"type":"map","values":"double"}}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"insert_records_random_response","fields":[{"name":"table_name","type":"string"},{"name":"count","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("count", "long"), ("options", "map", [("map", [("double")])])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("count", "long")] ),
+    "ENDPOINT" : "/insert/records/random" }
+_gpudb_schema_definitions[ "/insert/symbol" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"insert_symbol_request","fields":[{"name":"symbol_id","type":"string"},{"name":"symbol_format","type":"string"},{"name":"symbol_data","type":"bytes"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"insert_symbol_response","fields":[{"name":"symbol_id","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("symbol_id", "string"), ("symbol_format", "string"), ("symbol_data", "bytes"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("symbol_id", "string")] ),
+    "ENDPOINT" : "/insert/symbol" }
+_gpudb_schema_definitions[ "/kill/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"kill_proc_request","fields":[{"name":"run_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"kill_proc_response","fields":[{"name":"run_ids","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("run_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("run_ids", "array", [("string")])] ),
+    "ENDPOINT" : "/kill/proc" }
+_gpudb_schema_definitions[ "/lock/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"lock_table_request","fields":[{"name":"table_name","type":"string"},{"name":"lock_type","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"lock_table_response","fields":[{"name":"lock_type","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("lock_type", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("lock_type", "string")] ),
+    "ENDPOINT" : "/lock/table" }
+_gpudb_schema_definitions[ "/merge/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"merge_records_request","fields":[{"name":"table_name","type":"string"},{"name":"source_table_names","type":{"type":"array","items":"string"}},{"name":"field_maps","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"merge_records_response","fields":[{"name":"table_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("source_table_names", "array", [("string")]), ("field_maps", "array", [("map", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string")] ),
+    "ENDPOINT" : "/merge/records" }
+_gpudb_schema_definitions[ "/replace/tom" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"admin_replace_tom_request","fields":[{"name":"old_rank_tom","type":"long"},{"name":"new_rank_tom","type":"long"}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"admin_replace_tom_response","fields":[{"name":"old_rank_tom","type":"long"},{"name":"new_rank_tom","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("old_rank_tom", "long"), ("new_rank_tom", "long")] ),
+    "RSP_SCHEMA" : ( "record", [("old_rank_tom", "long"), ("new_rank_tom", "long")] ),
+    "ENDPOINT" : "/replace/tom" }
+_gpudb_schema_definitions[ "/revoke/permission/system" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"revoke_permission_system_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"revoke_permission_system_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string"), ("permission", "string")] ),
+    "ENDPOINT" : "/revoke/permission/system" }
+_gpudb_schema_definitions[ "/revoke/permission/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"revoke_permission_table_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"revoke_permission_table_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("name", "string"), ("permission", "string"), ("table_name", "string")] ),
+    "ENDPOINT" : "/revoke/permission/table" }
+_gpudb_schema_definitions[ "/revoke/role" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"revoke_role_request","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"revoke_role_response","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"}]}""",
+    "REQ_SCHEMA" : ( "record", [("role", "string"), ("member", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("role", "string"), ("member", "string")] ),
+    "ENDPOINT" : "/revoke/role" }
+_gpudb_schema_definitions[ "/show/proc" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_proc_response","fields":[{"name":"proc_names","type":{"type":"array","items":"string"}},{"name":"execution_modes","type":{"type":"array","items":"string"}},{"name":"files","type":{"type":"array","items":{"type":"map","values":"bytes"}}},{"name":"commands","type":{"type":"array","items":"string"}},{"name":"args","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"array","items":{"type":"map","values":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("proc_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("proc_names", "array", [("string")]), ("execution_modes", "array", [("string")]), ("files", "array", [("map", [("bytes")])]), ("commands", "array", [("string")]), ("args", "array", [("array", [("string")])]), ("options", "array", [("map", [("string")])])] ),
+    "ENDPOINT" : "/show/proc" }
+_gpudb_schema_definitions[ "/show/proc/status" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_proc_status_request","fields":[{"name":"run_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_proc_status_response","fields":[{"name":"proc_names","type":{"type":"map","values":"string"}},{"name":"params","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"bin_params","type":{"type":"map","values":{"type":"map","values":"bytes"}}},{"name":"input_table_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"input_column_names","type":{"type":"map","values":{"type":"map","values":{"type":"array","items":"string"}}}},{"name":"output_table_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"overall_statuses","type":{"type":"map","values":"string"}},{"name":"statuses","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"messages","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"results","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"string"}}}},{"name":"bin_results","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"bytes"}}}},{"name":"timings","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"long"}}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("run_id", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("proc_names", "map", [("string")]), ("params", "map", [("map", [("string")])]), ("bin_params", "map", [("map", [("bytes")])]), ("input_table_names", "map", [("array", [("string")])]), ("input_column_names", "map", [("map", [("array", [("string")])])]), ("output_table_names", "map", [("array", [("string")])]), ("options", "map", [("map", [("string")])]), ("overall_statuses", "map", [("string")]), ("statuses", "map", [("map", [("string")])]), ("messages", "map", [("map", [("string")])]), ("results", "map", [("map", [("map", [("string")])])]), ("bin_results", "map", [("map", [("map", [("bytes")])])]), ("timings", "map", [("map", [("map", [("long")])])])] ),
+    "ENDPOINT" : "/show/proc/status" }
+_gpudb_schema_definitions[ "/show/security" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_security_request","fields":[{"name":"names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_security_response","fields":[{"name":"types","type":{"type":"map","values":"string"}},{"name":"roles","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"permissions","type":{"type":"map","values":{"type":"array","items":{"type":"map","values":"string"}}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("types", "map", [("string")]), ("roles", "map", [("array", [("string")])]), ("permissions", "map", [("array", [("map", [("string")])])])] ),
+    "ENDPOINT" : "/show/security" }
+_gpudb_schema_definitions[ "/show/statistics" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_statistics_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_statistics_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"stastistics_map","type":{"type":"array","items":{"type":"array","items":{"type":"map","values":"string"}}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("stastistics_map", "array", [("array", [("map", [("string")])])])] ),
+    "ENDPOINT" : "/show/statistics" }
+_gpudb_schema_definitions[ "/show/system/properties" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_system_properties_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_system_properties_response","fields":[{"name":"property_map","type":{"type":"map","values":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("property_map", "map", [("string")])] ),
+    "ENDPOINT" : "/show/system/properties" }
+_gpudb_schema_definitions[ "/show/system/status" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_system_status_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_system_status_response","fields":[{"name":"status_map","type":{"type":"map","values":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("status_map", "map", [("string")])] ),
+    "ENDPOINT" : "/show/system/status" }
+_gpudb_schema_definitions[ "/show/system/timing" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_system_timing_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_system_timing_response","fields":[{"name":"endpoints","type":{"type":"array","items":"string"}},{"name":"time_in_ms","type":{"type":"array","items":"float"}},{"name":"jobIds","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("endpoints", "array", [("string")]), ("time_in_ms", "array", [("float")]), ("jobIds", "array", [("string")])] ),
+    "ENDPOINT" : "/show/system/timing" }
+_gpudb_schema_definitions[ "/show/table" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_table_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_table_response","fields":[{"name":"table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"table_descriptions","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"type_ids","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"type_labels","type":{"type":"array","items":"string"}},{"name":"properties","type":{"type":"array","items":{"type":"map","values":{"type":"array","items":"string"}}}},{"name":"additional_info","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"sizes","type":{"type":"array","items":"long"}},{"name":"full_sizes","type":{"type":"array","items":"long"}},{"name":"join_sizes","type":{"type":"array","items":"double"}},{"name":"total_size","type":"long"},{"name":"total_full_size","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_name", "string"), ("table_names", "array", [("string")]), ("table_descriptions", "array", [("array", [("string")])]), ("type_ids", "array", [("string")]), ("type_schemas", "array", [("string")]), ("type_labels", "array", [("string")]), ("properties", "array", [("map", [("array", [("string")])])]), ("additional_info", "array", [("map", [("string")])]), ("sizes", "array", [("long")]), ("full_sizes", "array", [("long")]), ("join_sizes", "array", [("double")]), ("total_size", "long"), ("total_full_size", "long")] ),
+    "ENDPOINT" : "/show/table" }
+_gpudb_schema_definitions[ "/show/table/metadata" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_table_metadata_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_table_metadata_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_maps","type":{"type":"array","items":{"type":"map","values":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("metadata_maps", "array", [("map", [("string")])])] ),
+    "ENDPOINT" : "/show/table/metadata" }
+_gpudb_schema_definitions[ "/show/tables/bytype" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_tables_by_type_request","fields":[{"name":"type_id","type":"string"},{"name":"label","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_tables_by_type_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("type_id", "string"), ("label", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("table_names", "array", [("string")])] ),
+    "ENDPOINT" : "/show/tables/bytype" }
+_gpudb_schema_definitions[ "/show/triggers" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_triggers_request","fields":[{"name":"trigger_ids","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_triggers_response","fields":[{"name":"trigger_map","type":{"type":"map","values":{"type":"map","values":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("trigger_ids", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("trigger_map", "map", [("map", [("string")])])] ),
+    "ENDPOINT" : "/show/triggers" }
+_gpudb_schema_definitions[ "/show/types" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"show_types_request","fields":[{"name":"type_id","type":"string"},{"name":"label","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"show_types_response","fields":[{"name":"type_ids","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"labels","type":{"type":"array","items":"string"}},{"name":"properties","type":{"type":"array","items":{"type":"map","values":{"type":"array","items":"string"}}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("type_id", "string"), ("label", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("type_ids", "array", [("string")]), ("type_schemas", "array", [("string")]), ("labels", "array", [("string")]), ("properties", "array", [("map", [("array", [("string")])])])] ),
+    "ENDPOINT" : "/show/types" }
+_gpudb_schema_definitions[ "/update/records" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"update_records_request","fields":[{"name":"table_name","type":"string"},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"new_values_maps","type":{"type":"array","items":{"type":"map","values":["string","null"]}}},{"name":"records_to_insert","type":{"type":"array","items":"bytes"}},{"name":"records_to_insert_str","type":{"type":"array","items":"string"}},{"name":"record_encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"update_records_response","fields":[{"name":"count_updated","type":"long"},{"name":"counts_updated","type":{"type":"array","items":"long"}},{"name":"count_inserted","type":"long"},{"name":"counts_inserted","type":{"type":"array","items":"long"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("new_values_maps", "array", [("map", [("nullable", [("string")])])]), ("records_to_insert", "array", [("bytes")]), ("records_to_insert_str", "array", [("string")]), ("record_encoding", "string"), ("options", "map", [("string")])] ),
+    "REQ_SCHEMA_CEXT" : ( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("new_values_maps", "array", [("map", [("nullable", [("string")])])]), ("records_to_insert", "object_array"), ("records_to_insert_str", "array", [("string")]), ("record_encoding", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count_updated", "long"), ("counts_updated", "array", [("long")]), ("count_inserted", "long"), ("counts_inserted", "array", [("long")])] ),
+    "ENDPOINT" : "/update/records" }
+_gpudb_schema_definitions[ "/update/records/byseries" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"update_records_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"world_table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"reserved","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"update_records_by_series_response","fields":[{"name":"count","type":"int"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("world_table_name", "string"), ("view_name", "string"), ("reserved", "array", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("count", "int")] ),
+    "ENDPOINT" : "/update/records/byseries" }
+_gpudb_schema_definitions[ "/visualize/image" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("track_ids", "array", [("array", [("string")])]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] ),
+    "ENDPOINT" : "/visualize/image" }
+_gpudb_schema_definitions[ "/visualize/image/chart" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_chart_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_names","type":{"type":"array","items":"string"}},{"name":"y_column_names","type":{"type":"array","items":"string"}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"string"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_chart_response","fields":[{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"string"},{"name":"image_data","type":"bytes"},{"name":"axes_info","type":{"type":"map","values":{"type":"array","items":"string"}}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("x_column_names", "array", [("string")]), ("y_column_names", "array", [("string")]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("bg_color", "string"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("bg_color", "string"), ("image_data", "bytes"), ("axes_info", "map", [("array", [("string")])])] ),
+    "ENDPOINT" : "/visualize/image/chart" }
+_gpudb_schema_definitions[ "/visualize/image/classbreak" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_classbreak_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"cb_attr","type":"string"},{"name":"cb_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointcolor_attr","type":"string"},{"name":"cb_pointcolor_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointsize_attr","type":"string"},{"name":"cb_pointsize_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointshape_attr","type":"string"},{"name":"cb_pointshape_vals","type":{"type":"array","items":"string"}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_classbreak_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("track_ids", "array", [("array", [("string")])]), ("cb_attr", "string"), ("cb_vals", "array", [("string")]), ("cb_pointcolor_attr", "string"), ("cb_pointcolor_vals", "array", [("string")]), ("cb_pointsize_attr", "string"), ("cb_pointsize_vals", "array", [("string")]), ("cb_pointshape_attr", "string"), ("cb_pointshape_vals", "array", [("string")]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] ),
+    "ENDPOINT" : "/visualize/image/classbreak" }
+_gpudb_schema_definitions[ "/visualize/image/contour" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_contour_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_contour_response","fields":[{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"},{"name":"grid_data","type":"bytes"},{"name":"fill_n0","type":"double"},{"name":"fill_nn","type":"double"},{"name":"min_level","type":"double"},{"name":"max_level","type":"double"},{"name":"samples_used","type":"long"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("value_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "int"), ("height", "int"), ("bg_color", "long"), ("image_data", "bytes"), ("grid_data", "bytes"), ("fill_n0", "double"), ("fill_nn", "double"), ("min_level", "double"), ("max_level", "double"), ("samples_used", "long")] ),
+    "ENDPOINT" : "/visualize/image/contour" }
+_gpudb_schema_definitions[ "/visualize/image/heatmap" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_heatmap_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_heatmap_response","fields":[{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("value_column_name", "string"), ("geometry_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "int"), ("height", "int"), ("bg_color", "long"), ("image_data", "bytes")] ),
+    "ENDPOINT" : "/visualize/image/heatmap" }
+_gpudb_schema_definitions[ "/visualize/image/labels" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_image_labels_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"x_offset","type":"string"},{"name":"y_offset","type":"string"},{"name":"text_string","type":"string"},{"name":"font","type":"string"},{"name":"text_color","type":"string"},{"name":"text_angle","type":"string"},{"name":"text_scale","type":"string"},{"name":"draw_box","type":"string"},{"name":"draw_leader","type":"string"},{"name":"line_width","type":"string"},{"name":"line_color","type":"string"},{"name":"fill_color","type":"string"},{"name":"leader_x_column_name","type":"string"},{"name":"leader_y_column_name","type":"string"},{"name":"filter","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_image_labels_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_name", "string"), ("x_column_name", "string"), ("y_column_name", "string"), ("x_offset", "string"), ("y_offset", "string"), ("text_string", "string"), ("font", "string"), ("text_color", "string"), ("text_angle", "string"), ("text_scale", "string"), ("draw_box", "string"), ("draw_leader", "string"), ("line_width", "string"), ("line_color", "string"), ("fill_color", "string"), ("leader_x_column_name", "string"), ("leader_y_column_name", "string"), ("filter", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] ),
+    "ENDPOINT" : "/visualize/image/labels" }
+_gpudb_schema_definitions[ "/visualize/video" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_video_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"time_intervals","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"video_style","type":"string"},{"name":"session_key","type":"string"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_video_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"num_frames","type":"int"},{"name":"session_key","type":"string"},{"name":"data","type":{"type":"array","items":"bytes"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("track_ids", "array", [("array", [("string")])]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("time_intervals", "array", [("array", [("double")])]), ("video_style", "string"), ("session_key", "string"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("num_frames", "int"), ("session_key", "string"), ("data", "array", [("bytes")])] ),
+    "ENDPOINT" : "/visualize/video" }
+_gpudb_schema_definitions[ "/visualize/video/heatmap" ] = {
+    "REQ_SCHEMA_STR" : """{"type":"record","name":"visualize_video_heatmap_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"time_intervals","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"video_style","type":"string"},{"name":"session_key","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}""",
+    "RSP_SCHEMA_STR" : """{"type":"record","name":"visualize_video_heatmap_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"num_frames","type":"int"},{"name":"session_key","type":"string"},{"name":"data","type":{"type":"array","items":"bytes"}}]}""",
+    "REQ_SCHEMA" : ( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("time_intervals", "array", [("array", [("double")])]), ("width", "int"), ("height", "int"), ("projection", "string"), ("video_style", "string"), ("session_key", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] ),
+    "RSP_SCHEMA" : ( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("num_frames", "int"), ("session_key", "string"), ("data", "array", [("bytes")])] ),
+    "ENDPOINT" : "/visualize/video/heatmap" }
+
+_gpudb_schema_registry = _GPUdbSchemaRegistry( _gpudb_schema_definitions )
+
+
+# Mapping of endpoint method names to endpoints
+_gpudb_func_to_endpoint_map = {}
+_gpudb_func_to_endpoint_map["admin_add_ranks"] = "/admin/add/ranks"
+_gpudb_func_to_endpoint_map["admin_alter_configuration"] = "/admin/alter/configuration"
+_gpudb_func_to_endpoint_map["admin_alter_jobs"] = "/admin/alter/jobs"
+_gpudb_func_to_endpoint_map["admin_alter_shards"] = "/admin/alter/shards"
+_gpudb_func_to_endpoint_map["admin_offline"] = "/admin/offline"
+_gpudb_func_to_endpoint_map["admin_rebalance"] = "/admin/rebalance"
+_gpudb_func_to_endpoint_map["admin_remove_ranks"] = "/admin/remove/ranks"
+_gpudb_func_to_endpoint_map["admin_show_alerts"] = "/admin/show/alerts"
+_gpudb_func_to_endpoint_map["admin_show_configuration"] = "/admin/show/configuration"
+_gpudb_func_to_endpoint_map["admin_show_jobs"] = "/admin/show/jobs"
+_gpudb_func_to_endpoint_map["admin_show_shards"] = "/admin/show/shards"
+_gpudb_func_to_endpoint_map["admin_shutdown"] = "/admin/shutdown"
+_gpudb_func_to_endpoint_map["admin_verify_db"] = "/admin/verifydb"
+_gpudb_func_to_endpoint_map["aggregate_convex_hull"] = "/aggregate/convexhull"
+_gpudb_func_to_endpoint_map["aggregate_group_by"] = "/aggregate/groupby"
+_gpudb_func_to_endpoint_map["aggregate_histogram"] = "/aggregate/histogram"
+_gpudb_func_to_endpoint_map["aggregate_k_means"] = "/aggregate/kmeans"
+_gpudb_func_to_endpoint_map["aggregate_min_max"] = "/aggregate/minmax"
+_gpudb_func_to_endpoint_map["aggregate_min_max_geometry"] = "/aggregate/minmax/geometry"
+_gpudb_func_to_endpoint_map["aggregate_statistics"] = "/aggregate/statistics"
+_gpudb_func_to_endpoint_map["aggregate_statistics_by_range"] = "/aggregate/statistics/byrange"
+_gpudb_func_to_endpoint_map["aggregate_unique"] = "/aggregate/unique"
+_gpudb_func_to_endpoint_map["aggregate_unpivot"] = "/aggregate/unpivot"
+_gpudb_func_to_endpoint_map["alter_system_properties"] = "/alter/system/properties"
+_gpudb_func_to_endpoint_map["alter_table"] = "/alter/table"
+_gpudb_func_to_endpoint_map["alter_table_metadata"] = "/alter/table/metadata"
+_gpudb_func_to_endpoint_map["alter_user"] = "/alter/user"
+_gpudb_func_to_endpoint_map["append_records"] = "/append/records"
+_gpudb_func_to_endpoint_map["clear_statistics"] = "/clear/statistics"
+_gpudb_func_to_endpoint_map["clear_table"] = "/clear/table"
+_gpudb_func_to_endpoint_map["clear_table_monitor"] = "/clear/tablemonitor"
+_gpudb_func_to_endpoint_map["clear_trigger"] = "/clear/trigger"
+_gpudb_func_to_endpoint_map["collect_statistics"] = "/collect/statistics"
+_gpudb_func_to_endpoint_map["create_job"] = "/create/job"
+_gpudb_func_to_endpoint_map["create_join_table"] = "/create/jointable"
+_gpudb_func_to_endpoint_map["create_materialized_view"] = "/create/materializedview"
+_gpudb_func_to_endpoint_map["create_proc"] = "/create/proc"
+_gpudb_func_to_endpoint_map["create_projection"] = "/create/projection"
+_gpudb_func_to_endpoint_map["create_role"] = "/create/role"
+_gpudb_func_to_endpoint_map["create_table"] = "/create/table"
+_gpudb_func_to_endpoint_map["create_table_monitor"] = "/create/tablemonitor"
+_gpudb_func_to_endpoint_map["create_trigger_by_area"] = "/create/trigger/byarea"
+_gpudb_func_to_endpoint_map["create_trigger_by_range"] = "/create/trigger/byrange"
+_gpudb_func_to_endpoint_map["create_type"] = "/create/type"
+_gpudb_func_to_endpoint_map["create_union"] = "/create/union"
+_gpudb_func_to_endpoint_map["create_user_external"] = "/create/user/external"
+_gpudb_func_to_endpoint_map["create_user_internal"] = "/create/user/internal"
+_gpudb_func_to_endpoint_map["delete_proc"] = "/delete/proc"
+_gpudb_func_to_endpoint_map["delete_records"] = "/delete/records"
+_gpudb_func_to_endpoint_map["delete_role"] = "/delete/role"
+_gpudb_func_to_endpoint_map["delete_user"] = "/delete/user"
+_gpudb_func_to_endpoint_map["execute_proc"] = "/execute/proc"
+_gpudb_func_to_endpoint_map["execute_sql"] = "/execute/sql"
+_gpudb_func_to_endpoint_map["filter"] = "/filter"
+_gpudb_func_to_endpoint_map["filter_by_area"] = "/filter/byarea"
+_gpudb_func_to_endpoint_map["filter_by_area_geometry"] = "/filter/byarea/geometry"
+_gpudb_func_to_endpoint_map["filter_by_box"] = "/filter/bybox"
+_gpudb_func_to_endpoint_map["filter_by_box_geometry"] = "/filter/bybox/geometry"
+_gpudb_func_to_endpoint_map["filter_by_geometry"] = "/filter/bygeometry"
+_gpudb_func_to_endpoint_map["filter_by_list"] = "/filter/bylist"
+_gpudb_func_to_endpoint_map["filter_by_radius"] = "/filter/byradius"
+_gpudb_func_to_endpoint_map["filter_by_radius_geometry"] = "/filter/byradius/geometry"
+_gpudb_func_to_endpoint_map["filter_by_range"] = "/filter/byrange"
+_gpudb_func_to_endpoint_map["filter_by_series"] = "/filter/byseries"
+_gpudb_func_to_endpoint_map["filter_by_string"] = "/filter/bystring"
+_gpudb_func_to_endpoint_map["filter_by_table"] = "/filter/bytable"
+_gpudb_func_to_endpoint_map["filter_by_value"] = "/filter/byvalue"
+_gpudb_func_to_endpoint_map["get_job"] = "/get/job"
+_gpudb_func_to_endpoint_map["get_records"] = "/get/records"
+_gpudb_func_to_endpoint_map["get_records_by_column"] = "/get/records/bycolumn"
+_gpudb_func_to_endpoint_map["get_records_by_series"] = "/get/records/byseries"
+_gpudb_func_to_endpoint_map["get_records_from_collection"] = "/get/records/fromcollection"
+_gpudb_func_to_endpoint_map["grant_permission_system"] = "/grant/permission/system"
+_gpudb_func_to_endpoint_map["grant_permission_table"] = "/grant/permission/table"
+_gpudb_func_to_endpoint_map["grant_role"] = "/grant/role"
+_gpudb_func_to_endpoint_map["has_proc"] = "/has/proc"
+_gpudb_func_to_endpoint_map["has_table"] = "/has/table"
+_gpudb_func_to_endpoint_map["has_type"] = "/has/type"
+_gpudb_func_to_endpoint_map["insert_records"] = "/insert/records"
+_gpudb_func_to_endpoint_map["insert_records_random"] = "/insert/records/random"
+_gpudb_func_to_endpoint_map["insert_symbol"] = "/insert/symbol"
+_gpudb_func_to_endpoint_map["kill_proc"] = "/kill/proc"
+_gpudb_func_to_endpoint_map["lock_table"] = "/lock/table"
+_gpudb_func_to_endpoint_map["merge_records"] = "/merge/records"
+_gpudb_func_to_endpoint_map["admin_replace_tom"] = "/replace/tom"
+_gpudb_func_to_endpoint_map["revoke_permission_system"] = "/revoke/permission/system"
+_gpudb_func_to_endpoint_map["revoke_permission_table"] = "/revoke/permission/table"
+_gpudb_func_to_endpoint_map["revoke_role"] = "/revoke/role"
+_gpudb_func_to_endpoint_map["show_proc"] = "/show/proc"
+_gpudb_func_to_endpoint_map["show_proc_status"] = "/show/proc/status"
+_gpudb_func_to_endpoint_map["show_security"] = "/show/security"
+_gpudb_func_to_endpoint_map["show_statistics"] = "/show/statistics"
+_gpudb_func_to_endpoint_map["show_system_properties"] = "/show/system/properties"
+_gpudb_func_to_endpoint_map["show_system_status"] = "/show/system/status"
+_gpudb_func_to_endpoint_map["show_system_timing"] = "/show/system/timing"
+_gpudb_func_to_endpoint_map["show_table"] = "/show/table"
+_gpudb_func_to_endpoint_map["show_table_metadata"] = "/show/table/metadata"
+_gpudb_func_to_endpoint_map["show_tables_by_type"] = "/show/tables/bytype"
+_gpudb_func_to_endpoint_map["show_triggers"] = "/show/triggers"
+_gpudb_func_to_endpoint_map["show_types"] = "/show/types"
+_gpudb_func_to_endpoint_map["update_records"] = "/update/records"
+_gpudb_func_to_endpoint_map["update_records_by_series"] = "/update/records/byseries"
+_gpudb_func_to_endpoint_map["visualize_image"] = "/visualize/image"
+_gpudb_func_to_endpoint_map["visualize_image_chart"] = "/visualize/image/chart"
+_gpudb_func_to_endpoint_map["visualize_image_classbreak"] = "/visualize/image/classbreak"
+_gpudb_func_to_endpoint_map["visualize_image_contour"] = "/visualize/image/contour"
+_gpudb_func_to_endpoint_map["visualize_image_heatmap"] = "/visualize/image/heatmap"
+_gpudb_func_to_endpoint_map["visualize_image_labels"] = "/visualize/image/labels"
+_gpudb_func_to_endpoint_map["visualize_video"] = "/visualize/video"
+_gpudb_func_to_endpoint_map["visualize_video_heatmap"] = "/visualize/video/heatmap"
+
+
+
+# ---------------------------------------------------------------------------
+# GPUdbJob - Handle to an endpoint call made as an asynchronous job
+# ---------------------------------------------------------------------------
+class GPUdbJob(object):
+    """A handle to an endpoint call made asynchronously through /create/job
+    (see :meth:`GPUdb.submit_job`).  The status of the job is polled with
+    /get/job in the background, by a single thread shared by all the jobs of
+    the same :class:`GPUdb` client; the first poll happens a few milliseconds
+    after submission, and the interval between polls grows from there.
+    """
+    def __init__( self, db, job_id, endpoint, poll ):
+        """Create the handle of a submitted job.
+
+        Parameters:
+            db (GPUdb)
+                The client through which the job was submitted.
+            job_id (long)
+                The ID of the job.
+            endpoint (str)
+                The endpoint invoked by the job, e.g. "/alter/table".
+            poll (callable)
+                Function checking on the job; returns the decoded endpoint
+                response once the job has completed, None while it is still
+                running, and raises an exception if it failed.
+        """
+        self.job_id   = job_id
+        self.endpoint = endpoint
+
+        self._db         = db
+        self._poll       = poll
+        self._done_event = threading.Event()
+        self._lock       = threading.Lock()
+        self._callbacks  = []
+        self._response   = None
+        self._exception  = None
+    # end __init__
+
+
+    def done( self ):
+        """Return whether the job has completed, failed or been cancelled."""
+        return self._done_event.is_set()
+    # end done
+
+
+    def result( self, timeout = None ):
+        """Wait for the job to complete and return the endpoint response.
+
+        Parameters:
+            timeout (float)
+                The maximum number of seconds to wait; waits indefinitely if
+                not given.
+
+        Returns:
+            The decoded response of the endpoint invoked by the job.
+
+        @throws GPUdbException if the job failed or was cancelled, or is not
+                done within the timeout.
+        """
+        exception = self.exception( timeout )
+        if exception is not None:
+            raise exception
+
+        return self._response
+    # end result
+
+
+    def exception( self, timeout = None ):
+        """Wait for the job to be done and return the error, if any; None
+        otherwise.
+
+        @throws GPUdbException if the job is not done within the timeout.
+        """
+        if not self._done_event.wait( timeout ):
+            raise GPUdbException( "Timed out waiting for job {} ({})"
+                                  "".format( self.job_id, self.endpoint ) )
+
+        return self._exception
+    # end exception
+
+
+    def cancel( self ):
+        """Ask the server to cancel the job (with /admin/alter/jobs).  The
+        job is done once the server has cancelled it; :meth:`result` then
+        raises an exception.
+
+        Returns:
+            True if the server accepted the request, False if it did not or
+            the job is already done.
+        """
+        if self.done():
+            return False
+
+        response = self._db.admin_alter_jobs( job_ids = [ self.job_id ],
+                                              action = "cancel" )
+        return _Util.is_ok( response )
+    # end cancel
+
+
+    def add_done_callback( self, callback ):
+        """Register a callback that is called with this job once it is done
+        (right away if it already is).  Callbacks run on the poller thread
+        and must not wait on other jobs of the same client.
+        """
+        with self._lock:
+            if not self._done_event.is_set():
+                self._callbacks.append( callback )
+                return
+
+        callback( self )
+    # end add_done_callback
+
+
+    def _set_result( self, response ):
+        """Mark the job as completed."""
+        self._response = response
+        self.__finish()
+    # end _set_result
+
+
+    def _set_exception( self, exception ):
+        """Mark the job as failed."""
+        self._exception = exception
+        self.__finish()
+    # end _set_exception
+
+
+    def __finish( self ):
+        """Wake up any waiters and run the callbacks."""
+        with self._lock:
+            self._done_event.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+
+        for callback in callbacks:
+            try:
+                callback( self )
+            except Exception:
+                pass # a failing callback must not stop the poller
+        # end loop
+    # end __finish
+
+# end class GPUdbJob
+
+
+
+# ---------------------------------------------------------------------------
+# _GPUdbJobPoller - Private poller of the asynchronous jobs of a client
+# ---------------------------------------------------------------------------
+class _GPUdbJobPoller(object):
+    """Internal poller that waits on any number of asynchronous jobs on a
+    single background thread.  Each job is first polled shortly after it is
+    added; every time it is found still running, the interval until its next
+    poll doubles, up to a maximum.  The thread exits when there are no jobs
+    left, and is started again for the next job.
+    """
+    # Seconds until the first poll of a job
+    _MIN_POLL_INTERVAL = 0.01
+
+    # Factor by which the poll interval grows
+    _POLL_BACKOFF = 2
+
+    def __init__( self, max_poll_interval = 5 ):
+        self.max_poll_interval = max_poll_interval
+
+        # Heap of the pending jobs, by the time of their next poll (with a
+        # sequence number breaking ties), along with their poll interval
+        self._jobs     = []
+        self._sequence = 0
+        self._cond     = threading.Condition()
+        self._thread   = None
+    # end __init__
+
+
+    def add( self, job ):
+        """Start polling the given job."""
+        with self._cond:
+            self.__schedule( job, self._MIN_POLL_INTERVAL )
+
+            if self._thread is None:
+                self._thread = threading.Thread( target = self.__poll_jobs,
+                                                 name = "GPUdbJobPoller" )
+                self._thread.daemon = True
+                self._thread.start()
+
+            self._cond.notify()
+    # end add
+
+
+    def __schedule( self, job, interval ):
+        """Schedule the next poll of the job; must be called while holding
+        the condition's lock.
+        """
+        self._sequence += 1
+        heapq.heappush( self._jobs, ( time.time() + interval, self._sequence,
+                                      interval, job ) )
+    # end __schedule
+
+
+    def __poll_jobs( self ):
+        """Poll the jobs as they come due, until there are none left (run on
+        the poller thread).
+        """
+        while True:
+            with self._cond:
+                # Wait for the earliest poll to come due
+                while True:
+                    if not self._jobs:
+                        self._thread = None
+                        return
+
+                    wait_time = self._jobs[ 0 ][ 0 ] - time.time()
+                    if (wait_time <= 0):
+                        break
+
+                    self._cond.wait( wait_time )
+                # end while
+
+                now = time.time()
+                due_jobs = []
+                while ( self._jobs and (self._jobs[ 0 ][ 0 ] <= now) ):
+                    ( poll_time, sequence, interval, job ) = heapq.heappop( self._jobs )
+                    due_jobs.append( (interval, job) )
+            # end with
+
+            for ( interval, job ) in due_jobs:
+                try:
+                    response = job._poll()
+                except Exception as ex:
+                    job._set_exception( ex )
+                    continue
+
+                if response is not None:
+                    job._set_result( response )
+                    continue
+
+                # Still running; check again later
+                with self._cond:
+                    self.__schedule( job, min( interval * self._POLL_BACKOFF,
+                                               self.max_poll_interval ) )
+            # end loop
+        # end while
+    # end __poll_jobs
+
+# end class _GPUdbJobPoller
+
+
+
+class _HedgeScheduler(object):
+    """Internal scheduler of the hedged requests of any number of reads.
+    Each hedge is handed to a small thread pool when its delay expires, from
+    a single background thread; the thread exits when there are no hedges
+    left to start, and is started again for the next one.
+    """
+    # Maximum number of hedged requests in flight at once
+    _MAX_HEDGES = 4
+
+    def __init__( self ):
+        # Heap of the pending hedges, by the time they are due (with a
+        # sequence number breaking ties)
+        self._hedges   = []
+        self._sequence = 0
+        self._cond     = threading.Condition()
+        self._thread   = None
+        self._pool     = None
+    # end __init__
+
+
+    def add( self, delay, claim, hedge ):
+        """Call *hedge* on the thread pool after *delay* seconds, if *claim*
+        (called on the scheduler thread) then returns True."""
+        with self._cond:
+            self._sequence += 1
+            heapq.heappush( self._hedges, ( time.time() + delay, self._sequence,
+                                            claim, hedge ) )
 
+            if self._thread is None:
+                self._thread = threading.Thread( target = self.__start_hedges,
+                                                 name = "GPUdbHedgeScheduler" )
+                self._thread.daemon = True
+                self._thread.start()
 
-    def __eq__( self, other ):
-        if isinstance(other, self.__class__):
-            return self.__dict__ == other.__dict__
-        else:
-            return False
-    # end __eq__
+            self._cond.notify()
+    # end add
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
-    # end __ne__
 
+    def close( self ):
+        """Drop the pending hedges and stop the thread pool, waiting for the
+        hedges in flight to finish (each being bounded by the socket
+        timeout).
+        """
+        with self._cond:
+            pool = self._pool
+            self._pool = None
+            self._hedges = []
+            self._cond.notify()
 
-# end class GPUdbRecord
+        if pool is not None:
+            pool.close()
+            pool.join()
+    # end close
+
+
+    def __start_hedges( self ):
+        """Start the hedges as they come due, until there are none left (run
+        on the scheduler thread).
+        """
+        while True:
+            with self._cond:
+                # Wait for the earliest hedge to come due
+                while True:
+                    if not self._hedges:
+                        self._thread = None
+                        return
+
+                    wait_time = self._hedges[ 0 ][ 0 ] - time.time()
+                    if (wait_time <= 0):
+                        break
 
+                    self._cond.wait( wait_time )
+                # end while
 
+                ( due_time, sequence, claim, hedge ) = heapq.heappop( self._hedges )
+            # end with
 
+            # The read may well be done by now
+            if not claim():
+                continue
 
+            with self._cond:
+                if self._pool is None:
+                    self._pool = ThreadPool( self._MAX_HEDGES )
+                self._pool.apply_async( hedge )
+            # end with
+        # end while
+    # end __start_hedges
 
+# end class _HedgeScheduler
 
 
 
@@ -2086,6 +4302,13 @@ class GPUdb(object):
                   encoding = "BINARY", connection = 'HTTP',
                   username = "", password = "", timeout = None,
                   no_init_db_contact = False,
+                  max_connections_per_host = 10,
+                  connection_idle_timeout = 60,
+                  decode_threads = 1,
+                  health_check_interval = None,
+                  hedge_percentile = None,
+                  retry_policy = None,
+                  insert_chunk_size = None,
                   **kwargs ):
         """
         Construct a new GPUdb client instance.
@@ -2133,6 +4356,61 @@ class GPUdb(object):
                 If True, the constructor won't communicate with the database
                 server (e.g. for checking version compatibility).  Default
                 is False.
+
+            max_connections_per_host (int)
+                Maximum number of HTTP connections, busy or idle, open to each
+                host (and to each host manager) at once; idle ones are kept
+                alive for reuse.  Requests made while all of them are busy
+                wait for one to be free, up to *timeout*.  Default is 10.
+
+            connection_idle_timeout (float)
+                Number of seconds a pooled connection may stay idle before it
+                is closed.  None means idle connections are never evicted.
+                Default is 60.
+
+            decode_threads (int)
+                Number of threads used to decode large binary responses of
+                :meth:`.get_records_and_decode`.  The records are split into
+                chunks that are decoded in parallel.  Can be overridden per
+                call.  Default is 1 (decode on the calling thread).
+
+            health_check_interval (float)
+                Number of seconds between the background health checks of the
+                hosts, when more than one host is given.  Read-only requests
+                go to the fastest healthy host, and hosts that keep failing
+                are skipped for a while.  None or 0 disables the health
+                checks (hosts are then only tracked by the outcome of
+                regular requests).  Default is None.
+
+            hedge_percentile (float)
+                If given, a read-only request that gets no response within
+                this percentile of the recent latencies of its endpoint is
+                also sent to a second host (from a small background thread
+                pool), and whichever response comes first is used; the other
+                request is cancelled.  For example, 95 hedges about the
+                slowest 5% of the reads.  Only used when more than one host
+                is given.  Default is None (no hedging).
+
+            retry_policy (GPUdbRetryPolicy)
+                How requests that fail due to connection errors are retried,
+                and the deadline for each request.  Can be overridden for
+                the calls made within a block with
+                :meth:`.using_retry_policy`.  Default is None (every host is
+                tried once, with no deadline).
+
+            insert_chunk_size (int)
+                If given, :meth:`.insert_records` requests are encoded about
+                this many bytes at a time and streamed to the server with
+                chunked transfer encoding, so that large batches are never
+                encoded into memory as a whole.  Only the encoded request is
+                bounded so: records given already encoded (as bytes or JSON
+                strings) are held in memory in full regardless, the
+                streaming merely saving the copy made by concatenating them.
+                The server must support chunked transfer encoding of
+                request bodies, hence streaming being opt-in.  Streamed
+                requests are not compressed with snappy, and are not used
+                with the "JSON" encoding.  Default is None (requests are
+                sent in one piece).
         """
         # Call the internal function to initialize the object
         self.__construct( host = host, port = port,
@@ -2141,6 +4419,13 @@ class GPUdb(object):
                           username = username, password = password,
                           timeout = timeout,
                           no_init_db_contact = no_init_db_contact,
+                          max_connections_per_host = max_connections_per_host,
+                          connection_idle_timeout = connection_idle_timeout,
+                          decode_threads = decode_threads,
+                          health_check_interval = health_check_interval,
+                          hedge_percentile = hedge_percentile,
+                          retry_policy = retry_policy,
+                          insert_chunk_size = insert_chunk_size,
                           **kwargs )
     # end __init__
 
@@ -2150,6 +4435,13 @@ class GPUdb(object):
                        encoding = "BINARY", connection = 'HTTP',
                        username = "", password = "", timeout = None,
                        no_init_db_contact = False,
+                       max_connections_per_host = 10,
+                       connection_idle_timeout = 60,
+                       decode_threads = 1,
+                       health_check_interval = None,
+                       hedge_percentile = None,
+                       retry_policy = None,
+                       insert_chunk_size = None,
                        **kwargs ):
         """
         Construct a new GPUdb client instance.
@@ -2197,6 +4489,61 @@ class GPUdb(object):
                 If True, the constructor won't communicate with the database
                 server (e.g. for checking version compatibility).  Default
                 is False.
+
+            max_connections_per_host (int)
+                Maximum number of HTTP connections, busy or idle, open to each
+                host (and to each host manager) at once; idle ones are kept
+                alive for reuse.  Requests made while all of them are busy
+                wait for one to be free, up to *timeout*.  Default is 10.
+
+            connection_idle_timeout (float)
+                Number of seconds a pooled connection may stay idle before it
+                is closed.  None means idle connections are never evicted.
+                Default is 60.
+
+            decode_threads (int)
+                Number of threads used to decode large binary responses of
+                :meth:`.get_records_and_decode`.  The records are split into
+                chunks that are decoded in parallel.  Can be overridden per
+                call.  Default is 1 (decode on the calling thread).
+
+            health_check_interval (float)
+                Number of seconds between the background health checks of the
+                hosts, when more than one host is given.  Read-only requests
+                go to the fastest healthy host, and hosts that keep failing
+                are skipped for a while.  None or 0 disables the health
+                checks (hosts are then only tracked by the outcome of
+                regular requests).  Default is None.
+
+            hedge_percentile (float)
+                If given, a read-only request that gets no response within
+                this percentile of the recent latencies of its endpoint is
+                also sent to a second host (from a small background thread
+                pool), and whichever response comes first is used; the other
+                request is cancelled.  For example, 95 hedges about the
+                slowest 5% of the reads.  Only used when more than one host
+                is given.  Default is None (no hedging).
+
+            retry_policy (GPUdbRetryPolicy)
+                How requests that fail due to connection errors are retried,
+                and the deadline for each request.  Can be overridden for
+                the calls made within a block with
+                :meth:`.using_retry_policy`.  Default is None (every host is
+                tried once, with no deadline).
+
+            insert_chunk_size (int)
+                If given, :meth:`.insert_records` requests are encoded about
+                this many bytes at a time and streamed to the server with
+                chunked transfer encoding, so that large batches are never
+                encoded into memory as a whole.  Only the encoded request is
+                bounded so: records given already encoded (as bytes or JSON
+                strings) are held in memory in full regardless, the
+                streaming merely saving the copy made by concatenating them.
+                The server must support chunked transfer encoding of
+                request bodies, hence streaming being opt-in.  Streamed
+                requests are not compressed with snappy, and are not used
+                with the "JSON" encoding.  Default is None (requests are
+                sent in one piece).
         """
         if type(host) is list:
             if not type(port) is list:
@@ -2233,6 +4580,70 @@ class GPUdb(object):
         self.password   = password
         self.timeout    = timeout
 
+        if ( not isinstance( max_connections_per_host, (int, long) )
+             or (max_connections_per_host < 1) ):
+            raise GPUdbException( "Expected a positive integer for 'max_connections_per_host', "
+                                  "got: '" + str(max_connections_per_host) + "'" )
+        self.max_connections_per_host = max_connections_per_host
+        self.connection_idle_timeout  = connection_idle_timeout
+
+        if ( not isinstance( decode_threads, (int, long) )
+             or (decode_threads < 1) ):
+            raise GPUdbException( "Expected a positive integer for 'decode_threads', "
+                                  "got: '" + str(decode_threads) + "'" )
+        self.decode_threads = decode_threads
+
+        if ( (health_check_interval is not None)
+             and ( not isinstance( health_check_interval, (int, long, float) )
+                   or (health_check_interval < 0) ) ):
+            raise GPUdbException( "Expected a non-negative number or None for "
+                                  "'health_check_interval', got: '"
+                                  + str(health_check_interval) + "'" )
+        self.health_check_interval = health_check_interval
+
+        if ( (hedge_percentile is not None)
+             and ( not isinstance( hedge_percentile, (int, long, float) )
+                   or not (0 < hedge_percentile < 100) ) ):
+            raise GPUdbException( "Expected a number between 0 and 100 (exclusive) "
+                                  "or None for 'hedge_percentile', got: '"
+                                  + str(hedge_percentile) + "'" )
+        self.hedge_percentile = hedge_percentile
+
+        if ( (retry_policy is not None)
+             and not isinstance( retry_policy, GPUdbRetryPolicy ) ):
+            raise GPUdbException( "Expected a GPUdbRetryPolicy or None for "
+                                  "'retry_policy', got: '"
+                                  + str(type(retry_policy)) + "'" )
+        self.retry_policy = retry_policy
+
+        if ( (insert_chunk_size is not None)
+             and ( not isinstance( insert_chunk_size, (int, long) )
+                   or (insert_chunk_size < 1) ) ):
+            raise GPUdbException( "Expected a positive integer or None for "
+                                  "'insert_chunk_size', got: '"
+                                  + str(insert_chunk_size) + "'" )
+        self.insert_chunk_size = insert_chunk_size
+
+        # Retry policies set for the calls made within a block, per thread
+        self._retry_policy_override = threading.local()
+
+        # Tracks the latency and health of the hosts
+        self._host_selector = _HostSelector( len( self._conn_tokens ) )
+
+        # The thread pool for parallel decoding is created on first use
+        self._decode_thread_pool      = None
+        self._decode_thread_pool_size = 0
+        self._decode_thread_pool_lock = threading.Lock()
+
+        # So are the poller of asynchronous jobs and the scheduler of hedged
+        # requests
+        self._job_poller      = None
+        self._hedge_scheduler = None
+        self._job_poller_lock = threading.Lock()
+
+        # Whether close() has been called
+        self._is_closed = False
+
         # Set up the credentials to be used per POST
         self.auth = None
         if len(self.username) != 0:
@@ -2276,6 +4687,23 @@ class GPUdb(object):
         # -------------------------------------------
         if not no_init_db_contact:
             self._perform_version_check()
+
+        # Keep checking the health of the hosts in the background; the
+        # checker only holds a weak reference so it stops with the client
+        if ( (len( self._conn_tokens ) > 1) and self.health_check_interval ):
+            client_ref = weakref.ref( self )
+
+            def probe( index ):
+                client = client_ref()
+                if ( (client is None) or client._is_closed ):
+                    return False
+                client.__check_host_health( index )
+                return True
+            # end probe
+
+            self._host_selector.start_health_checks( self.health_check_interval,
+                                                     probe )
+        # end if
     # end __construct
 
 
@@ -2322,7 +4750,14 @@ class GPUdb(object):
                         "username":   self.username,
                         "password":   self.password,
                         "timeout":    self.timeout,
-                        "no_init_db_contact": self.no_init_db_contact
+                        "no_init_db_contact": self.no_init_db_contact,
+                        "max_connections_per_host": self.max_connections_per_host,
+                        "connection_idle_timeout":  self.connection_idle_timeout,
+                        "decode_threads":           self.decode_threads,
+                        "health_check_interval":    self.health_check_interval,
+                        "hedge_percentile":         self.hedge_percentile,
+                        "retry_policy":             self.retry_policy,
+                        "insert_chunk_size":        self.insert_chunk_size
         }
         return pickle_this
     # end __getstate__
@@ -2340,10 +4775,67 @@ class GPUdb(object):
                           username   = state["username"],
                           password   = state["password"],
                           timeout    = state["timeout"],
-                          no_init_db_contact = state["no_init_db_contact"] )
+                          no_init_db_contact = state["no_init_db_contact"],
+                          max_connections_per_host = state.get( "max_connections_per_host", 10 ),
+                          connection_idle_timeout  = state.get( "connection_idle_timeout", 60 ),
+                          decode_threads           = state.get( "decode_threads", 1 ),
+                          health_check_interval    = state.get( "health_check_interval", None ),
+                          hedge_percentile         = state.get( "hedge_percentile", None ),
+                          retry_policy             = state.get( "retry_policy", None ),
+                          insert_chunk_size        = state.get( "insert_chunk_size", None ) )
     # end __setstate__
 
 
+    def __get_decode_thread_pool( self, num_threads ):
+        """Returns the thread pool used for decoding records in parallel,
+        creating it (or replacing it with a larger one) if it has fewer than
+        *num_threads* threads.
+        """
+        old_thread_pool = None
+        with self._decode_thread_pool_lock:
+            if (self._decode_thread_pool_size < num_threads):
+                old_thread_pool = self._decode_thread_pool
+                self._decode_thread_pool      = ThreadPool( num_threads )
+                self._decode_thread_pool_size = num_threads
+            # end if
+
+            thread_pool = self._decode_thread_pool
+        # end with
+
+        # Let any decoding still in progress on the old pool finish, then
+        # wait for its threads to exit (without blocking other callers)
+        if old_thread_pool is not None:
+            old_thread_pool.close()
+            old_thread_pool.join()
+
+        return thread_pool
+    # end __get_decode_thread_pool
+
+
+    def __get_hedge_scheduler( self ):
+        """Returns the scheduler of the hedged requests of this client,
+        creating it on first use.
+        """
+        with self._job_poller_lock:
+            if self._hedge_scheduler is None:
+                self._hedge_scheduler = _HedgeScheduler()
+
+            return self._hedge_scheduler
+    # end __get_hedge_scheduler
+
+
+    def __get_job_poller( self ):
+        """Returns the poller of the asynchronous jobs submitted through this
+        client, creating it on first use.
+        """
+        with self._job_poller_lock:
+            if self._job_poller is None:
+                self._job_poller = _GPUdbJobPoller()
+
+            return self._job_poller
+    # end __get_job_poller
+
+
     def _perform_version_check( self, do_print_warning = True ):
         """Perform a version check with the database server.
 
@@ -2381,6 +4873,35 @@ class GPUdb(object):
     # end get_version_info
 
 
+    @contextlib.contextmanager
+    def using_retry_policy( self, retry_policy ):
+        """Returns a context manager within which the requests made by the
+        current thread use the given retry policy instead of the client's.
+        For example::
+
+            with gpudb.using_retry_policy( GPUdbRetryPolicy( deadline = 30 ) ):
+                gpudb.insert_records( table_name, records )
+
+        Parameters:
+            retry_policy (GPUdbRetryPolicy)
+                The retry policy to use; None means every host is tried
+                once, with no deadline.
+        """
+        if ( (retry_policy is not None)
+             and not isinstance( retry_policy, GPUdbRetryPolicy ) ):
+            raise GPUdbException( "Expected a GPUdbRetryPolicy or None, got: '"
+                                  + str(type(retry_policy)) + "'" )
+
+        override = self._retry_policy_override
+        previous = getattr( override, "policies", None )
+        override.policies = ( previous or [] ) + [ retry_policy ]
+        try:
+            yield self
+        finally:
+            override.policies = previous
+    # end using_retry_policy
+
+
     def get_host( self ):
         """Return the host this client is talking to."""
         return self._get_current_conn_token()._host
@@ -2405,6 +4926,57 @@ class GPUdb(object):
                                        port = self.get_port() )
     # end get_host
 
+
+    def close_connections( self ):
+        """Close all idle keep-alive connections to the server(s).  New
+        connections are opened as needed by subsequent requests."""
+        for conn_token in self._conn_tokens:
+            conn_token.close_connections()
+    # end close_connections
+
+
+    def close( self ):
+        """Release the resources held by this client: stop the background
+        health checks of the hosts, shut down the thread pools used for
+        decoding records and hedging reads (waiting for their threads to
+        exit), and close all idle keep-alive connections.
+
+        The client can still be used afterwards, the thread pools and
+        connections then being created again as needed; the hosts' health
+        is no longer checked in the background, though.  The client can
+        also be used as a context manager, which closes it on exit.
+        """
+        self._is_closed = True
+
+        with self._decode_thread_pool_lock:
+            decode_thread_pool = self._decode_thread_pool
+            self._decode_thread_pool      = None
+            self._decode_thread_pool_size = 0
+
+        with self._job_poller_lock:
+            hedge_scheduler = self._hedge_scheduler
+            self._hedge_scheduler = None
+
+        if decode_thread_pool is not None:
+            decode_thread_pool.close()
+            decode_thread_pool.join()
+
+        if hedge_scheduler is not None:
+            hedge_scheduler.close()
+
+        self.close_connections()
+    # end close
+
+
+    def __enter__( self ):
+        return self
+    # end __enter__
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+    # end __exit__
+
     @property
     def host(self):
         return self.get_host()
@@ -2513,6 +5085,12 @@ class GPUdb(object):
     _conn_tokens   = ()          # Collection of parsed url entities
 
     timeout       = None        # HTTP request timeout (None=default socket timeout)
+    max_connections_per_host = 10 # Max open (busy or idle) connections per host
+    connection_idle_timeout  = 60 # Seconds before idle connections are closed
+    health_check_interval    = None  # Seconds between host health checks
+    hedge_percentile         = None # Latency percentile for hedging reads
+    retry_policy             = None # GPUdbRetryPolicy of failed requests
+    insert_chunk_size        = None # Bytes per chunk of streamed inserts
     encoding      = "BINARY"    # Input encoding, either 'BINARY' or 'JSON'.
     username      = ""          # Input username or empty string for none.
     password      = ""          # Input password or empty string for none.
@@ -2574,7 +5152,12 @@ class GPUdb(object):
         element is the body data (either unprocessed or processed).
         """
 
-        if self.encoding == 'BINARY':
+        # Streamed bodies go uncompressed, as snappy compresses the body as
+        # a whole
+        is_streamed = isinstance( body_data, _StreamingBody )
+
+        if ( (self.encoding == 'BINARY')
+             or (is_streamed and (self.encoding == 'SNAPPY')) ):
             headers = {"Content-type": "application/octet-stream",
                        "Accept": "application/octet-stream"}
         elif self.encoding == 'JSON':
@@ -2585,6 +5168,9 @@ class GPUdb(object):
                        "Accept": "application/x-snappy"}
             body_data = snappy.compress(body_data)
 
+        if is_streamed:
+            headers["Transfer-Encoding"] = "chunked"
+
         # Set the authentication header, if needed
         if self.auth:
             headers["Authorization"] = self.auth
@@ -2593,126 +5179,538 @@ class GPUdb(object):
     # end __create_header
    
  
-    def __post_and_get( self,
-                        host, port, url_path, connection_type,
-                        headers, body_data, endpoint ):
+    def __get_timeout( self, deadline ):
         """
-        Create a HTTP connection and POST then get GET, returning the server response.
+        Returns the socket timeout to use for a socket operation that must be
+        done by the given deadline; raises a timeout error if it has passed.
 
         Parameters:
-            host (str)
-                The host to send the request to
-            port (str)
+            deadline : The time by which the request must be done, or None.
+        """
+        if deadline is None:
+            return self.timeout
+
+        remaining = deadline - time.time()
+        if (remaining <= 0):
+            raise GPUdbConnectionException( "Timeout Error: The deadline of the "
+                                            "request has passed" )
+
+        if ( (self.timeout is None) or (remaining < self.timeout) ):
+            return remaining
+        return self.timeout
+    # end __get_timeout
+
+
+    def __post_and_get( self, conn_token, port, headers, body_data, endpoint,
+                        deadline, cancellation = None ):
+        """
+        POST to the given host over a pooled keep-alive connection and get
+        the server response.  If a reused connection turns out to have been
+        closed by the server, the request is retried once on a new connection,
+        but only if it failed before being fully sent or the endpoint is
+        read-only; a request that may already have been applied by the server
+        is never resent.
+
+        Parameters:
+            conn_token (_ConnectionToken)
+                The connection token of the host to send the request to
+            port (int)
                 The port to send the request to
-            url_path (str)
-                The URL for the request (exclusive of the endpoint)
-            connection_type (str)
-                'HTTP' or 'HTTPS'
             headers (dict)
                 The headers to use for the HTTP or HTTPS connection
-            body_data (bytes)
+            body_data (bytes or _StreamingBody)
                 Data to POST to GPUdb server.
             endpoint (str)
                 Server path to POST to, e.g. "/add".
+            deadline (float)
+                The time by which the request must be done, or None for no
+                limit other than the client's socket timeout.  Each socket
+                operation times out at the deadline at the latest.
+            cancellation (_Cancellation)
+                Optional handle through which the request may be cancelled
+                from another thread.
         """
-        # NOTE: Creating a new httplib.HTTPConnection is suprisingly just as
-        #       fast as reusing a persistent one and has the advantage of
-        #       fully retrying from scratch if the connection fails.
+        host = conn_token._host
 
         # Get the full URL path for the request
-        url_path = (url_path + endpoint)
+        url_path = (conn_token._gpudb_url_path + endpoint)
+
+        pool = conn_token.get_connection_pool( port,
+                                               self.max_connections_per_host,
+                                               self.connection_idle_timeout )
+
+        def set_timeout( conn ):
+            timeout = self.__get_timeout( deadline )
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout( timeout )
+        # end set_timeout
 
         # Try to establish a connection
         try:
-            if (connection_type == 'HTTP'):
-                conn = httplib.HTTPConnection( host = host,
-                                               port = port,
-                                               timeout = self.timeout)
-            elif (connection_type == 'HTTPS'):
-                conn = httplib.HTTPSConnection( host = host,
-                                                port = port,
-                                                timeout = self.timeout)
+            ( conn, is_reused ) = pool.acquire( self.__get_timeout( deadline ) )
         except Exception as e:
-            raise GPUdbConnectionException("Error connecting to '{}' on port {} due to: {}"
-                                           "".format(host, port, str(e)) )
+            raise _GPUdbUnsentRequestException( "Error connecting to '{}' on port {} due to: {}"
+                                                "".format(host, port, str(e)) )
 
-        # Try to post the message
-        try:
-            conn.request("POST", url_path, body_data, headers)
-        except Exception as e:
-            raise GPUdbConnectionException( "Error posting to '{}:{}{}' due to: {}"
-                                            "".format(host, port, url_path, str(e)) )
+        # Only requests that have no effect on the server may be resent once
+        # they have been fully written to the connection
+        is_idempotent = _HostSelector.is_read_only( endpoint )
 
-        # Get the response
-        try:
-            resp = conn.getresponse()
-        except: # some error occurred; return a message
-            raise GPUdbConnectionException( "Timeout Error: No response received from %s:%s"
-                                            "" % (host, port) )
+        while True:
+            # Try to post the message
+            is_sent = False
+            try:
+                set_timeout( conn )
+                if cancellation is not None:
+                    # Connect first, so that there is a socket to shut down
+                    if conn.sock is None:
+                        conn.connect()
+                    cancellation.attach( conn.sock )
+
+                if isinstance( body_data, _StreamingBody ):
+                    body_data.send( conn, url_path, headers )
+                else:
+                    conn.request("POST", url_path, body_data, headers)
+                is_sent = True
+
+                # The connection lets go of its socket if the response is the
+                # last one; keep it for reading the response
+                sock = conn.sock
+                set_timeout( conn )
+                resp = conn.getresponse()
+                break
+            except _StreamingBody.EncodingError as e:
+                # Not a connection problem; raise the original error
+                pool.discard( conn )
+                raise e.error
+            except (httplib.HTTPException, socket.error) as e:
+                if ( (cancellation is not None) and cancellation.is_cancelled ):
+                    pool.discard( conn )
+                    raise GPUdbConnectionException( "The request was cancelled" )
+
+                # A kept-alive socket may have been dropped by the server
+                # while idle; retry once from scratch on a fresh connection
+                # (which takes over the slot of the dropped one)
+                if ( is_reused
+                     and not isinstance( e, socket.timeout )
+                     and ( (not is_sent) or is_idempotent ) ):
+                    conn.close()
+                    conn = pool.new_connection( self.timeout )
+                    is_reused = False
+                    continue
+
+                pool.discard( conn )
+                error_type = GPUdbConnectionException if is_sent else _GPUdbUnsentRequestException
+                if isinstance( e, socket.timeout ):
+                    raise error_type( "Timeout Error: No response received from %s:%s"
+                                      "" % (host, port) )
+                raise error_type( "Error posting to '{}:{}{}' due to: {}"
+                                  "".format(host, port, url_path, str(e)) )
+            except GPUdbConnectionException:
+                # The deadline has passed, or the request was cancelled
+                pool.discard( conn )
+                raise
+            except Exception as e:
+                pool.discard( conn )
+                raise GPUdbConnectionException( "Error posting to '{}:{}{}' due to: {}"
+                                                "".format(host, port, url_path, str(e)) )
+        # end while
 
-        # Read the response
+        # Read the response, in pieces (as they arrive, where supported) if
+        # each must not read past the deadline
         try:
-            resp_data = resp.read()
+            if deadline is None:
+                resp_data = resp.read()
+            else:
+                read_piece = getattr( resp, "read1", resp.read )
+                pieces = []
+                while True:
+                    sock.settimeout( self.__get_timeout( deadline ) )
+                    piece = read_piece( 65536 )
+                    if not piece:
+                        break
+                    pieces.append( piece )
+                # end while
+                resp_data = b"".join( pieces )
+            # end if
             resp_time = resp.getheader('x-request-time-secs',None)
-            return  resp_data, resp_time
+        except GPUdbConnectionException:
+            pool.discard( conn )
+            raise
         except: # some error occurred; return a message
-            raise GPUdbException( "Error reading response from {}:{} for {}"
-                                  "".format( host, port, endpoint ) )
+            pool.discard( conn )
+            raise GPUdbConnectionException( "Error reading response from {}:{} for {}"
+                                            "".format( host, port, endpoint ) )
+
+        # The response has been fully read, so the connection can be reused
+        # unless the server asked to close it (or it may have been shut down)
+        if ( resp.will_close
+             or ( (cancellation is not None) and cancellation.detach() ) ):
+            pool.discard( conn )
+        else:
+            pool.release( conn )
+
+        return  resp_data, resp_time
     # end __post_and_get
 
 
-    def __post_to_gpudb_read(self, body_data, endpoint):
+    def __post_to_gpudb_read(self, body_data, endpoint, hedge = False):
         """
         Create a HTTP connection and POST then get GET, returning the server response.
+        With multiple hosts, the request is sent to each host in turn (as
+        ordered by the host selector) until one of them responds.
 
         Parameters:
             body_data : Data to POST to GPUdb server.
             endpoint  : Server path to POST to, e.g. "/add".
+            hedge     : If True, the request is idempotent and may be sent
+                        to a second host if the first one is slow.
         """
         # Get the header and process the body data
         ( headers, body_data ) = self.__create_header_and_process_body_data( body_data )
 
-        # NOTE: Creating a new httplib.HTTPConnection is suprisingly just as
-        #       fast as reusing a persistent one and has the advantage of
-        #       fully retrying from scratch if the connection fails.
+        return self.__post_with_retries(
+            lambda deadline: self.__post_to_any_host( headers, body_data, endpoint,
+                                                      hedge, deadline ),
+            endpoint )
+    # end __post_to_gpudb_read
 
-        initial_index = self._current_conn_token_index
-        cond = True
-        error = None
 
-        while cond:
-            loop_error = None
-            conn_token = self._get_current_conn_token()
+    def __get_retry_policy( self ):
+        """
+        Return the retry policy in effect for the current thread (or None).
+        """
+        policies = getattr( self._retry_policy_override, "policies", None )
+        return policies[ -1 ] if policies else self.retry_policy
+    # end __get_retry_policy
+
+
+    def __get_retry_deadline( self ):
+        """
+        Return the time by which a request made now must be done as per the
+        retry policy in effect, or None if there is no deadline.
+        """
+        policy = self.__get_retry_policy()
+        if ( (policy is None) or (policy.deadline is None) ):
+            return None
+        return time.time() + policy.deadline
+    # end __get_retry_deadline
+
+
+    def __post_with_retries( self, post, endpoint, deadline = None ):
+        """
+        Make a request, retrying it as per the retry policy in effect.
+
+        Parameters:
+            post     : Function making one attempt at the request, given the
+                       time by which the whole request must be done (or
+                       None); returns the response.
+            endpoint : Server path of the request, e.g. "/add".
+            deadline : The time by which the request must be done; by
+                       default, as per the retry policy.
+        """
+        policy = self.__get_retry_policy()
+
+        if policy is None:
+            return post( deadline )
+
+        if deadline is None:
+            deadline = self.__get_retry_deadline()
+
+        attempt = 1
+        error   = None
+        while True:
+            try:
+                return post( deadline )
+            except GPUdbException as ex:
+                error = _GPUdbUnsentRequestException.chain( error, ex )
+                delay = policy.get_retry_delay( attempt, error, deadline, endpoint )
+                if delay is None:
+                    raise error
+
+            time.sleep( delay )
+            attempt += 1
+        # end while
+    # end __post_with_retries
+
+
+    def __post_to_any_host( self, headers, body_data, endpoint, hedge, deadline ):
+        """
+        POST to each host in turn (as ordered by the host selector) until
+        one of them responds, and return its response.
+
+        Parameters:
+            headers   : The headers to use for the HTTP or HTTPS connection.
+            body_data : Data to POST to GPUdb server.
+            endpoint  : Server path to POST to, e.g. "/add".
+            hedge     : If True, the request is idempotent and may be sent
+                        to a second host if the first one is slow.
+            deadline  : The time by which the request must be done, or None.
+        """
+        read_only = _HostSelector.is_read_only( endpoint )
+        host_order = self._host_selector.get_host_order( self._current_conn_token_index,
+                                                         read_only )
+
+        if hedge:
+            hedge_delay = self._host_selector.get_latency_percentile( endpoint,
+                                                                      self.hedge_percentile )
+            if hedge_delay is not None:
+                return self.__post_hedged( host_order, headers, body_data,
+                                           endpoint, hedge_delay, deadline )
+        # end if
+
+        return self.__post_in_turn( host_order, headers, body_data, endpoint,
+                                    hedge, deadline, read_only, set(), None )
+    # end __post_to_any_host
+
+
+    def __post_in_turn( self, host_order, headers, body_data, endpoint, hedge,
+                        deadline, read_only, failed_indices, error ):
+        """
+        POST to each of the given hosts in turn until one of them responds,
+        and return its response.
 
-            # Try to post and get the message using the current connection
+        Parameters:
+            host_order     : Indices of the hosts, in the order to try them.
+            headers        : The headers to use for the HTTP or HTTPS connection.
+            body_data      : Data to POST to GPUdb server.
+            endpoint       : Server path to POST to, e.g. "/add".
+            hedge          : If True, also record the latency for hedging.
+            deadline       : The time by which the request must be done, or None.
+            read_only      : Whether the request is read-only.
+            failed_indices : Indices of the hosts that already failed the
+                             request; they are not tried again.
+            error          : The error of the last host that failed, if any.
+        """
+        for index in host_order:
+            if index in failed_indices:
+                continue
+
+            # Don't try another host once the deadline has passed
+            self.__get_timeout( deadline )
+
+            # Try to post and get the message using this host's connection
             # token's information
             try:
                 ( resp_data,
-                  resp_time ) = self.__post_and_get( conn_token._host, conn_token._port,
-                                                     conn_token._gpudb_url_path,
-                                                     conn_token._connection,
-                                                     headers,
-                                                     body_data,
-                                                     endpoint )
+                  resp_time ) = self.__post_to_host( index, headers, body_data,
+                                                     endpoint, hedge, deadline )
             except (GPUdbException, GPUdbConnectionException) as ex:
-                loop_error = ex
-                self._current_conn_token_index = \
-                    (self._current_conn_token_index+1) % len(self._conn_tokens)
-            error = loop_error
+                failed_indices.add( index )
+                error = _GPUdbUnsentRequestException.chain( error, ex )
+                continue
 
-            cond = error and (self._current_conn_token_index != initial_index)
-        # end while loop
+            self.__update_current_host( index, read_only, failed_indices )
+            return  resp_data, resp_time
+        # end for
 
-        if error:
-            if isinstance( error, (basestring, unicode)):
-                raise GPUdbException( error )
-            elif isinstance( error, GPUdbException ):
-                raise error
-            else:
-                raise GPUdbException( error )
+        self.__raise_post_error( error )
+    # end __post_in_turn
+
+
+    def __post_to_host( self, index, headers, body_data, endpoint, hedge,
+                        deadline, cancellation = None ):
+        """
+        POST to the host with the given index and get the server response,
+        recording the outcome with the host selector.
+
+        Parameters:
+            index     : Index of the connection token of the host.
+            headers   : The headers to use for the HTTP or HTTPS connection.
+            body_data : Data to POST to GPUdb server.
+            endpoint  : Server path to POST to, e.g. "/add".
+            hedge     : If True, also record the latency for hedging.
+            deadline  : The time by which the request must be done, or None.
+            cancellation : Optional handle through which the request may be
+                           cancelled from another thread.
+        """
+        conn_token = self._conn_tokens[ index ]
+
+        start_time = time.time()
+        try:
+            ( resp_data,
+              resp_time ) = self.__post_and_get( conn_token, conn_token._port,
+                                                 headers, body_data, endpoint,
+                                                 deadline, cancellation )
+        except (GPUdbException, GPUdbConnectionException):
+            # A cancelled request says nothing about the host
+            if ( (cancellation is None) or not cancellation.is_cancelled ):
+                self._host_selector.record_failure( index )
+            raise
+
+        latency = time.time() - start_time
+        self._host_selector.record_success( index, latency )
+        if hedge:
+            self._host_selector.record_latency( endpoint, latency )
 
         return  resp_data, resp_time
-    # end __post_to_gpudb_read
+    # end __post_to_host
+
+
+    def __post_hedged( self, host_order, headers, body_data, endpoint,
+                       hedge_delay, deadline ):
+        """
+        POST to the first host on the calling thread, and if it has not
+        responded within *hedge_delay* seconds, also to the second one (on
+        the thread pool of the hedge scheduler); returns the first successful
+        response, and cancels the other request.  If neither succeeds, the
+        remaining hosts are tried in turn.
+
+        Parameters:
+            host_order  : Indices of the hosts, in the order to try them.
+            headers     : The headers to use for the HTTP or HTTPS connection.
+            body_data   : Data to POST to GPUdb server.
+            endpoint    : Server path to POST to, e.g. "/get/records".
+            hedge_delay : Seconds to wait before sending the hedged request.
+            deadline    : The time by which the request must be done, or None.
+        """
+        first_index = host_order[ 0 ]
+        hedge_index = host_order[ 1 ]
+        first       = _Cancellation()
+        second      = _Cancellation()
+        results     = queue.Queue()
+
+        # Whether the first request is done, and whether the hedge was sent
+        lock   = threading.Lock()
+        status = { "is_done": False, "is_hedged": False }
+
+        def claim():
+            with lock:
+                status[ "is_hedged" ] = not status[ "is_done" ]
+                return status[ "is_hedged" ]
+        # end claim
+
+        def hedge():
+            try:
+                response = self.__post_to_host( hedge_index, headers, body_data,
+                                                endpoint, True, deadline, second )
+            except Exception as ex:
+                results.put( (None, ex) )
+                return
+
+            first.cancel()
+            results.put( (response, None) )
+        # end hedge
+
+        self.__get_hedge_scheduler().add( hedge_delay, claim, hedge )
+
+        failed_indices = set()
+        error = None
+        try:
+            response = self.__post_to_host( first_index, headers, body_data,
+                                            endpoint, True, deadline, first )
+        except (GPUdbException, GPUdbConnectionException) as ex:
+            response = None
+            error = ex
+        finally:
+            with lock:
+                status[ "is_done" ] = True
+        # end try
+
+        if error is None:
+            second.cancel()
+            self.__update_current_host( first_index, True, failed_indices )
+            return response
+
+        # Unless cancelled, the first request failed
+        if not first.is_cancelled:
+            failed_indices.add( first_index )
+
+        if status[ "is_hedged" ]:
+            ( response, ex ) = results.get()
+            if ex is None:
+                self.__update_current_host( hedge_index, True, failed_indices )
+                return response
+
+            failed_indices.add( hedge_index )
+            error = ex
+        # end if
+
+        return self.__post_in_turn( host_order, headers, body_data, endpoint,
+                                    True, deadline, True, failed_indices, error )
+    # end __post_hedged
+
+
+    def __can_hedge( self, endpoint, datum ):
+        """
+        Returns whether a request may be sent to more than one host at once,
+        i.e. hedging is enabled and the request does not modify anything.
+
+        Parameters:
+            endpoint : Server path to POST to, e.g. "/get/records".
+            datum    : Request dict of the endpoint.
+        """
+        if ( (self.hedge_percentile is None) or (len( self._conn_tokens ) < 2) ):
+            return False
+
+        if _HostSelector.is_read_only( endpoint ):
+            return True
+
+        # Aggregations are read-only unless they store their result in a table
+        if endpoint.startswith( "/aggregate/" ):
+            options = datum.get( "options" ) or {}
+            return ( "result_table" not in options )
+
+        return False
+    # end __can_hedge
+
+
+    def __update_current_host( self, index, read_only, failed_indices ):
+        """
+        Make the host that served a request the current one, unless the
+        request was read-only and the current host did not fail it.
+
+        Parameters:
+            index          : Index of the host that served the request.
+            read_only      : Whether the request was read-only.
+            failed_indices : Indices of the hosts that failed the request.
+        """
+        if ( (not read_only)
+             or (self._current_conn_token_index in failed_indices) ):
+            self._current_conn_token_index = index
+    # end __update_current_host
+
+
+    def __raise_post_error( self, error ):
+        """
+        Raise the error of the last host tried for a request as a
+        GPUdbException.
+        """
+        if isinstance( error, (basestring, unicode)):
+            raise GPUdbException( error )
+        elif isinstance( error, GPUdbException ):
+            raise error
+        else:
+            raise GPUdbException( error )
+    # end __raise_post_error
+
+
+    def __check_host_health( self, index ):
+        """
+        Check that the given host successfully responds to a cheap status
+        request; raises an exception if it doesn't (including if it reports
+        an error).  Used by the background health checks.
+
+        Parameters:
+            index : Index of the connection token of the host to check.
+        """
+        endpoint = "/show/system/status"
+        (REQ_SCHEMA, RSP_SCHEMA) = self.__get_schemas( endpoint )
+        encoded_datum = self.encode_datum_cext( REQ_SCHEMA, { "options": {} } )
+        ( headers, body_data ) = self.__create_header_and_process_body_data( encoded_datum )
+
+        conn_token = self._conn_tokens[ index ]
+        ( resp_data,
+          resp_time ) = self.__post_and_get( conn_token, conn_token._port, headers,
+                                             body_data, endpoint, None )
+
+        # Only the status of the response matters
+        status_info = self.__read_orig_datum_cext( self.gpudb_schemas[ "gpudb_response" ][ "RSP_SCHEMA" ],
+                                                   resp_data )
+        if (status_info[ "status" ] == "ERROR"):
+            raise GPUdbException( status_info[ "message" ] )
+    # end __check_host_health
 
 
     def __post_to_hm_read(self, body_data, endpoint):
@@ -2728,10 +5726,71 @@ class GPUdb(object):
         # Get the header and process the body data
         ( headers, body_data ) = self.__create_header_and_process_body_data( body_data )
 
-        # NOTE: Creating a new httplib.HTTPConnection is suprisingly just as
-        #       fast as reusing a persistent one and has the advantage of
-        #       fully retrying from scratch if the connection fails.
+        deadline = self.__get_retry_deadline()
+        try:
+            return self.__post_with_retries(
+                lambda deadline: self.__post_to_any_hm( headers, body_data,
+                                                        endpoint, deadline ),
+                endpoint, deadline )
+        except _GPUdbUnsentRequestException as ex:
+            # Only a request that no host manager got may be sent again;
+            # any other error (including the deadline passing) is final
+            error = ex
+
+        # Last ditch effort: if error due to wrong port, inquire the head node
+        # what the port is and use that if different
+        if ( (deadline is not None) and (time.time() >= deadline) ):
+            raise error
+
+        # Get the host manager port from the head node, within what is left
+        # of the deadline
+        try:
+            if deadline is None:
+                sys_properties = self.show_system_properties().property_map
+            else:
+                policy = copy.copy( self.__get_retry_policy() )
+                policy.deadline = deadline - time.time()
+                with self.using_retry_policy( policy ):
+                    sys_properties = self.show_system_properties().property_map
+        except (GPUdbException, GPUdbConnectionException) as ex:
+            raise GPUdbException( ex.message )
+
+        if "conf.hm_http_port" not in sys_properties:
+            raise GPUdbException( 'Error: "conf.hm_http_port" not found '
+                                  'system properties!' )
+        try :
+            hm_port = int( sys_properties[ "conf.hm_http_port" ] )
+        except:
+            raise GPUdbException ( "Expected a numeric port, got: '{}'"
+                                   "".format( str(sys_properties[ "conf.hm_http_port" ]) ) )
+
+        # Check if this host manager port works
+        conn_token = self._get_current_conn_token()
+        ( resp_data,
+          resp_time ) = self.__post_and_get( conn_token,
+                                             hm_port,
+                                             headers,
+                                             body_data,
+                                             endpoint,
+                                             deadline )
+        # Upon success, update the connection token's host manager port
+        conn_token._host_manager_port = hm_port
+
+        return  resp_data, resp_time
+    # end __post_to_hm_read
+
+
+    def __post_to_any_hm( self, headers, body_data, endpoint, deadline ):
+        """
+        POST to the host manager of each host in turn, starting with the
+        current one, until one of them responds, and return its response.
 
+        Parameters:
+            headers   : The headers to use for the HTTP or HTTPS connection.
+            body_data : Data to POST to the host manager.
+            endpoint  : Server path to POST to, e.g. "/admin/offline".
+            deadline  : The time by which the request must be done, or None.
+        """
         initial_index = self._current_conn_token_index
         cond = True
         error = None
@@ -2740,17 +5799,20 @@ class GPUdb(object):
             loop_error = None
             conn_token = self._get_current_conn_token()
 
+            # Don't try another host once the deadline has passed
+            self.__get_timeout( deadline )
+
             try:
                 ( resp_data,
-                  resp_time ) = self.__post_and_get( conn_token._host,
+                  resp_time ) = self.__post_and_get( conn_token,
                                                      conn_token._host_manager_port,
-                                                     conn_token._gpudb_url_path,
-                                                     conn_token._connection,
                                                      headers,
                                                      body_data,
-                                                     endpoint )
+                                                     endpoint,
+                                                     deadline )
             except (GPUdbException, GPUdbConnectionException) as ex:
-                loop_error = ex
+                # A request that an earlier host got may have been applied
+                loop_error = _GPUdbUnsentRequestException.chain( error, ex )
                 self._current_conn_token_index = \
                     (self._current_conn_token_index+1) % len(self._conn_tokens)
             error = loop_error
@@ -2758,53 +5820,11 @@ class GPUdb(object):
             cond = error and (self._current_conn_token_index != initial_index)
         # end while loop
 
-        # Last ditch effort: if error due to wrong port, inquire the head node
-        # what the port is and use that if different
         if error:
-            if isinstance( error, GPUdbConnectionException ):
-                # Get the host manager port from the head node
-                try:
-                    sys_properties = self.show_system_properties().property_map
-                except (GPUdbException, GPUdbConnectionException) as ex:
-                    raise GPUdbException( ex.message )
-
-                if "conf.hm_http_port" not in sys_properties:
-                    raise GPUdbException( 'Error: "conf.hm_http_port" not found '
-                                          'system properties!' )
-                try :
-                    hm_port = int( sys_properties[ "conf.hm_http_port" ] )
-                except:
-                    raise GPUdbException ( "Expected a numeric port, got: '{}'"
-                                           "".format( str(sys_properties[ "conf.hm_http_port" ]) ) )
-
-                # Check if this host manager port works
-                try:
-                    conn_token = self._get_current_conn_token()
-                    ( resp_data,
-                      resp_time ) = self.__post_and_get( conn_token._host,
-                                                         hm_port,
-                                                         conn_token._gpudb_url_path,
-                                                         conn_token._connection,
-                                                         headers,
-                                                         body_data,
-                                                         endpoint )
-                    # Upon success, update the connection token's host manager port
-                    conn_token._host_manager_port = hm_port
-                    # Reset the error
-                except (GPUdbException, GPUdbConnectionException) as ex:
-                    raise
-            else:
-                if isinstance( error, (basestring, unicode)):
-                    raise GPUdbException( error )
-                elif isinstance( error, GPUdbException ):
-                    raise error
-                else:
-                    raise GPUdbException( error )
-            # end inner if
-        # end if error
+            self.__raise_post_error( error )
 
         return  resp_data, resp_time
-    # end __post_to_hm_read
+    # end __post_to_any_hm
 
 
     def __client_to_object_encoding( self ):
@@ -2997,7 +6017,8 @@ class GPUdb(object):
             endpoint   : Server path to POST to, e.g. "/add".
         """
         encoded_datum = self.encode_datum(REQ_SCHEMA, datum)
-        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint)
+        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint,
+                                                             self.__can_hedge(endpoint, datum))
 
         return self.__read_datum(REP_SCHEMA, response, None, response_time)
     # end __post_then_get
@@ -3018,7 +6039,8 @@ class GPUdb(object):
             The decoded response.
         """
         encoded_datum = self.encode_datum_cext(REQ_SCHEMA, datum)
-        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint)
+        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint,
+                                                             self.__can_hedge(endpoint, datum))
 
         return self.__read_datum_cext(REP_SCHEMA, response, None, response_time)
     # end __post_then_get_cext
@@ -3059,16 +6081,36 @@ class GPUdb(object):
             element is the raw encoded response from the database.
         """
         encoded_datum = self.encode_datum_cext(REQ_SCHEMA, datum)
-        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint)
+        response, response_time  = self.__post_to_gpudb_read(encoded_datum, endpoint,
+                                                             self.__can_hedge(endpoint, datum))
+
+        # Return the decoded response and the raw response
+        return ( self.__read_datum_cext(REP_SCHEMA, response, None, response_time),
+                 response )
+    # end __post_then_get_cext
+
+
+    def __post_then_get_async_cext(self, REQ_SCHEMA, REP_SCHEMA, datum, endpoint):
+        """
+        Encode the datum dict using the REQ_SCHEMA, POST to GPUdb server via
+        the /create/job endpoint for an asynchronous call.  Wait for the job
+        to complete, and decode and return its response.
+
+        Parameters:
+            REQ_SCHEMA     : The Schema for the request.
+            REP_SCHEMA     : The Schema for the reply.
+            datum          : Request dict matching the REQ_SCHEMA.
+            endpoint       : Server path to POST to, e.g. "/alter/table".
+
+        Returns:
+            The decoded endpoint response.
+        """
+        return self.__submit_job( REQ_SCHEMA, REP_SCHEMA, datum, endpoint ).result()
+    # end __post_then_get_async_cext
 
-        # Return the decoded response and the raw response
-        return ( self.__read_datum_cext(REP_SCHEMA, response, None, response_time),
-                 response )
-    # end __post_then_get_cext
 
 
-    def __post_then_get_async_cext(self, REQ_SCHEMA, REP_SCHEMA, datum, endpoint,
-                                   retry_interval = 5):
+    def __post_async_cext(self, REQ_SCHEMA, datum, endpoint ):
         """
         Encode the datum dict using the REQ_SCHEMA, POST to GPUdb server via
         the /create/job endpoint for an asynchronous call.  Decode the /create/job
@@ -3076,12 +6118,8 @@ class GPUdb(object):
 
         Parameters:
             REQ_SCHEMA     : The Schema for the request.
-            REP_SCHEMA     : The Schema for the reply.
             datum          : Request dict matching the REQ_SCHEMA.
             endpoint       : Server path to POST to, e.g. "/alter/table".
-            retry_interval : The interval period for re-trying /get/job
-                             to see if the job has completed. In seconds.
-                             Default is 5 seconds.
 
         Returns:
             The decoded endpoint response.
@@ -3098,88 +6136,92 @@ class GPUdb(object):
         obj['endpoint'] = endpoint
         obj['request_encoding'] = 'json' if (self.encoding == 'JSON') else 'binary'
         if self.encoding == 'JSON':
-            obj['data'    ] = ()
-            # obj['data'    ] = bytes()
+            obj['data'    ] = bytes()
             obj['data_str'] = encoded_datum
         else:
             obj['data_str'] = ''
-            obj['data'    ] = ( encoded_datum )
+            obj['data'    ] = encoded_datum
         obj['options'] = {}
         
         # Make the asynchronouse /recate/job call
         response = self.__post_then_get_cext( create_job_req_schema, create_job_rsp_schema,
                                               obj, create_job_endpoint )
-
         if not _Util.is_ok( response ):
             raise GPUdbException( "Error in creating asynchronous job for {}: {}"
                                   "".format( endpoint, _Util.get_error_msg( response ) ) )
-        job_id =  response[ "job_id" ]
+        return response
+    # end __post_async_cext
+
+
+    def __submit_job( self, REQ_SCHEMA, REP_SCHEMA, datum, endpoint ):
+        """
+        Make an asynchronous call to the given endpoint via /create/job and
+        return a handle to the job, which is polled in the background.
+
+        Parameters:
+            REQ_SCHEMA     : The Schema for the request.
+            REP_SCHEMA     : The Schema for the reply.
+            datum          : Request dict matching the REQ_SCHEMA.
+            endpoint       : Server path to POST to, e.g. "/alter/table".
+
+        Returns:
+            A :class:`GPUdbJob` object.
+        """
+        response = self.__post_async_cext( REQ_SCHEMA, datum, endpoint )
+        job_id = response[ "job_id" ]
 
-        # Now, every retry_interval, check if the job is done; if done,
-        # then decode the response and return it
-        while (True):
-            # Try getting the job result back
+        def poll():
             job_result = self.__get_async_cext( job_id, REP_SCHEMA )
             if job_result:
                 # We need to insert the status_info into the response
                 # since the calling function may be expecting it
-                job_result['status_info'] = response['status_info']
+                job_result['status_info'] = dict( response['status_info'] )
                 # Remove the data type since it won't correspond to the
                 # actual endpoint invoked
                 del job_result['status_info']['data_type']
+            return job_result
+        # end poll
 
-                # Return the job result
-                return job_result
-            # end inner if
-
-            # Sleep a little before trying again
-            time.sleep( retry_interval )
-        # end infinite loop
-    # end __post_then_get_async_cext
-
+        job = GPUdbJob( self, job_id, endpoint, poll )
+        self.__get_job_poller().add( job )
+        return job
+    # end __submit_job
 
 
-    def __post_async_cext(self, REQ_SCHEMA, datum, endpoint ):
-        """
-        Encode the datum dict using the REQ_SCHEMA, POST to GPUdb server via
-        the /create/job endpoint for an asynchronous call.  Decode the /create/job
-        response and return it.
+    def submit_job( self, endpoint, request ):
+        """Call the given endpoint asynchronously, as a job created with
+        /create/job, without waiting for it to complete.  Long-running calls
+        (e.g. /alter/table or /create/projection) then do not hold up the
+        calling thread, and any number of them can be waited on at once.
 
         Parameters:
-            REQ_SCHEMA     : The Schema for the request.
-            datum          : Request dict matching the REQ_SCHEMA.
-            endpoint       : Server path to POST to, e.g. "/alter/table".
+            endpoint (str)
+                The endpoint to call, e.g. "/alter/table", or the name of
+                its method, e.g. "alter_table".
+            request (dict)
+                The request, as the dict the endpoint's method would send:
+                all the fields of the endpoint's request, by name.  The
+                'options' field defaults to an empty dict.
 
         Returns:
-            The decoded endpoint response.
+            A :class:`GPUdbJob` handle, whose :meth:`GPUdbJob.result` is the
+            decoded endpoint response.
         """
-        # Encode the payload of the actual endpoint to be called
-        encoded_datum = self.encode_datum_cext(REQ_SCHEMA, datum)
+        if not endpoint.startswith( "/" ):
+            if endpoint not in _gpudb_func_to_endpoint_map:
+                raise GPUdbException( "Unknown endpoint method '{}'".format( endpoint ) )
+            endpoint = _gpudb_func_to_endpoint_map[ endpoint ]
+        # end if
 
-        # Create and encode the payload of the /create/job endpoint
-        # which makes the asynchronous call
-        create_job_endpoint = "/create/job"
-        (create_job_req_schema, create_job_rsp_schema) = self.__get_schemas( create_job_endpoint )
+        (REQ_SCHEMA, RSP_SCHEMA) = self.__get_schemas( endpoint )
 
-        obj = {}
-        obj['endpoint'] = endpoint
-        obj['request_encoding'] = 'json' if (self.encoding == 'JSON') else 'binary'
-        if self.encoding == 'JSON':
-            obj['data'    ] = bytes()
-            obj['data_str'] = encoded_datum
-        else:
-            obj['data_str'] = ''
-            obj['data'    ] = encoded_datum
-        obj['options'] = {}
-        
-        # Make the asynchronouse /recate/job call
-        response = self.__post_then_get_cext( create_job_req_schema, create_job_rsp_schema,
-                                              obj, create_job_endpoint )
-        if not _Util.is_ok( response ):
-            raise GPUdbException( "Error in creating asynchronous job for {}: {}"
-                                  "".format( endpoint, _Util.get_error_msg( response ) ) )
-        return response
-    # end __post_async_cext
+        datum = dict( request )
+        if 'options' not in datum:
+            datum['options'] = {}
+        datum['options'] = self.__sanitize_dicts( datum['options'] )
+
+        return self.__submit_job( REQ_SCHEMA, RSP_SCHEMA, datum, endpoint )
+    # end submit_job
 
 
 
@@ -3209,8 +6251,8 @@ class GPUdb(object):
         # response = self.__post_then_get_cext( get_job_req_schema, get_job_rsp_schema,
         #                                       obj, get_job_endpoint )
         if not _Util.is_ok( response ):
-            raise GPUdbException( "Error in getting asynchronous job result for {}: {}"
-                                  "".format( endpoint, _Util.get_error_msg( response ) ) )
+            raise GPUdbException( "Error in getting asynchronous job result for job {}: {}"
+                                  "".format( job_id, _Util.get_error_msg( response ) ) )
 
         get_job_rsp = AttrDict( response )
 
@@ -3245,6 +6287,58 @@ class GPUdb(object):
 
 
 
+    def _prepare_request( self, endpoint, datum, get_req_cext = False ):
+        """Encode a request for the given endpoint without sending it.  Used
+        by clients that provide their own transport (e.g. :class:`AsyncGPUdb`).
+
+        Parameters:
+            endpoint (str)
+                Server path of the request, e.g. "/filter".
+            datum (dict)
+                Request dict matching the endpoint's request schema.  Any
+                dict-valued fields (e.g. options) are sanitized.
+            get_req_cext (bool)
+                If True, use the c-extension version of the request schema.
+
+        Returns:
+            A tuple where the first element is the header and the second
+            element is the (possibly compressed) body data.
+        """
+        (REQ_SCHEMA, RSP_SCHEMA) = self.__get_schemas( endpoint, get_req_cext = get_req_cext )
+
+        for key in datum:
+            if isinstance( datum[ key ], (dict, collections.OrderedDict) ):
+                datum[ key ] = self.__sanitize_dicts( datum[ key ] )
+
+        encoded_datum = self.encode_datum_cext( REQ_SCHEMA, datum )
+        return self.__create_header_and_process_body_data( encoded_datum )
+    # end _prepare_request
+
+
+    def _decode_response( self, endpoint, response, response_time = None,
+                          get_rsp_cext = False ):
+        """Decode a raw server response for the given endpoint; the
+        counterpart of :meth:`._prepare_request`.
+
+        Parameters:
+            endpoint (str)
+                Server path of the request, e.g. "/filter".
+            response (bytes)
+                The raw gpudb_response returned by the server.
+            response_time (str)
+                The value of the 'x-request-time-secs' header, if any.
+            get_rsp_cext (bool)
+                If True, use the c-extension version of the response schema.
+
+        Returns:
+            The decoded response.
+        """
+        (REQ_SCHEMA, RSP_SCHEMA) = self.__get_schemas( endpoint, get_rsp_cext = get_rsp_cext )
+        return self.__read_datum_cext( RSP_SCHEMA, response, None, response_time )
+    # end _decode_response
+
+
+
     def __sanitize_dicts( self, _dict ):
         """If the given options dictionary has boolean values, replace
         them with the strings 'true' and 'false' for consumption of the
@@ -3484,1364 +6578,18 @@ class GPUdb(object):
 
     def load_gpudb_schemas( self ):
         """Saves all request and response schemas for GPUdb queries
-           in a lookup table (lookup by query name).
-        """
-        self.gpudb_schemas = {}
-        name = "gpudb_response"
-        RSP_SCHEMA_STR = """{"type":"record","name":"gpudb_response","fields":[{"name":"status","type":"string"},{"name":"message","type":"string"},{"name":"data_type","type":"string"},{"name":"data","type":"bytes"},{"name":"data_str","type":"string"}]}"""
-        RSP_SCHEMA = Schema( "record", [("status", "string"), ("message", "string"), ("data_type", "string"), ("data", "object"), ("data_str", "string")] )
-        self.gpudb_schemas[ name ] = { "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "RSP_SCHEMA" : RSP_SCHEMA }
-        name = "trigger_notification"
-        RSP_SCHEMA_STR = """{"type":"record","name":"trigger_notification","fields":[{"name":"trigger_id","type":"string"},{"name":"set_id","type":"string"},{"name":"object_id","type":"string"},{"name":"object_data","type":"bytes"}]}"""
-        RSP_SCHEMA = Schema( "record", [("trigger_id", "string"), ("set_id", "string"), ("object_id", "string"), ("object_data", "bytes")] )
-        self.gpudb_schemas[ name ] = { "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "RSP_SCHEMA" : RSP_SCHEMA }
-        name = "/admin/add/ranks"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_add_ranks_request","fields":[{"name":"hosts","type":{"type":"array","items":"string"}},{"name":"config_params","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_add_ranks_response","fields":[{"name":"added_ranks","type":{"type":"array","items":"int"}},{"name":"results","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("hosts", "array", [("string")]), ("config_params", "array", [("map", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("added_ranks", "array", [("int")]), ("results", "array", [("string")])] )
-        ENDPOINT = "/admin/add/ranks"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/alter/configuration"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_alter_configuration_request","fields":[{"name":"config_string","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_alter_configuration_response","fields":[{"name":"status","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("config_string", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("status", "string")] )
-        ENDPOINT = "/admin/alter/configuration"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/alter/jobs"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_alter_jobs_request","fields":[{"name":"job_ids","type":{"type":"array","items":"int"}},{"name":"action","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_alter_jobs_response","fields":[{"name":"job_ids","type":{"type":"array","items":"int"}},{"name":"action","type":"string"},{"name":"status","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("job_ids", "array", [("int")]), ("action", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("job_ids", "array", [("int")]), ("action", "string"), ("status", "array", [("string")])] )
-        ENDPOINT = "/admin/alter/jobs"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/alter/shards"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_alter_shards_request","fields":[{"name":"version","type":"long"},{"name":"use_index","type":"boolean"},{"name":"rank","type":{"type":"array","items":"int"}},{"name":"tom","type":{"type":"array","items":"int"}},{"name":"index","type":{"type":"array","items":"int"}},{"name":"backup_map_list","type":{"type":"array","items":"int"}},{"name":"backup_map_values","type":{"type":"array","items":{"type":"array","items":"int"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_alter_shards_response","fields":[{"name":"version","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("version", "long"), ("use_index", "boolean"), ("rank", "array", [("int")]), ("tom", "array", [("int")]), ("index", "array", [("int")]), ("backup_map_list", "array", [("int")]), ("backup_map_values", "array", [("array", [("int")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("version", "long")] )
-        ENDPOINT = "/admin/alter/shards"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/offline"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_offline_request","fields":[{"name":"offline","type":"boolean"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_offline_response","fields":[{"name":"is_offline","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("offline", "boolean"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("is_offline", "boolean")] )
-        ENDPOINT = "/admin/offline"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/rebalance"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_rebalance_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"action","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_rebalance_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"message","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("action", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("message", "array", [("string")])] )
-        ENDPOINT = "/admin/rebalance"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/remove/ranks"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_remove_ranks_request","fields":[{"name":"ranks","type":{"type":"array","items":"int"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_remove_ranks_response","fields":[{"name":"removed_ranks","type":{"type":"array","items":"int"}},{"name":"results","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("ranks", "array", [("int")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("removed_ranks", "array", [("int")]), ("results", "array", [("string")])] )
-        ENDPOINT = "/admin/remove/ranks"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/show/alerts"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_show_alerts_request","fields":[{"name":"num_alerts","type":"int"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_show_alerts_response","fields":[{"name":"timestamps","type":{"type":"array","items":"string"}},{"name":"types","type":{"type":"array","items":"string"}},{"name":"params","type":{"type":"array","items":{"type":"map","values":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("num_alerts", "int"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("timestamps", "array", [("string")]), ("types", "array", [("string")]), ("params", "array", [("map", [("string")])])] )
-        ENDPOINT = "/admin/show/alerts"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/show/configuration"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_show_configuration_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_show_configuration_response","fields":[{"name":"config_string","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("config_string", "string")] )
-        ENDPOINT = "/admin/show/configuration"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/show/jobs"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_show_jobs_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_show_jobs_response","fields":[{"name":"job_id","type":{"type":"array","items":"int"}},{"name":"status","type":{"type":"array","items":"string"}},{"name":"endpoint_name","type":{"type":"array","items":"string"}},{"name":"time_received","type":{"type":"array","items":"long"}},{"name":"auth_id","type":{"type":"array","items":"string"}},{"name":"user_data","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("job_id", "array", [("int")]), ("status", "array", [("string")]), ("endpoint_name", "array", [("string")]), ("time_received", "array", [("long")]), ("auth_id", "array", [("string")]), ("user_data", "array", [("string")])] )
-        ENDPOINT = "/admin/show/jobs"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/show/shards"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_show_shards_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_show_shards_response","fields":[{"name":"version","type":"long"},{"name":"rank","type":{"type":"array","items":"int"}},{"name":"tom","type":{"type":"array","items":"int"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("version", "long"), ("rank", "array", [("int")]), ("tom", "array", [("int")])] )
-        ENDPOINT = "/admin/show/shards"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/shutdown"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_shutdown_request","fields":[{"name":"exit_type","type":"string"},{"name":"authorization","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_shutdown_response","fields":[{"name":"exit_status","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("exit_type", "string"), ("authorization", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("exit_status", "string")] )
-        ENDPOINT = "/admin/shutdown"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/admin/verifydb"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_verify_db_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_verify_db_response","fields":[{"name":"verified_ok","type":"boolean"},{"name":"error_list","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("verified_ok", "boolean"), ("error_list", "array", [("string")])] )
-        ENDPOINT = "/admin/verifydb"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/convexhull"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_convex_hull_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_convex_hull_response","fields":[{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"count","type":"int"},{"name":"is_valid","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("x_column_name", "string"), ("y_column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("x_vector", "array", [("double")]), ("y_vector", "array", [("double")]), ("count", "int"), ("is_valid", "boolean")] )
-        ENDPOINT = "/aggregate/convexhull"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/groupby"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_group_by_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_group_by_response","fields":[{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        ENDPOINT = "/aggregate/groupby"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/histogram"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_histogram_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"start","type":"double"},{"name":"end","type":"double"},{"name":"interval","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_histogram_response","fields":[{"name":"counts","type":{"type":"array","items":"double"}},{"name":"start","type":"double"},{"name":"end","type":"double"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("start", "double"), ("end", "double"), ("interval", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("counts", "array", [("double")]), ("start", "double"), ("end", "double")] )
-        ENDPOINT = "/aggregate/histogram"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/kmeans"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_k_means_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"k","type":"int"},{"name":"tolerance","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_k_means_response","fields":[{"name":"means","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"counts","type":{"type":"array","items":"long"}},{"name":"rms_dists","type":{"type":"array","items":"double"}},{"name":"count","type":"long"},{"name":"rms_dist","type":"double"},{"name":"tolerance","type":"double"},{"name":"num_iters","type":"int"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("k", "int"), ("tolerance", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("means", "array", [("array", [("double")])]), ("counts", "array", [("long")]), ("rms_dists", "array", [("double")]), ("count", "long"), ("rms_dist", "double"), ("tolerance", "double"), ("num_iters", "int")] )
-        ENDPOINT = "/aggregate/kmeans"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/minmax"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_min_max_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_min_max_response","fields":[{"name":"min","type":"double"},{"name":"max","type":"double"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("min", "double"), ("max", "double")] )
-        ENDPOINT = "/aggregate/minmax"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/minmax/geometry"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_min_max_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_min_max_geometry_response","fields":[{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double")] )
-        ENDPOINT = "/aggregate/minmax/geometry"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/statistics"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"stats","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_statistics_response","fields":[{"name":"stats","type":{"type":"map","values":"double"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("stats", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("stats", "map", [("double")])] )
-        ENDPOINT = "/aggregate/statistics"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/statistics/byrange"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_statistics_by_range_request","fields":[{"name":"table_name","type":"string"},{"name":"select_expression","type":"string"},{"name":"column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"stats","type":"string"},{"name":"start","type":"double"},{"name":"end","type":"double"},{"name":"interval","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_statistics_by_range_response","fields":[{"name":"stats","type":{"type":"map","values":{"type":"array","items":"double"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("select_expression", "string"), ("column_name", "string"), ("value_column_name", "string"), ("stats", "string"), ("start", "double"), ("end", "double"), ("interval", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("stats", "map", [("array", [("double")])])] )
-        ENDPOINT = "/aggregate/statistics/byrange"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/unique"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_unique_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_unique_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"has_more_records","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("has_more_records", "boolean")] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("has_more_records", "boolean")] )
-        ENDPOINT = "/aggregate/unique"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/aggregate/unpivot"
-        REQ_SCHEMA_STR = """{"type":"record","name":"aggregate_unpivot_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"variable_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"pivoted_columns","type":{"type":"array","items":"string"}},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"aggregate_unpivot_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("variable_column_name", "string"), ("value_column_name", "string"), ("pivoted_columns", "array", [("string")]), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        ENDPOINT = "/aggregate/unpivot"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/alter/system/properties"
-        REQ_SCHEMA_STR = """{"type":"record","name":"alter_system_properties_request","fields":[{"name":"property_updates_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"alter_system_properties_response","fields":[{"name":"updated_properties_map","type":{"type":"map","values":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("property_updates_map", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("updated_properties_map", "map", [("string")])] )
-        ENDPOINT = "/alter/system/properties"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/alter/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"alter_table_request","fields":[{"name":"table_name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"alter_table_response","fields":[{"name":"table_name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"type_id","type":"string"},{"name":"type_definition","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"label","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("action", "string"), ("value", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("action", "string"), ("value", "string"), ("type_id", "string"), ("type_definition", "string"), ("properties", "map", [("array", [("string")])]), ("label", "string")] )
-        ENDPOINT = "/alter/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/alter/table/metadata"
-        REQ_SCHEMA_STR = """{"type":"record","name":"alter_table_metadata_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"alter_table_metadata_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_map","type":{"type":"map","values":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("metadata_map", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("metadata_map", "map", [("string")])] )
-        ENDPOINT = "/alter/table/metadata"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/alter/user"
-        REQ_SCHEMA_STR = """{"type":"record","name":"alter_user_request","fields":[{"name":"name","type":"string"},{"name":"action","type":"string"},{"name":"value","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"alter_user_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("action", "string"), ("value", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/alter/user"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/append/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"append_records_request","fields":[{"name":"table_name","type":"string"},{"name":"source_table_name","type":"string"},{"name":"field_map","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"append_records_response","fields":[{"name":"table_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("source_table_name", "string"), ("field_map", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string")] )
-        ENDPOINT = "/append/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/clear/statistics"
-        REQ_SCHEMA_STR = """{"type":"record","name":"clear_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"clear_statistics_response","fields":[{"name":"table_name","type":"string"},{"name":"column_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("column_name", "string")] )
-        ENDPOINT = "/clear/statistics"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/clear/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"clear_table_request","fields":[{"name":"table_name","type":"string"},{"name":"authorization","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"clear_table_response","fields":[{"name":"table_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("authorization", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string")] )
-        ENDPOINT = "/clear/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/clear/tablemonitor"
-        REQ_SCHEMA_STR = """{"type":"record","name":"clear_table_monitor_request","fields":[{"name":"topic_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"clear_table_monitor_response","fields":[{"name":"topic_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("topic_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("topic_id", "string")] )
-        ENDPOINT = "/clear/tablemonitor"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/clear/trigger"
-        REQ_SCHEMA_STR = """{"type":"record","name":"clear_trigger_request","fields":[{"name":"trigger_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"clear_trigger_response","fields":[{"name":"trigger_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("trigger_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("trigger_id", "string")] )
-        ENDPOINT = "/clear/trigger"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/collect/statistics"
-        REQ_SCHEMA_STR = """{"type":"record","name":"collect_statistics_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"collect_statistics_response","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")])] )
-        ENDPOINT = "/collect/statistics"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/job"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_job_request","fields":[{"name":"endpoint","type":"string"},{"name":"request_encoding","type":"string"},{"name":"data","type":"bytes"},{"name":"data_str","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_job_response","fields":[{"name":"job_id","type":"int"}]}"""
-        REQ_SCHEMA = Schema( "record", [("endpoint", "string"), ("request_encoding", "string"), ("data", "bytes"), ("data_str", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("job_id", "int")] )
-        ENDPOINT = "/create/job"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/jointable"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_join_table_request","fields":[{"name":"join_table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_join_table_response","fields":[{"name":"join_table_name","type":"string"},{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("join_table_name", "string"), ("table_names", "array", [("string")]), ("column_names", "array", [("string")]), ("expressions", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("join_table_name", "string"), ("count", "long")] )
-        ENDPOINT = "/create/jointable"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/materializedview"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_materialized_view_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_materialized_view_response","fields":[{"name":"table_name","type":"string"},{"name":"view_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("view_id", "string")] )
-        ENDPOINT = "/create/materializedview"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"execution_mode","type":"string"},{"name":"files","type":{"type":"map","values":"bytes"}},{"name":"command","type":"string"},{"name":"args","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_proc_response","fields":[{"name":"proc_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("proc_name", "string"), ("execution_mode", "string"), ("files", "map", [("bytes")]), ("command", "string"), ("args", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("proc_name", "string")] )
-        ENDPOINT = "/create/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/projection"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_projection_request","fields":[{"name":"table_name","type":"string"},{"name":"projection_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_projection_response","fields":[{"name":"projection_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("projection_name", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("projection_name", "string")] )
-        ENDPOINT = "/create/projection"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/role"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_role_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_role_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/create/role"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_table_request","fields":[{"name":"table_name","type":"string"},{"name":"type_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_table_response","fields":[{"name":"table_name","type":"string"},{"name":"type_id","type":"string"},{"name":"is_collection","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("type_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("type_id", "string"), ("is_collection", "boolean")] )
-        ENDPOINT = "/create/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/tablemonitor"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_table_monitor_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_table_monitor_response","fields":[{"name":"topic_id","type":"string"},{"name":"table_name","type":"string"},{"name":"type_schema","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("topic_id", "string"), ("table_name", "string"), ("type_schema", "string")] )
-        ENDPOINT = "/create/tablemonitor"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/trigger/byarea"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_trigger_by_area_request","fields":[{"name":"request_id","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_column_name","type":"string"},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_trigger_by_area_response","fields":[{"name":"trigger_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("request_id", "string"), ("table_names", "array", [("string")]), ("x_column_name", "string"), ("x_vector", "array", [("double")]), ("y_column_name", "string"), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("trigger_id", "string")] )
-        ENDPOINT = "/create/trigger/byarea"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/trigger/byrange"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_trigger_by_range_request","fields":[{"name":"request_id","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"column_name","type":"string"},{"name":"min","type":"double"},{"name":"max","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_trigger_by_range_response","fields":[{"name":"trigger_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("request_id", "string"), ("table_names", "array", [("string")]), ("column_name", "string"), ("min", "double"), ("max", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("trigger_id", "string")] )
-        ENDPOINT = "/create/trigger/byrange"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/type"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_type_request","fields":[{"name":"type_definition","type":"string"},{"name":"label","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_type_response","fields":[{"name":"type_id","type":"string"},{"name":"type_definition","type":"string"},{"name":"label","type":"string"},{"name":"properties","type":{"type":"map","values":{"type":"array","items":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("type_definition", "string"), ("label", "string"), ("properties", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("type_id", "string"), ("type_definition", "string"), ("label", "string"), ("properties", "map", [("array", [("string")])])] )
-        ENDPOINT = "/create/type"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/union"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_union_request","fields":[{"name":"table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"input_column_names","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"output_column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_union_response","fields":[{"name":"table_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("table_names", "array", [("string")]), ("input_column_names", "array", [("array", [("string")])]), ("output_column_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string")] )
-        ENDPOINT = "/create/union"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/user/external"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_user_external_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_user_external_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/create/user/external"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/create/user/internal"
-        REQ_SCHEMA_STR = """{"type":"record","name":"create_user_internal_request","fields":[{"name":"name","type":"string"},{"name":"password","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"create_user_internal_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("password", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/create/user/internal"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/delete/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"delete_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"delete_proc_response","fields":[{"name":"proc_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("proc_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("proc_name", "string")] )
-        ENDPOINT = "/delete/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/delete/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"delete_records_request","fields":[{"name":"table_name","type":"string"},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"delete_records_response","fields":[{"name":"count_deleted","type":"long"},{"name":"counts_deleted","type":{"type":"array","items":"long"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count_deleted", "long"), ("counts_deleted", "array", [("long")])] )
-        ENDPOINT = "/delete/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/delete/role"
-        REQ_SCHEMA_STR = """{"type":"record","name":"delete_role_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"delete_role_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/delete/role"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/delete/user"
-        REQ_SCHEMA_STR = """{"type":"record","name":"delete_user_request","fields":[{"name":"name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"delete_user_response","fields":[{"name":"name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string")] )
-        ENDPOINT = "/delete/user"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/execute/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"execute_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"params","type":{"type":"map","values":"string"}},{"name":"bin_params","type":{"type":"map","values":"bytes"}},{"name":"input_table_names","type":{"type":"array","items":"string"}},{"name":"input_column_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"output_table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"execute_proc_response","fields":[{"name":"run_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("proc_name", "string"), ("params", "map", [("string")]), ("bin_params", "map", [("bytes")]), ("input_table_names", "array", [("string")]), ("input_column_names", "map", [("array", [("string")])]), ("output_table_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("run_id", "string")] )
-        ENDPOINT = "/execute/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/execute/sql"
-        REQ_SCHEMA_STR = """{"type":"record","name":"execute_sql_request","fields":[{"name":"Query","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"execute_sql_response","fields":[{"name":"query_execution_plan","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("Query", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("query_execution_plan", "string")] )
-        ENDPOINT = "/execute/sql"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"expression","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("expression", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byarea"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_area_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_column_name","type":"string"},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_area_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("x_vector", "array", [("double")]), ("y_column_name", "string"), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byarea"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byarea/geometry"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_area_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"x_vector","type":{"type":"array","items":"double"}},{"name":"y_vector","type":{"type":"array","items":"double"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_area_geometry_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("x_vector", "array", [("double")]), ("y_vector", "array", [("double")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byarea/geometry"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bybox"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_box_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"y_column_name","type":"string"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_box_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("y_column_name", "string"), ("min_y", "double"), ("max_y", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bybox"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bybox/geometry"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_box_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_box_geometry_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bybox/geometry"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bygeometry"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"input_wkt","type":"string"},{"name":"operation","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_geometry_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("input_wkt", "string"), ("operation", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bygeometry"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bylist"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_list_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_values_map","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_list_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_values_map", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bylist"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byradius"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_radius_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"x_center","type":"double"},{"name":"y_column_name","type":"string"},{"name":"y_center","type":"double"},{"name":"radius","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_radius_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("x_column_name", "string"), ("x_center", "double"), ("y_column_name", "string"), ("y_center", "double"), ("radius", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byradius"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byradius/geometry"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_radius_geometry_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"x_center","type":"double"},{"name":"y_center","type":"double"},{"name":"radius","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_radius_geometry_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("x_center", "double"), ("y_center", "double"), ("radius", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byradius/geometry"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byrange"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_range_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"lower_bound","type":"double"},{"name":"upper_bound","type":"double"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_range_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("lower_bound", "double"), ("upper_bound", "double"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byrange"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byseries"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"track_id","type":"string"},{"name":"target_track_ids","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_series_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("track_id", "string"), ("target_track_ids", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byseries"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bystring"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_string_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"expression","type":"string"},{"name":"mode","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_string_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("expression", "string"), ("mode", "string"), ("column_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bystring"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/bytable"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_table_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"column_name","type":"string"},{"name":"source_table_name","type":"string"},{"name":"source_table_column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_table_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("column_name", "string"), ("source_table_name", "string"), ("source_table_column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/bytable"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/filter/byvalue"
-        REQ_SCHEMA_STR = """{"type":"record","name":"filter_by_value_request","fields":[{"name":"table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"is_string","type":"boolean"},{"name":"value","type":"double"},{"name":"value_str","type":"string"},{"name":"column_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"filter_by_value_response","fields":[{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("view_name", "string"), ("is_string", "boolean"), ("value", "double"), ("value_str", "string"), ("column_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "long")] )
-        ENDPOINT = "/filter/byvalue"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/get/job"
-        REQ_SCHEMA_STR = """{"type":"record","name":"get_job_request","fields":[{"name":"job_id","type":"int"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"get_job_response","fields":[{"name":"endpoint","type":"string"},{"name":"job_status","type":"string"},{"name":"running","type":"boolean"},{"name":"progress","type":"int"},{"name":"successful","type":"boolean"},{"name":"response_encoding","type":"string"},{"name":"job_response","type":"bytes"},{"name":"job_response_str","type":"string"},{"name":"status_map","type":{"type":"map","values":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("job_id", "int"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("endpoint", "string"), ("job_status", "string"), ("running", "boolean"), ("progress", "int"), ("successful", "boolean"), ("response_encoding", "string"), ("job_response", "bytes"), ("job_response_str", "string"), ("status_map", "map", [("string")])] )
-        ENDPOINT = "/get/job"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/get/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"get_records_request","fields":[{"name":"table_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"get_records_response","fields":[{"name":"table_name","type":"string"},{"name":"type_name","type":"string"},{"name":"type_schema","type":"string"},{"name":"records_binary","type":{"type":"array","items":"bytes"}},{"name":"records_json","type":{"type":"array","items":"string"}},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("type_name", "string"), ("type_schema", "string"), ("records_binary", "array", [("bytes")]), ("records_json", "array", [("string")]), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("type_name", "string"), ("type_schema", "string"), ("records_binary", "object_array"), ("records_json", "array", [("string")]), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        ENDPOINT = "/get/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/get/records/bycolumn"
-        REQ_SCHEMA_STR = """{"type":"record","name":"get_records_by_column_request","fields":[{"name":"table_name","type":"string"},{"name":"column_names","type":{"type":"array","items":"string"}},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"get_records_by_column_response","fields":[{"name":"table_name","type":"string"},{"name":"response_schema_str","type":"string"},{"name":"binary_encoded_response","type":"bytes"},{"name":"json_encoded_response","type":"string"},{"name":"total_number_of_records","type":"long"},{"name":"has_more_records","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("column_names", "array", [("string")]), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "bytes"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("response_schema_str", "string"), ("binary_encoded_response", "object"), ("json_encoded_response", "string"), ("total_number_of_records", "long"), ("has_more_records", "boolean")] )
-        ENDPOINT = "/get/records/bycolumn"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/get/records/byseries"
-        REQ_SCHEMA_STR = """{"type":"record","name":"get_records_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"world_table_name","type":"string"},{"name":"offset","type":"int"},{"name":"limit","type":"int"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"get_records_by_series_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"type_names","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"list_records_binary","type":{"type":"array","items":{"type":"array","items":"bytes"}}},{"name":"list_records_json","type":{"type":"array","items":{"type":"array","items":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("world_table_name", "string"), ("offset", "int"), ("limit", "int"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("type_names", "array", [("string")]), ("type_schemas", "array", [("string")]), ("list_records_binary", "array", [("array", [("bytes")])]), ("list_records_json", "array", [("array", [("string")])])] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_names", "array", [("string")]), ("type_names", "array", [("string")]), ("type_schemas", "array", [("string")]), ("list_records_binary", "array", [("object_array")]), ("list_records_json", "array", [("array", [("string")])])] )
-        ENDPOINT = "/get/records/byseries"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/get/records/fromcollection"
-        REQ_SCHEMA_STR = """{"type":"record","name":"get_records_from_collection_request","fields":[{"name":"table_name","type":"string"},{"name":"offset","type":"long"},{"name":"limit","type":"long"},{"name":"encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"get_records_from_collection_response","fields":[{"name":"table_name","type":"string"},{"name":"type_names","type":{"type":"array","items":"string"}},{"name":"records_binary","type":{"type":"array","items":"bytes"}},{"name":"records_json","type":{"type":"array","items":"string"}},{"name":"record_ids","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("offset", "long"), ("limit", "long"), ("encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("type_names", "array", [("string")]), ("records_binary", "array", [("bytes")]), ("records_json", "array", [("string")]), ("record_ids", "array", [("string")])] )
-        RSP_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("type_names", "array", [("string")]), ("records_binary", "object_array"), ("records_json", "array", [("string")]), ("record_ids", "array", [("string")])] )
-        ENDPOINT = "/get/records/fromcollection"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "RSP_SCHEMA_CEXT" : RSP_SCHEMA_CEXT,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/grant/permission/system"
-        REQ_SCHEMA_STR = """{"type":"record","name":"grant_permission_system_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"grant_permission_system_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string")] )
-        ENDPOINT = "/grant/permission/system"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/grant/permission/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"grant_permission_table_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"filter_expression","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"grant_permission_table_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"filter_expression","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("filter_expression", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("filter_expression", "string")] )
-        ENDPOINT = "/grant/permission/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/grant/role"
-        REQ_SCHEMA_STR = """{"type":"record","name":"grant_role_request","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"grant_role_response","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("role", "string"), ("member", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("role", "string"), ("member", "string")] )
-        ENDPOINT = "/grant/role"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/has/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"has_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"has_proc_response","fields":[{"name":"proc_name","type":"string"},{"name":"proc_exists","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("proc_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("proc_name", "string"), ("proc_exists", "boolean")] )
-        ENDPOINT = "/has/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/has/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"has_table_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"has_table_response","fields":[{"name":"table_name","type":"string"},{"name":"table_exists","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("table_exists", "boolean")] )
-        ENDPOINT = "/has/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/has/type"
-        REQ_SCHEMA_STR = """{"type":"record","name":"has_type_request","fields":[{"name":"type_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"has_type_response","fields":[{"name":"type_id","type":"string"},{"name":"type_exists","type":"boolean"}]}"""
-        REQ_SCHEMA = Schema( "record", [("type_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("type_id", "string"), ("type_exists", "boolean")] )
-        ENDPOINT = "/has/type"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/insert/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"insert_records_request","fields":[{"name":"table_name","type":"string"},{"name":"list","type":{"type":"array","items":"bytes"}},{"name":"list_str","type":{"type":"array","items":"string"}},{"name":"list_encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"insert_records_response","fields":[{"name":"record_ids","type":{"type":"array","items":"string"}},{"name":"count_inserted","type":"int"},{"name":"count_updated","type":"int"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("list", "array", [("bytes")]), ("list_str", "array", [("string")]), ("list_encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("record_ids", "array", [("string")]), ("count_inserted", "int"), ("count_updated", "int")] )
-        REQ_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("list", "object_array"), ("list_str", "array", [("string")]), ("list_encoding", "string"), ("options", "map", [("string")])] )
-        ENDPOINT = "/insert/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "REQ_SCHEMA_CEXT" : REQ_SCHEMA_CEXT,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/insert/records/random"
-        REQ_SCHEMA_STR = """{"type":"record","name":"insert_records_random_request","fields":[{"name":"table_name","type":"string"},{"name":"count","type":"long"},{"name":"options","type":{"type":"map","values":{"type":"map","values":"double"}}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"insert_records_random_response","fields":[{"name":"table_name","type":"string"},{"name":"count","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("count", "long"), ("options", "map", [("map", [("double")])])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("count", "long")] )
-        ENDPOINT = "/insert/records/random"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/insert/symbol"
-        REQ_SCHEMA_STR = """{"type":"record","name":"insert_symbol_request","fields":[{"name":"symbol_id","type":"string"},{"name":"symbol_format","type":"string"},{"name":"symbol_data","type":"bytes"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"insert_symbol_response","fields":[{"name":"symbol_id","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("symbol_id", "string"), ("symbol_format", "string"), ("symbol_data", "bytes"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("symbol_id", "string")] )
-        ENDPOINT = "/insert/symbol"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/kill/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"kill_proc_request","fields":[{"name":"run_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"kill_proc_response","fields":[{"name":"run_ids","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("run_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("run_ids", "array", [("string")])] )
-        ENDPOINT = "/kill/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/lock/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"lock_table_request","fields":[{"name":"table_name","type":"string"},{"name":"lock_type","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"lock_table_response","fields":[{"name":"lock_type","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("lock_type", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("lock_type", "string")] )
-        ENDPOINT = "/lock/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/merge/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"merge_records_request","fields":[{"name":"table_name","type":"string"},{"name":"source_table_names","type":{"type":"array","items":"string"}},{"name":"field_maps","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"merge_records_response","fields":[{"name":"table_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("source_table_names", "array", [("string")]), ("field_maps", "array", [("map", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string")] )
-        ENDPOINT = "/merge/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/replace/tom"
-        REQ_SCHEMA_STR = """{"type":"record","name":"admin_replace_tom_request","fields":[{"name":"old_rank_tom","type":"long"},{"name":"new_rank_tom","type":"long"}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"admin_replace_tom_response","fields":[{"name":"old_rank_tom","type":"long"},{"name":"new_rank_tom","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("old_rank_tom", "long"), ("new_rank_tom", "long")] )
-        RSP_SCHEMA = Schema( "record", [("old_rank_tom", "long"), ("new_rank_tom", "long")] )
-        ENDPOINT = "/replace/tom"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/revoke/permission/system"
-        REQ_SCHEMA_STR = """{"type":"record","name":"revoke_permission_system_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"revoke_permission_system_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string")] )
-        ENDPOINT = "/revoke/permission/system"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/revoke/permission/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"revoke_permission_table_request","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"revoke_permission_table_response","fields":[{"name":"name","type":"string"},{"name":"permission","type":"string"},{"name":"table_name","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("table_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("name", "string"), ("permission", "string"), ("table_name", "string")] )
-        ENDPOINT = "/revoke/permission/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/revoke/role"
-        REQ_SCHEMA_STR = """{"type":"record","name":"revoke_role_request","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"revoke_role_response","fields":[{"name":"role","type":"string"},{"name":"member","type":"string"}]}"""
-        REQ_SCHEMA = Schema( "record", [("role", "string"), ("member", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("role", "string"), ("member", "string")] )
-        ENDPOINT = "/revoke/role"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/proc"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_proc_request","fields":[{"name":"proc_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_proc_response","fields":[{"name":"proc_names","type":{"type":"array","items":"string"}},{"name":"execution_modes","type":{"type":"array","items":"string"}},{"name":"files","type":{"type":"array","items":{"type":"map","values":"bytes"}}},{"name":"commands","type":{"type":"array","items":"string"}},{"name":"args","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"array","items":{"type":"map","values":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("proc_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("proc_names", "array", [("string")]), ("execution_modes", "array", [("string")]), ("files", "array", [("map", [("bytes")])]), ("commands", "array", [("string")]), ("args", "array", [("array", [("string")])]), ("options", "array", [("map", [("string")])])] )
-        ENDPOINT = "/show/proc"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/proc/status"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_proc_status_request","fields":[{"name":"run_id","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_proc_status_response","fields":[{"name":"proc_names","type":{"type":"map","values":"string"}},{"name":"params","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"bin_params","type":{"type":"map","values":{"type":"map","values":"bytes"}}},{"name":"input_table_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"input_column_names","type":{"type":"map","values":{"type":"map","values":{"type":"array","items":"string"}}}},{"name":"output_table_names","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"overall_statuses","type":{"type":"map","values":"string"}},{"name":"statuses","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"messages","type":{"type":"map","values":{"type":"map","values":"string"}}},{"name":"results","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"string"}}}},{"name":"bin_results","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"bytes"}}}},{"name":"timings","type":{"type":"map","values":{"type":"map","values":{"type":"map","values":"long"}}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("run_id", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("proc_names", "map", [("string")]), ("params", "map", [("map", [("string")])]), ("bin_params", "map", [("map", [("bytes")])]), ("input_table_names", "map", [("array", [("string")])]), ("input_column_names", "map", [("map", [("array", [("string")])])]), ("output_table_names", "map", [("array", [("string")])]), ("options", "map", [("map", [("string")])]), ("overall_statuses", "map", [("string")]), ("statuses", "map", [("map", [("string")])]), ("messages", "map", [("map", [("string")])]), ("results", "map", [("map", [("map", [("string")])])]), ("bin_results", "map", [("map", [("map", [("bytes")])])]), ("timings", "map", [("map", [("map", [("long")])])])] )
-        ENDPOINT = "/show/proc/status"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/security"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_security_request","fields":[{"name":"names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_security_response","fields":[{"name":"types","type":{"type":"map","values":"string"}},{"name":"roles","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"permissions","type":{"type":"map","values":{"type":"array","items":{"type":"map","values":"string"}}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("types", "map", [("string")]), ("roles", "map", [("array", [("string")])]), ("permissions", "map", [("array", [("map", [("string")])])])] )
-        ENDPOINT = "/show/security"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/statistics"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_statistics_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_statistics_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"stastistics_map","type":{"type":"array","items":{"type":"array","items":{"type":"map","values":"string"}}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("stastistics_map", "array", [("array", [("map", [("string")])])])] )
-        ENDPOINT = "/show/statistics"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/system/properties"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_system_properties_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_system_properties_response","fields":[{"name":"property_map","type":{"type":"map","values":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("property_map", "map", [("string")])] )
-        ENDPOINT = "/show/system/properties"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/system/status"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_system_status_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_system_status_response","fields":[{"name":"status_map","type":{"type":"map","values":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("status_map", "map", [("string")])] )
-        ENDPOINT = "/show/system/status"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/system/timing"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_system_timing_request","fields":[{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_system_timing_response","fields":[{"name":"endpoints","type":{"type":"array","items":"string"}},{"name":"time_in_ms","type":{"type":"array","items":"float"}},{"name":"jobIds","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("endpoints", "array", [("string")]), ("time_in_ms", "array", [("float")]), ("jobIds", "array", [("string")])] )
-        ENDPOINT = "/show/system/timing"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/table"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_table_request","fields":[{"name":"table_name","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_table_response","fields":[{"name":"table_name","type":"string"},{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"table_descriptions","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"type_ids","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"type_labels","type":{"type":"array","items":"string"}},{"name":"properties","type":{"type":"array","items":{"type":"map","values":{"type":"array","items":"string"}}}},{"name":"additional_info","type":{"type":"array","items":{"type":"map","values":"string"}}},{"name":"sizes","type":{"type":"array","items":"long"}},{"name":"full_sizes","type":{"type":"array","items":"long"}},{"name":"join_sizes","type":{"type":"array","items":"double"}},{"name":"total_size","type":"long"},{"name":"total_full_size","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_name", "string"), ("table_names", "array", [("string")]), ("table_descriptions", "array", [("array", [("string")])]), ("type_ids", "array", [("string")]), ("type_schemas", "array", [("string")]), ("type_labels", "array", [("string")]), ("properties", "array", [("map", [("array", [("string")])])]), ("additional_info", "array", [("map", [("string")])]), ("sizes", "array", [("long")]), ("full_sizes", "array", [("long")]), ("join_sizes", "array", [("double")]), ("total_size", "long"), ("total_full_size", "long")] )
-        ENDPOINT = "/show/table"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/table/metadata"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_table_metadata_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_table_metadata_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"metadata_maps","type":{"type":"array","items":{"type":"map","values":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("metadata_maps", "array", [("map", [("string")])])] )
-        ENDPOINT = "/show/table/metadata"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/tables/bytype"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_tables_by_type_request","fields":[{"name":"type_id","type":"string"},{"name":"label","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_tables_by_type_response","fields":[{"name":"table_names","type":{"type":"array","items":"string"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("type_id", "string"), ("label", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("table_names", "array", [("string")])] )
-        ENDPOINT = "/show/tables/bytype"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/triggers"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_triggers_request","fields":[{"name":"trigger_ids","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_triggers_response","fields":[{"name":"trigger_map","type":{"type":"map","values":{"type":"map","values":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("trigger_ids", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("trigger_map", "map", [("map", [("string")])])] )
-        ENDPOINT = "/show/triggers"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/show/types"
-        REQ_SCHEMA_STR = """{"type":"record","name":"show_types_request","fields":[{"name":"type_id","type":"string"},{"name":"label","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"show_types_response","fields":[{"name":"type_ids","type":{"type":"array","items":"string"}},{"name":"type_schemas","type":{"type":"array","items":"string"}},{"name":"labels","type":{"type":"array","items":"string"}},{"name":"properties","type":{"type":"array","items":{"type":"map","values":{"type":"array","items":"string"}}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("type_id", "string"), ("label", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("type_ids", "array", [("string")]), ("type_schemas", "array", [("string")]), ("labels", "array", [("string")]), ("properties", "array", [("map", [("array", [("string")])])])] )
-        ENDPOINT = "/show/types"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/update/records"
-        REQ_SCHEMA_STR = """{"type":"record","name":"update_records_request","fields":[{"name":"table_name","type":"string"},{"name":"expressions","type":{"type":"array","items":"string"}},{"name":"new_values_maps","type":{"type":"array","items":{"type":"map","values":["string","null"]}}},{"name":"records_to_insert","type":{"type":"array","items":"bytes"}},{"name":"records_to_insert_str","type":{"type":"array","items":"string"}},{"name":"record_encoding","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"update_records_response","fields":[{"name":"count_updated","type":"long"},{"name":"counts_updated","type":{"type":"array","items":"long"}},{"name":"count_inserted","type":"long"},{"name":"counts_inserted","type":{"type":"array","items":"long"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("new_values_maps", "array", [("map", [("nullable", [("string")])])]), ("records_to_insert", "array", [("bytes")]), ("records_to_insert_str", "array", [("string")]), ("record_encoding", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count_updated", "long"), ("counts_updated", "array", [("long")]), ("count_inserted", "long"), ("counts_inserted", "array", [("long")])] )
-        REQ_SCHEMA_CEXT = Schema( "record", [("table_name", "string"), ("expressions", "array", [("string")]), ("new_values_maps", "array", [("map", [("nullable", [("string")])])]), ("records_to_insert", "object_array"), ("records_to_insert_str", "array", [("string")]), ("record_encoding", "string"), ("options", "map", [("string")])] )
-        ENDPOINT = "/update/records"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "REQ_SCHEMA_CEXT" : REQ_SCHEMA_CEXT,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/update/records/byseries"
-        REQ_SCHEMA_STR = """{"type":"record","name":"update_records_by_series_request","fields":[{"name":"table_name","type":"string"},{"name":"world_table_name","type":"string"},{"name":"view_name","type":"string"},{"name":"reserved","type":{"type":"array","items":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"update_records_by_series_response","fields":[{"name":"count","type":"int"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("world_table_name", "string"), ("view_name", "string"), ("reserved", "array", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("count", "int")] )
-        ENDPOINT = "/update/records/byseries"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("track_ids", "array", [("array", [("string")])]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] )
-        ENDPOINT = "/visualize/image"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image/chart"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_chart_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_names","type":{"type":"array","items":"string"}},{"name":"y_column_names","type":{"type":"array","items":"string"}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"string"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_chart_response","fields":[{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"string"},{"name":"image_data","type":"bytes"},{"name":"axes_info","type":{"type":"map","values":{"type":"array","items":"string"}}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("x_column_names", "array", [("string")]), ("y_column_names", "array", [("string")]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("bg_color", "string"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("bg_color", "string"), ("image_data", "bytes"), ("axes_info", "map", [("array", [("string")])])] )
-        ENDPOINT = "/visualize/image/chart"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image/classbreak"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_classbreak_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"cb_attr","type":"string"},{"name":"cb_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointcolor_attr","type":"string"},{"name":"cb_pointcolor_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointsize_attr","type":"string"},{"name":"cb_pointsize_vals","type":{"type":"array","items":"string"}},{"name":"cb_pointshape_attr","type":"string"},{"name":"cb_pointshape_vals","type":{"type":"array","items":"string"}},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_classbreak_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("track_ids", "array", [("array", [("string")])]), ("cb_attr", "string"), ("cb_vals", "array", [("string")]), ("cb_pointcolor_attr", "string"), ("cb_pointcolor_vals", "array", [("string")]), ("cb_pointsize_attr", "string"), ("cb_pointsize_vals", "array", [("string")]), ("cb_pointshape_attr", "string"), ("cb_pointshape_vals", "array", [("string")]), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] )
-        ENDPOINT = "/visualize/image/classbreak"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image/contour"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_contour_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_contour_response","fields":[{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"},{"name":"grid_data","type":"bytes"},{"name":"fill_n0","type":"double"},{"name":"fill_nn","type":"double"},{"name":"min_level","type":"double"},{"name":"max_level","type":"double"},{"name":"samples_used","type":"long"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("value_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "int"), ("height", "int"), ("bg_color", "long"), ("image_data", "bytes"), ("grid_data", "bytes"), ("fill_n0", "double"), ("fill_nn", "double"), ("min_level", "double"), ("max_level", "double"), ("samples_used", "long")] )
-        ENDPOINT = "/visualize/image/contour"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image/heatmap"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_heatmap_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"value_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_heatmap_response","fields":[{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("value_column_name", "string"), ("geometry_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "int"), ("height", "int"), ("bg_color", "long"), ("image_data", "bytes")] )
-        ENDPOINT = "/visualize/image/heatmap"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/image/labels"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_image_labels_request","fields":[{"name":"table_name","type":"string"},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"x_offset","type":"string"},{"name":"y_offset","type":"string"},{"name":"text_string","type":"string"},{"name":"font","type":"string"},{"name":"text_color","type":"string"},{"name":"text_angle","type":"string"},{"name":"text_scale","type":"string"},{"name":"draw_box","type":"string"},{"name":"draw_leader","type":"string"},{"name":"line_width","type":"string"},{"name":"line_color","type":"string"},{"name":"fill_color","type":"string"},{"name":"leader_x_column_name","type":"string"},{"name":"leader_y_column_name","type":"string"},{"name":"filter","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_image_labels_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"image_data","type":"bytes"}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_name", "string"), ("x_column_name", "string"), ("y_column_name", "string"), ("x_offset", "string"), ("y_offset", "string"), ("text_string", "string"), ("font", "string"), ("text_color", "string"), ("text_angle", "string"), ("text_scale", "string"), ("draw_box", "string"), ("draw_leader", "string"), ("line_width", "string"), ("line_color", "string"), ("fill_color", "string"), ("leader_x_column_name", "string"), ("leader_y_column_name", "string"), ("filter", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("image_data", "bytes")] )
-        ENDPOINT = "/visualize/image/labels"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/video"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_video_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"world_table_names","type":{"type":"array","items":"string"}},{"name":"track_ids","type":{"type":"array","items":{"type":"array","items":"string"}}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"geometry_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"bg_color","type":"long"},{"name":"time_intervals","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"video_style","type":"string"},{"name":"session_key","type":"string"},{"name":"style_options","type":{"type":"map","values":{"type":"array","items":"string"}}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_video_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"num_frames","type":"int"},{"name":"session_key","type":"string"},{"name":"data","type":{"type":"array","items":"bytes"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("world_table_names", "array", [("string")]), ("track_ids", "array", [("array", [("string")])]), ("x_column_name", "string"), ("y_column_name", "string"), ("geometry_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("width", "int"), ("height", "int"), ("projection", "string"), ("bg_color", "long"), ("time_intervals", "array", [("array", [("double")])]), ("video_style", "string"), ("session_key", "string"), ("style_options", "map", [("array", [("string")])]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("num_frames", "int"), ("session_key", "string"), ("data", "array", [("bytes")])] )
-        ENDPOINT = "/visualize/video"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
-        name = "/visualize/video/heatmap"
-        REQ_SCHEMA_STR = """{"type":"record","name":"visualize_video_heatmap_request","fields":[{"name":"table_names","type":{"type":"array","items":"string"}},{"name":"x_column_name","type":"string"},{"name":"y_column_name","type":"string"},{"name":"min_x","type":"double"},{"name":"max_x","type":"double"},{"name":"min_y","type":"double"},{"name":"max_y","type":"double"},{"name":"time_intervals","type":{"type":"array","items":{"type":"array","items":"double"}}},{"name":"width","type":"int"},{"name":"height","type":"int"},{"name":"projection","type":"string"},{"name":"video_style","type":"string"},{"name":"session_key","type":"string"},{"name":"style_options","type":{"type":"map","values":"string"}},{"name":"options","type":{"type":"map","values":"string"}}]}"""
-        RSP_SCHEMA_STR = """{"type":"record","name":"visualize_video_heatmap_response","fields":[{"name":"width","type":"double"},{"name":"height","type":"double"},{"name":"bg_color","type":"long"},{"name":"num_frames","type":"int"},{"name":"session_key","type":"string"},{"name":"data","type":{"type":"array","items":"bytes"}}]}"""
-        REQ_SCHEMA = Schema( "record", [("table_names", "array", [("string")]), ("x_column_name", "string"), ("y_column_name", "string"), ("min_x", "double"), ("max_x", "double"), ("min_y", "double"), ("max_y", "double"), ("time_intervals", "array", [("array", [("double")])]), ("width", "int"), ("height", "int"), ("projection", "string"), ("video_style", "string"), ("session_key", "string"), ("style_options", "map", [("string")]), ("options", "map", [("string")])] )
-        RSP_SCHEMA = Schema( "record", [("width", "double"), ("height", "double"), ("bg_color", "long"), ("num_frames", "int"), ("session_key", "string"), ("data", "array", [("bytes")])] )
-        ENDPOINT = "/visualize/video/heatmap"
-        self.gpudb_schemas[ name ] = { "REQ_SCHEMA_STR" : REQ_SCHEMA_STR,
-                                       "RSP_SCHEMA_STR" : RSP_SCHEMA_STR,
-                                       "REQ_SCHEMA" : REQ_SCHEMA,
-                                       "RSP_SCHEMA" : RSP_SCHEMA,
-                                       "ENDPOINT" : ENDPOINT }
+           in a lookup table (lookup by query name).  The lookup table is
+           shared by all GPUdb instances, and each endpoint's schemas are
+           only built the first time they are used.
+        """
+        self.gpudb_schemas = _gpudb_schema_registry
     # end load_gpudb_schemas
 
     def load_gpudb_func_to_endpoint_map( self ):
         """Saves a mapping of rest endpoint function names
-           to endpoints in a dictionary.
-        """
-        self.gpudb_func_to_endpoint_map = {}
-        self.gpudb_func_to_endpoint_map["admin_add_ranks"] = "/admin/add/ranks"
-        self.gpudb_func_to_endpoint_map["admin_alter_configuration"] = "/admin/alter/configuration"
-        self.gpudb_func_to_endpoint_map["admin_alter_jobs"] = "/admin/alter/jobs"
-        self.gpudb_func_to_endpoint_map["admin_alter_shards"] = "/admin/alter/shards"
-        self.gpudb_func_to_endpoint_map["admin_offline"] = "/admin/offline"
-        self.gpudb_func_to_endpoint_map["admin_rebalance"] = "/admin/rebalance"
-        self.gpudb_func_to_endpoint_map["admin_remove_ranks"] = "/admin/remove/ranks"
-        self.gpudb_func_to_endpoint_map["admin_show_alerts"] = "/admin/show/alerts"
-        self.gpudb_func_to_endpoint_map["admin_show_configuration"] = "/admin/show/configuration"
-        self.gpudb_func_to_endpoint_map["admin_show_jobs"] = "/admin/show/jobs"
-        self.gpudb_func_to_endpoint_map["admin_show_shards"] = "/admin/show/shards"
-        self.gpudb_func_to_endpoint_map["admin_shutdown"] = "/admin/shutdown"
-        self.gpudb_func_to_endpoint_map["admin_verify_db"] = "/admin/verifydb"
-        self.gpudb_func_to_endpoint_map["aggregate_convex_hull"] = "/aggregate/convexhull"
-        self.gpudb_func_to_endpoint_map["aggregate_group_by"] = "/aggregate/groupby"
-        self.gpudb_func_to_endpoint_map["aggregate_histogram"] = "/aggregate/histogram"
-        self.gpudb_func_to_endpoint_map["aggregate_k_means"] = "/aggregate/kmeans"
-        self.gpudb_func_to_endpoint_map["aggregate_min_max"] = "/aggregate/minmax"
-        self.gpudb_func_to_endpoint_map["aggregate_min_max_geometry"] = "/aggregate/minmax/geometry"
-        self.gpudb_func_to_endpoint_map["aggregate_statistics"] = "/aggregate/statistics"
-        self.gpudb_func_to_endpoint_map["aggregate_statistics_by_range"] = "/aggregate/statistics/byrange"
-        self.gpudb_func_to_endpoint_map["aggregate_unique"] = "/aggregate/unique"
-        self.gpudb_func_to_endpoint_map["aggregate_unpivot"] = "/aggregate/unpivot"
-        self.gpudb_func_to_endpoint_map["alter_system_properties"] = "/alter/system/properties"
-        self.gpudb_func_to_endpoint_map["alter_table"] = "/alter/table"
-        self.gpudb_func_to_endpoint_map["alter_table_metadata"] = "/alter/table/metadata"
-        self.gpudb_func_to_endpoint_map["alter_user"] = "/alter/user"
-        self.gpudb_func_to_endpoint_map["append_records"] = "/append/records"
-        self.gpudb_func_to_endpoint_map["clear_statistics"] = "/clear/statistics"
-        self.gpudb_func_to_endpoint_map["clear_table"] = "/clear/table"
-        self.gpudb_func_to_endpoint_map["clear_table_monitor"] = "/clear/tablemonitor"
-        self.gpudb_func_to_endpoint_map["clear_trigger"] = "/clear/trigger"
-        self.gpudb_func_to_endpoint_map["collect_statistics"] = "/collect/statistics"
-        self.gpudb_func_to_endpoint_map["create_job"] = "/create/job"
-        self.gpudb_func_to_endpoint_map["create_join_table"] = "/create/jointable"
-        self.gpudb_func_to_endpoint_map["create_materialized_view"] = "/create/materializedview"
-        self.gpudb_func_to_endpoint_map["create_proc"] = "/create/proc"
-        self.gpudb_func_to_endpoint_map["create_projection"] = "/create/projection"
-        self.gpudb_func_to_endpoint_map["create_role"] = "/create/role"
-        self.gpudb_func_to_endpoint_map["create_table"] = "/create/table"
-        self.gpudb_func_to_endpoint_map["create_table_monitor"] = "/create/tablemonitor"
-        self.gpudb_func_to_endpoint_map["create_trigger_by_area"] = "/create/trigger/byarea"
-        self.gpudb_func_to_endpoint_map["create_trigger_by_range"] = "/create/trigger/byrange"
-        self.gpudb_func_to_endpoint_map["create_type"] = "/create/type"
-        self.gpudb_func_to_endpoint_map["create_union"] = "/create/union"
-        self.gpudb_func_to_endpoint_map["create_user_external"] = "/create/user/external"
-        self.gpudb_func_to_endpoint_map["create_user_internal"] = "/create/user/internal"
-        self.gpudb_func_to_endpoint_map["delete_proc"] = "/delete/proc"
-        self.gpudb_func_to_endpoint_map["delete_records"] = "/delete/records"
-        self.gpudb_func_to_endpoint_map["delete_role"] = "/delete/role"
-        self.gpudb_func_to_endpoint_map["delete_user"] = "/delete/user"
-        self.gpudb_func_to_endpoint_map["execute_proc"] = "/execute/proc"
-        self.gpudb_func_to_endpoint_map["execute_sql"] = "/execute/sql"
-        self.gpudb_func_to_endpoint_map["filter"] = "/filter"
-        self.gpudb_func_to_endpoint_map["filter_by_area"] = "/filter/byarea"
-        self.gpudb_func_to_endpoint_map["filter_by_area_geometry"] = "/filter/byarea/geometry"
-        self.gpudb_func_to_endpoint_map["filter_by_box"] = "/filter/bybox"
-        self.gpudb_func_to_endpoint_map["filter_by_box_geometry"] = "/filter/bybox/geometry"
-        self.gpudb_func_to_endpoint_map["filter_by_geometry"] = "/filter/bygeometry"
-        self.gpudb_func_to_endpoint_map["filter_by_list"] = "/filter/bylist"
-        self.gpudb_func_to_endpoint_map["filter_by_radius"] = "/filter/byradius"
-        self.gpudb_func_to_endpoint_map["filter_by_radius_geometry"] = "/filter/byradius/geometry"
-        self.gpudb_func_to_endpoint_map["filter_by_range"] = "/filter/byrange"
-        self.gpudb_func_to_endpoint_map["filter_by_series"] = "/filter/byseries"
-        self.gpudb_func_to_endpoint_map["filter_by_string"] = "/filter/bystring"
-        self.gpudb_func_to_endpoint_map["filter_by_table"] = "/filter/bytable"
-        self.gpudb_func_to_endpoint_map["filter_by_value"] = "/filter/byvalue"
-        self.gpudb_func_to_endpoint_map["get_job"] = "/get/job"
-        self.gpudb_func_to_endpoint_map["get_records"] = "/get/records"
-        self.gpudb_func_to_endpoint_map["get_records_by_column"] = "/get/records/bycolumn"
-        self.gpudb_func_to_endpoint_map["get_records_by_series"] = "/get/records/byseries"
-        self.gpudb_func_to_endpoint_map["get_records_from_collection"] = "/get/records/fromcollection"
-        self.gpudb_func_to_endpoint_map["grant_permission_system"] = "/grant/permission/system"
-        self.gpudb_func_to_endpoint_map["grant_permission_table"] = "/grant/permission/table"
-        self.gpudb_func_to_endpoint_map["grant_role"] = "/grant/role"
-        self.gpudb_func_to_endpoint_map["has_proc"] = "/has/proc"
-        self.gpudb_func_to_endpoint_map["has_table"] = "/has/table"
-        self.gpudb_func_to_endpoint_map["has_type"] = "/has/type"
-        self.gpudb_func_to_endpoint_map["insert_records"] = "/insert/records"
-        self.gpudb_func_to_endpoint_map["insert_records_random"] = "/insert/records/random"
-        self.gpudb_func_to_endpoint_map["insert_symbol"] = "/insert/symbol"
-        self.gpudb_func_to_endpoint_map["kill_proc"] = "/kill/proc"
-        self.gpudb_func_to_endpoint_map["lock_table"] = "/lock/table"
-        self.gpudb_func_to_endpoint_map["merge_records"] = "/merge/records"
-        self.gpudb_func_to_endpoint_map["admin_replace_tom"] = "/replace/tom"
-        self.gpudb_func_to_endpoint_map["revoke_permission_system"] = "/revoke/permission/system"
-        self.gpudb_func_to_endpoint_map["revoke_permission_table"] = "/revoke/permission/table"
-        self.gpudb_func_to_endpoint_map["revoke_role"] = "/revoke/role"
-        self.gpudb_func_to_endpoint_map["show_proc"] = "/show/proc"
-        self.gpudb_func_to_endpoint_map["show_proc_status"] = "/show/proc/status"
-        self.gpudb_func_to_endpoint_map["show_security"] = "/show/security"
-        self.gpudb_func_to_endpoint_map["show_statistics"] = "/show/statistics"
-        self.gpudb_func_to_endpoint_map["show_system_properties"] = "/show/system/properties"
-        self.gpudb_func_to_endpoint_map["show_system_status"] = "/show/system/status"
-        self.gpudb_func_to_endpoint_map["show_system_timing"] = "/show/system/timing"
-        self.gpudb_func_to_endpoint_map["show_table"] = "/show/table"
-        self.gpudb_func_to_endpoint_map["show_table_metadata"] = "/show/table/metadata"
-        self.gpudb_func_to_endpoint_map["show_tables_by_type"] = "/show/tables/bytype"
-        self.gpudb_func_to_endpoint_map["show_triggers"] = "/show/triggers"
-        self.gpudb_func_to_endpoint_map["show_types"] = "/show/types"
-        self.gpudb_func_to_endpoint_map["update_records"] = "/update/records"
-        self.gpudb_func_to_endpoint_map["update_records_by_series"] = "/update/records/byseries"
-        self.gpudb_func_to_endpoint_map["visualize_image"] = "/visualize/image"
-        self.gpudb_func_to_endpoint_map["visualize_image_chart"] = "/visualize/image/chart"
-        self.gpudb_func_to_endpoint_map["visualize_image_classbreak"] = "/visualize/image/classbreak"
-        self.gpudb_func_to_endpoint_map["visualize_image_contour"] = "/visualize/image/contour"
-        self.gpudb_func_to_endpoint_map["visualize_image_heatmap"] = "/visualize/image/heatmap"
-        self.gpudb_func_to_endpoint_map["visualize_image_labels"] = "/visualize/image/labels"
-        self.gpudb_func_to_endpoint_map["visualize_video"] = "/visualize/video"
-        self.gpudb_func_to_endpoint_map["visualize_video_heatmap"] = "/visualize/video/heatmap"
+           to endpoints in a dictionary (shared by all GPUdb instances).
+        """
+        self.gpudb_func_to_endpoint_map = _gpudb_func_to_endpoint_map
     # end load_gpudb_func_to_endpoint_map
 
     # begin admin_alter_jobs
@@ -5531,7 +7279,8 @@ class GPUdb(object):
                                        offset = None, limit = 1000, encoding =
                                        'binary', options = {}, record_type =
                                        None, force_primitive_return_types =
-                                       True, get_column_major = True ):
+                                       True, get_column_major = True,
+                                       use_numpy = False ):
         """Calculates unique combinations (groups) of values for the given columns
         in a given table/view/collection and computes aggregates on each unique
         combination. This is somewhat analogous to an SQL-style SELECT...GROUP
@@ -5798,9 +7547,18 @@ class GPUdb(object):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A dict with the following entries--
@@ -5828,6 +7586,7 @@ class GPUdb(object):
         assert ( (record_type == None) or isinstance(record_type, RecordType) ), "aggregate_group_by_and_decode: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
         assert isinstance(force_primitive_return_types, bool), "aggregate_group_by_and_decode: Argument 'force_primitive_return_types' must be bool; given %s" % type( force_primitive_return_types ).__name__
         assert isinstance(get_column_major, bool), "aggregate_group_by_and_decode: Argument 'get_column_major' must be bool; given %s" % type( get_column_major ).__name__
+        assert isinstance(use_numpy, bool), "aggregate_group_by_and_decode: Argument 'use_numpy' must be bool; given %s" % type( use_numpy ).__name__
 
         (REQ_SCHEMA, RSP_SCHEMA_CEXT) = self.__get_schemas( "/aggregate/groupby", get_rsp_cext = True )
 
@@ -5852,13 +7611,17 @@ class GPUdb(object):
         # Decode the data
         if (encoding == 'binary'):
             record_type = record_type if record_type else RecordType.from_dynamic_schema( response["response_schema_str"], raw_response, response["binary_encoded_response"] )
-            records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
-            if force_primitive_return_types:
-                records = _Util.convert_cext_records_to_ordered_dicts( records )
-
-            # Transpose the data to column-major, if requested by the user
             if get_column_major:
-                records = GPUdbRecord.transpose_data_to_col_major( records )
+                # The data is column-major on the wire; decode the columns
+                # as-is instead of creating and transposing records
+                columns = record_type.decode_dynamic_records_columnar( raw_response, response["binary_encoded_response"] )
+                records = _Util.convert_cext_columns_to_column_major( record_type, columns,
+                                                                      force_primitive_return_types,
+                                                                      use_numpy )
+            else:
+                records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
+                if force_primitive_return_types:
+                    records = _Util.convert_cext_records_to_ordered_dicts( records )
 
             response["records"] = records
         else:
@@ -6641,7 +8404,8 @@ class GPUdb(object):
                                      offset = None, limit = 10000, encoding =
                                      'binary', options = {}, record_type = None,
                                      force_primitive_return_types = True,
-                                     get_column_major = True ):
+                                     get_column_major = True,
+                                     use_numpy = False ):
         """Returns all the unique values from a particular column (specified by
         input parameter *column_name*) of a particular table or collection
         (specified by input parameter *table_name*). If input parameter
@@ -6810,9 +8574,18 @@ class GPUdb(object):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A dict with the following entries--
@@ -6840,6 +8613,7 @@ class GPUdb(object):
         assert ( (record_type == None) or isinstance(record_type, RecordType) ), "aggregate_unique_and_decode: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
         assert isinstance(force_primitive_return_types, bool), "aggregate_unique_and_decode: Argument 'force_primitive_return_types' must be bool; given %s" % type( force_primitive_return_types ).__name__
         assert isinstance(get_column_major, bool), "aggregate_unique_and_decode: Argument 'get_column_major' must be bool; given %s" % type( get_column_major ).__name__
+        assert isinstance(use_numpy, bool), "aggregate_unique_and_decode: Argument 'use_numpy' must be bool; given %s" % type( use_numpy ).__name__
 
         (REQ_SCHEMA, RSP_SCHEMA_CEXT) = self.__get_schemas( "/aggregate/unique", get_rsp_cext = True )
 
@@ -6864,13 +8638,17 @@ class GPUdb(object):
         # Decode the data
         if (encoding == 'binary'):
             record_type = record_type if record_type else RecordType.from_dynamic_schema( response["response_schema_str"], raw_response, response["binary_encoded_response"] )
-            records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
-            if force_primitive_return_types:
-                records = _Util.convert_cext_records_to_ordered_dicts( records )
-
-            # Transpose the data to column-major, if requested by the user
             if get_column_major:
-                records = GPUdbRecord.transpose_data_to_col_major( records )
+                # The data is column-major on the wire; decode the columns
+                # as-is instead of creating and transposing records
+                columns = record_type.decode_dynamic_records_columnar( raw_response, response["binary_encoded_response"] )
+                records = _Util.convert_cext_columns_to_column_major( record_type, columns,
+                                                                      force_primitive_return_types,
+                                                                      use_numpy )
+            else:
+                records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
+                if force_primitive_return_types:
+                    records = _Util.convert_cext_records_to_ordered_dicts( records )
 
             response["records"] = records
         else:
@@ -7100,7 +8878,8 @@ class GPUdb(object):
                                       None, encoding = 'binary', options = {},
                                       record_type = None,
                                       force_primitive_return_types = True,
-                                      get_column_major = True ):
+                                      get_column_major = True,
+                                      use_numpy = False ):
         """Rotate the column values into rows values.
 
         For unpivot details and examples, see `Unpivot
@@ -7258,9 +9037,18 @@ class GPUdb(object):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A dict with the following entries--
@@ -7293,6 +9081,7 @@ class GPUdb(object):
         assert ( (record_type == None) or isinstance(record_type, RecordType) ), "aggregate_unpivot_and_decode: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
         assert isinstance(force_primitive_return_types, bool), "aggregate_unpivot_and_decode: Argument 'force_primitive_return_types' must be bool; given %s" % type( force_primitive_return_types ).__name__
         assert isinstance(get_column_major, bool), "aggregate_unpivot_and_decode: Argument 'get_column_major' must be bool; given %s" % type( get_column_major ).__name__
+        assert isinstance(use_numpy, bool), "aggregate_unpivot_and_decode: Argument 'use_numpy' must be bool; given %s" % type( use_numpy ).__name__
 
         (REQ_SCHEMA, RSP_SCHEMA_CEXT) = self.__get_schemas( "/aggregate/unpivot", get_rsp_cext = True )
 
@@ -7318,13 +9107,17 @@ class GPUdb(object):
         # Decode the data
         if (encoding == 'binary'):
             record_type = record_type if record_type else RecordType.from_dynamic_schema( response["response_schema_str"], raw_response, response["binary_encoded_response"] )
-            records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
-            if force_primitive_return_types:
-                records = _Util.convert_cext_records_to_ordered_dicts( records )
-
-            # Transpose the data to column-major, if requested by the user
             if get_column_major:
-                records = GPUdbRecord.transpose_data_to_col_major( records )
+                # The data is column-major on the wire; decode the columns
+                # as-is instead of creating and transposing records
+                columns = record_type.decode_dynamic_records_columnar( raw_response, response["binary_encoded_response"] )
+                records = _Util.convert_cext_columns_to_column_major( record_type, columns,
+                                                                      force_primitive_return_types,
+                                                                      use_numpy )
+            else:
+                records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
+                if force_primitive_return_types:
+                    records = _Util.convert_cext_records_to_ordered_dicts( records )
 
             response["records"] = records
         else:
@@ -11464,7 +13257,9 @@ class GPUdb(object):
     # begin get_records_and_decode
     def get_records_and_decode( self, table_name = None, offset = 0, limit = 10000,
                                 encoding = 'binary', options = {}, record_type =
-                                None, force_primitive_return_types = True ):
+                                None, force_primitive_return_types = True,
+                                get_column_major = False, decode_threads = None,
+                                use_numpy = False ):
         """Retrieves records from a given table, optionally filtered by an
         expression and/or sorted by a column. This operation can be performed
         on tables, views, or on homogeneous collections (collections containing
@@ -11562,6 +13357,28 @@ class GPUdb(object):
                 :class:`Record` objects will be returned. Default value is
                 True.
 
+            get_column_major (bool)
+                Indicates if the decoded records will be returned column-major
+                (as an OrderedDict of column name to column values) instead of
+                as a list of records.  In binary mode, the records are decoded
+                directly into columns, without creating an object per record;
+                see :meth:`_Util.convert_cext_columns_to_column_major` for the
+                returned column types.  Default value is False.
+
+            decode_threads (int)
+                Number of threads to decode the binary records on, in chunks
+                of at least 10000 records each.  Only used when records are
+                not returned column-major.  If None, the *decode_threads*
+                setting of the client is used.  Default value is None.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
+
         Returns:
             A dict with the following entries--
 
@@ -11581,9 +13398,10 @@ class GPUdb(object):
             has_more_records (bool)
                 Too many records. Returned a partial set.
 
-            records (list of :class:`Record`)
+            records (list of :class:`Record` or OrderedDict)
                 A list of :class:`Record` objects which contain the decoded
-                records.
+                records, or an OrderedDict of column name to column values if
+                input parameter *get_column_major* is True.
         """
         assert isinstance( table_name, (basestring)), "get_records_and_decode(): Argument 'table_name' must be (one) of type(s) '(basestring)'; given %s" % type( table_name ).__name__
         assert isinstance( offset, (int, long, float)), "get_records_and_decode(): Argument 'offset' must be (one) of type(s) '(int, long, float)'; given %s" % type( offset ).__name__
@@ -11592,6 +13410,9 @@ class GPUdb(object):
         assert isinstance( options, (dict)), "get_records_and_decode(): Argument 'options' must be (one) of type(s) '(dict)'; given %s" % type( options ).__name__
         assert ( (record_type == None) or isinstance(record_type, RecordType) ), "get_records_and_decode: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
         assert isinstance(force_primitive_return_types, bool), "get_records_and_decode: Argument 'force_primitive_return_types' must be bool; given %s" % type( force_primitive_return_types ).__name__
+        assert isinstance(get_column_major, bool), "get_records_and_decode: Argument 'get_column_major' must be bool; given %s" % type( get_column_major ).__name__
+        assert ( (decode_threads == None) or (isinstance(decode_threads, (int, long)) and (decode_threads >= 1)) ), "get_records_and_decode: Argument 'decode_threads' must be a positive integer or None; given %s" % str( decode_threads )
+        assert isinstance(use_numpy, bool), "get_records_and_decode: Argument 'use_numpy' must be bool; given %s" % type( use_numpy ).__name__
 
         (REQ_SCHEMA, RSP_SCHEMA_CEXT) = self.__get_schemas( "/get/records", get_rsp_cext = True )
 
@@ -11615,13 +13436,27 @@ class GPUdb(object):
         # Decode the data
         if (encoding == 'binary'):
             record_type = record_type if record_type else self.get_known_type( response["type_name"] )
-            records = record_type.decode_records( raw_response, response["records_binary"] )
-            if force_primitive_return_types:
-                records = _Util.convert_cext_records_to_ordered_dicts( records )
+            if get_column_major:
+                # Decode straight into columns; no per-record objects needed
+                columns = record_type.decode_records_columnar( raw_response, response["records_binary"] )
+                records = _Util.convert_cext_columns_to_column_major( record_type, columns,
+                                                                      force_primitive_return_types,
+                                                                      use_numpy )
+            else:
+                decode_threads = decode_threads if decode_threads else self.decode_threads
+                thread_pool = self.__get_decode_thread_pool( decode_threads ) if (decode_threads > 1) else None
+                records = _Util.decode_cext_records_in_chunks( record_type, raw_response,
+                                                               response["records_binary"],
+                                                               thread_pool, decode_threads )
+                if force_primitive_return_types:
+                    records = _Util.convert_cext_records_to_ordered_dicts( records )
             response["records"] = records
         else:
-            response["records"] = [ json.loads(_r, object_pairs_hook = collections.OrderedDict)
-                                     for _r in response["records_json"] ]
+            records = [ json.loads(_r, object_pairs_hook = collections.OrderedDict)
+                        for _r in response["records_json"] ]
+            if get_column_major:
+                records = GPUdbRecord.transpose_data_to_col_major( records )
+            response["records"] = records
         # end if
 
         del response["records_binary"]
@@ -11786,7 +13621,8 @@ class GPUdb(object):
                                           encoding = 'binary', options = {},
                                           record_type = None,
                                           force_primitive_return_types = True,
-                                          get_column_major = True ):
+                                          get_column_major = True,
+                                          use_numpy = False ):
         """For a given table, retrieves the values from the requested column(s).
         Maps of column name to the array of values as well as the column data
         type are returned. This endpoint supports pagination with the input
@@ -11895,9 +13731,18 @@ class GPUdb(object):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A dict with the following entries--
@@ -11928,6 +13773,7 @@ class GPUdb(object):
         assert ( (record_type == None) or isinstance(record_type, RecordType) ), "get_records_by_column_and_decode: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
         assert isinstance(force_primitive_return_types, bool), "get_records_by_column_and_decode: Argument 'force_primitive_return_types' must be bool; given %s" % type( force_primitive_return_types ).__name__
         assert isinstance(get_column_major, bool), "get_records_by_column_and_decode: Argument 'get_column_major' must be bool; given %s" % type( get_column_major ).__name__
+        assert isinstance(use_numpy, bool), "get_records_by_column_and_decode: Argument 'use_numpy' must be bool; given %s" % type( use_numpy ).__name__
 
         (REQ_SCHEMA, RSP_SCHEMA_CEXT) = self.__get_schemas( "/get/records/bycolumn", get_rsp_cext = True )
 
@@ -11952,13 +13798,17 @@ class GPUdb(object):
         # Decode the data
         if (encoding == 'binary'):
             record_type = record_type if record_type else RecordType.from_dynamic_schema( response["response_schema_str"], raw_response, response["binary_encoded_response"] )
-            records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
-            if force_primitive_return_types:
-                records = _Util.convert_cext_records_to_ordered_dicts( records )
-
-            # Transpose the data to column-major, if requested by the user
             if get_column_major:
-                records = GPUdbRecord.transpose_data_to_col_major( records )
+                # The data is column-major on the wire; decode the columns
+                # as-is instead of creating and transposing records
+                columns = record_type.decode_dynamic_records_columnar( raw_response, response["binary_encoded_response"] )
+                records = _Util.convert_cext_columns_to_column_major( record_type, columns,
+                                                                      force_primitive_return_types,
+                                                                      use_numpy )
+            else:
+                records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
+                if force_primitive_return_types:
+                    records = _Util.convert_cext_records_to_ordered_dicts( records )
 
             response["records"] = records
         else:
@@ -12912,7 +14762,12 @@ class GPUdb(object):
         # end if
 
 
-        if use_object_array:
+        if ( (self.insert_chunk_size is not None) and (self.encoding != 'JSON') ):
+            # Stream the request instead of encoding it all up front
+            body = _StreamingBody( lambda: self.__get_insert_records_chunks( obj, use_object_array ) )
+            response, response_time = self.__post_to_gpudb_read( body, '/insert/records' )
+            response = self.__read_datum_cext( RSP_SCHEMA, response, None, response_time )
+        elif use_object_array:
             response = self.__post_then_get_cext( REQ_SCHEMA_CEXT, RSP_SCHEMA, obj, '/insert/records' )
         else:
             response = self.__post_then_get_cext( REQ_SCHEMA, RSP_SCHEMA, obj, '/insert/records' )
@@ -12924,6 +14779,149 @@ class GPUdb(object):
     # end insert_records
 
 
+    def __get_insert_records_chunks( self, obj, use_object_array ):
+        """Generates the binary encoded /insert/records request *obj* in
+        chunks of about *insert_chunk_size* bytes.  The records are encoded
+        a batch at a time, each batch making one Avro array block.  Records
+        given already encoded are only split into blocks; they take as much
+        memory as they did before being passed in.
+
+        Parameters:
+            obj (dict)
+                The request, as built by :meth:`.insert_records`.
+            use_object_array (bool)
+                Whether the records are given as :class:`Record` objects
+                (rather than as encoded bytes).
+        """
+        yield _insert_records_head_schema.encode( { "table_name": obj[ "table_name" ] } )
+
+        if not obj[ "list" ]:
+            yield b"\x00" # empty array
+        elif use_object_array:
+            ( record_type, records ) = obj[ "list" ]
+            for block in self.__get_array_blocks( _insert_records_objects_schema, "list",
+                                                  records,
+                                                  lambda batch: ( record_type, batch ) ):
+                yield block
+        else:
+            for block in self.__get_array_blocks( _insert_records_bytes_schema, "list",
+                                                  obj[ "list" ], list ):
+                yield block
+
+        for block in self.__get_array_blocks( _insert_records_strings_schema, "list_str",
+                                              obj[ "list_str" ], list ):
+            yield block
+
+        yield _insert_records_tail_schema.encode( { "list_encoding": obj[ "list_encoding" ],
+                                                    "options": obj[ "options" ] } )
+    # end __get_insert_records_chunks
+
+
+    def __get_array_blocks( self, schema, field, values, make_value ):
+        """Generates the Avro encoding of an array as blocks of about
+        *insert_chunk_size* bytes, followed by the terminating empty block.
+
+        Parameters:
+            schema (Schema)
+                A record schema with the array as its only field.
+            field (str)
+                The name of the array field.
+            values (list)
+                The values of the array.
+            make_value (function)
+                Converts a slice of *values* to the value of the field.
+        """
+        # The first block holds a single value; the number of values of each
+        # following block is set from the average encoded size of the values
+        # of the previous one, but at most doubles from block to block, so
+        # that a block does not grow much larger than the chunk size
+        batch_size = 1
+        start = 0
+        while (start < len( values )):
+            batch = values[ start : start + batch_size ]
+            block = schema.encode( { field: make_value( batch ) } )
+
+            # Drop the empty block ending the encoded array
+            block = block[ : -1 ]
+            yield block
+
+            batch_size = max( 1, min( 2 * len( batch ),
+                                      int( self.insert_chunk_size * len( batch )
+                                           / float( len( block ) ) ) ) )
+            start += len( batch )
+        # end while
+
+        yield b"\x00"
+    # end __get_array_blocks
+
+
+    def insert_records_columnar( self, table_name = None, data = None,
+                                 null_masks = None, options = {},
+                                 record_type = None ):
+        """Adds multiple records, given as column-major data, to the specified
+        table.  The records are encoded by the C-extension directly from the
+        column values, in a single pass, without creating an object per
+        record; NumPy arrays of numeric or date/time types are read as typed
+        buffers.  Otherwise, this behaves as :meth:`.insert_records` with
+        binary encoding.
+
+        Parameters:
+
+            table_name (str)
+                Table to which the records are to be added. Must be an existing
+                table.
+
+            data (dict of str to sequence or NumPy array)
+                The values of each column of the table, keyed by column name.
+                All columns must have the same number of values.  For NumPy
+                arrays, date, datetime and time columns can be given as
+                'datetime64' or 'timedelta64' arrays, and masked arrays can be
+                used for nullable columns.  Sequences must contain values of
+                the types accepted by :class:`Record`, and None for nulls.
+
+            null_masks (dict of str to sequence)
+                Optional null masks for the nullable columns, keyed by column
+                name.  A true value in a mask indicates that the column value
+                in that row is null (and the value given in input parameter
+                *data* is ignored).  Default None.
+
+            options (dict of str to str)
+                Optional parameters; see :meth:`.insert_records`.  Default
+                value is an empty dict ( {} ).
+
+            record_type (RecordType)
+                The :class:`RecordType` of the table.  If None, it will be
+                looked up using :meth:`.show_table`.  Default is None.
+
+        Returns:
+            A dict with the same entries as returned by
+            :meth:`.insert_records`.
+        """
+        assert isinstance( table_name, (basestring)), "insert_records_columnar(): Argument 'table_name' must be (one) of type(s) '(basestring)'; given %s" % type( table_name ).__name__
+        assert isinstance( data, (dict)), "insert_records_columnar(): Argument 'data' must be (one) of type(s) '(dict)'; given %s" % type( data ).__name__
+        assert isinstance( null_masks, (dict, type( None ))), "insert_records_columnar(): Argument 'null_masks' must be (one) of type(s) '(dict, type( None ))'; given %s" % type( null_masks ).__name__
+        assert isinstance( options, (dict)), "insert_records_columnar(): Argument 'options' must be (one) of type(s) '(dict)'; given %s" % type( options ).__name__
+        assert ( (record_type == None) or isinstance(record_type, RecordType) ), "insert_records_columnar: Argument 'record_type' must be either RecordType or None; given %s" % type( record_type ).__name__
+
+        if not record_type:
+            show_table_rsp = self.show_table( table_name )
+            if not _Util.is_ok( show_table_rsp ):
+                return show_table_rsp
+            record_type = self.get_known_type( show_table_rsp["type_ids"][ 0 ] )
+        # end if
+
+        # Encode all the records in one go
+        columns, nulls = _Util.convert_columns_to_cext_columns( record_type, data, null_masks )
+        try:
+            encoded_data = record_type.encode_records_columnar( columns, nulls )
+        except (TypeError, ValueError, OverflowError) as e:
+            raise GPUdbException( str( e ) )
+
+        # The records are already encoded, so they are sent as is
+        return self.insert_records( table_name, encoded_data, "binary", options )
+    # end insert_records_columnar
+
+
     # begin insert_records_random
     def insert_records_random( self, table_name = None, count = None, options = {}
                                ):
@@ -15667,9 +17665,9 @@ class GPUdbTable( object ):
             # Save the per-insertion-call flushing setting
             self._flush_multi_head_ingest_per_insertion = flush_multi_head_ingest_per_insertion
 
-            # Set the function used by multihead ingestor for encoding records
-            # TODO: Convert the multihead ingestor to use the c-extension
-            self._record_encoding_function = lambda vals: GPUdbRecord( self.gpudbrecord_type, vals )
+            # The multihead ingestor converts the records into c-extension
+            # Record objects itself
+            self._record_encoding_function = lambda vals: vals
         else: # no multi-head ingestion
             # Set the function used by the regular insertion for encoding records
             self._record_encoding_function = lambda vals: self.__encode_data_for_insertion_cext( vals )
@@ -15680,7 +17678,8 @@ class GPUdbTable( object ):
         self._multihead_retriever = None
         if use_multihead_io:
             self._multihead_retriever = RecordRetriever( self.db, self.name,
-                                                         self.gpudbrecord_type )
+                                                         self.gpudbrecord_type,
+                                                         is_table_replicated = self._is_replicated )
 
             # Set the function used by multihead ingestor for encoding records
             # TODO: Convert the multi-head record retriever to use the c-extension
@@ -15785,12 +17784,47 @@ class GPUdbTable( object ):
     def __iter__( self ):
         """Return a table iterator for this table.  Defaults to the first
         10,000 records in the table.  If needing to access more records,
-        please use the GPUdbTableIterator class directly.
+        please use :meth:`.iter_records`, or the GPUdbTableIterator class
+        directly.
         """
         return GPUdbTableIterator( self )
     # end __iter__
 
 
+    def iter_records( self, page_size = 10000, prefetch_depth = 2,
+                      options = None, force_primitive_return_types = True ):
+        """Return an iterator that streams all the records of this table
+        (or those matching a filter expression), fetching them page by page.
+        The next pages are fetched on a background thread while the current
+        page is being consumed.
+
+        Parameters:
+            page_size (int)
+                The number of records to fetch per /get/records call.
+                Default is 10000.
+
+            prefetch_depth (int)
+                The maximum number of fetched pages to hold ahead of the page
+                being consumed; bounds the memory used.  Default is 2.
+
+            options (dict of str)
+                Options for /get/records, e.g. *expression*, *sort_by* and
+                *sort_order*; see :meth:`.get_records`.  Default None.
+
+            force_primitive_return_types (bool)
+                See :meth:`.get_records`.  Default is True.
+
+        Returns:
+            A :class:`GPUdbTableStreamIterator` object.
+        """
+        return GPUdbTableStreamIterator( self, page_size = page_size,
+                                         prefetch_depth = prefetch_depth,
+                                         options = options,
+                                         force_primitive_return_types =
+                                         force_primitive_return_types )
+    # end iter_records
+
+
     def __process_view_name(self, view_name ):
         """Given a view name, process it as needed.
 
@@ -16183,6 +18217,63 @@ class GPUdbTable( object ):
     # end insert_records
 
 
+    def insert_records_columnar( self, data, null_masks = None, options = None ):
+        """Insert multiple records given as column-major data.  The records
+        are encoded by the C-extension directly from the column values; see
+        :meth:`GPUdb.insert_records_columnar`.  They are inserted through the
+        head node in a single request even if multi-head ingestion is set
+        up, after the records queued for it have been flushed.
+
+        Parameters:
+            data (dict of str to sequence or NumPy array)
+                The values of each column of the table, keyed by column name.
+                All columns must have the same number of values.
+
+            null_masks (dict of str to sequence)
+                Optional null masks for the nullable columns, keyed by column
+                name.  Default None.
+
+            options (dict of str to str)
+                Optional parameters for the insertion operation.  Default None.
+
+        Returns:
+            A :class:`.GPUdbTable` object with the the insert_records()
+            response fields converted to attributes and stored within.
+        """
+        options = options if options else {}
+
+        if self._multihead_ingestor:
+            # The ingestor routes record objects; rather than creating them
+            # from the columns, let the head node route the encoded records,
+            # after the ones queued earlier (which they may update)
+            try:
+                self._multihead_ingestor.flush()
+            except Exception as e:
+                raise GPUdbException( str(e) )
+        # end if
+
+        try: # if the first attempt fails, we'll check if the table
+            # type has been modified by any chance
+            response = self.db.insert_records_columnar( self.name, data, null_masks,
+                                                        options, self.record_type )
+            if not _Util.is_ok( response ):
+                raise GPUdbException( _Util.get_error_msg( response ) )
+        except GPUdbException as e:
+            if self.__update_table_type():
+                # The table type indeed had been modified; retry insertion
+                # with the current/new type
+                response = self.db.insert_records_columnar( self.name, data, null_masks,
+                                                            options, self.record_type )
+                if not _Util.is_ok( response ):
+                    raise GPUdbException( _Util.get_error_msg( response ) )
+            else:
+                raise
+        # end try-catch
+
+        return self
+    # end insert_records_columnar
+
+
     def insert_records_random( self, count = None, options = {} ):
         """Generates a specified number of random records and adds them to the
         given table. There is an optional parameter that allows the user to
@@ -16444,7 +18535,8 @@ class GPUdbTable( object ):
     
     def get_records( self, offset = 0, limit = 10000,
                      encoding = 'binary', options = {},
-                     force_primitive_return_types = True ):
+                     force_primitive_return_types = True,
+                     get_column_major = False, use_numpy = False ):
         """Retrieves records from a given table, optionally filtered by an
         expression and/or sorted by a column. This operation can be performed
         on tables, views, or on homogeneous collections (collections containing
@@ -16528,14 +18620,30 @@ class GPUdbTable( object ):
                 :class:`Record` objects will be returned. Default value is
                 True.
 
+            get_column_major (bool)
+                Indicates if the records will be returned column-major (as an
+                OrderedDict of column name to column values) instead of as a
+                list of records.  In binary mode, the records are decoded
+                directly into columns.  Default value is False.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists.  Default value is
+                False.
 
         Returns:
-            A list of :class:`Record` objects containg the record values.
+            A list of :class:`Record` objects containg the record values, or
+            an OrderedDict of column name to column values if
+            *get_column_major* is True.
         """
         response = self.db.get_records_and_decode( self.name, offset, limit, encoding, options,
                                                    record_type = self.record_type,
                                                    force_primitive_return_types =
-                                                   force_primitive_return_types )
+                                                   force_primitive_return_types,
+                                                   get_column_major = get_column_major,
+                                                   use_numpy = use_numpy )
         if not _Util.is_ok( response ):
             raise GPUdbException( _Util.get_error_msg( response ) )
 
@@ -16548,7 +18656,9 @@ class GPUdbTable( object ):
             response = self.db.get_records_and_decode( self.name, offset, limit, encoding, options,
                                                        record_type = self.record_type,
                                                        force_primitive_return_types =
-                                                       force_primitive_return_types )
+                                                       force_primitive_return_types,
+                                                       get_column_major = get_column_major,
+                                                       use_numpy = use_numpy )
         # end if
 
         # Return just the records; disregard the extra info within the response
@@ -16560,7 +18670,8 @@ class GPUdbTable( object ):
     def get_records_by_column( self, column_names, offset = 0, limit = 10000,
                                encoding = 'binary', options = {},
                                print_data = False,
-                               force_primitive_return_types = True, get_column_major = True ):
+                               force_primitive_return_types = True, get_column_major = True,
+                               use_numpy = False ):
         """For a given table, retrieves the values of the given columns within a
         given range. It returns maps of column name to the vector of values for
         each supported data type (double, float, long, int and string). This
@@ -16655,9 +18766,18 @@ class GPUdbTable( object ):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Decodes the fetched records and saves them in the response class in an
         attribute called data.
@@ -16672,7 +18792,8 @@ class GPUdbTable( object ):
                                                              force_primitive_return_types =
                                                              force_primitive_return_types,
                                                              get_column_major =
-                                                             get_column_major )
+                                                             get_column_major,
+                                                             use_numpy = use_numpy )
         if not _Util.is_ok( response ):
             raise GPUdbException( _Util.get_error_msg( response ) )
 
@@ -17492,7 +19613,8 @@ class GPUdbTable( object ):
     def aggregate_group_by( self, column_names = None, offset = None, limit =
                             1000, encoding = 'binary', options = {},
                             force_primitive_return_types = True,
-                            get_column_major = True ):
+                            get_column_major = True,
+                            use_numpy = False ):
         """Calculates unique combinations (groups) of values for the given columns
         in a given table/view/collection and computes aggregates on each unique
         combination. This is somewhat analogous to an SQL-style SELECT...GROUP
@@ -17748,9 +19870,18 @@ class GPUdbTable( object ):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A read-only GPUdbTable object if input options has "result_table";
@@ -17792,7 +19923,8 @@ class GPUdbTable( object ):
                                                           force_primitive_return_types=
                                                           force_primitive_return_types,
                                                           get_column_major =
-                                                          get_column_major )
+                                                          get_column_major,
+                                                          use_numpy = use_numpy )
         if not _Util.is_ok( response ):
             raise GPUdbException( _Util.get_error_msg( response ) )
 
@@ -18296,7 +20428,8 @@ class GPUdbTable( object ):
     def aggregate_unique( self, column_name = None, offset = None, limit =
                           10000, encoding = 'binary', options = {},
                           force_primitive_return_types = True, get_column_major
-                          = True ):
+                          = True,
+                          use_numpy = False ):
         """Returns all the unique values from a particular column (specified by
         input parameter *column_name*) of a particular table or collection
         (specified by input parameter *table_name*). If input parameter
@@ -18455,9 +20588,18 @@ class GPUdbTable( object ):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A read-only GPUdbTable object if input options has "result_table";
@@ -18498,7 +20640,8 @@ class GPUdbTable( object ):
                                                         force_primitive_return_types=
                                                         force_primitive_return_types,
                                                         get_column_major =
-                                                        get_column_major )
+                                                        get_column_major,
+                                                        use_numpy = use_numpy )
         if not _Util.is_ok( response ):
             raise GPUdbException( _Util.get_error_msg( response ) )
 
@@ -18517,7 +20660,8 @@ class GPUdbTable( object ):
                            value_column_name = '', pivoted_columns = None,
                            encoding = 'binary', options = {},
                            force_primitive_return_types = True, get_column_major
-                           = True ):
+                           = True,
+                           use_numpy = False ):
         """Rotate the column values into rows values.
 
         For unpivot details and examples, see `Unpivot
@@ -18662,9 +20806,18 @@ class GPUdbTable( object ):
                 True.
 
             get_column_major (bool)
-                Indicates if the decoded records will be transposed to be
-                column-major or returned as is (row-major).  Default value is
-                True.
+                Indicates if the decoded records will be returned column-major
+                or row-major.  In binary mode, column-major data is decoded
+                directly into columns, without creating an object per record.
+                Default value is True.
+
+            use_numpy (bool)
+                Only used if input parameter *get_column_major* is True and
+                the encoding is binary.  If True and NumPy is available, the
+                column values are returned as NumPy arrays (with masked arrays
+                for nullable columns) instead of lists, and the columns are
+                returned even if there are no records (instead of an empty
+                list).  Default value is False.
 
         Returns:
             A read-only GPUdbTable object if input options has "result_table";
@@ -18712,7 +20865,8 @@ class GPUdbTable( object ):
                                                          force_primitive_return_types=
                                                          force_primitive_return_types,
                                                          get_column_major =
-                                                         get_column_major )
+                                                         get_column_major,
+                                                         use_numpy = use_numpy )
         if not _Util.is_ok( response ):
             raise GPUdbException( _Util.get_error_msg( response ) )
 
@@ -21075,6 +23229,119 @@ class GPUdbTableIterator( Iterator ):
 
 
 
+# ---------------------------------------------------------------------------
+# GPUdbTableStreamIterator - Iterator Class to stream all records of a table
+# ---------------------------------------------------------------------------
+class GPUdbTableStreamIterator( _PrefetchingIterator ):
+    """Iterates over all the records of a given table (or those matching a
+    filter expression), fetching them a page at a time.  A background thread
+    fetches up to *prefetch_depth* pages ahead while the caller consumes the
+    current page, so that the network is not idle while records are being
+    processed.
+
+    As with :class:`GPUdbTableIterator`, GPUdb does not guarantee the order of
+    the returned records, and if the table is modified while it is being
+    iterated over, records may be skipped or returned more than once.
+
+    The background thread stops once all records have been fetched, or when
+    the iterator is closed--by calling :meth:`close`, by leaving a ``with``
+    block, or by the iterator being garbage collected::
+
+        with GPUdbTableStreamIterator( table ) as records:
+            for record in records:
+                ...
+    """
+
+    def __init__( self, table, page_size = 10000, prefetch_depth = 2,
+                  options = None, force_primitive_return_types = True,
+                  db = None ):
+        """Initiate the iterator and start fetching the records.
+
+        Parameters:
+            table (GPUdbTable)
+                A GPUdbTable object or a name of a table
+            page_size (int)
+                The number of records to fetch per /get/records call; an
+                integer value greater than or equal to 1.
+            prefetch_depth (int)
+                The maximum number of fetched pages held ahead of the page
+                being consumed; an integer value greater than or equal to 1.
+            options (dict of str)
+                Optional options for /get/records (e.g. *expression*).
+            force_primitive_return_types (bool)
+                See :meth:`GPUdbTable.get_records`.
+            db (GPUdb)
+                Optional GPUdb object
+        """
+        if not isinstance( page_size, (int, long) ) or (page_size < 1):
+            raise GPUdbException( "Page size must be >= 1; given {0}"
+                                  "".format( page_size ) )
+        self.page_size = page_size
+
+        if not isinstance( prefetch_depth, (int, long) ) or (prefetch_depth < 1):
+            raise GPUdbException( "Prefetch depth must be >= 1; given {0}"
+                                  "".format( prefetch_depth ) )
+        self.prefetch_depth = prefetch_depth
+
+        if (options is not None) and not isinstance( options, dict ):
+            raise GPUdbException( "Argument 'options' must be a dict; given "
+                                  "{0}".format( type( options ) ) )
+        self.options = options if options else {}
+        self.force_primitive_return_types = force_primitive_return_types
+
+        # Save the table name and the GPUdb object
+        if isinstance( table, GPUdbTable ):
+            self.table = table
+        elif isinstance( table, (str, unicode) ):
+            if not isinstance( db, GPUdb ):
+                raise GPUdbException( "Argument 'db' must be a GPUdb object "
+                                      "if 'table' is the table name; given "
+                                      "{0}".format( type( db ) ) )
+            # Create the table object
+            self.table = GPUdbTable( None, table, db = db )
+        else:
+            raise GPUdbException( "Argument 'table' must be a GPUdbTable object"
+                                  " or a string; given {0}".format( table ) )
+
+        # The page source must not refer to the iterator itself
+        get_pages = GPUdbTableStreamIterator.__get_pages
+        ( db, table_name ) = ( self.table.db, self.table.name )
+        options = self.options
+        super( GPUdbTableStreamIterator, self ).__init__(
+            [ lambda: get_pages( db, table_name, page_size, options,
+                                 force_primitive_return_types ) ],
+            prefetch_depth )
+    # end __init__
+
+
+    @staticmethod
+    def __get_pages( db, table_name, page_size, options,
+                     force_primitive_return_types ):
+        """Generates the pages of records of the table (run on the
+        background thread).
+        """
+        offset = 0
+        while True:
+            response = db.get_records_and_decode( table_name, offset, page_size,
+                                                  options = options,
+                                                  force_primitive_return_types =
+                                                  force_primitive_return_types )
+            if not _Util.is_ok( response ):
+                raise GPUdbException( _Util.get_error_msg( response ) )
+
+            records = response.records
+            offset += len( records )
+            yield records
+
+            if (not response.has_more_records) or (not records):
+                return
+        # end while
+    # end __get_pages
+
+# end class GPUdbTableStreamIterator
+
+
+
 # ---------------------------------------------------------------------------
 # GPUdbTableOptions - Class to handle GPUdb table creation options
 # ---------------------------------------------------------------------------
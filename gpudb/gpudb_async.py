@@ -0,0 +1,647 @@
+###############################################################################
+#
+# gpudb_async.py
+#
+# Python API file for making non-blocking requests to GPUdb using asyncio.
+# Requires Python 3.5 or later.
+#
+# Copyright (c) 2018 Kinetica DB Inc.
+#
+###############################################################################
+
+import asyncio
+import collections
+import inspect
+import json
+import ssl
+import time
+
+from gpudb.gpudb import GPUdb, GPUdbException, GPUdbConnectionException, \
+    GPUdbRecord, AttrDict, RecordType, _HostSelector, _Util
+
+
+
+# ---------------------------------------------------------------------------
+# _AsyncConnectionPool - Private pool of keep-alive asyncio HTTP connections
+# ---------------------------------------------------------------------------
+class _AsyncConnectionPool(object):
+    """Internal pool of persistent HTTP(S) stream connections to a single
+    host and port, for use from a single event loop.  At most
+    *max_connections* connections are open at once, whether in use or idle;
+    a request made while all of them are in use waits for one to be
+    released.  Connections left idle for more than *idle_timeout* seconds,
+    or closed by the server while idle, are closed instead of being reused.
+    """
+    def __init__( self, host, port, connection, max_connections, idle_timeout ):
+        self._host            = host
+        self._port            = port
+        self._ssl             = ssl.create_default_context() \
+                                if (connection == 'HTTPS') else None
+        self._max_connections = max_connections
+        self._idle_timeout    = idle_timeout
+        self._idle            = [] # list of (reader, writer, last used time)
+        self._num_open        = 0  # number of connections in use or idle
+        self._cond            = asyncio.Condition()
+    # end __init__
+
+
+    async def new_connection( self ):
+        """Opens a new connection; returns a (reader, writer) tuple."""
+        return await asyncio.open_connection( self._host, self._port,
+                                              ssl = self._ssl )
+    # end new_connection
+
+
+    def __take_idle( self ):
+        """Returns an idle connection that can be reused, or None, closing
+        any that cannot."""
+        now = time.time()
+        while self._idle:
+            ( reader, writer, last_used ) = self._idle.pop()
+            if ( reader.at_eof()
+                 or ( (self._idle_timeout is not None)
+                      and ((now - last_used) > self._idle_timeout) ) ):
+                writer.close()
+                self._num_open -= 1
+                continue
+            return ( reader, writer )
+        # end while
+        return None
+    # end __take_idle
+
+
+    async def acquire( self, timeout = None ):
+        """Returns a tuple of a reader, a writer, and whether it is a reused
+        keep-alive connection (which may have been closed by the server),
+        waiting up to *timeout* seconds (forever if None) for one to be
+        available.  The connection must be handed back with
+        :meth:`release` or :meth:`discard`.
+        """
+        async with self._cond:
+            await asyncio.wait_for(
+                self._cond.wait_for( lambda: ( bool( self._idle )
+                                               or (self._num_open < self._max_connections) ) ),
+                timeout )
+            idle = self.__take_idle()
+            if idle is not None:
+                return ( idle[ 0 ], idle[ 1 ], True )
+            self._num_open += 1
+        # end async with
+
+        try:
+            ( reader, writer ) = await self.new_connection()
+        except BaseException:
+            await self.__free_slot()
+            raise
+        return ( reader, writer, False )
+    # end acquire
+
+
+    async def __free_slot( self ):
+        async with self._cond:
+            self._num_open -= 1
+            self._cond.notify()
+    # end __free_slot
+
+
+    async def release( self, reader, writer ):
+        """Returns a connection whose response has been fully read back to
+        the pool."""
+        async with self._cond:
+            self._idle.append( (reader, writer, time.time()) )
+            self._cond.notify()
+    # end release
+
+
+    async def discard( self, writer ):
+        """Closes a connection that must not be reused, freeing its place in
+        the pool."""
+        writer.close()
+        await self.__free_slot()
+    # end discard
+
+
+    def clear( self ):
+        """Closes all idle connections."""
+        idle = self._idle
+        self._idle = []
+        self._num_open -= len( idle )
+        for ( reader, writer, last_used ) in idle:
+            writer.close()
+    # end clear
+# end class _AsyncConnectionPool
+
+
+
+# ---------------------------------------------------------------------------
+# AsyncGPUdb - asyncio client for GPUdb
+# ---------------------------------------------------------------------------
+class AsyncGPUdb(object):
+    """An asyncio-based client for GPUdb.  Every endpoint method of
+    :class:`GPUdb` is available as a coroutine with the same name and
+    arguments, e.g.::
+
+        db = AsyncGPUdb( host = "127.0.0.1", port = "9191" )
+        response = await db.filter( table_name = "t", view_name = "v",
+                                    expression = "x > 0" )
+
+    Requests are encoded and responses decoded with the same c-extension
+    schemas as :class:`GPUdb`, but are sent over non-blocking keep-alive
+    connections, so that a single event loop can have many requests in
+    flight at once.  A client must only be used from one event loop.
+
+    The *_and_decode* methods and :meth:`.insert_records` mirror their
+    :class:`GPUdb` counterparts.  The other methods return the response as
+    the server sent it (e.g. :meth:`.get_records` returns the binary
+    records undecoded).
+    """
+
+    def __init__( self, host = "127.0.0.1", port = "9191",
+                  host_manager_port = "9300",
+                  encoding = "BINARY", connection = 'HTTP',
+                  username = "", password = "", timeout = None,
+                  max_connections_per_host = 10,
+                  connection_idle_timeout = 60 ):
+        """
+        Construct a new asyncio GPUdb client instance.  No request is made
+        to the server until the first coroutine is awaited.
+
+        Parameters:
+
+            host, port, host_manager_port, encoding, connection, username,
+            password, timeout, max_connections_per_host,
+            connection_idle_timeout
+                Same as for :class:`GPUdb`.
+        """
+        # The synchronous client provides the connection information, the
+        # credentials and the request/response schemas; it never contacts
+        # the server itself.
+        self.db = GPUdb( host = host, port = port,
+                         host_manager_port = host_manager_port,
+                         encoding = encoding, connection = connection,
+                         username = username, password = password,
+                         timeout = timeout, no_init_db_contact = True,
+                         max_connections_per_host = max_connections_per_host,
+                         connection_idle_timeout = connection_idle_timeout )
+        self._pools = {}
+    # end __init__
+
+
+    def __getattr__( self, name ):
+        """Creates (and caches) a coroutine for any GPUdb endpoint method
+        not explicitly defined in this class."""
+        db = self.__dict__.get( "db" )
+        if ( (db is None) or (name not in db.gpudb_func_to_endpoint_map)
+             or not hasattr( GPUdb, name ) ):
+            raise AttributeError( "'AsyncGPUdb' object has no attribute '{}'"
+                                  "".format( name ) )
+
+        endpoint = db.gpudb_func_to_endpoint_map[ name ]
+        method   = self.__create_endpoint_method( name, endpoint )
+        setattr( self, name, method )
+        return method
+    # end __getattr__
+
+
+    def __create_endpoint_method( self, name, endpoint ):
+        """Builds a coroutine that takes the same arguments as the GPUdb
+        method *name* and submits them to *endpoint*."""
+        signature = inspect.signature( getattr( GPUdb, name ) )
+        schema_fields = json.loads( self.db.gpudb_schemas[ endpoint ]["REQ_SCHEMA_STR"] )["fields"]
+        fields = [ field["name"] for field in schema_fields ]
+        array_fields = set( field["name"] for field in schema_fields
+                            if ( isinstance( field["type"], dict )
+                                 and (field["type"]["type"] == "array") ) )
+
+        async def endpoint_method( *args, **kwargs ):
+            bound = signature.bind( None, *args, **kwargs )
+            bound.apply_defaults()
+
+            obj = {}
+            for field in fields:
+                value = bound.arguments[ field ]
+                if (field in array_fields) and not isinstance( value, (list, tuple) ):
+                    value = [] if (value is None) else [ value ]
+                obj[ field ] = value
+            # end loop
+
+            return AttrDict( await self.submit_request( endpoint, obj ) )
+        # end endpoint_method
+
+        endpoint_method.__name__ = name
+        endpoint_method.__doc__  = getattr( GPUdb, name ).__doc__
+        return endpoint_method
+    # end __create_endpoint_method
+
+
+    # -----------------------------------------------------------------------
+    # Transport
+    # -----------------------------------------------------------------------
+
+    def __get_pool( self, conn_token, port ):
+        """Returns the connection pool for the given host and port."""
+        key = ( conn_token._host, port )
+        pool = self._pools.get( key )
+        if pool is None:
+            pool = _AsyncConnectionPool( conn_token._host, port,
+                                         conn_token._connection,
+                                         self.db.max_connections_per_host,
+                                         self.db.connection_idle_timeout )
+            self._pools[ key ] = pool
+        return pool
+    # end __get_pool
+
+
+    @staticmethod
+    async def __read_response( reader ):
+        """Reads an HTTP/1.1 response; returns a tuple of the status code,
+        the headers (with lower-case names), and the body."""
+        status_line = await reader.readline()
+        if not status_line:
+            raise ConnectionResetError( "Connection closed by server" )
+        status = int( status_line.split()[ 1 ] )
+
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            ( key, value ) = line.decode( "latin-1" ).split( ":", 1 )
+            headers[ key.strip().lower() ] = value.strip()
+        # end while
+
+        if headers.get( "transfer-encoding", "" ).lower() == "chunked":
+            chunks = []
+            while True:
+                size = int( (await reader.readline()).split( b";" )[ 0 ], 16 )
+                if size == 0:
+                    # Skip any trailers
+                    while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                        pass
+                    break
+                chunks.append( await reader.readexactly( size ) )
+                await reader.readexactly( 2 ) # chunk's trailing CRLF
+            # end while
+            body = b"".join( chunks )
+        elif "content-length" in headers:
+            body = await reader.readexactly( int( headers[ "content-length" ] ) )
+        else:
+            body = await reader.read()
+            headers[ "connection" ] = "close"
+
+        return ( status, headers, body )
+    # end __read_response
+
+
+    async def __post_and_get( self, conn_token, port, headers, body_data, endpoint ):
+        """POST to the given host over a pooled keep-alive connection and
+        get the server response.  A reused connection that turns out to have
+        been closed by the server is retried once on a new connection, but
+        only if the request failed before being fully sent or the endpoint is
+        read-only, so that a request that may already have been applied by
+        the server is never resent."""
+        host = conn_token._host
+        url_path = (conn_token._gpudb_url_path + endpoint)
+        pool = self.__get_pool( conn_token, port )
+        is_idempotent = _HostSelector.is_read_only( endpoint )
+
+        request = [ "POST {} HTTP/1.1".format( url_path ),
+                    "Host: {}:{}".format( host, port ),
+                    "Content-Length: {}".format( len( body_data ) ) ]
+        request.extend( "{}: {}".format( k, v ) for ( k, v ) in headers.items() )
+        request = ("\r\n".join( request ) + "\r\n\r\n").encode( "latin-1" )
+
+        try:
+            ( reader, writer, is_reused ) = await pool.acquire( self.db.timeout )
+        except (OSError, asyncio.TimeoutError) as e:
+            raise GPUdbConnectionException( "Error connecting to '{}' on port {} due to: {}"
+                                            "".format( host, port, str(e) ) )
+
+        while True:
+            is_sent = False
+            try:
+                writer.write( request )
+                writer.write( body_data )
+                await writer.drain()
+                is_sent = True
+                ( status, resp_headers, resp_data ) = \
+                    await asyncio.wait_for( self.__read_response( reader ),
+                                            self.db.timeout )
+                break
+            except asyncio.TimeoutError:
+                await pool.discard( writer )
+                raise GPUdbConnectionException( "Timeout Error: No response received from %s:%s"
+                                                "" % (host, port) )
+            except (OSError, asyncio.IncompleteReadError, ValueError, IndexError) as e:
+                writer.close()
+
+                # A kept-alive socket may have been dropped by the server
+                # while idle; retry once from scratch on a fresh connection
+                # (which takes over the slot of the dropped one)
+                if is_reused and ( (not is_sent) or is_idempotent ):
+                    try:
+                        ( reader, writer ) = await pool.new_connection()
+                    except OSError as e:
+                        await pool.discard( writer )
+                        raise GPUdbConnectionException( "Error connecting to '{}' on port {} due to: {}"
+                                                        "".format( host, port, str(e) ) )
+                    is_reused = False
+                    continue
+
+                await pool.discard( writer )
+                raise GPUdbConnectionException( "Error posting to '{}:{}{}' due to: {}"
+                                                "".format( host, port, url_path, str(e) ) )
+            except BaseException:
+                # e.g. the awaiting task was cancelled
+                await pool.discard( writer )
+                raise
+        # end while
+
+        if resp_headers.get( "connection", "" ).lower() == "close":
+            await pool.discard( writer )
+        else:
+            await pool.release( reader, writer )
+
+        return ( resp_data, resp_headers.get( "x-request-time-secs", None ) )
+    # end __post_and_get
+
+
+    async def __post_to_gpudb_read( self, body_data, headers, endpoint,
+                                    use_host_manager = False ):
+        """POST to the current server, failing over to the next one (as
+        :class:`GPUdb` does) on a connection error."""
+        db = self.db
+        initial_index = db._current_conn_token_index
+
+        while True:
+            conn_token = db._get_current_conn_token()
+            port = conn_token._host_manager_port if use_host_manager else conn_token._port
+            try:
+                return await self.__post_and_get( conn_token, port, headers,
+                                                  body_data, endpoint )
+            except GPUdbException:
+                db._current_conn_token_index = \
+                    (db._current_conn_token_index + 1) % len( db._conn_tokens )
+                if (db._current_conn_token_index == initial_index):
+                    raise
+        # end while
+    # end __post_to_gpudb_read
+
+
+    async def submit_request( self, endpoint, request, get_req_cext = False,
+                              get_rsp_cext = False, get_raw = False ):
+        """Submit a request to any GPUdb endpoint and return the decoded
+        response.
+
+        Parameters:
+            endpoint (str)
+                Server path to POST to, e.g. "/filter".
+            request (dict)
+                Request dict matching the endpoint's request schema.
+            get_req_cext (bool)
+                If True, use the c-extension version of the request schema.
+            get_rsp_cext (bool)
+                If True, use the c-extension version of the response schema.
+            get_raw (bool)
+                If True, return a tuple of the decoded response and the raw
+                response bytes.
+
+        Returns:
+            The decoded response (an OrderedDict), or a tuple if *get_raw*.
+        """
+        ( headers, body_data ) = self.db._prepare_request( endpoint, request,
+                                                           get_req_cext = get_req_cext )
+        use_host_manager = endpoint in ("/admin/show/alerts",)
+        ( raw_response, response_time ) = \
+            await self.__post_to_gpudb_read( body_data, headers, endpoint,
+                                             use_host_manager = use_host_manager )
+        response = self.db._decode_response( endpoint, raw_response, response_time,
+                                             get_rsp_cext = get_rsp_cext )
+        if get_raw:
+            return ( response, raw_response )
+        return response
+    # end submit_request
+
+
+    def close( self ):
+        """Close all idle keep-alive connections."""
+        for pool in self._pools.values():
+            pool.clear()
+    # end close
+
+
+    # -----------------------------------------------------------------------
+    # Endpoints that need more than encoding the arguments as-is
+    # -----------------------------------------------------------------------
+
+    async def get_known_type( self, type_id, lookup_type = True ):
+        """Coroutine version of :meth:`GPUdb.get_known_type`."""
+        known_type = self.db.get_known_type( type_id, lookup_type = False )
+        if (known_type is not None) or not lookup_type:
+            return known_type
+
+        type_info = await self.show_types( type_id = type_id, label = "" )
+        if not _Util.is_ok( type_info ):
+            raise GPUdbException( "Error in finding type {}: {}"
+                                  "".format( type_id,
+                                             _Util.get_error_msg( type_info ) ) )
+
+        record_type = RecordType.from_type_schema( label = "",
+                                                   type_schema = type_info["type_schemas"][ 0 ],
+                                                   properties  = type_info["properties"][ 0 ] )
+        self.db.save_known_type( type_id, record_type )
+        return record_type
+    # end get_known_type
+
+
+    async def get_records_and_decode( self, table_name = None, offset = 0,
+                                      limit = 10000, encoding = 'binary',
+                                      options = {}, record_type = None,
+                                      force_primitive_return_types = True ):
+        """Coroutine version of :meth:`GPUdb.get_records_and_decode`."""
+        if ( (self.db.encoding == "JSON") and (encoding == "binary") ):
+            encoding = "json"
+
+        obj = {}
+        obj['table_name'] = table_name
+        obj['offset'] = offset
+        obj['limit'] = limit
+        obj['encoding'] = encoding
+        obj['options'] = options
+
+        response, raw_response = await self.submit_request( "/get/records", obj,
+                                                            get_rsp_cext = True,
+                                                            get_raw = True )
+        if not _Util.is_ok( response ):
+            return AttrDict( response )
+
+        # Decode the data
+        if (encoding == 'binary'):
+            record_type = record_type if record_type else (await self.get_known_type( response["type_name"] ))
+            records = record_type.decode_records( raw_response, response["records_binary"] )
+            if force_primitive_return_types:
+                records = _Util.convert_cext_records_to_ordered_dicts( records )
+            response["records"] = records
+        else:
+            response["records"] = [ json.loads(_r, object_pairs_hook = collections.OrderedDict)
+                                     for _r in response["records_json"] ]
+        # end if
+
+        del response["records_binary"]
+        del response["records_json"]
+
+        return AttrDict( response )
+    # end get_records_and_decode
+
+
+    async def __dynamic_request_and_decode( self, endpoint, obj, record_type,
+                                            force_primitive_return_types,
+                                            get_column_major ):
+        """Submits a request for an endpoint with a dynamic schema response
+        and decodes the records."""
+        if ( (self.db.encoding == "JSON") and (obj['encoding'] == "binary") ):
+            obj['encoding'] = "json"
+
+        response, raw_response = await self.submit_request( endpoint, obj,
+                                                            get_rsp_cext = True,
+                                                            get_raw = True )
+        if not _Util.is_ok( response ):
+            return AttrDict( response )
+
+        # Decode the data
+        if (obj['encoding'] == 'binary'):
+            record_type = record_type if record_type else RecordType.from_dynamic_schema( response["response_schema_str"], raw_response, response["binary_encoded_response"] )
+            records = record_type.decode_dynamic_records( raw_response, response["binary_encoded_response"] )
+            if force_primitive_return_types:
+                records = _Util.convert_cext_records_to_ordered_dicts( records )
+
+            # Transpose the data to column-major, if requested by the user
+            if get_column_major:
+                records = GPUdbRecord.transpose_data_to_col_major( records )
+
+            response["records"] = records
+        else:
+            records = json.loads( response["json_encoded_response"] )
+            if get_column_major:
+                records = GPUdbRecord.decode_dynamic_json_data_column_major( records, response["response_schema_str"] )
+            else:
+                records = GPUdbRecord.decode_dynamic_json_data_row_major( records, response["response_schema_str"] )
+            response["records"] = records
+        # end if
+
+        del response["binary_encoded_response"]
+        del response["json_encoded_response"]
+
+        return AttrDict( response )
+    # end __dynamic_request_and_decode
+
+
+    async def get_records_by_column_and_decode( self, table_name = None,
+                                                column_names = None,
+                                                offset = None, limit = None,
+                                                encoding = 'binary', options = {},
+                                                record_type = None,
+                                                force_primitive_return_types = True,
+                                                get_column_major = True ):
+        """Coroutine version of :meth:`GPUdb.get_records_by_column_and_decode`."""
+        obj = {}
+        obj['table_name'] = table_name
+        obj['column_names'] = column_names if isinstance( column_names, list ) else ( [] if (column_names is None) else [ column_names ] )
+        obj['offset'] = offset
+        obj['limit'] = limit
+        obj['encoding'] = encoding
+        obj['options'] = options
+
+        return await self.__dynamic_request_and_decode( "/get/records/bycolumn", obj,
+                                                        record_type,
+                                                        force_primitive_return_types,
+                                                        get_column_major )
+    # end get_records_by_column_and_decode
+
+
+    async def aggregate_group_by_and_decode( self, table_name = None,
+                                             column_names = None, offset = None,
+                                             limit = 1000, encoding = 'binary',
+                                             options = {}, record_type = None,
+                                             force_primitive_return_types = True,
+                                             get_column_major = True ):
+        """Coroutine version of :meth:`GPUdb.aggregate_group_by_and_decode`."""
+        obj = {}
+        obj['table_name'] = table_name
+        obj['column_names'] = column_names if isinstance( column_names, list ) else ( [] if (column_names is None) else [ column_names ] )
+        obj['offset'] = offset
+        obj['limit'] = limit
+        obj['encoding'] = encoding
+        obj['options'] = options
+
+        return await self.__dynamic_request_and_decode( "/aggregate/groupby", obj,
+                                                        record_type,
+                                                        force_primitive_return_types,
+                                                        get_column_major )
+    # end aggregate_group_by_and_decode
+
+
+    async def aggregate_unique_and_decode( self, table_name = None,
+                                           column_name = None, offset = None,
+                                           limit = 10000, encoding = 'binary',
+                                           options = {}, record_type = None,
+                                           force_primitive_return_types = True,
+                                           get_column_major = True ):
+        """Coroutine version of :meth:`GPUdb.aggregate_unique_and_decode`."""
+        obj = {}
+        obj['table_name'] = table_name
+        obj['column_name'] = column_name
+        obj['offset'] = offset
+        obj['limit'] = limit
+        obj['encoding'] = encoding
+        obj['options'] = options
+
+        return await self.__dynamic_request_and_decode( "/aggregate/unique", obj,
+                                                        record_type,
+                                                        force_primitive_return_types,
+                                                        get_column_major )
+    # end aggregate_unique_and_decode
+
+
+    async def insert_records( self, table_name = None, data = None,
+                              list_encoding = None, options = {},
+                              record_type = None ):
+        """Coroutine version of :meth:`GPUdb.insert_records`.  Records given
+        as lists or dicts (along with *record_type*) are converted to Record
+        objects on the event loop's default executor, so that converting a
+        large batch does not hold up the loop."""
+        data = data if isinstance( data, list ) else ( [] if (data is None) else [ data ] )
+
+        obj = {}
+        obj['table_name'] = table_name
+        list_encoding = list_encoding if list_encoding else \
+                        ('json' if (self.db.encoding == 'JSON') else 'binary')
+        obj['list_encoding'] = list_encoding
+        obj['options'] = options
+
+        if (list_encoding == 'binary'):
+            # Convert the objects to proper Records, off the event loop
+            loop = asyncio.get_event_loop()
+            use_object_array, data = await loop.run_in_executor(
+                None, _Util.convert_binary_data_to_cext_records,
+                self.db, table_name, data, record_type )
+
+            if use_object_array:
+                # First tuple element must be a RecordType or a Schema from the c-extension
+                obj['list'] = (data[0].type, data) if data else ()
+            else: # use avro-encoded bytes for the data
+                obj['list'] = data
+
+            obj['list_str'] = []
+        else:
+            obj['list_str'] = data
+            obj['list'] = () # needs a tuple for the c-extension
+            use_object_array = True
+        # end if
+
+        response = await self.submit_request( "/insert/records", obj,
+                                              get_req_cext = use_object_array )
+        return AttrDict( response )
+    # end insert_records
+
+# end class AsyncGPUdb
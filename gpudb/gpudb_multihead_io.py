@@ -15,8 +15,10 @@ import sys
 
 if sys.version_info.major >= 3:
     from gpudb.gpudb import GPUdb, GPUdbRecord, GPUdbRecordType, GPUdbColumnProperty, GPUdbException
+    from gpudb.gpudb import Record, _Util, _PrefetchingIterator, _GPUdbUnsentRequestException
 else:
     from gpudb import GPUdb, GPUdbRecord, GPUdbRecordType, GPUdbColumnProperty, GPUdbException
+    from gpudb import Record, _Util, _PrefetchingIterator, _GPUdbUnsentRequestException
 
 from avro import schema, datafile, io
 import datetime
@@ -24,31 +26,36 @@ import json
 import random
 import re
 import struct
+import threading
+import time
+import weakref
 
+from multiprocessing.pool import ThreadPool
 
+
+# From the c-extension: RecordType, for routing batches of records natively
+from protocol import RecordType
+
+
+# MurmurHash3 for computing the record key hashes: the native implementation
+# of the c-extension, else the mmh3 package, else the (much slower) pure
+# python implementation in the packages directory (all of them having the
+# same interface)
 try:
-    # if this fails, use the slower pure python implementation
-    import mmh3 # murmur hash
-    from mmh3 import hash_bytes, hash64 # murmur hash
-except:
-
-    import os
-    # The absolute path of this gpudb.py module for importing local packages
-    gpudb_module_path = __file__
-    if gpudb_module_path[len(gpudb_module_path)-3:] == "pyc": # allow symlinks to gpudb.py
-        gpudb_module_path = gpudb_module_path[0:len(gpudb_module_path)-1]
-    if os.path.islink(gpudb_module_path): # allow symlinks to gpudb.py
-        gpudb_module_path = os.readlink(gpudb_module_path)
-    gpudb_module_path = os.path.dirname(os.path.abspath(gpudb_module_path))
-
-    # Search for our modules first, probably don't need imp or virt envs.
-    if not gpudb_module_path + "/packages" in sys.path :
-        sys.path.insert(1, gpudb_module_path + "/packages")
-
-    # pure python implementation
-    import pymmh3 as mmh3
+    from protocol import hash64
+except ImportError:
+    try:
+        from mmh3 import hash64 # murmur hash
+    except ImportError:
+        from pymmh3 import hash64 # pure python implementation
 # end try block
 
+# Whether the c-extension builds (and hashes) the record keys natively; one
+# built from older sources does not, and the keys are then built in python
+_have_native_keys = ( hasattr( Record, "compute_key_hashes" )
+                      and hasattr( RecordType, "compute_key_hash_codes" )
+                      and hasattr( RecordType, "route_records" ) )
+
 
 # Python version dependent imports
 if sys.version_info >= (2, 7):
@@ -61,6 +68,19 @@ if sys.version_info.major >= 3:
 else:
     from urlparse import urlparse
 
+if sys.version_info.major >= 3:
+    from queue import Queue, Empty, Full
+else:
+    from Queue import Queue, Empty, Full
+
+# NumPy is optional; used for concatenating column-major scan results
+have_numpy = False
+try:
+    import numpy
+    have_numpy = True
+except ImportError:
+    have_numpy = False
+
 
 # Handle basestring in python3
 if sys.version_info.major >= 3:
@@ -89,7 +109,8 @@ class C:
     _ok     = "OK"
 
     # GPUdb /admin/show/shards response dict keys
-    _shard_ranks = "rank"
+    _shard_ranks   = "rank"
+    _shard_version = "version"
 
     # GPUdb /insert/records response dict keys
     _count_inserted = "count_inserted"
@@ -140,6 +161,121 @@ class InsertionException(Exception):
 # end class InsertionException
 
 
+
+# Class: InsertionFuture
+# ======================
+class InsertionFuture:
+    """The pending outcome of a batch of records sent to GPUdb in the
+    background by an asynchronous :class:`GPUdbIngestor`.
+    """
+    def __init__( self, records ):
+        self.records = records
+
+        self._done_event     = threading.Event()
+        self._lock           = threading.Lock()
+        self._callbacks      = []
+        self._count_inserted = None
+        self._count_updated  = None
+        self._exception      = None
+    # end __init__
+
+
+    def get_records( self ):
+        """Return the records of the batch."""
+        return self.records
+    # end get_records
+
+
+    def done( self ):
+        """Return whether the batch has been inserted or has failed."""
+        return self._done_event.is_set()
+    # end done
+
+
+    def result( self, timeout = None ):
+        """Wait for the batch to be inserted and return the counts.
+
+        Parameters:
+            timeout (float)
+                The maximum number of seconds to wait; waits indefinitely if
+                not given.
+
+        Returns:
+            A dict with the number of records inserted and updated under the
+            'count_inserted' and 'count_updated' keys.
+
+        @throws GPUdbException if the batch is not done within the timeout.
+        @throws InsertionException if the batch could not be inserted.
+        """
+        exception = self.exception( timeout )
+        if exception is not None:
+            raise exception
+
+        return { C._count_inserted : self._count_inserted,
+                 C._count_updated  : self._count_updated }
+    # end result
+
+
+    def exception( self, timeout = None ):
+        """Wait for the batch to be inserted and return the error, if
+        any; None otherwise.
+
+        @throws GPUdbException if the batch is not done within the timeout.
+        """
+        if not self._done_event.wait( timeout ):
+            raise GPUdbException( "Timed out waiting for the insertion of %d "
+                                  "records" % len( self.records ) )
+
+        return self._exception
+    # end exception
+
+
+    def add_done_callback( self, callback ):
+        """Register a callback that is called with this future once the
+        batch has been inserted or has failed (right away if that has
+        already happened).  Callbacks run on the ingestor's sender thread
+        and must not wait on the ingestor (e.g. by calling its flush()).
+        """
+        with self._lock:
+            if not self._done_event.is_set():
+                self._callbacks.append( callback )
+                return
+
+        callback( self )
+    # end add_done_callback
+
+
+    def _set_result( self, count_inserted, count_updated ):
+        """Mark the batch as inserted."""
+        self._count_inserted = count_inserted
+        self._count_updated  = count_updated
+        self.__finish()
+    # end _set_result
+
+
+    def _set_exception( self, exception ):
+        """Mark the batch as failed."""
+        self._exception = exception
+        self.__finish()
+    # end _set_exception
+
+
+    def __finish( self ):
+        """Wake up any waiters and run the callbacks."""
+        with self._lock:
+            self._done_event.set()
+            callbacks = self._callbacks
+            self._callbacks = []
+
+        for callback in callbacks:
+            try:
+                callback( self )
+            except Exception:
+                pass # a faulty callback must not stop the sender
+    # end __finish
+# end class InsertionFuture
+
+
 # Public Class GPUdbWorkerList
 # ============================
 
@@ -408,6 +544,13 @@ class _RecordKey:
     to the server.
     """
 
+    # Minimum and maximum supported years for the date format
+    _MIN_SUPPORTED_YEAR = 1000
+    _MAX_SUPPORTED_YEAR = 2900
+
+    # Some regular expressions needed later (compiled once for all keys)
+    _ipv4_regex = re.compile( r"^(?P<a>\d{1,3})\.(?P<b>\d{1,3})\.(?P<c>\d{1,3})\.(?P<d>\d{1,3})$" )
+    _decimal_regex = re.compile( r"^\s*(?P<sign>[+-]?)((?P<int>\d+)(\.(?P<frac1>\d{0,4}))?|\.(?P<frac2>\d{1,4}))\s*\Z" )
 
     def __init__( self, buffer_size ):
         """Initialize the RecordKey.
@@ -428,13 +571,6 @@ class _RecordKey:
         # The hash value for routing the record to the appropriate GPUdb worker
         self._routing_hash = 0
 
-        # Minimum and maximum supported years for the date format
-        self._MIN_SUPPORTED_YEAR = 1000
-        self._MAX_SUPPORTED_YEAR = 2900
-
-        # Some regular expressions needed later
-        self._ipv4_regex = re.compile( r"^(?P<a>\d{1,3})\.(?P<b>\d{1,3})\.(?P<c>\d{1,3})\.(?P<d>\d{1,3})$" )
-        self._decimal_regex = re.compile( r"^\s*(?P<sign>[+-]?)((?P<int>\d+)(\.(?P<frac1>\d{0,4}))?|\.(?P<frac2>\d{1,4}))\s*\Z" )
     # end RecordKey __init__
 
     @property
@@ -450,6 +586,16 @@ class _RecordKey:
     # end hash_code
 
 
+    def set_hashes( self, routing_hash, hash_code ):
+        """Set the hashes of a key built natively by the c-extension
+        (see Record.compute_key_hashes()) instead of through the add_xxx()
+        functions and compute_hashes().
+        """
+        self._routing_hash = routing_hash
+        self._hash_code    = hash_code
+    # end set_hashes
+
+
     def __is_buffer_full( self, throw_if_full = True ):
         """Internal function which checks whether the buffer is already full.
         """
@@ -756,7 +902,7 @@ class _RecordKey:
             # end if
 
             # Hash the string value
-            a = mmh3.hash64( bytes(val, "utf-8"), seed = 10 )
+            a = hash64( bytes(val, "utf-8"), seed = 10 )
 
             hash_val = a[ 0 ] # the first half
 
@@ -780,7 +926,7 @@ class _RecordKey:
             # end if
 
             # Hash the string value
-            a = mmh3.hash64( val, seed = 10 )
+            a = hash64( val, seed = 10 )
 
             hash_val = a[ 0 ] # the first half
 
@@ -923,7 +1069,7 @@ class _RecordKey:
         """Add a decimal number to the buffer (can be null)--eight bytes.
 
         Parameters:
-            val (str)
+            val (str or decimal.Decimal)
                 Must represent a decimal value up to 19 digits of precision and
                 four digits of scale.
         """
@@ -936,6 +1082,10 @@ class _RecordKey:
             return
         # end if
 
+        # Decimal objects (e.g. from a Record) are formatted without exponent
+        if not isinstance( val, basestring ):
+            val = "{0:f}".format( val )
+
         # Parse the IPv4
         match = self._decimal_regex.match( val )
         if not match:
@@ -1408,7 +1558,7 @@ class _RecordKey:
         def compute_hashes( self ):
             """Compute the Murmur hash of the key.
             """
-            a = mmh3.hash64( self._buffer_value, seed = 10 )
+            a = hash64( self._buffer_value, seed = 10 )
             self._routing_hash = a[ 0 ] # the first half
 
             self._hash_code = int( self._routing_hash ^ ( self._routing_hash >> 32 ) )
@@ -1418,7 +1568,7 @@ class _RecordKey:
         def compute_hashes( self ):
             """Compute the Murmur hash of the key.
             """
-            a = mmh3.hash64( str( self._buffer_value ), seed = 10 )
+            a = hash64( str( self._buffer_value ), seed = 10 )
             self._routing_hash = a[ 0 ] # the first half
 
             self._hash_code = int( self._routing_hash ^ ( self._routing_hash >> 32 ) )
@@ -1604,6 +1754,14 @@ class _RecordKeyBuilder:
             self._key_types.append( column_type )
         # end loop
 
+        # Keys of c-extension Record objects can be built natively as long as
+        # the Record's column types agree with the key types deduced above
+        self._cext_record_type = record_type.record_type
+        cext_key_types = [ self._cext_record_type[ i ].data_type
+                           for i in self.routing_key_indices ]
+        self._use_cext_keys = ( _have_native_keys
+                                and (cext_key_types == self._key_types) )
+
 
         # Build the key schema
         key_schema_fields_str = []
@@ -1637,7 +1795,7 @@ class _RecordKeyBuilder:
 
         Parameters:
 
-            record (OrderedDict or GPUdbRecord)
+            record (OrderedDict, GPUdbRecord or Record)
                 The object based on which the key is to be built.
 
         Returns:
@@ -1651,29 +1809,48 @@ class _RecordKeyBuilder:
         if isinstance( record, GPUdbRecord ):
             record = record.column_values
 
-        # Check that the given record is an OrderedDict of the given table
-        # type
-        if not isinstance( record, collections.OrderedDict ):
-            raise GPUdbException( "Given record must be a GPUdbRecord object or"
-                              " an OrderedDict; given %s"
+        # Check that the given record is an OrderedDict or a Record of the
+        # given table type
+        if not isinstance( record, (collections.OrderedDict, Record) ):
+            raise GPUdbException( "Given record must be a GPUdbRecord object, "
+                              "a Record object or an OrderedDict; given %s"
                               % str( type( record ) ) )
 
-        # Check all the keys of the given record
-        record_keys = list( record.keys() )
-        if (record_keys != self._record_column_names):
-            raise GPUdbException( "Given record must be of the type '%s'"
-                                  " (with columns '%s'); given record has columns '%s' "
-                                  % ( self._record_type.schema_string,
-                                      self._record_column_names,
-                                      record_keys ) )
+        # Check all the keys of the given record (a Record of this very
+        # record type is known to be fine)
+        is_cext_record = ( isinstance( record, Record )
+                           and (record.type is self._cext_record_type) )
+        if not is_cext_record:
+            record_keys = list( record.keys() )
+            if (record_keys != self._record_column_names):
+                raise GPUdbException( "Given record must be of the type '%s'"
+                                      " (with columns '%s'); given record has columns '%s' "
+                                      % ( self._record_type.schema_string,
+                                          self._record_column_names,
+                                          record_keys ) )
+        # end if
 
-        # Create and populate a RecordKey object
+        # Create a RecordKey object
         record_key = _RecordKey( self._key_buffer_size )
 
+        # Build the key and compute its hashes in the c-extension, if possible
+        if is_cext_record and self._use_cext_keys:
+            try:
+                record_key.set_hashes( *record.compute_key_hashes( self.routing_key_indices ) )
+                return record_key
+            except ValueError:
+                # Let the python implementation below handle (and report)
+                # any values that do not fit the key
+                pass
+        # end if
+
+        # Populate the RecordKey object
+        record_values = list( record.values() )
+
         # Add each routing column's value to the key
         for i, key_idx in enumerate( self.routing_key_indices ):
             # Extract the value for the relevant routing column
-            value = list( record.values() )[ key_idx ]
+            value = record_values[ key_idx ]
 
             # Based on the column's type, call the appropriate
             # Record.add_xxx() function
@@ -1688,6 +1865,71 @@ class _RecordKeyBuilder:
 
 
 
+    def build_hash_codes( self, records ):
+        """Computes the key hash codes of a list of Record objects in a
+        single pass through the c-extension.
+
+        Parameters:
+
+            records (list of Record)
+                The records, which must be of this builder's record type.
+
+        Returns:
+            A list with the hash code of each record's key (as in
+            :meth:`_RecordKey.hash_code`), or None if the keys cannot be built
+            natively (then they need to be built one by one with
+            :meth:`.build`).
+        """
+        if not self._use_cext_keys:
+            return None
+
+        try:
+            return self._cext_record_type.compute_key_hash_codes( records,
+                                                                  self.routing_key_indices )
+        except (TypeError, ValueError):
+            # Not all Record objects of this type, or values that do not
+            # fit the key
+            return None
+    # end build_hash_codes
+
+
+
+    def route_records( self, records, routing_table ):
+        """Determines the worker rank of each of a list of Record objects in
+        a single pass through the c-extension.
+
+        Parameters:
+
+            records (list of Record)
+                The records, which must be of this builder's record type.
+
+            routing_table (list of int)
+                The worker rank of each shard, if any.
+
+        Returns:
+            A list with the worker rank of each record (as given by
+            :meth:`_RecordKey.route`), or None if the keys cannot be built
+            natively (then they need to be built one by one with
+            :meth:`.build`).
+        """
+        if not routing_table: # no routing info is provided
+            return [ 0 ] * len( records )
+
+        if not self._use_cext_keys:
+            return None
+
+        try:
+            return self._cext_record_type.route_records( records,
+                                                         self.routing_key_indices,
+                                                         routing_table )
+        except (TypeError, ValueError):
+            # Not all Record objects of this type, or values that do not
+            # fit the key
+            return None
+    # end route_records
+
+
+
     def build_key_with_shard_values_only( self, key_values ):
         """Builds a RecordKey object based on the input data and returns it.
 
@@ -1748,6 +1990,34 @@ class _RecordKeyBuilder:
         return record_key
     # end build_key_with_shard_values_only
 
+
+
+    def build_key_identity( self, key_values ):
+        """Builds a value identifying the given key values exactly, unlike
+        the hash code of their key (which may collide): the encoded values
+        of the key, along with the values of any string columns (which are
+        encoded as hashes) and which values are null (which are encoded as
+        zeros).
+
+        Parameters:
+
+            key_values (list or dict)
+                Values for the sharding columns, as given to
+                build_key_with_shard_values_only().
+
+        Returns:
+            A hashable value, equal for equal key values.
+        """
+        record_key = self.build_key_with_shard_values_only( key_values )
+
+        if isinstance( key_values, dict ):
+            key_values = [ key_values[ _name ] for _name in self.key_columns_names ]
+
+        values = tuple( ( value if (col_type == "string") else (value is None) )
+                        for (value, col_type) in zip( key_values, self._key_types ) )
+        return ( bytes( record_key._buffer_value ), values )
+    # end build_key_identity
+
     
 
     def build_expression_with_key_values_only( self, key_values ):
@@ -1888,17 +2158,25 @@ class _WorkerQueue:
         self.has_primary_key = has_primary_key
         self.update_on_existing_pk = update_on_existing_pk
 
-        # Create a gpudb instance
+        # Create a gpudb instance for the worker; this is cheap since the
+        # endpoint schemas are shared by all GPUdb instances
         self.gpudb = GPUdb( host = url,
                             encoding = gpudb.encoding,
                             connection = gpudb.connection, 
                             username = gpudb.username,
                             password = gpudb.password,
-                            no_init_db_contact = True )
+                            timeout = gpudb.timeout,
+                            no_init_db_contact = True,
+                            max_connections_per_host = gpudb.max_connections_per_host,
+                            connection_idle_timeout = gpudb.connection_idle_timeout,
+                            retry_policy = gpudb.retry_policy )
+        # Share the type lookup cache with the head node client
+        self.gpudb._known_types = gpudb._known_types
 
         # Initialize other members:
-        # A queue for the data
+        # A queue for the data, and when its oldest record was queued
         self.record_queue = []
+        self.oldest_record_time = None
 
         # A map of pk/shard key to queue index for that data
         # (if the table contains primary keys)
@@ -1923,12 +2201,89 @@ class _WorkerQueue:
         Returns:
             The list of records (if the queue becomes full) or None.
         """
-        old_queue_length = len( self.record_queue )
-
-        # Need to check a lot of stuff if the record has a valid primary key
+        # Only valid primary keys are checked for duplicates
+        key_hash_code = None
         if (self.has_primary_key and key.is_valid):
             key_hash_code = key.hash_code
 
+        if not self.__add( record, key_hash_code ):
+            return None
+
+        # Flush the record queue when full capacity has been reached
+        if (len( self.record_queue ) == self.capacity):
+            # Return whatever flush returns (which is the current/old queue)
+            return self.flush()
+        else:
+            # return none to indicate nothing to do
+            return None
+    # end insert
+
+
+
+    def insert_batch( self, records, key_hash_codes = None ):
+        """Insert multiple records into the queue (each if it checks out, as
+        with :meth:`.insert`).  Return the queues that become full along the
+        way.
+
+        Parameters:
+            records (list of Record)
+                The records to be inserted.
+
+            key_hash_codes (list of int)
+                The hash codes of the records' primary keys, if the table
+                has a primary key.
+
+        Returns:
+            A list of the full lists of records, in the order they filled
+            up (empty if the queue has not become full).
+        """
+        full_queues = []
+
+        # Without primary keys, the records can be added in chunks
+        if not self.has_primary_key:
+            start = 0
+            while (start < len( records )):
+                if not self.record_queue:
+                    self.oldest_record_time = time.time()
+
+                room = self.capacity - len( self.record_queue )
+                self.record_queue.extend( records[ start : (start + room) ] )
+                start += room
+
+                if (len( self.record_queue ) == self.capacity):
+                    full_queues.append( self.flush() )
+            # end loop
+
+            return full_queues
+        # end if
+
+        for (record, key_hash_code) in zip( records, key_hash_codes ):
+            self.__add( record, key_hash_code )
+
+            if (len( self.record_queue ) == self.capacity):
+                full_queues.append( self.flush() )
+        # end loop
+
+        return full_queues
+    # end insert_batch
+
+
+
+    def __add( self, record, key_hash_code ):
+        """Internal method to add a record to the queue, taking care of any
+        record with the same primary key (given by its hash code, or None if
+        the record has no valid primary key) already in it.
+
+        Returns:
+            False if the record was dropped for having a duplicate primary
+            key, True otherwise.
+        """
+        old_queue_length = len( self.record_queue )
+        if (old_queue_length == 0):
+            self.oldest_record_time = time.time()
+
+        # Need to check a lot of stuff if the record has a valid primary key
+        if (key_hash_code is not None):
             if self.update_on_existing_pk:
                 # Update on existing primary key (if key exists)
                 if key_hash_code in self.primary_key_to_queue_index_map:
@@ -1944,7 +2299,7 @@ class _WorkerQueue:
             else: # if key already exists, do NOT insert this record
                 if key_hash_code in self.primary_key_to_queue_index_map:
                     # Yes, the key exists, so, it's a problem
-                    return None
+                    return False
                 else: # key does not already exist
                     self.record_queue.append( record )
                     self.primary_key_to_queue_index_map[ key_hash_code ] = old_queue_length
@@ -1954,14 +2309,8 @@ class _WorkerQueue:
             self.record_queue.append( record )
         # end outer if-else
 
-        # Flush the record queue when full capacity has been reached
-        if (len( self.record_queue ) == self.capacity):
-            # Return whatever flush returns (which is the current/old queue)
-            return self.flush()
-        else:
-            # return none to indicate nothing to do
-            return None
-    # end insert
+        return True
+    # end __add
 
 
 
@@ -1975,6 +2324,7 @@ class _WorkerQueue:
 
         # Create a fresh new queue
         self.record_queue = []
+        self.oldest_record_time = None
 
         # if a key->record_queue_index map exists, clear it
         if self.primary_key_to_queue_index_map:
@@ -1984,6 +2334,18 @@ class _WorkerQueue:
     # end flush
 
 
+    def get_linger_deadline( self, linger_time ):
+        """Return the time by which the queue should be flushed for its
+        oldest record not to wait longer than the given linger time, or None
+        if the queue is empty.
+        """
+        if self.oldest_record_time is None:
+            return None
+
+        return (self.oldest_record_time + linger_time)
+    # end get_linger_deadline
+
+
     def get_url( self ):
         """Return the URL."""
         return self.url
@@ -2011,7 +2373,11 @@ class GPUdbIngestor:
                   batch_size,
                   options = None,
                   workers = None,
-                  is_table_replicated = False ):
+                  is_table_replicated = False,
+                  flush_threads = None,
+                  is_async = False,
+                  max_queued_records = None,
+                  linger_time = None ):
         """Initializes the GPUdbIngestor instance.
 
         Parameters:
@@ -2035,11 +2401,48 @@ class GPUdbIngestor:
                 parameter.
             workers (GPUdbWorkerList)
                 Optional parameter.  A list of GPUdb worker rank addresses.
+                If not given, the worker list is obtained from the server,
+                and obtained again whenever the shards get reassigned (when
+                an insertion fails after a rebalance, or after ranks have
+                been added or removed, the routing table is refreshed and
+                the records are re-routed automatically).
             is_table_replicated (bool)
                 Optional boolean flag indicating whether the table is replicated; if
                 True, then multi-head ingestion will not be used (but the head node
                 would be used for ingestion instead).  This is due to GPUdb not
                 supporting multi-head ingestion on replicated tables.
+            flush_threads (int)
+                Optional parameter.  The maximum number of worker queues that
+                will be flushed concurrently, each on its own thread with at
+                most one insertion in flight per worker.  Default is one
+                thread per worker; 1 flushes the queues one after the other.
+            is_async (bool)
+                Optional boolean flag; if True, full queues are handed off to
+                a background sender thread per worker instead of being
+                inserted on the caller's thread.  :meth:`.insert_record` and
+                :meth:`.insert_records` then return :class:`InsertionFuture`
+                objects for the batches they send off, and :meth:`.flush`
+                waits for all the batches and reports any that failed.  Call
+                :meth:`.close` when done to stop the sender threads.
+            max_queued_records (int)
+                Optional parameter; applies to asynchronous mode only.  The
+                maximum number of records that may be waiting for (or in the
+                middle of) being sent by the background threads; adding a
+                batch that would exceed it blocks the caller until enough
+                records have been inserted.  Default is two batches per
+                worker.
+            linger_time (float)
+                Optional parameter.  The maximum time, in seconds, that a
+                record may wait in a worker queue that has not filled up; a
+                background timer flushes any queue whose oldest record has
+                been waiting this long, so that the records of low-rate
+                workers do not wait for an explicit :meth:`.flush`.  In
+                synchronous mode, the timer waits for any insert or flush
+                call in progress, and errors from its flushes are raised by
+                the next insert or flush call; in asynchronous mode, they are
+                reported like those of other batches.  Call :meth:`.close`
+                when done to stop the timer.  Default None (queues are only
+                flushed when full or explicitly).
         """
 
         # Validate input parameter 'gpudb'
@@ -2076,19 +2479,55 @@ class GPUdbIngestor:
             raise GPUdbException( "Parameter 'is_table_replicated' must be of type "
                                   "a boolean value; given %s"
                                   % str( type( is_table_replicated ) ) )
+        # Validate input parameter 'flush_threads'
+        if ( (flush_threads is not None)
+             and ( not isinstance( flush_threads, int ) or (flush_threads < 1) ) ):
+            raise GPUdbException( "Parameter 'flush_threads' must be a positive "
+                                  "integer, if given; given %s"
+                                  % str( flush_threads ) )
+        # Validate input parameter 'is_async'
+        if not isinstance( is_async, bool ):
+            raise GPUdbException( "Parameter 'is_async' must be a boolean "
+                                  "value; given %s" % str( type( is_async ) ) )
+        # Validate input parameter 'max_queued_records'
+        if ( (max_queued_records is not None)
+             and ( not isinstance( max_queued_records, int ) or (max_queued_records < 1) ) ):
+            raise GPUdbException( "Parameter 'max_queued_records' must be a "
+                                  "positive integer, if given; given %s"
+                                  % str( max_queued_records ) )
+        # Validate input parameter 'linger_time'
+        if ( (linger_time is not None)
+             and ( not isinstance( linger_time, (int, long, float) ) or (linger_time <= 0) ) ):
+            raise GPUdbException( "Parameter 'linger_time' must be a positive "
+                                  "number, if given; given %s"
+                                  % str( linger_time ) )
 
         # Save the parameter values
         self.gpudb               = gpudb
         self.table_name          = table_name
         self.record_type         = record_type
         self.batch_size          = batch_size
-        self.options             = options
+        self.options             = options if options else {}
         self.is_table_replicated = is_table_replicated
-        print ("self.is_table_replicated:", self.is_table_replicated) # debug~~~~~
 
         self.count_inserted = 0
         self.count_updated  = 0
 
+        # Flushes of different worker queues may run concurrently; guard
+        # the counts and lazily create the thread pool for the flushes
+        self._count_lock        = threading.Lock()
+        self._flush_thread_pool = None
+
+        # The worker queues are shared with the linger timer (if any), so
+        # they are only touched while holding this lock
+        self._queue_lock = threading.Lock()
+
+        # In synchronous mode, held by the caller for each insert and flush,
+        # and by the linger timer for each of its flushes, so that the timer
+        # never flushes a worker's queue while the caller may have an
+        # insertion in flight to that worker (or records queued before it)
+        self._flush_lock = threading.RLock()
+
         # Create the primary and shard key builders
         self.shard_key_builder   = _RecordKeyBuilder( self.record_type )
         self.primary_key_builder = _RecordKeyBuilder( self.record_type,
@@ -2122,56 +2561,77 @@ class GPUdbIngestor:
             update_on_existing_pk = (self.options[ "update_on_existing_pk" ] == "true")
         # end if
 
-        self.worker_queues = []
+        self.has_primary_key       = has_primary_key
+        self.update_on_existing_pk = update_on_existing_pk
 
-        # If no worker URLs are provided, get them from the server
+        # If no worker URLs are provided, get them from the server (and
+        # again whenever the shards get reassigned)
+        self._workers_given = bool( workers )
         if not workers:
             # If the table is replicated, then we use only the head node
             workers = GPUdbWorkerList( self.gpudb,
                                        use_head_node_only = self.is_table_replicated )
 
         # Create worker queues per worker URL
-        for worker in workers.get_worker_urls():
-            try:
-                worker_url = worker
-                wq = _WorkerQueue( worker_url, self.gpudb,
-                                   self.batch_size,
-                                   has_primary_key = has_primary_key,
-                                   update_on_existing_pk = update_on_existing_pk )
-                self.worker_queues.append( wq )
-            except Exception as e:
-                raise
-        # end loop over workers
+        self.worker_queues = [ self.__create_worker_queue( worker_url )
+                               for worker_url in workers.get_worker_urls() ]
 
         # Get the number of workers
-        if not workers:
-            self.num_ranks = 1
-        else:
-            self.num_ranks = len( workers.get_worker_urls() )
+        self.num_ranks = len( self.worker_queues )
+
+        # One flush thread per worker queue unless told otherwise
+        if flush_threads is None:
+            flush_threads = len( self.worker_queues )
+        self.flush_threads = max( 1, min( flush_threads, len( self.worker_queues ) ) )
+
+        # Set up the background senders for asynchronous mode; the records
+        # handed off but not yet inserted are counted (and bounded) under
+        # the condition, which also collects the failed batches for flush()
+        self.is_async = is_async
+        if max_queued_records is None:
+            max_queued_records = 2 * self.batch_size * len( self.worker_queues )
+        self.max_queued_records = max_queued_records
+
+        self._is_closed            = False
+        self._queued_records_count = 0
+        self._queued_records_cond  = threading.Condition()
+        self._async_batch_count    = 0
+        self._async_failures       = []
+        self._sender_queues        = {}
+        self._sender_threads       = []
+        if self.is_async:
+            for worker in self.worker_queues:
+                self.__start_sender( worker )
+        # end if
 
         # Very important to know if multi-head IO is actually enabled
         # at the server
         self.is_multihead_enabled = workers.is_multihead_enabled()
-            
+
         # Set the routing table, iff multi-head I/O is turned on
-        # AND the table is not replicated
-        self.routing_table = None
+        # AND the table is not replicated; the version of the shard map it
+        # was built from tells when it needs to be refreshed
+        self.routing_table  = None
+        self.shard_version  = None
+        self._routing_lock  = threading.Lock()
         if ( self.is_multihead_enabled
-             and (not self.is_table_replicated)
-             and (self.primary_key_builder or self.shard_key_builder) ):
-            print ("Setting the routing table, ", self.is_table_replicated) # debug~~~~~~
-            # Get the sharding assignment ranks
-            shard_info = self.gpudb.admin_show_shards()
-            # Subtract 1 from each value of the routing_table
-            # (because the 1st worker rank is the 0th element in the worker list)
-            self.routing_table = [(rank-1) for rank in shard_info[ C._shard_ranks ] ]
-
-            # Check that enough worker URLs are specified
-            for routing_table_entry in self.routing_table:
-                if (routing_table_entry > self.num_ranks):
-                    raise GPUdbException( "Not enough worker URLs specified." )
+             and (not self.is_table_replicated) ):
+            (self.shard_version, self.routing_table) = self.__get_routing_table( self.num_ranks )
         # end if
 
+        # Start the timer flushing the queues that have lingered too long
+        self.linger_time    = linger_time
+        self._linger_stop   = threading.Event()
+        self._linger_thread = None
+        if (self.linger_time is not None):
+            self._linger_thread = threading.Thread( target = GPUdbIngestor.__linger,
+                                                    args = ( weakref.ref( self ),
+                                                             self._linger_stop,
+                                                             self.linger_time ),
+                                                    name = "GPUdbIngestor-linger" )
+            self._linger_thread.daemon = True
+            self._linger_thread.start()
+        # end if
     # end GPUdbIngestor __init__
 
 
@@ -2211,6 +2671,27 @@ class GPUdbIngestor:
     # end get_count_updated
 
 
+    def get_flush_threads( self ):
+        """Return the maximum number of worker queues flushed concurrently."""
+        return self.flush_threads
+    # end get_flush_threads
+
+
+    def get_linger_time( self ):
+        """Return the maximum time (in seconds) that records wait in a worker
+        queue before it is flushed, or None if queues are only flushed when
+        full or explicitly."""
+        return self.linger_time
+    # end get_linger_time
+
+
+    def get_max_queued_records( self ):
+        """Return the maximum number of records waiting to be sent in the
+        background (asynchronous mode only)."""
+        return self.max_queued_records
+    # end get_max_queued_records
+
+
     def insert_record( self, record, record_encoding = "binary" ):
         """Queues a record for insertion into GPUdb. If the queue reaches the
         {@link #get_batch_size batch size}, all records in the queue will be
@@ -2220,8 +2701,10 @@ class GPUdbIngestor:
         being inserted if needed (for example, to retry).
 
         Parameters:
-            record (dict, GPUdbRecord, collections.OrderedDict)
-                The record to insert.
+            record (Record, GPUdbRecord, list, dict, collections.OrderedDict)
+                The record to insert.  With the 'binary' encoding, the record
+                is converted to a :class:`Record` (unless it is one already)
+                and encoded by the c-extension when its queue is sent.
 
             record_encoding (str)
                 The encoding to use for the insertion.  Allowed values are:
@@ -2231,83 +2714,76 @@ class GPUdbIngestor:
 
                 The default values is 'binary'.
 
+        Returns:
+            In asynchronous mode, the :class:`InsertionFuture` of the batch
+            handed off to the background sender if the queue became full;
+            None otherwise.
+
         @throws InsertionException if an error occurs while inserting.
         """
-        # If a dict is given, convert it into a GPUdbRecord object
-        if isinstance( record, dict ):
-            record = GPUdbRecord( self.record_type, record )
-        
-        if not isinstance(record, (GPUdbRecord, collections.OrderedDict)):
-            raise GPUdbException( "Input parameter 'record' must be a GPUdbRecord or an "
-                                  "OrderedDict; given %s" % str(type(record)) )
-
-        if record_encoding.lower() not in ("json", "binary"):
-            raise GPUdbException( "Input parameter 'record_encoding' must be "
-                                  "one of ['json', 'binary']; given '%s'" % record_encoding )
-
-        # Build the primary and/or shard key(s) for this record
-        primary_key = None
-        shard_key   = None
-
-        # Build the primary key
-        if self.primary_key_builder:
-            primary_key = self.primary_key_builder.build( record )
-
-        # Build the shard key
-        if self.shard_key_builder:
-            shard_key = self.shard_key_builder.build( record )
+        if self.is_async:
+            worker_queue, queue = self.__queue_record( record, record_encoding )
 
-        # Create a worker queue
-        worker_queue = None
-
-        # Get the index of the worker to be used
-        if (not shard_key):
-            worker_index = random.randint( 0, (self.num_ranks - 1) )
-        else:
-            # Use the routing table and the shard key to find the right worker
-            worker_index = shard_key.route( self.routing_table )
-        # end if-else
+            # Hand off the queue, if it has become full
+            if queue:
+                return self.__send_async( worker_queue, queue )
+            return None
+        # end if
 
-        # Get the worker
-        worker_queue = self.worker_queues[ worker_index ]
+        with self._flush_lock:
+            self.__raise_detached_failures( [ record ] )
 
-        # Encode the object into binary if not already encoded
-        if record_encoding == "binary":
-            if isinstance( record, GPUdbRecord ):
-                encoded_record = record.binary_data
-            else:
-                encoded_record = GPUdbRecord( self.record_type, record ).binary_data
-        else:
-            if isinstance( record, GPUdbRecord ):
-                encoded_record = record.column_values
-            else:
-                encoded_record = record
-        # end if-else
+            worker_queue, queue = self.__queue_record( record, record_encoding )
 
-        # Insert the record for the worker queue
-        queue = worker_queue.insert( encoded_record, primary_key )
+            # Flush, if necessary (when the worker queue returns a non-empty queue)
+            if queue:
+                self.__flush( queue, worker_queue.get_gpudb() )
+        # end with
 
-        # Flush, if necessary (when the worker queue returns a non-empty queue)
-        if queue:
-            self.__flush( queue, worker_queue.get_gpudb() )
+        return None
     # end insert_record
 
 
     def insert_records( self, records, record_encoding = "binary" ):
         """Queues a list of records for insertion into GPUdb. If any queue reaches
         the {@link #get_batch_size batch size}, all records in that queue will be
-        inserted into GPUdb before the method returns. If an error occurs while
+        inserted into GPUdb before the method returns; queues of different
+        workers that fill up are inserted concurrently. If an error occurs while
         inserting the queued records, the records will no longer be in that queue
         nor in GPUdb; catch {@link InsertionException} to get the list of records
-        that were being inserted (including any from the queue in question and
+        that were being inserted (including any from the queue(s) in question and
         any remaining in the list not yet queued) if needed (for example, to
         retry). Note that depending on the number of records, multiple calls to
         GPUdb may occur.
 
+        With the 'binary' encoding, the whole list is converted to
+        :class:`Record` objects, routed to the workers in a single pass of the
+        c-extension (which computes the shard and primary key hashes of all
+        the records), and queued in per-worker batches; the queues that fill
+        up are then inserted in rounds of one queue per worker.  (Records whose
+        keys cannot be built natively are routed one by one instead.)
+
+        In asynchronous mode, full queues are handed off to the background
+        senders instead, and the failures are reported through the returned
+        futures and by :meth:`.flush`.
+
         Parameters:
-            records (GPUdbRecord, collections.OrderedDict)
+            records (list of Record, GPUdbRecord, list, dict, collections.OrderedDict)
                 The records to insert
 
+            record_encoding (str)
+                The encoding to use for the insertion.  Allowed values are:
+
+                * 'binary'
+                * 'json'
+
+                The default values is 'binary'.
+
+        Returns:
+            In asynchronous mode, a list of the :class:`InsertionFuture`
+            objects of the batches handed off to the background senders;
+            None otherwise.
+
         @throws InsertionException if an error occurs while inserting
         """
         if not records:
@@ -2321,63 +2797,1078 @@ class GPUdbIngestor:
                                   "one of ['json', 'binary']; given '%s'"
                                   % record_encoding )
 
-        for record in records:
+        if self.is_async:
+            return self.__insert_records( records, record_encoding )
+
+        with self._flush_lock:
+            self.__raise_detached_failures( records )
+            return self.__insert_records( records, record_encoding )
+    # end insert_records
+
+
+
+    def __insert_records( self, records, record_encoding ):
+        """Internal method to queue (and insert the queues that fill up) the
+        given non-empty list of records; see :meth:`.insert_records`."""
+        # Route and queue binary records in bulk, if possible
+        if (record_encoding == "binary"):
+            if self._is_closed:
+                raise GPUdbException( "Cannot insert records into a closed ingestor" )
+
+            records = _Util.convert_binary_data_to_cext_records( self.gpudb,
+                                                                 self.table_name,
+                                                                 records,
+                                                                 self.record_type.record_type )[ 1 ]
+            # Route and queue the records under the same routing table
+            with self._queue_lock:
+                batches = self.__partition_records( records )
+                if batches is not None:
+                    full_queues = self.__queue_batches( batches )
+            # end with
+
+            if batches is not None:
+                return self.__insert_full_queues( full_queues )
+        # end if
+
+        if self.is_async:
+            futures = []
+            for record in records:
+                future = self.insert_record( record, record_encoding )
+                if future is not None:
+                    futures.append( future )
+
+            return futures
+        # end if
+
+        # Queues that have filled up, but not yet been inserted; at most one
+        # per worker so that each worker has at most one insertion in flight
+        full_queues = collections.OrderedDict()
+
+        for index, record in enumerate( records ):
+            queue = None
             try:
-                self.insert_record( record, record_encoding )
+                worker_queue, queue = self.__queue_record( record, record_encoding )
+
+                # If this worker already has a full queue waiting, insert all
+                # the waiting queues before holding on to the new one
+                if ( queue and (worker_queue in full_queues) ):
+                    self.__flush_full_queues( full_queues )
+
+                if queue:
+                    full_queues[ worker_queue ] = queue
+                    queue = None
+
+                # Insert the remaining full queues once the list is queued up
+                if (index == (len( records ) - 1)):
+                    self.__flush_full_queues( full_queues )
             except InsertionException as e:
                 # Add the remaining records that could not be inserted
                 uninserted_records = e.get_records()
-                remaining_records = records[ records.index( record ) :  ]
+                if queue:
+                    uninserted_records.extend( queue )
+                remaining_records = records[ (index + 1) : ]
                 uninserted_records.extend( remaining_records )
 
+                raise
+            except:
+                # Do not lose the records of queues that filled up before
+                # the offending record
+                self.__flush_full_queues( full_queues )
                 raise
             # done handling the error case
+        # end loop
     # end insert_records
 
 
 
-
     def flush( self ):
-        """Ensures that any queued records are inserted into GPUdb. If an error
-        occurs while inserting the records from any queue, the records will no
-        longer be in that queue nor in GPUdb; catch {@link InsertException} to
-        get the list of records that were being inserted if needed (for example,
-        to retry). Other queues may also still contain unflushed records if
-        this occurs.
-
-        @throws InsertException if an error occurs while inserting records.
+        """Ensures that any queued records are inserted into GPUdb.  The queues
+        of the different workers are inserted concurrently (see the
+        *flush_threads* constructor parameter).  If an error occurs while
+        inserting the records from any queue, the records will no longer be in
+        that queue nor in GPUdb; catch {@link InsertionException} to get the
+        list of records that were being inserted if needed (for example, to
+        retry).  The records of all the queues that failed are gathered into a
+        single exception; the other queues will have been inserted.
+
+        In asynchronous mode, the queues are handed off to the background
+        senders and this method waits for every batch sent so far to be
+        done; the exception then gathers all the batches that failed since
+        the previous flush.
+
+        @throws InsertionException if an error occurs while inserting records.
         """
-        for worker in self.worker_queues:
-            queue = worker.flush()
+        if self.is_async:
+            with self._queue_lock:
+                queues = [ (worker, worker.flush()) for worker in self.worker_queues ]
+
+            for (worker, queue) in queues:
+                if queue:
+                    self.__send_async( worker, queue )
+            # end loop
+
+            self.__wait_for_async_batches()
+            return
+        # end if
+
+        with self._flush_lock:
+            with self._queue_lock:
+                queues = [ (worker.flush(), worker.get_gpudb())
+                           for worker in self.worker_queues ]
+
             # Actually insert the records
-            self.__flush( queue, worker.get_gpudb() )
+            self.__flush_queues( queues )
+
+            # Report the errors of the queues flushed by the linger timer (or
+            # re-routed after the shards got reassigned) since the last call
+            self.__wait_for_async_batches()
+        # end with
     # end flush
 
 
 
-    def __flush( self, queue, worker_gpudb ):
-        """Internal method to flush--actually insert--the records to GPUdb.
+    def close( self ):
+        """Flushes any queued records and releases the threads used by this
+        ingestor; no records may be inserted afterward.  The ingestor can
+        also be used as a context manager, which closes it on exit.  An
+        ingestor dropped without being closed releases its threads when it
+        is garbage collected, but its queued records are discarded.
 
-        @param queue  List of records to insert
-        @param url  The URL to which to send the records.
+        @throws InsertionException if an error occurs while inserting records.
         """
-        if not queue:
-            return # nothing to do
+        if self._is_closed:
+            return
+
+        # Stop the linger timer; the final flush takes care of the queues
+        if self._linger_thread is not None:
+            self._linger_stop.set()
+            self._linger_thread.join()
+            self._linger_thread = None
 
         try:
-            # Insert the records
-            insert_rsp = worker_gpudb.insert_records( table_name = self.table_name,
-                                                      data = queue,
-                                                      options = self.options )
-            if (insert_rsp['status_info']['status'] != "OK"):
+            self.flush()
+        finally:
+            with self._queued_records_cond:
+                self._is_closed = True
+
+            # Stop the background senders
+            for batches in self._sender_queues.values():
+                batches.put( None )
+            for sender in self._sender_threads:
+                sender.join()
+
+            with self._count_lock:
+                flush_thread_pool = self._flush_thread_pool
+                self._flush_thread_pool = None
+
+            if flush_thread_pool is not None:
+                flush_thread_pool.close()
+                flush_thread_pool.join()
+    # end close
+
+
+    def __enter__( self ):
+        return self
+    # end __enter__
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+    # end __exit__
+
+
+    def __del__( self ):
+        """Releases the threads of an ingestor dropped without being closed;
+        its queued records are discarded.  The threads are told to stop but
+        not waited for, as this may run on one of them.
+        """
+        # The constructor may have failed before the threads were set up
+        if getattr( self, "_is_closed", True ):
+            return
+        self._is_closed = True
+
+        linger_stop = getattr( self, "_linger_stop", None )
+        if linger_stop is not None:
+            linger_stop.set()
+
+        for batches in self._sender_queues.values():
+            batches.put( None )
+
+        # The pool may have been finalized already, if collected along with
+        # the ingestor
+        if self._flush_thread_pool is not None:
+            try:
+                self._flush_thread_pool.close()
+            except (OSError, ValueError):
+                pass
+    # end __del__
+
+
+
+    def __queue_record( self, record, record_encoding ):
+        """Internal method to route a record to the queue of its worker.
+
+        Returns:
+            A tuple with the worker queue the record was added to and the
+            records to insert if that queue has become full (None otherwise).
+        """
+        if self._is_closed:
+            raise GPUdbException( "Cannot insert records into a closed ingestor" )
+
+        if record_encoding.lower() not in ("json", "binary"):
+            raise GPUdbException( "Input parameter 'record_encoding' must be "
+                                  "one of ['json', 'binary']; given '%s'" % record_encoding )
+
+        if (record_encoding == "binary"):
+            # Convert the record into a c-extension Record object, which is
+            # both what the keys are built from and what gets sent to the
+            # worker (encoded by the c-extension along with its batch)
+            if not isinstance( record, Record ):
+                if not isinstance( record, (GPUdbRecord, dict, list) ):
+                    raise GPUdbException( "Input parameter 'record' must be a Record, "
+                                          "GPUdbRecord, list, dict or OrderedDict; "
+                                          "given %s" % str(type(record)) )
+
+                record = _Util.convert_binary_data_to_cext_records( self.gpudb,
+                                                                    self.table_name,
+                                                                    [ record ],
+                                                                    self.record_type.record_type )[ 1 ][ 0 ]
+            # end if
+        else:
+            # If a dict is given, convert it into a GPUdbRecord object
+            if isinstance( record, dict ):
+                record = GPUdbRecord( self.record_type, record )
+
+            if not isinstance(record, (GPUdbRecord, collections.OrderedDict)):
+                raise GPUdbException( "Input parameter 'record' must be a GPUdbRecord or an "
+                                      "OrderedDict; given %s" % str(type(record)) )
+        # end if-else
+
+        # Build the primary and/or shard key(s) for this record
+        primary_key = None
+        shard_key   = None
+
+        # Build the primary key
+        if self.primary_key_builder:
+            primary_key = self.primary_key_builder.build( record )
+
+        # Build the shard key
+        if self.shard_key_builder:
+            shard_key = self.shard_key_builder.build( record )
+
+        # Binary records are queued as Record objects (already converted
+        # above); JSON records as their column values
+        if ( (record_encoding != "binary") and isinstance( record, GPUdbRecord ) ):
+            encoded_record = record.column_values
+        else:
+            encoded_record = record
+        # end if-else
+
+        # Route the record and insert it into the worker queue (under the
+        # same routing table, which may get refreshed at any time)
+        with self._queue_lock:
+            # Get the index of the worker to be used
+            if (not shard_key):
+                worker_index = random.randint( 0, (self.num_ranks - 1) )
+            else:
+                # Use the routing table and the shard key to find the right worker
+                worker_index = shard_key.route( self.routing_table )
+            # end if-else
+
+            worker_queue = self.worker_queues[ worker_index ]
+            queue = worker_queue.insert( encoded_record, primary_key )
+        # end with
+
+        return (worker_queue, queue)
+    # end __queue_record
+
+
+
+    def __partition_records( self, records ):
+        """Internal method to route a list of Record objects to their
+        workers in bulk; must be called while holding the queue lock.
+
+        Returns:
+            A list with, for each worker queue, a tuple of the records routed
+            to it and the hash codes of their primary keys (None if the table
+            has no primary key); or None if the keys of the records cannot be
+            built natively.
+        """
+        # The primary key hash codes, for detecting duplicate keys
+        key_hash_codes = None
+        if self.primary_key_builder:
+            key_hash_codes = self.primary_key_builder.build_hash_codes( records )
+            if key_hash_codes is None:
+                return None
+        # end if
+
+        # Get the index of the worker to be used for each record
+        if not self.shard_key_builder:
+            worker_indices = [ random.randint( 0, (self.num_ranks - 1) )
+                               for record in records ]
+        else:
+            worker_indices = self.shard_key_builder.route_records( records,
+                                                                   self.routing_table )
+            if worker_indices is None:
+                return None
+        # end if-else
+
+        # Split the records (and hash codes) into per-worker batches
+        batches = [ ( [], (None if (key_hash_codes is None) else []) )
+                    for worker in self.worker_queues ]
+
+        if key_hash_codes is None:
+            for (record, worker_index) in zip( records, worker_indices ):
+                batches[ worker_index ][ 0 ].append( record )
+        else:
+            for (record, worker_index, key_hash_code) in zip( records, worker_indices, key_hash_codes ):
+                (batch_records, batch_key_hash_codes) = batches[ worker_index ]
+                batch_records.append( record )
+                batch_key_hash_codes.append( key_hash_code )
+        # end if-else
+
+        return batches
+    # end __partition_records
+
+
+
+    def __queue_batches( self, batches ):
+        """Internal method to queue the per-worker batches of records given
+        by :meth:`.__partition_records`; must be called while holding the
+        queue lock.
+
+        Returns:
+            A list of tuples of each worker queue that filled up and the list
+            of its full queues.
+        """
+        full_queues = []
+        for (worker, (batch_records, batch_key_hash_codes)) in zip( self.worker_queues, batches ):
+            if batch_records:
+                worker_full_queues = worker.insert_batch( batch_records, batch_key_hash_codes )
+                if worker_full_queues:
+                    full_queues.append( (worker, worker_full_queues) )
+        # end loop
+
+        return full_queues
+    # end __queue_batches
+
+
+
+    def __insert_full_queues( self, full_queues ):
+        """Internal method to insert (or, in asynchronous mode, send off) the
+        queues that filled up in :meth:`.__queue_batches`, in rounds of at
+        most one queue per worker.
+
+        Returns:
+            In asynchronous mode, the list of :class:`InsertionFuture`
+            objects of the batches sent off; None otherwise.
+        """
+        num_rounds = max( [ len( queues ) for (worker, queues) in full_queues ] + [ 0 ] )
+
+        if self.is_async:
+            futures = []
+            for round_index in range( num_rounds ):
+                for (worker, queues) in full_queues:
+                    if (round_index < len( queues )):
+                        futures.append( self.__send_async( worker, queues[ round_index ] ) )
+            # end loop
+
+            return futures
+        # end if
+
+        for round_index in range( num_rounds ):
+            try:
+                self.__flush_queues( [ (queues[ round_index ], worker.get_gpudb())
+                                       for (worker, queues) in full_queues
+                                       if (round_index < len( queues )) ] )
+            except Exception as e:
+                # The records of the full queues of later rounds will not be
+                # inserted either; make sure the caller gets them
+                remaining_records = []
+                for (worker, queues) in full_queues:
+                    for queue in queues[ (round_index + 1) : ]:
+                        remaining_records.extend( queue )
+
+                if not remaining_records:
+                    raise
+
+                if isinstance( e, InsertionException ):
+                    e.get_records().extend( remaining_records )
+                    raise
+
+                raise InsertionException( str( e ), remaining_records )
+        # end loop
+
+        return None
+    # end __insert_full_queues
+
+
+
+    def __flush_full_queues( self, full_queues ):
+        """Internal method to concurrently insert the queues that filled up
+        during :meth:`.insert_records`, emptying the given map of worker
+        queue to full queue.
+        """
+        queues = [ (queue, worker.get_gpudb())
+                   for (worker, queue) in full_queues.items() ]
+        full_queues.clear()
+
+        self.__flush_queues( queues )
+    # end __flush_full_queues
+
+
+
+    def __get_flush_thread_pool( self ):
+        """Internal method to get the thread pool used for flushing worker
+        queues concurrently, creating it on first use.
+        """
+        with self._count_lock:
+            if self._flush_thread_pool is None:
+                self._flush_thread_pool = ThreadPool( self.flush_threads )
+
+            return self._flush_thread_pool
+    # end __get_flush_thread_pool
+
+
+
+    def __try_flush( self, queue_and_gpudb ):
+        """Internal method to flush one worker's queue, returning any error
+        (along with the queue) instead of raising it so that the errors of
+        concurrent flushes can be gathered.
+        """
+        (queue, worker_gpudb) = queue_and_gpudb
+        try:
+            self.__flush( queue, worker_gpudb )
+        except InsertionException as e:
+            # Only some of the records may have failed after being re-routed
+            return (e, e.get_records())
+        except Exception as e:
+            return (e, queue)
+
+        return None
+    # end __try_flush
+
+
+
+    def __flush_queues( self, queues ):
+        """Internal method to insert the records of multiple worker queues,
+        at most :meth:`.get_flush_threads` of them at a time.
+
+        @param queues  List of tuples of the records to insert and the GPUdb
+                       handle of the worker to which to send them.
+
+        @throws InsertionException with the records of all the queues that
+                could not be inserted (or the error itself if only one
+                queue failed).
+        """
+        queues = [ queue_and_gpudb for queue_and_gpudb in queues
+                   if queue_and_gpudb[ 0 ] ]
+        if not queues:
+            return # nothing to do
+
+        if ( (self.flush_threads == 1) or (len( queues ) == 1) ):
+            errors = [ self.__try_flush( queue_and_gpudb ) for queue_and_gpudb in queues ]
+        else:
+            errors = self.__get_flush_thread_pool().map( self.__try_flush, queues )
+
+        errors = [ error for error in errors if error is not None ]
+        if (len( errors ) == 1):
+            raise errors[ 0 ][ 0 ]
+
+        self.__raise_insertion_errors( errors, len( queues ) )
+    # end __flush_queues
+
+
+
+    def __raise_insertion_errors( self, errors, num_batches ):
+        """Internal method to raise a single InsertionException for the
+        given failed batches, if any.
+
+        @param errors  List of tuples of the error and the records of each
+                       batch that could not be inserted.
+        @param num_batches  The total number of batches that were sent.
+        """
+        if not errors:
+            return
+
+        # Gather the records of all the failed batches into one exception
+        uninserted_records = []
+        for (error, queue) in errors:
+            uninserted_records.extend( queue )
+
+        message = ( "Insertion failed for %d of %d batches: %s"
+                    % ( len( errors ), num_batches,
+                        "; ".join( str( error ) for (error, queue) in errors ) ) )
+        raise InsertionException( message, uninserted_records )
+    # end __raise_insertion_errors
+
+
+
+    def __send_async( self, worker, queue ):
+        """Internal method to hand off a full queue to the background sender
+        of the given worker, blocking while too many records are waiting.
+
+        Returns:
+            The :class:`InsertionFuture` for the batch.
+        """
+        future = InsertionFuture( queue )
+
+        with self._queued_records_cond:
+            # Apply backpressure (but always let a lone batch through, even
+            # if it is larger than the bound)
+            while ( (self._queued_records_count > 0)
+                    and ( (self._queued_records_count + len( queue ))
+                          > self.max_queued_records ) ):
+                self._queued_records_cond.wait()
+
+            if self._is_closed:
+                raise GPUdbException( "Cannot insert records into a closed ingestor" )
+
+            self._queued_records_count += len( queue )
+            self._async_batch_count    += 1
+        # end with
+
+        self._sender_queues[ worker ].put( (queue, worker.get_gpudb(),
+                                            self.shard_version, future) )
+        return future
+    # end __send_async
+
+
+
+    @staticmethod
+    def __send_batches( ingestor_ref, batches ):
+        """Internal method run by each background sender thread; inserts the
+        batches handed off for its worker one at a time until told to stop.
+        Only a weak reference to the ingestor is held between the batches,
+        so that dropping the ingestor stops the thread.
+        """
+        while True:
+            batch = batches.get()
+            if batch is None:
+                return # the ingestor has been closed (or garbage collected)
+
+            ingestor = ingestor_ref()
+            if ingestor is None:
+                batch[ 3 ]._set_exception( GPUdbException( "The ingestor was garbage "
+                                                           "collected before the batch "
+                                                           "was inserted" ) )
+                continue
+
+            ingestor.__send_batch( batch )
+            del ingestor
+        # end loop
+    # end __send_batches
+
+
+
+    def __send_batch( self, batch ):
+        """Internal method to insert a batch handed off to a background
+        sender, settling its future."""
+        (queue, worker_gpudb, shard_version, future) = batch
+        try:
+            insert_rsp = self.__flush( queue, worker_gpudb, shard_version )
+            future._set_result( insert_rsp[ C._count_inserted ],
+                                insert_rsp[ C._count_updated  ] )
+        except Exception as e:
+            failed_records = queue
+            if isinstance( e, InsertionException ):
+                failed_records = e.get_records()
+
+            with self._queued_records_cond:
+                self._async_failures.append( (e, failed_records) )
+            future._set_exception( e )
+        finally:
+            with self._queued_records_cond:
+                self._queued_records_count -= len( queue )
+                self._queued_records_cond.notify_all()
+    # end __send_batch
+
+
+
+    @staticmethod
+    def __linger( ingestor_ref, stop, linger_time ):
+        """Internal method run by the linger timer thread; flushes the
+        lingering worker queues until the ingestor is closed or garbage
+        collected.  Only a weak reference to the ingestor is held between
+        the flushes, so that dropping the ingestor stops the thread.
+        """
+        timeout = linger_time
+        while not stop.wait( timeout ):
+            ingestor = ingestor_ref()
+            if ingestor is None:
+                return
+
+            next_deadline = ingestor.__flush_lingering_queues()
+            del ingestor
+
+            timeout = max( 0, next_deadline - time.time() )
+        # end loop
+    # end __linger
+
+
+
+    def __flush_lingering_queues( self ):
+        """Internal method to flush the worker queues whose oldest record
+        has been waiting for the linger time.
+
+        Returns:
+            The time by which the next queue will linger too long.
+        """
+        if self.is_async:
+            # The background senders keep the batches of each worker in
+            # order
+            ( lingering_queues, next_deadline ) = self.__take_lingering_queues()
+            for (worker, queue) in lingering_queues:
+                self.__send_async( worker, queue )
+        else:
+            # Wait for the caller to be done inserting
+            with self._flush_lock:
+                ( lingering_queues, next_deadline ) = self.__take_lingering_queues()
+                if lingering_queues:
+                    self.__flush_detached( [ (queue, worker.get_gpudb())
+                                             for (worker, queue) in lingering_queues ] )
+        # end if
+
+        return next_deadline
+    # end __flush_lingering_queues
+
+
+
+    def __take_lingering_queues( self ):
+        """Internal method to take the worker queues whose oldest record has
+        been waiting for the linger time.
+
+        Returns:
+            A tuple of the list of tuples of each lingering worker queue and
+            its records, and the time by which the next queue will linger
+            too long.
+        """
+        now = time.time()
+
+        # Any queue that gets its first record from now on cannot expire
+        # before the next full period
+        lingering_queues = []
+        next_deadline = now + self.linger_time
+        with self._queue_lock:
+            for worker in self.worker_queues:
+                deadline = worker.get_linger_deadline( self.linger_time )
+                if (deadline is None):
+                    continue
+
+                if (deadline <= now):
+                    lingering_queues.append( (worker, worker.flush()) )
+                else:
+                    next_deadline = min( next_deadline, deadline )
+        # end with
+
+        return ( lingering_queues, next_deadline )
+    # end __take_lingering_queues
+
+
+
+    def __flush_detached( self, queues, concurrently = True ):
+        """Internal method to insert the given queues on behalf of no caller
+        in particular: for the linger timer in synchronous mode, or after
+        the records queued under an outdated routing table have been
+        re-routed.  The queues are accounted for like asynchronous batches,
+        so that :meth:`.flush` waits for them and reports their errors.
+
+        @param queues  List of tuples of the records to insert and the GPUdb
+                       handle of the worker to which to send them.
+        @param concurrently  Whether to insert the queues on the flush
+                             thread pool (which must not be done from one of
+                             its own threads).
+        """
+        num_records = sum( len( queue ) for (queue, worker_gpudb) in queues )
+        with self._queued_records_cond:
+            self._queued_records_count += num_records
+            self._async_batch_count    += len( queues )
+
+        errors = []
+        try:
+            if ( (not concurrently) or (self.flush_threads == 1) or (len( queues ) == 1) ):
+                errors = [ self.__try_flush( queue_and_gpudb ) for queue_and_gpudb in queues ]
+            else:
+                errors = self.__get_flush_thread_pool().map( self.__try_flush, queues )
+        finally:
+            with self._queued_records_cond:
+                self._async_failures.extend( error for error in errors if error is not None )
+                self._queued_records_count -= num_records
+                self._queued_records_cond.notify_all()
+    # end __flush_detached
+
+
+
+    def __raise_detached_failures( self, records ):
+        """Internal method to raise, in synchronous mode, the failures of the
+        queues flushed by the linger timer (or re-routed) since the last
+        call, before queuing any of the given records; must be called while
+        holding the flush lock.
+
+        @throws InsertionException with the records of the failed queues
+                followed by the given records.
+        """
+        with self._queued_records_cond:
+            errors = self._async_failures
+            if not errors:
+                return
+
+            num_batches = self._async_batch_count
+            self._async_failures    = []
+            self._async_batch_count = 0
+        # end with
+
+        uninserted_records = []
+        for (error, queue) in errors:
+            uninserted_records.extend( queue )
+        uninserted_records.extend( records )
+
+        message = ( "Insertion failed for %d of %d batches flushed in the "
+                    "background (the given records were not queued): %s"
+                    % ( len( errors ), num_batches,
+                        "; ".join( str( error ) for (error, queue) in errors ) ) )
+        raise InsertionException( message, uninserted_records )
+    # end __raise_detached_failures
+
+
+
+    def __wait_for_async_batches( self ):
+        """Internal method to wait until the background senders are done
+        with every batch handed off so far, and raise the failures since the
+        last call.
+        """
+        with self._queued_records_cond:
+            while (self._queued_records_count > 0):
+                self._queued_records_cond.wait()
+
+            errors = self._async_failures
+            num_batches = self._async_batch_count
+            self._async_failures    = []
+            self._async_batch_count = 0
+        # end with
+
+        if (len( errors ) == 1):
+            raise errors[ 0 ][ 0 ]
+
+        self.__raise_insertion_errors( errors, num_batches )
+    # end __wait_for_async_batches
+
+
+
+    def __flush( self, queue, worker_gpudb, shard_version = None ):
+        """Internal method to flush--actually insert--the records to GPUdb.
+        If the insertion fails because the shards have been reassigned since
+        the records were routed, the routing table is refreshed and the
+        records are re-routed to their new workers.  That is only done for
+        failures that leave the records known not to have been inserted
+        (see :meth:`.__may_be_misrouted`); any other failure is raised as
+        is, without refreshing the shard map.
+
+        @param queue  List of records to insert
+        @param worker_gpudb  The GPUdb handle of the worker to which to send
+                             the records.
+        @param shard_version  The version of the shard map under which the
+                              records were routed; default is the current one.
+
+        @returns the insertion response, or None if there was nothing to insert.
+        """
+        if not queue:
+            return None # nothing to do
+
+        if (shard_version is None):
+            shard_version = self.shard_version
+
+        try:
+            return self.__insert_queue( queue, worker_gpudb )
+        except Exception as e:
+            # A failure is only worth retrying if the records may have been
+            # sent to the wrong worker (the shard map having changed since
+            # they were routed), or to one that is gone
+            if not ( self.__may_be_misrouted( e )
+                     and ( self.__update_routing( shard_version )
+                           or self.__is_worker_gone( worker_gpudb ) ) ):
+                raise
+        # end try
+
+        return self.__reroute( queue )
+    # end __flush
+
+
+
+    @staticmethod
+    def __may_be_misrouted( error ):
+        """Internal method to tell whether an insertion that failed with the
+        given error may have failed because of an outdated routing table,
+        in a way that leaves its records known not to have been inserted
+        (so that they may safely be sent again):
+
+        * the server rejected them (e.g. records received by a rank that
+          does not own their shard after a rebalance);
+        * the request could not be sent at all (e.g. the worker rank has
+          been removed).
+
+        Whether the routing is to blame is then told by comparing the
+        version of the server's shard map with the one the records were
+        routed under (see :meth:`.__update_routing`), rather than from the
+        error message, which does not reliably say: records rejected for
+        another reason are rejected again by their new worker.
+
+        A request whose connection failed after it was sent may have been
+        applied, and is never resent.
+        """
+        if isinstance( error, _GPUdbUnsentRequestException ):
+            return True
+
+        return isinstance( error, InsertionException )
+    # end __may_be_misrouted
+
+
+
+    def __insert_queue( self, queue, worker_gpudb ):
+        """Internal method to insert the records to the given worker.
+
+        @param queue  List of records to insert
+        @param worker_gpudb  The GPUdb handle of the worker to which to send
+                             the records.
+
+        @returns the insertion response.
+        """
+        try:
+            # Insert the records
+            insert_rsp = worker_gpudb.insert_records( table_name = self.table_name,
+                                                      data = queue,
+                                                      options = self.options )
+            if (insert_rsp['status_info']['status'] != "OK"):
                 raise InsertionException( insert_rsp['status_info']['message'], queue )
 
-            # Update the insert and update counts
-            self.count_inserted += insert_rsp[ C._count_inserted ]
-            self.count_updated  += insert_rsp[ C._count_updated  ]
+            # Update the insert and update counts; other workers' queues
+            # may be getting flushed at the same time
+            with self._count_lock:
+                self.count_inserted += insert_rsp[ C._count_inserted ]
+                self.count_updated  += insert_rsp[ C._count_updated  ]
+
+            return insert_rsp
         except InsertionException as e:
             raise InsertionException( str(e), queue )
-    # end __flush
+    # end __insert_queue
+
+
+
+    def __reroute( self, records ):
+        """Internal method to insert records that were routed under an
+        outdated routing table, after routing them anew.  Each group of
+        records is inserted with :meth:`.__flush`, so the records are
+        re-routed again should the shards be reassigned once more.
+
+        @param records  List of records to insert
+
+        @returns the combined insertion response.
+
+        @throws InsertionException with the records of the groups that could
+                not be inserted.
+        """
+        shard_version = self.shard_version
+        groups = self.__route_records( records )
+
+        count_inserted = 0
+        count_updated  = 0
+        errors = []
+        for (group, worker_gpudb) in groups:
+            try:
+                insert_rsp = self.__flush( group, worker_gpudb, shard_version )
+                count_inserted += insert_rsp[ C._count_inserted ]
+                count_updated  += insert_rsp[ C._count_updated  ]
+            except InsertionException as e:
+                errors.append( (e, e.get_records()) )
+            except Exception as e:
+                errors.append( (e, group) )
+        # end loop
+
+        self.__raise_insertion_errors( errors, len( groups ) )
+
+        return { C._info : { C._status : C._ok, C._msg : "" },
+                 C._count_inserted : count_inserted,
+                 C._count_updated  : count_updated }
+    # end __reroute
+
+
+
+    def __route_records( self, records ):
+        """Internal method to group records by the worker they are routed to
+        under the current routing table.
+
+        @param records  List of records (Record objects, or the column values
+                        of JSON records)
+
+        @returns a list of tuples of the records of each group and the GPUdb
+                 handle of the worker to which to send them.
+        """
+        with self._queue_lock:
+            routing_table = self.routing_table
+            worker_queues = self.worker_queues
+
+        # Without a shard key, any worker will do
+        if not self.shard_key_builder:
+            worker = worker_queues[ random.randint( 0, (len( worker_queues ) - 1) ) ]
+            return [ (records, worker.get_gpudb()) ]
+
+        worker_indices = self.shard_key_builder.route_records( records, routing_table )
+        if worker_indices is None:
+            worker_indices = [ self.shard_key_builder.build( record ).route( routing_table )
+                               for record in records ]
+
+        groups = collections.OrderedDict()
+        for (record, worker_index) in zip( records, worker_indices ):
+            groups.setdefault( worker_index, [] ).append( record )
+
+        return [ (group, worker_queues[ worker_index ].get_gpudb())
+                 for (worker_index, group) in groups.items() ]
+    # end __route_records
+
+
+
+    def __update_routing( self, shard_version ):
+        """Internal method to refresh the routing table, along with the
+        worker list and queues, if the shards have been reassigned at the
+        server (e.g. by a rebalance, or ranks being added or removed) since
+        the given version of the shard map.  The records queued under the
+        outdated routing table are re-routed and inserted.
+
+        @param shard_version  The version of the shard map under which some
+                              records were routed.
+
+        @returns whether the routing has changed since the given version.
+        """
+        if (self.shard_version is None):
+            return False # not routing to the workers in the first place
+
+        with self._routing_lock:
+            # Some other failed insertion may have refreshed it already
+            if (self.shard_version != shard_version):
+                return True
+
+            try:
+                shard_info = self.gpudb.admin_show_shards()
+                if ( (shard_info[ C._info ][ C._status ] == C._error)
+                     or (shard_info[ C._shard_version ] == self.shard_version) ):
+                    return False
+
+                # Ranks may have been added or removed, too
+                if self._workers_given:
+                    worker_urls = [ worker.get_url() for worker in self.worker_queues ]
+                else:
+                    worker_urls = GPUdbWorkerList( self.gpudb ).get_worker_urls()
+
+                (new_shard_version, routing_table) = self.__get_routing_table( len( worker_urls ) )
+            except GPUdbException:
+                # Cannot tell; the original error stands
+                return False
+
+            with self._queue_lock:
+                # Keep the queues of the workers that are still around
+                old_worker_queues = dict( (worker.get_url(), worker)
+                                          for worker in self.worker_queues )
+                worker_queues = []
+                for worker_url in worker_urls:
+                    worker = old_worker_queues.pop( worker_url, None )
+                    if worker is None:
+                        worker = self.__create_worker_queue( worker_url )
+                        if self.is_async:
+                            self.__start_sender( worker )
+                    # end if
+
+                    worker_queues.append( worker )
+                # end loop
+
+                # Take out all the queued records; they were routed with the
+                # outdated routing table
+                queued_records = []
+                for worker in self.worker_queues:
+                    queued_records.extend( worker.flush() )
+
+                self.worker_queues = worker_queues
+                self.num_ranks     = len( worker_queues )
+                self.routing_table = routing_table
+                self.shard_version = new_shard_version
+            # end with
+        # end with
+
+        if queued_records:
+            self.__flush_detached( self.__route_records( queued_records ),
+                                   concurrently = False )
+
+        return True
+    # end __update_routing
+
+
+
+    def __is_worker_gone( self, worker_gpudb ):
+        """Internal method to tell whether the worker with the given GPUdb
+        handle has been dropped from the worker list.  (The background
+        senders of such workers keep running until the ingestor is closed,
+        re-routing any batches still handed off to them.)
+        """
+        with self._queue_lock:
+            return all( (worker.get_gpudb() is not worker_gpudb)
+                        for worker in self.worker_queues )
+    # end __is_worker_gone
+
+
+
+    def __get_routing_table( self, num_ranks ):
+        """Internal method to get the current shard map from the server.
+
+        @param num_ranks  The number of worker ranks to route to.
+
+        @returns a tuple of the version of the shard map and the routing
+                 table built from it (None if the table has neither a
+                 primary nor a shard key).
+        """
+        shard_info = self.gpudb.admin_show_shards()
+        if (shard_info[ C._info ][ C._status ] == C._error):
+            raise GPUdbException( "Unable to retrieve the shard map; error: %s"
+                                  % shard_info[ C._info ][ C._msg ] )
+
+        if not (self.primary_key_builder or self.shard_key_builder):
+            return (shard_info[ C._shard_version ], None)
+
+        # Subtract 1 from each value of the routing_table
+        # (because the 1st worker rank is the 0th element in the worker list)
+        routing_table = [(rank-1) for rank in shard_info[ C._shard_ranks ] ]
+
+        # Check that enough worker URLs are specified
+        for routing_table_entry in routing_table:
+            if (routing_table_entry >= num_ranks):
+                raise GPUdbException( "Not enough worker URLs specified." )
+
+        return (shard_info[ C._shard_version ], routing_table)
+    # end __get_routing_table
+
+
+
+    def __create_worker_queue( self, worker_url ):
+        """Internal method to create the queue for the given worker URL."""
+        return _WorkerQueue( worker_url, self.gpudb,
+                             self.batch_size,
+                             has_primary_key = self.has_primary_key,
+                             update_on_existing_pk = self.update_on_existing_pk )
+    # end __create_worker_queue
+
+
+
+    def __start_sender( self, worker ):
+        """Internal method to start the background sender thread of the
+        given worker queue (asynchronous mode only)."""
+        batches = Queue()
+        sender = threading.Thread( target = GPUdbIngestor.__send_batches,
+                                   args = ( weakref.ref( self ), batches ),
+                                   name = "GPUdbIngestor-sender-%s" % worker.get_url() )
+        sender.daemon = True
+        sender.start()
+
+        self._sender_queues[ worker ] = batches
+        self._sender_threads.append( sender )
+    # end __start_sender
 
 
 # end class GPUdbIngestor
@@ -2385,6 +3876,118 @@ class GPUdbIngestor:
 
 
 
+def _concatenate_columns( column_chunks ):
+    """Concatenate chunks of column-major data (OrderedDicts of column name
+    to list or NumPy array of values) into one.
+    """
+    columns = collections.OrderedDict()
+    for chunk in column_chunks:
+        for (name, values) in chunk.items():
+            columns.setdefault( name, [] ).append( values )
+    # end loop
+
+    for (name, parts) in columns.items():
+        if ( have_numpy and isinstance( parts[ 0 ], numpy.ndarray ) ):
+            if isinstance( parts[ 0 ], numpy.ma.MaskedArray ):
+                columns[ name ] = numpy.ma.concatenate( parts )
+            else:
+                columns[ name ] = numpy.concatenate( parts )
+        else:
+            columns[ name ] = [ value for part in parts for value in part ]
+    # end loop
+
+    return columns
+# end _concatenate_columns
+
+
+
+
+class MultiHeadScanIterator( _PrefetchingIterator ):
+    """Iterates over all the records of a table (or those matching a filter
+    expression), read from several worker ranks at once.  Each rank is paged
+    through on its own background thread, and the pages of all the ranks are
+    handed over through one bounded queue, in the order they arrive.
+
+    The background threads stop once all records have been fetched, or when
+    the iterator is closed--by calling :meth:`close`, by leaving a ``with``
+    block, or by the iterator being garbage collected.
+    """
+
+    def __init__( self, worker_gpudbs, table_name, record_type,
+                  page_size = 10000, prefetch_depth = 2, options = None ):
+        """Initiate the iterator and start fetching the records.
+
+        Parameters:
+            worker_gpudbs (list of GPUdb)
+                The GPUdb handles of the ranks to read the records from.
+            table_name (str)
+                The name of the table.
+            record_type (RecordType)
+                The c-extension type of the table's records.
+            page_size (int)
+                The number of records to fetch per /get/records call to each
+                rank; an integer value greater than or equal to 1.
+            prefetch_depth (int)
+                The maximum number of fetched pages, per rank, held ahead of
+                the page being consumed; an integer value greater than or
+                equal to 1.
+            options (dict of str)
+                Optional options for /get/records (e.g. *expression*).
+        """
+        if not isinstance( page_size, (int, long) ) or (page_size < 1):
+            raise GPUdbException( "Page size must be >= 1; given {0}"
+                                  "".format( page_size ) )
+        if not isinstance( prefetch_depth, (int, long) ) or (prefetch_depth < 1):
+            raise GPUdbException( "Prefetch depth must be >= 1; given {0}"
+                                  "".format( prefetch_depth ) )
+        if (options is not None) and not isinstance( options, dict ):
+            raise GPUdbException( "Argument 'options' must be a dict; given "
+                                  "{0}".format( type( options ) ) )
+
+        self.table_name  = table_name
+        self.record_type = record_type
+        self.page_size   = page_size
+        self.options     = options if options else {}
+
+        # The page sources must not refer to the iterator itself
+        get_pages = MultiHeadScanIterator.__get_pages
+        options = self.options
+        page_sources = [ ( lambda worker_gpudb = worker_gpudb:
+                           get_pages( worker_gpudb, table_name, record_type,
+                                      page_size, options ) )
+                         for worker_gpudb in worker_gpudbs ]
+        super( MultiHeadScanIterator, self ).__init__( page_sources, prefetch_depth )
+    # end __init__
+
+
+    @staticmethod
+    def __get_pages( worker_gpudb, table_name, record_type, page_size, options ):
+        """Generates the pages of records of one rank (run on that rank's
+        background thread).
+        """
+        offset = 0
+        while True:
+            response = worker_gpudb.get_records_and_decode( table_name, offset,
+                                                            page_size,
+                                                            options = options,
+                                                            record_type = record_type )
+            if not (response['status_info']['status'] == 'OK'):
+                raise GPUdbException( response['status_info']['message'] )
+
+            records = response["records"]
+            offset += len( records )
+            yield records
+
+            if (not response["has_more_records"]) or (not records):
+                return
+        # end while
+    # end __get_pages
+
+# end class MultiHeadScanIterator
+
+
+
+
 class RecordRetriever:
     """Retrieves records from all worker ranks directly.  If multi-head
     retrieval is not set up, then automatically retrieves records from the
@@ -2395,7 +3998,8 @@ class RecordRetriever:
                   gpudb,
                   table_name,
                   record_type,
-                  workers = None ):
+                  workers = None,
+                  is_table_replicated = False ):
         """Initializes the RecordRetriever instance.
 
         Parameters:
@@ -2413,6 +4017,11 @@ class RecordRetriever:
                 parameter.
             workers (GPUdbWorkerList)
                 Optional parameter.  A list of GPUdb worker rank addresses.
+            is_table_replicated (bool)
+                Optional boolean flag indicating whether the table is
+                replicated; if True, then full-table scans are made through
+                the head node (since every worker rank holds all the
+                records).
         """
 
         # Validate input parameter 'gpudb'
@@ -2436,10 +4045,17 @@ class RecordRetriever:
                                   "GPUdbWorkerList; given %s"
                                   % str( type( workers ) ) )
 
+        # Validate input parameter 'is_table_replicated'
+        if not isinstance( is_table_replicated, bool ):
+            raise GPUdbException( "Parameter 'is_table_replicated' must be of type "
+                                  "a boolean value; given %s"
+                                  % str( type( is_table_replicated ) ) )
+
         # Save the parameter values
         self.gpudb       = gpudb
         self.table_name  = table_name
         self.record_type = record_type
+        self.is_table_replicated = is_table_replicated
 
         # Create the shard key builder
         self.shard_key_builder = _RecordKeyBuilder( self.record_type )
@@ -2455,51 +4071,91 @@ class RecordRetriever:
         # Set up the worker queues
         # ------------------------
 
-        # If no worker URLs are provided, get them from the server
+        # If no worker URLs are provided, get them from the server (and
+        # again whenever the shards get reassigned)
+        self._workers_given = bool( workers )
         if not workers:
             workers = GPUdbWorkerList( self.gpudb )
 
         # Create worker queues per worker URL
-        self.worker_queues = []
-        for worker in workers.get_worker_urls():
-            try:
-                worker_url = worker
-                wq = _WorkerQueue( worker_url, self.gpudb,
-                                   # self.batch_size,
-                                   1 ) # using one for now..........
-                self.worker_queues.append( wq )
-            except Exception as e:
-                raise
-        # end loop over workers
+        self.worker_queues = [ self.__create_worker_queue( worker_url )
+                               for worker_url in workers.get_worker_urls() ]
 
         # Get the number of workers
-        if not workers:
-            self.num_ranks = 1
-        else:
-            self.num_ranks = len( workers.get_worker_urls() )
+        self.num_ranks = len( self.worker_queues )
 
         # Very important to know if multi-head IO is actually enabled
         # at the server
         self.is_multihead_enabled = workers.is_multihead_enabled()
 
-        self.routing_table = None
+        # Set the routing table, along with the version of the shard map it
+        # was built from (which tells when it needs to be refreshed)
+        self.routing_table  = None
+        self.shard_version  = None
+        self._routing_lock  = threading.Lock()
         if ( self.is_multihead_enabled
              and self.shard_key_builder ):
-            # Get the sharding assignment ranks
-            shard_info = self.gpudb.admin_show_shards()
-            # Subtract 1 from each value of the routing_table
-            # (because the 1st worker rank is the 0th element in the worker list)
-            self.routing_table = [(rank-1) for rank in shard_info[ C._shard_ranks ] ]
-
-            # Check that enough worker URLs are specified
-            for routing_table_entry in self.routing_table:
-                if (routing_table_entry > self.num_ranks):
-                    raise GPUdbException( "Not enough worker URLs specified." )
+            (self.shard_version, self.routing_table) = self.__get_routing_table( self.num_ranks )
         # end if
+
+        # The thread pool for batched lookups and column scans is created
+        # on first use, with a thread per worker rank
+        self._thread_pool = None
+        self._thread_pool_size = 0
+        self._thread_pool_lock = threading.Lock()
+        self._is_closed = False
     # end RecordRetriever __init__
 
 
 
+    def close( self ):
+        """Releases the threads used by this retriever for batched lookups
+        and column scans; these cannot be made afterward.  The retriever can
+        also be used as a context manager, which closes it on exit.  A
+        retriever dropped without being closed releases its threads when it
+        is garbage collected.
+        """
+        with self._thread_pool_lock:
+            self._is_closed = True
+            thread_pool = self._thread_pool
+            self._thread_pool = None
+
+        if thread_pool is not None:
+            thread_pool.close()
+            thread_pool.join()
+    # end close
+
+
+    def __enter__( self ):
+        return self
+    # end __enter__
+
+
+    def __exit__( self, exc_type, exc_value, traceback ):
+        self.close()
+    # end __exit__
+
+
+    def __del__( self ):
+        """Releases the threads of a retriever dropped without being closed.
+        The threads are told to stop but not waited for.
+        """
+        # The constructor may have failed before the pool was set up
+        if getattr( self, "_is_closed", True ):
+            return
+        self._is_closed = True
+
+        # The pool may have been finalized already, if collected along with
+        # the retriever
+        if self._thread_pool is not None:
+            try:
+                self._thread_pool.close()
+            except (OSError, ValueError):
+                pass
+    # end __del__
+
+
+
     def get_records_by_key( self, key_values, expression = "" ):
         """Fetches the record(s) from the appropriate worker rank directly
         (or, if multi-head record retrieval is not set up, then from the
@@ -2542,32 +4198,480 @@ class RecordRetriever:
         # Build the shard key
         shard_key = self.shard_key_builder.build_key_with_shard_values_only( key_values )
 
-        # Get the appropriate worker
-        worker_index = shard_key.route( self.routing_table )
-        worker_queue = self.worker_queues[ worker_index ]
-
-        # Fetch the record(s) that map to this shard key
-        gr_rsp = worker_queue.get_gpudb().get_records( self.table_name,
-                                                       limit = self.gpudb.END_OF_SET,
-                                                       options = options,
-                                                       get_record_type = False )
+        while True:
+            # Get the appropriate worker (and the routing it is based on)
+            with self._routing_lock:
+                shard_version = self.shard_version
+                worker_index  = shard_key.route( self.routing_table )
+                worker_queue  = self.worker_queues[ worker_index ]
 
-        if not (gr_rsp['status_info']['status'] == 'OK'):
-            raise GPUdbException( gr_rsp['status_info']['message'] )
-
-        
-        # Decode the records
-        records = GPUdbRecord.decode_binary_data( gr_rsp["type_schema"],
-                                                  gr_rsp["records_binary"] )
+            # Fetch (and decode, with the c-extension) the record(s) that map
+            # to this shard key; if that fails after the shards got
+            # reassigned, try again with the new routing
+            try:
+                gr_rsp = worker_queue.get_gpudb().get_records_and_decode( self.table_name,
+                                                                          limit = self.gpudb.END_OF_SET,
+                                                                          options = options,
+                                                                          record_type = self.record_type.record_type )
+            except GPUdbException:
+                if not self.__update_routing( shard_version ):
+                    raise
+                continue
+            # end try
+
+            if not (gr_rsp['status_info']['status'] == 'OK'):
+                if self.__update_routing( shard_version ):
+                    continue
+                raise GPUdbException( gr_rsp['status_info']['message'] )
+
+            break
+        # end loop
 
-        # Replace the encoded records in the response with the decoded records
-        gr_rsp["data"]    = records
-        gr_rsp["records"] = records
+        # Also provide the decoded records as 'data'
+        gr_rsp["data"] = gr_rsp["records"]
         # TODO: Potential desired behavior
         # 1. return only the decoded records
         return gr_rsp
     # end get_records_by_key
-    
+
+
+
+    def get_records_by_keys( self, key_values_list, expression = "",
+                             keys_per_request = 100 ):
+        """Fetches the records that map to each of the given shard keys.
+        The keys are grouped by the worker rank they map to (or, if
+        multi-head record retrieval is not set up, all go to the head node),
+        the keys of each group are combined into one filter expression per
+        request (of at most *keys_per_request* keys), and the requests to the
+        different workers are made concurrently.
+
+        Parameters:
+
+            key_values_list (list of lists or dicts)
+                The values for the sharding columns of each key to look up,
+                each as given to :meth:`.get_records_by_key`.
+
+            expression (str)
+                Optional parameter.  If given, it is passed to /get/records
+                as a filter expression along with the keys'.
+
+            keys_per_request (int)
+                Optional parameter.  The maximum number of keys looked up by
+                a single request.  Default is 100.
+
+        Returns:
+            A list with, for each given key (in the same order), the list of
+            the decoded records that map to it.
+        """
+        # If there is no shard key, then we can't do this
+        if not self.shard_key_builder:
+            raise GPUdbException( "Cannot get key from unsharded table '%s'"
+                                  % self.table_name )
+
+        # Validate input parameter 'key_values_list'
+        if not isinstance( key_values_list, list ):
+            raise GPUdbException( "Parameter 'key_values_list' must be a list; "
+                                  "given %s" % str( type( key_values_list ) ) )
+        # Validate input parameter 'keys_per_request'
+        if ( not isinstance( keys_per_request, int ) or (keys_per_request < 1) ):
+            raise GPUdbException( "Parameter 'keys_per_request' must be a positive "
+                                  "integer; given %s" % str( keys_per_request ) )
+
+        # Build the key, its identity (to match the records fetched to it)
+        # and the expression for each key
+        keys        = [ self.shard_key_builder.build_key_with_shard_values_only( key_values )
+                        for key_values in key_values_list ]
+        identities  = [ self.shard_key_builder.build_key_identity( key_values )
+                        for key_values in key_values_list ]
+        expressions = [ self.shard_key_builder.build_expression_with_key_values_only( key_values )
+                        for key_values in key_values_list ]
+
+        results = [ [] for key in keys ]
+        self.__get_records_for_keys( list( range( len( keys ) ) ), keys, identities,
+                                     expressions, expression, keys_per_request, results )
+        return results
+    # end get_records_by_keys
+
+
+
+    def iter_all_records( self, expression = "", page_size = 10000,
+                          prefetch_depth = 2 ):
+        """Returns an iterator over all the records of the table (or those
+        matching the given expression), read from all the worker ranks
+        directly.  Each rank is paged through independently on its own
+        background thread, and the pages are handed over as they arrive, so
+        the order of the records is arbitrary.
+
+        If multi-head retrieval is not set up, or the table is replicated,
+        the records are read from the head node.  Records inserted, deleted
+        or moved by a rebalance during the scan may be missed or returned
+        more than once.
+
+        Parameters:
+
+            expression (str)
+                Optional parameter.  If given, it is passed to /get/records
+                as a filter expression.
+
+            page_size (int)
+                The number of records to fetch per /get/records call to each
+                rank.  Default is 10000.
+
+            prefetch_depth (int)
+                The maximum number of fetched pages, per rank, to hold ahead
+                of the page being consumed; bounds the memory used.  Default
+                is 2.
+
+        Returns:
+            A :class:`MultiHeadScanIterator` object, yielding the decoded
+            records.
+        """
+        options = { "expression" : expression } if expression else {}
+
+        return MultiHeadScanIterator( self.__get_scan_gpudbs(), self.table_name,
+                                      self.record_type.record_type,
+                                      page_size = page_size,
+                                      prefetch_depth = prefetch_depth,
+                                      options = options )
+    # end iter_all_records
+
+
+
+    def get_all_columns( self, column_names, expression = "",
+                         page_size = 10000, use_numpy = False ):
+        """Fetches the values of the given columns of all the records of the
+        table (or those matching the given expression), read from all the
+        worker ranks concurrently, each paged through independently with
+        /get/records/bycolumn.
+
+        If multi-head retrieval is not set up, or the table is replicated,
+        the values are read from the head node.
+
+        Parameters:
+
+            column_names (list of str)
+                The names of the columns (or column expressions) whose values
+                to fetch.
+
+            expression (str)
+                Optional parameter.  If given, it is passed to
+                /get/records/bycolumn as a filter expression.
+
+            page_size (int)
+                The number of records to fetch per /get/records/bycolumn
+                call to each rank.  Default is 10000.
+
+            use_numpy (bool)
+                If True and NumPy is available, the column values are
+                returned as NumPy arrays (see
+                :meth:`GPUdb.get_records_by_column_and_decode`) instead of
+                lists.  Default is False.
+
+        Returns:
+            An OrderedDict of column name to the values of all the records.
+        """
+        # Validate input parameter 'column_names'
+        column_names = column_names if isinstance( column_names, list ) else [ column_names ]
+        # Validate input parameter 'page_size'
+        if ( not isinstance( page_size, (int, long) ) or (page_size < 1) ):
+            raise GPUdbException( "Parameter 'page_size' must be a positive "
+                                  "integer; given %s" % str( page_size ) )
+
+        options = { "expression" : expression } if expression else {}
+        scans = [ (worker_gpudb, column_names, page_size, options, use_numpy)
+                  for worker_gpudb in self.__get_scan_gpudbs() ]
+
+        if (len( scans ) == 1):
+            column_chunks = [ self.__get_columns_from_worker( scans[ 0 ] ) ]
+        else:
+            column_chunks = self.__get_thread_pool().map( self.__get_columns_from_worker, scans )
+
+        return _concatenate_columns( [ columns for chunks in column_chunks
+                                       for columns in chunks ] )
+    # end get_all_columns
+
+
+
+    def __get_columns_from_worker( self, scan ):
+        """Internal method to page through the given columns of the records
+        held by one worker rank.
+
+        Returns:
+            A list of the column-major data of each page.
+        """
+        (worker_gpudb, column_names, page_size, options, use_numpy) = scan
+
+        column_chunks = []
+        offset = 0
+        while True:
+            response = worker_gpudb.get_records_by_column_and_decode( self.table_name,
+                                                                      column_names,
+                                                                      offset, page_size,
+                                                                      options = options,
+                                                                      use_numpy = use_numpy )
+            if not (response['status_info']['status'] == 'OK'):
+                raise GPUdbException( response['status_info']['message'] )
+
+            columns = response["records"]
+            num_records = len( next( iter( columns.values() ) ) ) if columns else 0
+            column_chunks.append( columns )
+            offset += num_records
+
+            if ( (not response["has_more_records"]) or (num_records == 0) ):
+                return column_chunks
+        # end loop
+    # end __get_columns_from_worker
+
+
+
+    def __get_scan_gpudbs( self ):
+        """Internal method to get the GPUdb handles through which to scan
+        the whole table: one per worker rank, or just the head node's if the
+        table is replicated.
+        """
+        if self.is_table_replicated:
+            return [ self.gpudb ]
+
+        with self._routing_lock:
+            return [ worker.get_gpudb() for worker in self.worker_queues ]
+    # end __get_scan_gpudbs
+
+
+
+    def __get_records_for_keys( self, key_indices, keys, identities, expressions,
+                                expression, keys_per_request, results ):
+        """Internal method to look up the given keys (given by their indices
+        in *keys*, *identities* and *expressions*) in per-worker batches, and
+        add the records of each key to its list in *results*.  The keys of
+        the batches that fail after the shards got reassigned are looked up
+        again with the new routing.
+        """
+        # Group the keys by worker, and split the groups into batches
+        with self._routing_lock:
+            shard_version = self.shard_version
+            worker_key_indices = collections.OrderedDict()
+            for key_index in key_indices:
+                worker_index = keys[ key_index ].route( self.routing_table )
+                worker_key_indices.setdefault( worker_index, [] ).append( key_index )
+
+            batches = []
+            for (worker_index, indices) in worker_key_indices.items():
+                worker_queue = self.worker_queues[ worker_index ]
+                for start in range( 0, len( indices ), keys_per_request ):
+                    batches.append( (worker_queue,
+                                     indices[ start : (start + keys_per_request) ]) )
+            # end loop
+        # end with
+
+        # Combine each batch's keys into one filter expression
+        requests = []
+        for (worker_queue, indices) in batches:
+            batch_expression = " or ".join( "(" + expressions[ key_index ] + ")"
+                                            for key_index in indices )
+            if expression:
+                batch_expression = ( "(" + batch_expression + ") and ("
+                                     + expression + ")" )
+
+            requests.append( (worker_queue, batch_expression) )
+        # end loop
+
+        # Fetch the records of all the batches concurrently
+        if not requests:
+            return # nothing to do
+        elif (len( requests ) == 1):
+            responses = [ self.__try_get_records( requests[ 0 ] ) ]
+        else:
+            responses = self.__get_thread_pool().map( self.__try_get_records, requests )
+
+        failed_key_indices = []
+        errors = []
+        for ((worker_queue, indices), (records, error)) in zip( batches, responses ):
+            if (error is not None):
+                failed_key_indices.extend( indices )
+                errors.append( error )
+                continue
+            # end if
+
+            # Hand each record to the key(s) it matches; the key values are
+            # compared, as their hash codes may collide
+            indices_by_identity = {}
+            for key_index in indices:
+                indices_by_identity.setdefault( identities[ key_index ], [] ).append( key_index )
+
+            for record in records:
+                record_identity = self.shard_key_builder.build_key_identity(
+                    [ record[ name ] for name in self.shard_key_builder.key_columns_names ] )
+                for key_index in indices_by_identity.get( record_identity, [] ):
+                    results[ key_index ].append( record )
+            # end loop
+        # end loop
+
+        if not errors:
+            return
+
+        if not self.__update_routing( shard_version ):
+            raise errors[ 0 ]
+
+        self.__get_records_for_keys( failed_key_indices, keys, identities,
+                                     expressions, expression, keys_per_request, results )
+    # end __get_records_for_keys
+
+
+
+    def __try_get_records( self, worker_and_expression ):
+        """Internal method to fetch the records matching the given expression
+        from the given worker, returning any error instead of raising it so
+        that the errors of concurrent lookups can be gathered.
+
+        Returns:
+            A tuple of the decoded records (or None) and the error (or None).
+        """
+        (worker_queue, expression) = worker_and_expression
+
+        options = {}
+        options["expression"] = expression
+        options["fast_index_lookup"] = "true"
+
+        try:
+            gr_rsp = worker_queue.get_gpudb().get_records_and_decode( self.table_name,
+                                                                      limit = self.gpudb.END_OF_SET,
+                                                                      options = options,
+                                                                      record_type = self.record_type.record_type )
+            if not (gr_rsp['status_info']['status'] == 'OK'):
+                raise GPUdbException( gr_rsp['status_info']['message'] )
+        except GPUdbException as e:
+            return (None, e)
+
+        return (gr_rsp["records"], None)
+    # end __try_get_records
+
+
+
+    def __get_thread_pool( self ):
+        """Internal method to get the thread pool used for making batched
+        lookups and column scans concurrently, creating it on first use.
+        """
+        with self._thread_pool_lock:
+            if self._is_closed:
+                raise GPUdbException( "Cannot look up records with a closed "
+                                      "retriever" )
+
+            if self._thread_pool is None:
+                self._thread_pool_size = len( self.worker_queues )
+                self._thread_pool = ThreadPool( self._thread_pool_size )
+
+            return self._thread_pool
+    # end __get_thread_pool
+
+
+
+    def __resize_thread_pool( self ):
+        """Internal method to replace the thread pool, if any, by a larger
+        one after worker ranks have been added, so that all of them can
+        still be queried at once.  Lookups running on the old pool finish
+        before its threads stop.
+        """
+        with self._thread_pool_lock:
+            if ( (self._thread_pool is None)
+                 or (self._thread_pool_size >= len( self.worker_queues )) ):
+                return
+
+            old_thread_pool = self._thread_pool
+            self._thread_pool_size = len( self.worker_queues )
+            self._thread_pool = ThreadPool( self._thread_pool_size )
+
+        old_thread_pool.close()
+    # end __resize_thread_pool
+
+
+
+    def __update_routing( self, shard_version ):
+        """Internal method to refresh the routing table, along with the
+        worker list, if the shards have been reassigned at the server (e.g.
+        by a rebalance, or ranks being added or removed) since the given
+        version of the shard map.
+
+        @param shard_version  The version of the shard map under which a
+                              lookup was routed.
+
+        @returns whether the routing has changed since the given version.
+        """
+        if (self.shard_version is None):
+            return False # not routing to the workers in the first place
+
+        with self._routing_lock:
+            # Some other failed lookup may have refreshed it already
+            if (self.shard_version != shard_version):
+                return True
+
+            try:
+                shard_info = self.gpudb.admin_show_shards()
+                if ( (shard_info[ C._info ][ C._status ] == C._error)
+                     or (shard_info[ C._shard_version ] == self.shard_version) ):
+                    return False
+
+                # Ranks may have been added or removed, too
+                if self._workers_given:
+                    worker_urls = [ worker.get_url() for worker in self.worker_queues ]
+                else:
+                    worker_urls = GPUdbWorkerList( self.gpudb ).get_worker_urls()
+
+                (new_shard_version, routing_table) = self.__get_routing_table( len( worker_urls ) )
+            except GPUdbException:
+                # Cannot tell; the original error stands
+                return False
+
+            # Keep the queues of the workers that are still around
+            old_worker_queues = dict( (worker.get_url(), worker)
+                                      for worker in self.worker_queues )
+            self.worker_queues = [ ( old_worker_queues.get( worker_url )
+                                     or self.__create_worker_queue( worker_url ) )
+                                   for worker_url in worker_urls ]
+            self.num_ranks     = len( self.worker_queues )
+            self.routing_table = routing_table
+            self.shard_version = new_shard_version
+        # end with
+
+        self.__resize_thread_pool()
+        return True
+    # end __update_routing
+
+
+
+    def __get_routing_table( self, num_ranks ):
+        """Internal method to get the current shard map from the server.
+
+        @param num_ranks  The number of worker ranks to route to.
+
+        @returns a tuple of the version of the shard map and the routing
+                 table built from it.
+        """
+        shard_info = self.gpudb.admin_show_shards()
+        if (shard_info[ C._info ][ C._status ] == C._error):
+            raise GPUdbException( "Unable to retrieve the shard map; error: %s"
+                                  % shard_info[ C._info ][ C._msg ] )
+
+        # Subtract 1 from each value of the routing_table
+        # (because the 1st worker rank is the 0th element in the worker list)
+        routing_table = [(rank-1) for rank in shard_info[ C._shard_ranks ] ]
+
+        # Check that enough worker URLs are specified
+        for routing_table_entry in routing_table:
+            if (routing_table_entry >= num_ranks):
+                raise GPUdbException( "Not enough worker URLs specified." )
+
+        return (shard_info[ C._shard_version ], routing_table)
+    # end __get_routing_table
+
+
+
+    def __create_worker_queue( self, worker_url ):
+        """Internal method to create the queue for the given worker URL."""
+        return _WorkerQueue( worker_url, self.gpudb,
+                             # self.batch_size,
+                             1 ) # using one for now..........
+    # end __create_worker_queue
+
 # end class RecordRetriever
 
 
@@ -58,7 +58,7 @@ AvroErrorCode read_digits(uint8_t** pos, const uint8_t* max, const unsigned min_
     unsigned temp_digits = 0;
     long temp_i = 0;
 
-    while (temp_digits <= max_digits && *pos < max && **pos >= '0' && **pos <= '9')
+    while (temp_digits < max_digits && *pos < max && **pos >= '0' && **pos <= '9')
     {
         temp_i *= 10;
         temp_i += **pos - '0';
@@ -362,7 +362,7 @@ AvroErrorCode write_digits(uint8_t** pos, const uint8_t* max, const int min_digi
 
     digits += zeroes;
 
-    if (*pos + digits >= max)
+    if (*pos + digits > max)
     {
         return ERR_EOF;
     }
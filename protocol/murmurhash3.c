@@ -0,0 +1,151 @@
+/*----------------------------------------------------------------------------*/
+/* murmurhash3.c: MurmurHash3 hash function used for record key routing.      */
+/*----------------------------------------------------------------------------*/
+
+#include "murmurhash3.h"
+
+#include "common.h"
+
+/* Hash constants */
+#define C1 0x87c37b91114253d5ULL
+#define C2 0x4cf5ad432745937fULL
+
+#define ROTL64(x, r) (((x) << (r)) | ((x) >> (64 - (r))))
+
+/* Reads a 64-bit little-endian value from a buffer, independent of the
+   platform's byte order and alignment requirements. */
+static uint64_t read_uint64_le(const uint8_t* data)
+{
+    return (uint64_t)data[0]
+           | ((uint64_t)data[1] << 8)
+           | ((uint64_t)data[2] << 16)
+           | ((uint64_t)data[3] << 24)
+           | ((uint64_t)data[4] << 32)
+           | ((uint64_t)data[5] << 40)
+           | ((uint64_t)data[6] << 48)
+           | ((uint64_t)data[7] << 56);
+}
+
+/* Final avalanche mix of a 64-bit hash value. */
+static uint64_t fmix64(uint64_t k)
+{
+    k ^= k >> 33;
+    k *= 0xff51afd7ed558ccdULL;
+    k ^= k >> 33;
+    k *= 0xc4ceb9fe1a85ec53ULL;
+    k ^= k >> 33;
+    return k;
+}
+
+void murmurhash3_x64_128(const uint8_t* data, Py_ssize_t len, uint32_t seed, uint64_t* h1, uint64_t* h2)
+{
+    const uint8_t* tail;
+    Py_ssize_t block_count = len / 16;
+    Py_ssize_t i;
+
+    uint64_t k1;
+    uint64_t k2;
+
+    *h1 = seed;
+    *h2 = seed;
+
+    /* Body: process 16-byte blocks. */
+
+    for (i = 0; i < block_count; ++i)
+    {
+        k1 = read_uint64_le(data + i * 16);
+        k2 = read_uint64_le(data + i * 16 + 8);
+
+        k1 *= C1;
+        k1 = ROTL64(k1, 31);
+        k1 *= C2;
+        *h1 ^= k1;
+
+        *h1 = ROTL64(*h1, 27);
+        *h1 += *h2;
+        *h1 = *h1 * 5 + 0x52dce729;
+
+        k2 *= C2;
+        k2 = ROTL64(k2, 33);
+        k2 *= C1;
+        *h2 ^= k2;
+
+        *h2 = ROTL64(*h2, 31);
+        *h2 += *h1;
+        *h2 = *h2 * 5 + 0x38495ab5;
+    }
+
+    /* Tail: process the remaining 0-15 bytes. */
+
+    tail = data + block_count * 16;
+    k1 = 0;
+    k2 = 0;
+
+    switch (len & 15)
+    {
+        case 15: k2 ^= (uint64_t)tail[14] << 48;
+        case 14: k2 ^= (uint64_t)tail[13] << 40;
+        case 13: k2 ^= (uint64_t)tail[12] << 32;
+        case 12: k2 ^= (uint64_t)tail[11] << 24;
+        case 11: k2 ^= (uint64_t)tail[10] << 16;
+        case 10: k2 ^= (uint64_t)tail[9] << 8;
+        case 9:
+            k2 ^= (uint64_t)tail[8];
+            k2 *= C2;
+            k2 = ROTL64(k2, 33);
+            k2 *= C1;
+            *h2 ^= k2;
+
+        case 8: k1 ^= (uint64_t)tail[7] << 56;
+        case 7: k1 ^= (uint64_t)tail[6] << 48;
+        case 6: k1 ^= (uint64_t)tail[5] << 40;
+        case 5: k1 ^= (uint64_t)tail[4] << 32;
+        case 4: k1 ^= (uint64_t)tail[3] << 24;
+        case 3: k1 ^= (uint64_t)tail[2] << 16;
+        case 2: k1 ^= (uint64_t)tail[1] << 8;
+        case 1:
+            k1 ^= (uint64_t)tail[0];
+            k1 *= C1;
+            k1 = ROTL64(k1, 31);
+            k1 *= C2;
+            *h1 ^= k1;
+    }
+
+    /* Finalization. */
+
+    *h1 ^= (uint64_t)len;
+    *h2 ^= (uint64_t)len;
+
+    *h1 += *h2;
+    *h2 += *h1;
+
+    *h1 = fmix64(*h1);
+    *h2 = fmix64(*h2);
+
+    *h1 += *h2;
+    *h2 += *h1;
+}
+
+PyObject* murmurhash3_hash64(PyObject* module, PyObject* args, PyObject* kwargs)
+{
+    Py_buffer buffer = { NULL };
+
+    unsigned int seed = 0;
+    static char* keywords[] = { "key", "seed", NULL };
+
+    uint64_t h1;
+    uint64_t h2;
+
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|I", keywords, &buffer, &seed), error)
+    murmurhash3_x64_128((const uint8_t*)buffer.buf, buffer.len, (uint32_t)seed, &h1, &h2);
+    PyBuffer_Release(&buffer);
+    return Py_BuildValue("(LL)", (PY_LONG_LONG)h1, (PY_LONG_LONG)h2);
+
+error:
+    if (buffer.buf)
+    {
+        PyBuffer_Release(&buffer);
+    }
+
+    return NULL;
+}
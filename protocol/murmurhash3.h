@@ -0,0 +1,46 @@
+/*----------------------------------------------------------------------------*/
+/* murmurhash3.h: MurmurHash3 hash function used for record key routing.      */
+/*----------------------------------------------------------------------------*/
+
+#ifndef _MURMURHASH3_H_
+#define _MURMURHASH3_H_
+
+#include <Python.h>
+#include "platform.h"
+
+/*----------------------------------------------------------------------------*/
+
+/* Computes the 128-bit x64 variant of the MurmurHash3 hash of a buffer, as
+   used by Kinetica for computing shard and primary key hashes. Data is read
+   in little-endian byte order regardless of platform, producing the same
+   results as the reference implementation on x64 (and the mmh3 Python
+   package). May be called without holding the GIL.
+
+   data: Pointer to the data to hash.
+
+   len: Length of the data in bytes.
+
+   seed: Seed value for the hash.
+
+   h1: Receives the first (low) 64 bits of the hash.
+
+   h2: Receives the second (high) 64 bits of the hash. */
+void murmurhash3_x64_128(const uint8_t* data, Py_ssize_t len, uint32_t seed, uint64_t* h1, uint64_t* h2);
+
+/* Python hash64 function. Computes the 128-bit x64 variant of the MurmurHash3
+   hash of a buffer and returns it as two signed 64-bit integers. Equivalent
+   to the hash64 function of the mmh3 package.
+
+   Parameters:
+       key (buffer)
+           The data to hash.
+
+       seed (int, optional)
+           Seed value for the hash. Defaults to 0.
+
+   Returns:
+       A tuple of two ints containing the first and second 64 bits of the
+       hash. */
+PyObject* murmurhash3_hash64(PyObject* module, PyObject* args, PyObject* kwargs);
+
+#endif /* _MURMURHASH3_H_ */
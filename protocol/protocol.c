@@ -2,6 +2,7 @@
 
 #include "bufferrange.h"
 #include "common.h"
+#include "murmurhash3.h"
 #include "record.h"
 #include "schema.h"
 
@@ -15,6 +16,7 @@
         ProtocolState* state = (ProtocolState*)PyModule_GetState(module);
         Py_CLEAR(state->json_decode);
         Py_CLEAR(state->json_encode);
+        Py_CLEAR(state->decimal_type);
         Py_CLEAR(state->array_string);
         Py_CLEAR(state->label_string);
         Py_CLEAR(state->null_string);
@@ -51,6 +53,7 @@
         ProtocolState* state = (ProtocolState*)PyModule_GetState(module);
         Py_VISIT(state->json_decode);
         Py_VISIT(state->json_encode);
+        Py_VISIT(state->decimal_type);
         Py_VISIT(state->array_string);
         Py_VISIT(state->label_string);
         Py_VISIT(state->null_string);
@@ -67,6 +70,14 @@
     ProtocolState Protocol_state;
 #endif
 
+/* -- Protocol Module Functions --------------------------------------------- */
+
+static PyMethodDef Protocol_methods[] =
+{
+    { "hash64", (PyCFunction)murmurhash3_hash64, METH_VARARGS | METH_KEYWORDS, NULL },
+    { NULL }
+};
+
 /* -- Protocol Module Initialization ---------------------------------------- */
 
 #if PY_MAJOR_VERSION >= 3
@@ -76,7 +87,7 @@ static struct PyModuleDef Protocol_module =
     "kinetica.protocol",    /* m_name */
     0,                      /* m_doc */
     sizeof(ProtocolState),  /* m_size */
-    0,                      /* m_methods */
+    Protocol_methods,       /* m_methods */
     0,                      /* m_slots */
     Protocol_traverse,      /* m_traverse */
     Protocol_clear,         /* m_clear */
@@ -109,7 +120,7 @@ void initprotocol(void)
     #if PY_MAJOR_VERSION >= 3
         module = PyModule_Create(&Protocol_module);
     #else
-        module = Py_InitModule("protocol", NULL);
+        module = Py_InitModule("protocol", Protocol_methods);
     #endif
 
     CHECK(module, error);
@@ -140,6 +151,14 @@ void initprotocol(void)
 
     Py_CLEAR(imported);
 
+    imported = PyImport_ImportModule("decimal");
+    CHECK(imported, error)
+
+    state->decimal_type = PyObject_GetAttrString(imported, "Decimal");
+    CHECK(state->decimal_type, error)
+
+    Py_CLEAR(imported);
+
     CHECK(init_bufferrange(module), error)
     CHECK(init_record(module), error)
     CHECK(init_schema(module), error)
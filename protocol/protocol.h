@@ -21,6 +21,9 @@ typedef struct
     /* Pointer to he encode method of a JSONEncoder object. */
     PyObject* json_encode;
 
+    /* Pointer to the decimal.Decimal class. */
+    PyObject* decimal_type;
+
     /* Unicode objects containing string constants initialized and used by
        record.c. */
     PyObject* array_string;           /* "array" */
@@ -11,6 +11,7 @@
 #include "bufferrange.h"
 #include "common.h"
 #include "dt.h"
+#include "murmurhash3.h"
 #include "protocol.h"
 
 /*----------------------------------------------------------------------------*/
@@ -335,7 +336,14 @@ static void RecordType_dealloc(RecordType* self)
 
 /* Forward declarations for decoding functions. */
 static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* args, PyObject* kwargs);
+static PyObject* RecordType_decode_dynamic_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs);
 static PyObject* RecordType_decode_records(RecordType* self, PyObject* args, PyObject* kwargs);
+static PyObject* RecordType_decode_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs);
+static PyObject* RecordType_encode_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs);
+
+/* Forward declarations for routing key functions. */
+static PyObject* RecordType_compute_key_hash_codes(RecordType* self, PyObject* args, PyObject* kwargs);
+static PyObject* RecordType_route_records(RecordType* self, PyObject* args, PyObject* kwargs);
 
 /* Python RecordType.from_dynamic_schema method. Creates a RecordType object
    from the Avro schema and binary data returned by a dynamic schema endpoint.
@@ -1476,6 +1484,8 @@ static PyObject* RecordType_to_type_schema(RecordType* self, void* unused)
             case CDT_CHAR256:
             case CDT_DATE:
             case CDT_DATETIME:
+            case CDT_DECIMAL:
+            case CDT_IPV4:
             case CDT_TIME:
                 CHECK(PyList_Append(column_properties, column->data_type_name) == 0, error)
                 field_type = PyTuple_GET_ITEM(state->column_data_type_names, CDT_STRING);
@@ -1573,13 +1583,18 @@ static PyMemberDef RecordType_members[] =
 
 static PyMethodDef RecordType_methods[] =
 {
+    { "compute_key_hash_codes", (PyCFunction)RecordType_compute_key_hash_codes, METH_VARARGS | METH_KEYWORDS, NULL },
     { "decode_dynamic_records", (PyCFunction)RecordType_decode_dynamic_records, METH_VARARGS | METH_KEYWORDS, NULL },
+    { "decode_dynamic_records_columnar", (PyCFunction)RecordType_decode_dynamic_records_columnar, METH_VARARGS | METH_KEYWORDS, NULL },
     { "decode_records", (PyCFunction)RecordType_decode_records, METH_VARARGS | METH_KEYWORDS, NULL },
+    { "decode_records_columnar", (PyCFunction)RecordType_decode_records_columnar, METH_VARARGS | METH_KEYWORDS, NULL },
+    { "encode_records_columnar", (PyCFunction)RecordType_encode_records_columnar, METH_VARARGS | METH_KEYWORDS, NULL },
     { "from_dynamic_schema", (PyCFunction)RecordType_from_dynamic_schema, METH_CLASS | METH_VARARGS | METH_KEYWORDS, NULL },
     { "from_type_schema", (PyCFunction)RecordType_from_type_schema, METH_CLASS | METH_VARARGS | METH_KEYWORDS, NULL },
     { "items", (PyCFunction)RecordType_items, METH_NOARGS, NULL },
     { "index", (PyCFunction)RecordType_index, METH_O, NULL },
     { "keys", (PyCFunction)RecordType_keys, METH_NOARGS, NULL },
+    { "route_records", (PyCFunction)RecordType_route_records, METH_VARARGS | METH_KEYWORDS, NULL },
     { "to_type_schema", (PyCFunction)RecordType_to_type_schema, METH_NOARGS, NULL },
     { "values", (PyCFunction)RecordType_values, METH_NOARGS, NULL },
     { NULL }
@@ -2625,9 +2640,13 @@ static PyMemberDef Record_members[] =
     { NULL }
 };
 
+/* Forward declarations for routing key functions. */
+static PyObject* Record_compute_key_hashes(Record* self, PyObject* arg_columns);
+
 static PyMethodDef Record_methods[] =
 {
     { "as_dict", (PyCFunction)Record_as_dict, METH_NOARGS, NULL },
+    { "compute_key_hashes", (PyCFunction)Record_compute_key_hashes, METH_O, NULL },
     { "decode", (PyCFunction)Record_decode, METH_VARARGS | METH_KEYWORDS, NULL },
     { "encode", (PyCFunction)Record_encode, METH_NOARGS, NULL },
     { "items", (PyCFunction)Record_items, METH_NOARGS, NULL },
@@ -2701,6 +2720,88 @@ error:
 
 /*----------------------------------------------------------------------------*/
 
+/* Decimal and IPv4 formatting functions. */
+
+/* Maximum length of the string form of a decimal or IPv4 value. */
+#define MAX_DECIMAL_STRING_LEN 21
+#define MAX_IPV4_STRING_LEN 15
+
+/* Formats a Kinetica decimal (a value scaled by 10000) into a buffer of at
+   least MAX_DECIMAL_STRING_LEN bytes in the format [-]I.FFFF (not null
+   terminated). Returns the length of the formatted string. */
+static Py_ssize_t format_decimal(PY_LONG_LONG decimal, char* buffer)
+{
+    char digits[MAX_DECIMAL_STRING_LEN];
+    unsigned PY_LONG_LONG temp;
+    Py_ssize_t digit_count = 0;
+    Py_ssize_t len = 0;
+
+    temp = decimal < 0 ? (unsigned PY_LONG_LONG)0 - (unsigned PY_LONG_LONG)decimal : (unsigned PY_LONG_LONG)decimal;
+
+    /* Generate digits in reverse order; always at least five so that there
+       is an integral digit and four fractional digits. */
+
+    while (temp || digit_count < 5)
+    {
+        digits[digit_count++] = (char)('0' + temp % 10);
+        temp /= 10;
+    }
+
+    if (decimal < 0)
+    {
+        buffer[len++] = '-';
+    }
+
+    while (digit_count > 4)
+    {
+        buffer[len++] = digits[--digit_count];
+    }
+
+    buffer[len++] = '.';
+
+    while (digit_count > 0)
+    {
+        buffer[len++] = digits[--digit_count];
+    }
+
+    return len;
+}
+
+/* Formats a Kinetica IPv4 address (an unsigned 32-bit value) into a buffer of
+   at least MAX_IPV4_STRING_LEN bytes in the format A.B.C.D (not null
+   terminated). Returns the length of the formatted string. */
+static Py_ssize_t format_ipv4(PY_LONG_LONG ipv4, char* buffer)
+{
+    Py_ssize_t len = 0;
+    int shift;
+
+    for (shift = 24; shift >= 0; shift -= 8)
+    {
+        int octet = (int)((ipv4 >> shift) & 0xFF);
+
+        if (octet >= 100)
+        {
+            buffer[len++] = (char)('0' + octet / 100);
+        }
+
+        if (octet >= 10)
+        {
+            buffer[len++] = (char)('0' + octet / 10 % 10);
+        }
+
+        buffer[len++] = (char)('0' + octet % 10);
+
+        if (shift)
+        {
+            buffer[len++] = '.';
+        }
+    }
+
+    return len;
+}
+
+/*----------------------------------------------------------------------------*/
+
 /* Record column accessor functions. See description and notes at typedef for
    GetColumnFunc above. */
 
@@ -2770,6 +2871,28 @@ static PyObject* get_datetime_column(ColumnValue* column_value)
                                       DT_MSEC(datetime) * 1000);
 }
 
+/* Accessor function for decimal columns. */
+static PyObject* get_decimal_column(ColumnValue* column_value)
+{
+    char buffer[MAX_DECIMAL_STRING_LEN];
+    Py_ssize_t len;
+    PyObject* string;
+    PyObject* value;
+
+    ProtocolState* state = GET_STATE();
+    CHECK(state, error)
+
+    len = format_decimal(column_value->value.l, buffer);
+    string = PyUnicode_FromStringAndSize(buffer, len);
+    CHECK(string, error)
+    value = PyObject_CallFunctionObjArgs(state->decimal_type, string, NULL);
+    Py_DECREF(string);
+    return value;
+
+error:
+    return NULL;
+}
+
 /* Accessor function for double columns. */
 static PyObject* get_double_column(ColumnValue* column_value)
 {
@@ -2792,6 +2915,14 @@ static PyObject* get_int_column(ColumnValue* column_value)
     #endif
 }
 
+/* Accessor function for ipv4 columns. */
+static PyObject* get_ipv4_column(ColumnValue* column_value)
+{
+    char buffer[MAX_IPV4_STRING_LEN];
+
+    return PyUnicode_FromStringAndSize(buffer, format_ipv4(column_value->value.l, buffer));
+}
+
 /* Accessor function for long columns. */
 static PyObject* get_long_column(ColumnValue* column_value)
 {
@@ -2870,11 +3001,13 @@ static GetColumnFunc get_column[CDT_MAX] =
     get_string_column,     /* CDT_CHAR256 */
     get_date_column,       /* CDT_DATE */
     get_datetime_column,   /* CDT_DATETIME */
+    get_decimal_column,    /* CDT_DECIMAL */
     get_double_column,     /* CDT_DOUBLE */
     get_float_column,      /* CDT_FLOAT */
     get_int_column,        /* CDT_INT */
     get_int_column,        /* CDT_INT8 */
     get_int_column,        /* CDT_INT16 */
+    get_ipv4_column,       /* CDT_IPV4 */
     get_long_column,       /* CDT_LONG */
     get_string_column,     /* CDT_STRING */
     get_time_column,       /* CDT_TIME */
@@ -2883,396 +3016,675 @@ static GetColumnFunc get_column[CDT_MAX] =
 
 /*----------------------------------------------------------------------------*/
 
-/* Record column mutator functions. See description and notes at typedef for
-   SetColumnFunc above.*/
+/* Value parsing functions. These parse the string forms of date, datetime,
+   time, decimal and IPv4 values, as used in Avro-encoded binary data and
+   accepted by the column mutator functions. */
 
-/* Mutator function for bytes columns. */
-static int set_bytes_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Parses a date string in the format YYYY-MM-DD (optionally surrounded by
+   whitespace) occupying the entire range from pos to max into a Kinetica
+   date. */
+static AvroErrorCode parse_date(uint8_t** pos, uint8_t* max, long* date)
 {
-    Py_ssize_t len;
-    char* data;
-    ColumnValue* column_value;
-    PyObject* old_value;
+    long year;
+    long month;
+    long day;
 
-    #if PY_MAJOR_VERSION >= 3
-        value = PyObject_Bytes(value);
-        CHECK(value, error)
-        len = PyBytes_GET_SIZE(value);
-        data = PyBytes_AS_STRING(value);
-    #else
-        value = PyObject_Str(value);
-        CHECK(value, error)
-        len = PyString_GET_SIZE(value);
-        data = PyString_AS_STRING(value);
-    #endif
+    unsigned digits;
 
-    column_value = &(&self->column_values)[index];
-    old_value = PyList_GET_ITEM(self->values, index);
+    skip_whitespace(pos, max, 0);
+    AVRO_RETURN_ERROR(read_digits(pos, max, 4, 4, 1000, 2900, &year, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 12, &month, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 31, &day, &digits))
+    skip_whitespace(pos, max, 0);
 
-    if (!old_value)
+    if (*pos != max)
     {
-        free(column_value->value.data);
+        return ERR_OVERFLOW;
     }
-    else
+
+    if (!encode_date((int)year, (int)month, (int)day, date))
     {
-        Py_DECREF(old_value);
+        return ERR_OVERFLOW;
     }
 
-    PyList_SET_ITEM(self->values, index, value);
-    column_value->value.data = data;
-    column_value->len = len;
-    return 1;
-
-error:
-    return 0;
+    return ERR_NONE;
 }
 
-/* Mutator helper function for small charN columns (N <= 8). */
-static int set_char_column_small(Record* self, Py_ssize_t index, PyObject* value, int size)
+/* Parses a datetime string in the format YYYY-MM-DD[ HH:MM:SS[.mmm]]
+   (optionally surrounded by whitespace) occupying the entire range from pos to
+   max into a Kinetica datetime. */
+static AvroErrorCode parse_datetime(uint8_t** pos, uint8_t* max, PY_LONG_LONG* datetime)
 {
-    Py_ssize_t len;
-    char* data;
-    ColumnValue* column_value;
+    long year;
+    long month;
+    long day;
+    long hour;
+    long minute;
+    long second;
+    long millisecond;
 
-    #if PY_MAJOR_VERSION >= 3
-        value = PyObject_Str(value);
-        CHECK(value, error)
-        data = PyUnicode_AsUTF8AndSize(value, &len);
-        CHECK(data, error)
-        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
-        column_value = &(&self->column_values)[index];
-        memcpy(&column_value->value.c, data, len);
-    #else
-        PyObject* string = NULL;
+    unsigned digits;
 
-        value = PyObject_Unicode(value);
-        CHECK(value, error)
-        string = PyUnicode_AsUTF8String(value);
-        CHECK(string, error)
-        len = PyString_GET_SIZE(string);
-        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
-        data = PyString_AS_STRING(string);
-        column_value = &(&self->column_values)[index];
-        memcpy(&column_value->value.c, data, len);
-        Py_DECREF(string);
-    #endif
+    skip_whitespace(pos, max, 0);
+    AVRO_RETURN_ERROR(read_digits(pos, max, 4, 4, 1000, 2900, &year, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 12, &month, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 31, &day, &digits))
 
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    PyList_SET_ITEM(self->values, index, value);
-    column_value->len = len;
-    return 1;
+    if (*pos < max)
+    {
+        AVRO_RETURN_ERROR(skip_whitespace(pos, max, 1))
+    }
 
-error:
-    #if PY_MAJOR_VERSION < 3
-        Py_XDECREF(string);
-    #endif
+    if (*pos == max)
+    {
+        if (!encode_datetime((int)year, (int)month, (int)day, 0, 0, 0, 0, datetime))
+        {
+            return ERR_OVERFLOW;
+        }
 
-    Py_XDECREF(value);
-    return 0;
-}
+        return ERR_NONE;
+    }
 
-/* Mutator function for char1 columns. */
-static int set_char1_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_small(self, index, value, 1);
-}
+    AVRO_RETURN_ERROR(read_digits(pos, max, 1, 2, 0, 23, &hour, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &minute, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &second, &digits))
 
-/* Mutator function for char2 columns. */
-static int set_char2_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_small(self, index, value, 2);
-}
+    if (*pos < max && **pos == '.')
+    {
+        ++*pos;
+        AVRO_RETURN_ERROR(read_digits(pos, max, 1, 3, 0, 999, &millisecond, &digits))
 
-/* Mutator function for char4 columns. */
-static int set_char4_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_small(self, index, value, 4);
-}
+        if (digits < 3)
+        {
+            if (digits == 2)
+            {
+                millisecond *= 10;
+            }
+            else
+            {
+                millisecond *= 100;
+            }
+        }
+    }
+    else
+    {
+        millisecond = 0;
+    }
 
-/* Mutator function for char8 columns. */
-static int set_char8_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_small(self, index, value, 8);
+    skip_whitespace(pos, max, 0);
+
+    if (*pos != max)
+    {
+        return ERR_OVERFLOW;
+    }
+
+    if (!encode_datetime((int)year, (int)month, (int)day, (int)hour, (int)minute, (int)second, (int)millisecond, datetime))
+    {
+        return ERR_OVERFLOW;
+    }
+
+    return ERR_NONE;
 }
 
-/* Mutator helper function for large charN columns (N > 8). */
-static int set_char_column_large(Record* self, Py_ssize_t index, PyObject* value, int size)
+/* Parses a time string in the format HH:MM:SS[.mmm] (optionally surrounded by
+   whitespace) occupying the entire range from pos to max into a Kinetica
+   time. */
+static AvroErrorCode parse_time(uint8_t** pos, uint8_t* max, long* time)
 {
-    Py_ssize_t len;
-    char* data;
-    ColumnValue* column_value;
+    long hour;
+    long minute;
+    long second;
+    long millisecond;
 
-    #if PY_MAJOR_VERSION >= 3
-        PyObject* old_value;
+    unsigned digits;
 
-        value = PyObject_Str(value);
-        CHECK(value, error)
-        data = PyUnicode_AsUTF8AndSize(value, &len);
-        CHECK(data, error)
-        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
-        column_value = &(&self->column_values)[index];
-        old_value = PyList_GET_ITEM(self->values, index);
+    skip_whitespace(pos, max, 0);
+    AVRO_RETURN_ERROR(read_digits(pos, max, 1, 2, 0, 23, &hour, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &minute, &digits))
+    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &second, &digits))
 
-        if (!old_value)
+    if (*pos < max && **pos == '.')
+    {
+        ++*pos;
+        AVRO_RETURN_ERROR(read_digits(pos, max, 1, 3, 0, 999, &millisecond, &digits))
+
+        if (digits < 3)
         {
-            free(column_value->value.data);
-        }
-        else
-        {
-            Py_DECREF(old_value);
+            if (digits == 2)
+            {
+                millisecond *= 10;
+            }
+            else
+            {
+                millisecond *= 100;
+            }
         }
+    }
+    else
+    {
+        millisecond = 0;
+    }
 
-        PyList_SET_ITEM(self->values, index, value);
-        column_value->value.data = data;
-    #else
-        PyObject* string = NULL;
+    skip_whitespace(pos, max, 0);
 
-        value = PyObject_Unicode(value);
-        CHECK(value, error)
-        string = PyUnicode_AsUTF8String(value);
-        CHECK(string, error)
-        len = PyString_GET_SIZE(string);
-        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
-        data = PyString_AS_STRING(string);
-        column_value = &(&self->column_values)[index];
+    if (*pos != max)
+    {
+        return ERR_OVERFLOW;
+    }
 
-        if (len != column_value->len)
+    encode_time((int)hour, (int)minute, (int)second, (int)millisecond, time);
+    return ERR_NONE;
+}
+
+/* Internal function to get the UTF-8 encoded contents of a Python str (or, in
+   Python 2, str or unicode) object. Returns a new reference to an object that
+   owns the buffer, which must be kept alive while the buffer is used, or NULL
+   if an exception occurred. */
+static PyObject* get_utf8_string(PyObject* value, uint8_t** data, Py_ssize_t* len)
+{
+    #if PY_MAJOR_VERSION >= 3
+        *data = (uint8_t*)PyUnicode_AsUTF8AndSize(value, len);
+        CHECK(*data, error)
+        Py_INCREF(value);
+        return value;
+    #else
+        PyObject* string;
+
+        if (PyUnicode_Check(value))
         {
-            char* temp = MALLOC(len);
-            CHECK_NONE(temp, PyExc_MemoryError, error)
-            free(column_value->value.data);
-            column_value->value.data = temp;
+            string = PyUnicode_AsUTF8String(value);
+            CHECK(string, error)
+        }
+        else
+        {
+            Py_INCREF(value);
+            string = value;
         }
 
-        memcpy(column_value->value.data, data, len);
-        Py_DECREF(string);
-        Py_XDECREF(PyList_GET_ITEM(self->values, index));
-        PyList_SET_ITEM(self->values, index, value);
+        *data = (uint8_t*)PyString_AS_STRING(string);
+        *len = PyString_GET_SIZE(string);
+        return string;
     #endif
 
-    column_value->len = len;
-    return 1;
-
 error:
-    #if PY_MAJOR_VERSION < 3
-        Py_XDECREF(string);
-    #endif
-
-    Py_XDECREF(value);
-    return 0;
+    return NULL;
 }
 
-/* Mutator function for char16 columns. */
-static int set_char16_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Internal function to get the value of a Python int (or, in Python 2, int or
+   long) object as epoch milliseconds, checking that it is within the range of
+   valid Kinetica datetimes. Returns 1 if successful, 0 if the object is not an
+   integer (with no exception set), or -1 if an exception occurred. */
+static int get_epoch_ms(PyObject* value, PY_LONG_LONG* epoch_ms)
 {
-    return set_char_column_large(self, index, value, 16);
-}
+    #if PY_MAJOR_VERSION >= 3
+        if (!PyLong_Check(value))
+    #else
+        if (!PyLong_Check(value) && !PyInt_Check(value))
+    #endif
+    {
+        return 0;
+    }
 
-/* Mutator function for char32 columns. */
-static int set_char32_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_large(self, index, value, 32);
-}
+    *epoch_ms = PyLong_AsLongLong(value);
+    CHECK(*epoch_ms != -1 || !PyErr_Occurred(), error)
+    CHECK_STRING(*epoch_ms >= MIN_EPOCH_MS && *epoch_ms <= MAX_EPOCH_MS, PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+    return 1;
 
-/* Mutator function for char64 columns. */
-static int set_char64_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_large(self, index, value, 64);
+error:
+    return -1;
 }
 
-/* Mutator function for char128 columns. */
-static int set_char128_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Internal function to convert a Python str (in YYYY-MM-DD format) or int
+   (epoch milliseconds) value into a Kinetica date. Returns 1 if successful,
+   or 0 if an exception occurred. */
+static int convert_date_value(PyObject* value, long* date)
 {
-    return set_char_column_large(self, index, value, 128);
-}
+    PY_LONG_LONG epoch_ms;
+    PY_LONG_LONG datetime;
+    int r;
 
-/* Mutator function for char256 columns. */
-static int set_char256_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_char_column_large(self, index, value, 256);
-}
+    if (IS_STRING(value))
+    {
+        uint8_t* pos;
+        Py_ssize_t len;
+        PyObject* string = get_utf8_string(value, &pos, &len);
+        AvroErrorCode error;
 
-/* Mutator function for date columns. */
-static int set_date_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    long date;
-    ColumnValue* column_value;
+        CHECK(string, error)
+        error = parse_date(&pos, pos + len, date);
+        Py_DECREF(string);
+        CHECK_STRING(error == ERR_NONE, PyExc_ValueError, "value must be in YYYY-MM-DD format and between 1/1/1000 and 12/31/2900", error)
+        return 1;
+    }
 
-    CHECK_STRING(PyDate_Check(value), PyExc_TypeError, "value must be date", error)
-    CHECK_STRING(encode_date(PyDateTime_GET_YEAR(value),
-                             PyDateTime_GET_MONTH(value),
-                             PyDateTime_GET_DAY(value),
-                             &date),
-                 PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    Py_INCREF(value);
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.i = date;
-    column_value->len = 0;
+    r = get_epoch_ms(value, &epoch_ms);
+    CHECK(r != -1, error)
+    CHECK_STRING(r, PyExc_TypeError, "value must be date, str or int", error)
+    datetime = epoch_ms_to_datetime(epoch_ms);
+    encode_date((int)DT_YEAR(datetime), (int)DT_MONTH(datetime), (int)DT_DAY(datetime), date);
     return 1;
 
 error:
     return 0;
 }
 
-/* Mutator function for datetime columns. */
-static int set_datetime_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Internal function to convert a Python str (in YYYY-MM-DD[ HH:MM:SS[.mmm]]
+   format) or int (epoch milliseconds) value into a Kinetica datetime. Returns
+   1 if successful, or 0 if an exception occurred. */
+static int convert_datetime_value(PyObject* value, PY_LONG_LONG* datetime)
 {
-    PY_LONG_LONG datetime;
-    ColumnValue* column_value;
-
-    CHECK_STRING(PyDateTime_Check(value), PyExc_TypeError, "value must be datetime", error)
-    CHECK_STRING(encode_datetime(PyDateTime_GET_YEAR(value),
-                                 PyDateTime_GET_MONTH(value),
-                                 PyDateTime_GET_DAY(value),
-                                 PyDateTime_DATE_GET_HOUR(value),
-                                 PyDateTime_DATE_GET_MINUTE(value),
-                                 PyDateTime_DATE_GET_SECOND(value),
-                                 PyDateTime_DATE_GET_MICROSECOND(value) / 1000,
-                                 &datetime),
-                 PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    Py_INCREF(value);
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.l = datetime;
-    column_value->len = 0;
-    return 1;
+    PY_LONG_LONG epoch_ms;
+    int r;
 
-error:
-    return 0;
-}
+    if (IS_STRING(value))
+    {
+        uint8_t* pos;
+        Py_ssize_t len;
+        PyObject* string = get_utf8_string(value, &pos, &len);
+        AvroErrorCode error;
 
-/* Mutator function for double columns. */
-static int set_double_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    ColumnValue* column_value;
+        CHECK(string, error)
+        error = parse_datetime(&pos, pos + len, datetime);
+        Py_DECREF(string);
+        CHECK_STRING(error == ERR_NONE, PyExc_ValueError, "value must be in YYYY-MM-DD [HH:MM:SS[.mmm]] format and between 1/1/1000 and 12/31/2900", error)
+        return 1;
+    }
 
-    value = PyNumber_Float(value);
-    CHECK(value, error)
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.d = PyFloat_AS_DOUBLE(value);
-    column_value->len = 0;
+    r = get_epoch_ms(value, &epoch_ms);
+    CHECK(r != -1, error)
+    CHECK_STRING(r, PyExc_TypeError, "value must be datetime, str or int", error)
+    *datetime = epoch_ms_to_datetime(epoch_ms);
     return 1;
 
 error:
     return 0;
 }
 
-/* Mutator function for float columns. */
-static int set_float_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Internal function to convert a Python str (in HH:MM:SS[.mmm] format) or int
+   (milliseconds since midnight) value into a Kinetica time. Returns 1 if
+   successful, or 0 if an exception occurred. */
+static int convert_time_value(PyObject* value, long* time)
 {
-    ColumnValue* column_value;
-
-    value = PyNumber_Float(value);
-    CHECK(value, error)
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.f = (float)PyFloat_AS_DOUBLE(value);
-    column_value->len = 0;
-    return 1;
+    PY_LONG_LONG ms;
 
-error:
-    return 0;
-}
+    if (IS_STRING(value))
+    {
+        uint8_t* pos;
+        Py_ssize_t len;
+        PyObject* string = get_utf8_string(value, &pos, &len);
+        AvroErrorCode error;
 
-/* Mutator helper function for sized int columns. */
-static int set_int_column_sized(Record* self, Py_ssize_t index, PyObject* value, long min, long max)
-{
-    ColumnValue* column_value;
+        CHECK(string, error)
+        error = parse_time(&pos, pos + len, time);
+        Py_DECREF(string);
+        CHECK_STRING(error == ERR_NONE, PyExc_ValueError, "value must be in HH:MM:SS[.mmm] format", error)
+        return 1;
+    }
 
     #if PY_MAJOR_VERSION >= 3
-        long temp;
-
-        value = PyNumber_Long(value);
-        CHECK(value, error)
-        temp = PyLong_AsLong(value);
-        CHECK(temp != -1 || !PyErr_Occurred(), error)
-        CHECK_STRING(temp >= min && temp <= max, PyExc_OverflowError, "value out of range", error)
+        CHECK_STRING(PyLong_Check(value), PyExc_TypeError, "value must be time, str or int", error)
     #else
-        long temp;
-
-        value = PyNumber_Int(value);
-        CHECK(value, error)
-        CHECK_STRING(PyInt_Check(value), PyExc_ValueError, "value out of range", error)
-        temp = PyInt_AS_LONG(value);
-        CHECK_STRING(temp >= min && temp <= max, PyExc_OverflowError, "value out of range", error)
+        CHECK_STRING(PyLong_Check(value) || PyInt_Check(value), PyExc_TypeError, "value must be time, str or int", error)
     #endif
 
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.i = temp;
-    column_value->len = 0;
+    ms = PyLong_AsLongLong(value);
+    CHECK(ms != -1 || !PyErr_Occurred(), error)
+    CHECK_STRING(ms >= 0 && ms < 86400000, PyExc_ValueError, "value out of range, must be between 00:00:00.000 and 23:59:59.999", error)
+    encode_time((int)(ms / 3600000), (int)(ms / 60000 % 60), (int)(ms / 1000 % 60), (int)(ms % 1000), time);
     return 1;
 
 error:
-    Py_XDECREF(value);
     return 0;
 }
 
-/* Mutator function for int columns. */
-static int set_int_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Parses a decimal string in the format [+-]I[.F] or [+-].F (optionally
+   surrounded by whitespace) occupying the entire range from pos to max into a
+   Kinetica decimal (the value scaled by 10000). Digits beyond the fourth
+   fractional digit are only allowed if they are zero. */
+static AvroErrorCode parse_decimal(uint8_t** pos, uint8_t* max, PY_LONG_LONG* decimal)
 {
-    return set_int_column_sized(self, index, value, INT32_MIN, INT32_MAX);
-}
+    unsigned PY_LONG_LONG value = 0;
+    char negative = 0;
+    unsigned digits = 0;
+    unsigned scale = 0;
 
-/* Mutator function for int8 columns. */
-static int set_int8_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_int_column_sized(self, index, value, INT8_MIN, INT8_MAX);
-}
+    skip_whitespace(pos, max, 0);
 
-/* Mutator function for int16 columns. */
-static int set_int16_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    return set_int_column_sized(self, index, value, INT16_MIN, INT16_MAX);
-}
+    if (*pos < max && (**pos == '+' || **pos == '-'))
+    {
+        negative = **pos == '-';
+        ++*pos;
+    }
 
-/* Mutator function for long columns. */
-static int set_long_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    ColumnValue* column_value;
+    while (*pos < max && **pos >= '0' && **pos <= '9')
+    {
+        value = value * 10 + (**pos - '0');
 
-    PY_LONG_LONG temp;
+        if (value > INT64_MAX / 10000)
+        {
+            return ERR_OVERFLOW;
+        }
 
-    value = PyNumber_Long(value);
-    CHECK(value, error)
-    temp = PyLong_AsLongLong(value);
-    CHECK(temp != -1 || !PyErr_Occurred(), error)
-    CHECK_STRING(temp >= INT64_MIN && temp <= INT64_MAX, PyExc_OverflowError, "value out of range", error)
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.l = temp;
-    column_value->len = 0;
-    return 1;
+        ++digits;
+        ++*pos;
+    }
 
-error:
-    Py_XDECREF(value);
-    return 0;
-}
+    if (*pos < max && **pos == '.')
+    {
+        ++*pos;
 
-/* Mutator function for string columns. */
-static int set_string_column(Record* self, Py_ssize_t index, PyObject* value)
-{
-    Py_ssize_t len;
-    char* data;
-    ColumnValue* column_value;
+        while (*pos < max && **pos >= '0' && **pos <= '9')
+        {
+            if (scale < 4)
+            {
+                value = value * 10 + (**pos - '0');
+                ++scale;
+            }
+            else if (**pos != '0')
+            {
+                return ERR_OVERFLOW;
+            }
 
-    #if PY_MAJOR_VERSION >= 3
-        PyObject* old_value;
+            ++digits;
+            ++*pos;
+        }
+    }
 
-        value = PyObject_Str(value);
-        CHECK(value, error)
-        data = PyUnicode_AsUTF8AndSize(value, &len);
-        CHECK(data, error)
-        column_value = &(&self->column_values)[index];
-        old_value = PyList_GET_ITEM(self->values, index);
+    skip_whitespace(pos, max, 0);
+
+    if (digits == 0 || *pos != max)
+    {
+        return ERR_OVERFLOW;
+    }
+
+    while (scale < 4)
+    {
+        value *= 10;
+        ++scale;
+    }
+
+    if (value > INT64_MAX)
+    {
+        return ERR_OVERFLOW;
+    }
+
+    *decimal = negative ? -(PY_LONG_LONG)value : (PY_LONG_LONG)value;
+    return ERR_NONE;
+}
+
+/* Parses an IPv4 address string in the format A.B.C.D occupying the entire
+   range from pos to max into a Kinetica IPv4 address (an unsigned 32-bit
+   value). */
+static AvroErrorCode parse_ipv4(uint8_t** pos, uint8_t* max, PY_LONG_LONG* ipv4)
+{
+    PY_LONG_LONG value = 0;
+    long octet;
+    unsigned digits;
+    int i;
+
+    for (i = 0; i < 4; ++i)
+    {
+        if (i > 0)
+        {
+            AVRO_RETURN_ERROR(skip_char(pos, max, '.'))
+        }
+
+        AVRO_RETURN_ERROR(read_digits(pos, max, 1, 3, 0, 255, &octet, &digits))
+
+        if (digits > 3)
+        {
+            return ERR_OVERFLOW;
+        }
+
+        value = (value << 8) | octet;
+    }
+
+    if (*pos != max)
+    {
+        return ERR_OVERFLOW;
+    }
+
+    *ipv4 = value;
+    return ERR_NONE;
+}
+
+/* Internal function to convert a Python str (in [+-]I[.F] format), int, or
+   other number (such as decimal.Decimal or float, formatted with the "f"
+   format) value into a Kinetica decimal. Returns 1 if successful, or 0 if an
+   exception occurred. */
+static int convert_decimal_value(PyObject* value, PY_LONG_LONG* decimal)
+{
+    PyObject* string;
+    uint8_t* pos;
+    Py_ssize_t len;
+    AvroErrorCode error;
+
+    #if PY_MAJOR_VERSION >= 3
+        if (PyLong_Check(value))
+    #else
+        if (PyLong_Check(value) || PyInt_Check(value))
+    #endif
+    {
+        PY_LONG_LONG temp = PyLong_AsLongLong(value);
+        CHECK(temp != -1 || !PyErr_Occurred(), error)
+        CHECK_STRING(temp >= -(INT64_MAX / 10000) && temp <= INT64_MAX / 10000, PyExc_OverflowError, "value out of range", error)
+        *decimal = temp * 10000;
+        return 1;
+    }
+
+    if (IS_STRING(value))
+    {
+        Py_INCREF(value);
+    }
+    else
+    {
+        PyObject* format_spec;
+
+        CHECK_STRING(PyNumber_Check(value), PyExc_TypeError, "value must be Decimal, str, int or float", error)
+        format_spec = PyUnicode_FromString("f");
+        CHECK(format_spec, error)
+        value = PyObject_Format(value, format_spec);
+        Py_DECREF(format_spec);
+        CHECK(value, error)
+    }
+
+    string = get_utf8_string(value, &pos, &len);
+    Py_DECREF(value);
+    CHECK(string, error)
+    error = parse_decimal(&pos, pos + len, decimal);
+    Py_DECREF(string);
+    CHECK_STRING(error == ERR_NONE, PyExc_ValueError, "value must be a decimal number with up to 4 fractional digits, between -922337203685477.5807 and 922337203685477.5807", error)
+    return 1;
+
+error:
+    return 0;
+}
+
+/* Internal function to convert a Python str (in A.B.C.D format), int, or other
+   object whose str form is in A.B.C.D format (such as
+   ipaddress.IPv4Address) value into a Kinetica IPv4 address. Returns 1 if
+   successful, or 0 if an exception occurred. */
+static int convert_ipv4_value(PyObject* value, PY_LONG_LONG* ipv4)
+{
+    PyObject* string;
+    uint8_t* pos;
+    Py_ssize_t len;
+    AvroErrorCode error;
+
+    #if PY_MAJOR_VERSION >= 3
+        if (PyLong_Check(value))
+    #else
+        if (PyLong_Check(value) || PyInt_Check(value))
+    #endif
+    {
+        PY_LONG_LONG temp = PyLong_AsLongLong(value);
+        CHECK(temp != -1 || !PyErr_Occurred(), error)
+        CHECK_STRING(temp >= 0 && temp <= UINT32_MAX, PyExc_OverflowError, "value out of range", error)
+        *ipv4 = temp;
+        return 1;
+    }
+
+    if (IS_STRING(value))
+    {
+        Py_INCREF(value);
+    }
+    else
+    {
+        value = PyObject_Str(value);
+        CHECK(value, error)
+    }
+
+    string = get_utf8_string(value, &pos, &len);
+    Py_DECREF(value);
+    CHECK(string, error)
+    error = parse_ipv4(&pos, pos + len, ipv4);
+    Py_DECREF(string);
+    CHECK_STRING(error == ERR_NONE, PyExc_ValueError, "value must be in A.B.C.D format", error)
+    return 1;
+
+error:
+    return 0;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Record column mutator functions. See description and notes at typedef for
+   SetColumnFunc above.*/
+
+/* Mutator function for bytes columns. */
+static int set_bytes_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    Py_ssize_t len;
+    char* data;
+    ColumnValue* column_value;
+    PyObject* old_value;
+
+    #if PY_MAJOR_VERSION >= 3
+        value = PyObject_Bytes(value);
+        CHECK(value, error)
+        len = PyBytes_GET_SIZE(value);
+        data = PyBytes_AS_STRING(value);
+    #else
+        value = PyObject_Str(value);
+        CHECK(value, error)
+        len = PyString_GET_SIZE(value);
+        data = PyString_AS_STRING(value);
+    #endif
+
+    column_value = &(&self->column_values)[index];
+    old_value = PyList_GET_ITEM(self->values, index);
+
+    if (!old_value)
+    {
+        free(column_value->value.data);
+    }
+    else
+    {
+        Py_DECREF(old_value);
+    }
+
+    PyList_SET_ITEM(self->values, index, value);
+    column_value->value.data = data;
+    column_value->len = len;
+    return 1;
+
+error:
+    return 0;
+}
+
+/* Mutator helper function for small charN columns (N <= 8). */
+static int set_char_column_small(Record* self, Py_ssize_t index, PyObject* value, int size)
+{
+    Py_ssize_t len;
+    char* data;
+    ColumnValue* column_value;
+
+    #if PY_MAJOR_VERSION >= 3
+        value = PyObject_Str(value);
+        CHECK(value, error)
+        data = PyUnicode_AsUTF8AndSize(value, &len);
+        CHECK(data, error)
+        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
+        column_value = &(&self->column_values)[index];
+        memcpy(&column_value->value.c, data, len);
+    #else
+        PyObject* string = NULL;
+
+        value = PyObject_Unicode(value);
+        CHECK(value, error)
+        string = PyUnicode_AsUTF8String(value);
+        CHECK(string, error)
+        len = PyString_GET_SIZE(string);
+        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
+        data = PyString_AS_STRING(string);
+        column_value = &(&self->column_values)[index];
+        memcpy(&column_value->value.c, data, len);
+        Py_DECREF(string);
+    #endif
+
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value->len = len;
+    return 1;
+
+error:
+    #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(string);
+    #endif
+
+    Py_XDECREF(value);
+    return 0;
+}
+
+/* Mutator function for char1 columns. */
+static int set_char1_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_small(self, index, value, 1);
+}
+
+/* Mutator function for char2 columns. */
+static int set_char2_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_small(self, index, value, 2);
+}
+
+/* Mutator function for char4 columns. */
+static int set_char4_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_small(self, index, value, 4);
+}
+
+/* Mutator function for char8 columns. */
+static int set_char8_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_small(self, index, value, 8);
+}
+
+/* Mutator helper function for large charN columns (N > 8). */
+static int set_char_column_large(Record* self, Py_ssize_t index, PyObject* value, int size)
+{
+    Py_ssize_t len;
+    char* data;
+    ColumnValue* column_value;
+
+    #if PY_MAJOR_VERSION >= 3
+        PyObject* old_value;
+
+        value = PyObject_Str(value);
+        CHECK(value, error)
+        data = PyUnicode_AsUTF8AndSize(value, &len);
+        CHECK(data, error)
+        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
+        column_value = &(&self->column_values)[index];
+        old_value = PyList_GET_ITEM(self->values, index);
 
         if (!old_value)
         {
@@ -3293,6 +3705,7 @@ static int set_string_column(Record* self, Py_ssize_t index, PyObject* value)
         string = PyUnicode_AsUTF8String(value);
         CHECK(string, error)
         len = PyString_GET_SIZE(string);
+        CHECK_OBJECT(len <= size, PyExc_ValueError, format_string("maximum length %d exceeded", size), error)
         data = PyString_AS_STRING(string);
         column_value = &(&self->column_values)[index];
 
@@ -3322,568 +3735,775 @@ error:
     return 0;
 }
 
-/* Mutator function for time columns. */
-static int set_time_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Mutator function for char16 columns. */
+static int set_char16_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    long time;
-    ColumnValue* column_value;
-
-    CHECK_STRING(PyTime_Check(value), PyExc_TypeError, "value must be time", error)
-    encode_time(PyDateTime_TIME_GET_HOUR(value),
-                PyDateTime_TIME_GET_MINUTE(value),
-                PyDateTime_TIME_GET_SECOND(value),
-                PyDateTime_TIME_GET_MICROSECOND(value) / 1000,
-                &time);
-    Py_XDECREF(PyList_GET_ITEM(self->values, index));
-    Py_INCREF(value);
-    PyList_SET_ITEM(self->values, index, value);
-    column_value = &(&self->column_values)[index];
-    column_value->value.i = time;
-    column_value->len = 0;
-    return 1;
-
-error:
-    return 0;
+    return set_char_column_large(self, index, value, 16);
 }
 
-/* Mutator function for timestamp columns. */
-static int set_timestamp_column(Record* self, Py_ssize_t index, PyObject* value)
+/* Mutator function for char32 columns. */
+static int set_char32_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    ColumnValue* column_value;
+    return set_char_column_large(self, index, value, 32);
+}
 
-    PY_LONG_LONG temp;
+/* Mutator function for char64 columns. */
+static int set_char64_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_large(self, index, value, 64);
+}
+
+/* Mutator function for char128 columns. */
+static int set_char128_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_large(self, index, value, 128);
+}
+
+/* Mutator function for char256 columns. */
+static int set_char256_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    return set_char_column_large(self, index, value, 256);
+}
+
+/* Mutator function for date columns. */
+static int set_date_column(Record* self, Py_ssize_t index, PyObject* value)
+{
+    long date;
+    ColumnValue* column_value;
+
+    if (PyDate_Check(value))
+    {
+        CHECK_STRING(encode_date(PyDateTime_GET_YEAR(value),
+                                 PyDateTime_GET_MONTH(value),
+                                 PyDateTime_GET_DAY(value),
+                                 &date),
+                     PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+        Py_INCREF(value);
+    }
+    else
+    {
+        /* Strings and integers are converted; the date object is created
+           from the raw value if the value is retrieved. */
+
+        CHECK(convert_date_value(value, &date), error)
+        value = NULL;
+    }
 
-    value = PyNumber_Long(value);
-    CHECK(value, error)
-    temp = PyLong_AsLongLong(value);
-    CHECK(temp != -1 || !PyErr_Occurred(), error)
-    CHECK_STRING(temp >= MIN_EPOCH_MS && temp <= MAX_EPOCH_MS, PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
     Py_XDECREF(PyList_GET_ITEM(self->values, index));
     PyList_SET_ITEM(self->values, index, value);
     column_value = &(&self->column_values)[index];
-    column_value->value.l = epoch_ms_to_datetime(temp);
+    column_value->value.i = date;
     column_value->len = 0;
     return 1;
 
 error:
-    Py_XDECREF(value);
     return 0;
 }
 
-/* Column mutator function dispatch table. */
-static SetColumnFunc set_column[CDT_MAX] =
-{
-    set_bytes_column,    /* CDT_BYTES */
-    set_char1_column,    /* CDT_CHAR1 */
-    set_char2_column,    /* CDT_CHAR2 */
-    set_char4_column,    /* CDT_CHAR4 */
-    set_char8_column,    /* CDT_CHAR8 */
-    set_char16_column,   /* CDT_CHAR16 */
-    set_char32_column,   /* CDT_CHAR32 */
-    set_char64_column,   /* CDT_CHAR64 */
-    set_char128_column,  /* CDT_CHAR128 */
-    set_char256_column,  /* CDT_CHAR256 */
-    set_date_column,     /* CDT_DATE */
-    set_datetime_column, /* CDT_DATETIME */
-    set_double_column,   /* CDT_DOUBLE */
-    set_float_column,    /* CDT_FLOAT */
-    set_int_column,      /* CDT_INT */
-    set_int8_column,     /* CDT_INT8 */
-    set_int16_column,    /* CDT_INT16 */
-    set_long_column,     /* CDT_LONG */
-    set_string_column,   /* CDT_STRING */
-    set_time_column,     /* CDT_TIME */
-    set_timestamp_column /* CDT_TIMESTAMP */
-};
-
-/*----------------------------------------------------------------------------*/
-
-/* Record column clear functions. See description and notes at typedef for
-   ClearColumnFunc above. */
-
-/* Clear function for bytes columns. */
-static void clear_bytes_column(Record* self, Py_ssize_t index, int from_python)
+/* Mutator function for datetime columns. */
+static int set_datetime_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    ColumnValue* column_value = &(&self->column_values)[index];
+    PY_LONG_LONG datetime;
+    ColumnValue* column_value;
 
-    if (from_python)
+    if (PyDateTime_Check(value))
     {
-        PyObject* old_value = PyList_GET_ITEM(self->values, index);
-
-        if (!old_value)
-        {
-            free(column_value->value.data);
-        }
-        else
-        {
-            Py_DECREF(old_value);
-        }
-
-        PyList_SET_ITEM(self->values, index, NULL);
+        CHECK_STRING(encode_datetime(PyDateTime_GET_YEAR(value),
+                                     PyDateTime_GET_MONTH(value),
+                                     PyDateTime_GET_DAY(value),
+                                     PyDateTime_DATE_GET_HOUR(value),
+                                     PyDateTime_DATE_GET_MINUTE(value),
+                                     PyDateTime_DATE_GET_SECOND(value),
+                                     PyDateTime_DATE_GET_MICROSECOND(value) / 1000,
+                                     &datetime),
+                     PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+        Py_INCREF(value);
     }
     else
     {
-        free(column_value->value.data);
+        /* Strings and integers are converted; the datetime object is created
+           from the raw value if the value is retrieved. */
+
+        CHECK(convert_datetime_value(value, &datetime), error)
+        value = NULL;
     }
 
-    column_value->value.data = NULL;
-    column_value->len = - (&self->type->column_defs)[index].is_nullable;
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.l = datetime;
+    column_value->len = 0;
+    return 1;
+
+error:
+    return 0;
 }
 
-/* Clear function for non-variable length and small variable-length data types
-   that do not require an external buffer outside of the ColumnValue struct. */
-static void clear_simple_column(Record* self, Py_ssize_t index, int from_python)
+/* Mutator function for decimal columns. The decimal.Decimal object is created
+   from the raw value if the value is retrieved. */
+static int set_decimal_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    ColumnValue* column_value = &(&self->column_values)[index];
+    PY_LONG_LONG decimal;
+    ColumnValue* column_value;
 
-    if (from_python)
-    {
-        Py_XDECREF(PyList_GET_ITEM(self->values, index));
-        PyList_SET_ITEM(self->values, index, NULL);
-    }
+    CHECK(convert_decimal_value(value, &decimal), error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, NULL);
+    column_value = &(&self->column_values)[index];
+    column_value->value.l = decimal;
+    column_value->len = 0;
+    return 1;
 
-    memset(&column_value->value, 0, sizeof(ColumnValueBase));
-    column_value->len = - (&self->type->column_defs)[index].is_nullable;
+error:
+    return 0;
 }
 
-/* Clear function for string columns. */
-static void clear_string_column(Record* self, Py_ssize_t index, int from_python)
+/* Mutator function for double columns. */
+static int set_double_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    #if PY_MAJOR_VERSION >= 3
-        clear_bytes_column(self, index, from_python);
-    #else
-        ColumnValue* column_value = &(&self->column_values)[index];
+    ColumnValue* column_value;
 
-        if (from_python)
-        {
-            Py_XDECREF(PyList_GET_ITEM(self->values, index));
-            PyList_SET_ITEM(self->values, index, NULL);
-        }
+    value = PyNumber_Float(value);
+    CHECK(value, error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.d = PyFloat_AS_DOUBLE(value);
+    column_value->len = 0;
+    return 1;
 
-        free((&self->column_values)[index].value.data);
-        column_value->value.data = NULL;
-        column_value->len = - (&self->type->column_defs)[index].is_nullable;
-    #endif
+error:
+    return 0;
 }
 
-/* Column clear function dispatch table. */
-static ClearColumnFunc clear_column[] =
+/* Mutator function for float columns. */
+static int set_float_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    clear_bytes_column,  /* CDT_BYTES */
-    clear_simple_column, /* CDT_CHAR1 */
-    clear_simple_column, /* CDT_CHAR2 */
-    clear_simple_column, /* CDT_CHAR4 */
-    clear_simple_column, /* CDT_CHAR8 */
-    clear_string_column, /* CDT_CHAR16 */
-    clear_string_column, /* CDT_CHAR32 */
-    clear_string_column, /* CDT_CHAR64 */
-    clear_string_column, /* CDT_CHAR128 */
-    clear_string_column, /* CDT_CHAR256 */
-    clear_simple_column, /* CDT_DATE */
-    clear_simple_column, /* CDT_DATETIME */
-    clear_simple_column, /* CDT_DOUBLE */
-    clear_simple_column, /* CDT_FLOAT */
-    clear_simple_column, /* CDT_INT */
-    clear_simple_column, /* CDT_INT8 */
-    clear_simple_column, /* CDT_INT16 */
-    clear_simple_column, /* CDT_LONG */
-    clear_string_column, /* CDT_STRING */
-    clear_simple_column, /* CDT_TIME */
-    clear_simple_column  /* CDT_TIMESTAMP */
-};
-
-/*----------------------------------------------------------------------------*/
-
-/* Record reading functions. */
-
-/* Function type for a function that reads a column value from an Avro-encoded
-   binary buffer into a ColumnValue struct as a raw value. All functions of
-   this type take these parameters:
+    ColumnValue* column_value;
 
-   pos: Pointer to a pointer to the start of the Avro-encoded binary data for
-        the value being read within the buffer. This will be updated to point
-        to the position immediately following the value data on return. If an
-        error occurs, this may point to an arbitrary location between the
-        initial value and max on return.
+    value = PyNumber_Float(value);
+    CHECK(value, error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.f = (float)PyFloat_AS_DOUBLE(value);
+    column_value->len = 0;
+    return 1;
 
-   max: Pointer to the end of the buffer containing the Avro-encoded binary
-        value data (must be >= *pos, and may be beyond the end of the value
-        data). If this is reached before the value is completely read,
-        ERR_EOF is returned.
+error:
+    return 0;
+}
 
-   column_value: Pointer to the ColumnValue struct into which to read the
-                 value. The struct must not contain an existing value that
-                 should be freed.
+/* Mutator helper function for sized int columns. */
+static int set_int_column_sized(Record* self, Py_ssize_t index, PyObject* value, long min, long max)
+{
+    ColumnValue* column_value;
 
-   An AvroErrorCode is returned indicating success (ERR_NONE) or failure. */
-typedef AvroErrorCode (*ReadColumnFunc)(uint8_t**, uint8_t*, ColumnValue*);
+    #if PY_MAJOR_VERSION >= 3
+        long temp;
 
-/* Reading function for bytes columns. */
-static AvroErrorCode read_bytes_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    Py_ssize_t len;
-    char* data;
+        value = PyNumber_Long(value);
+        CHECK(value, error)
+        temp = PyLong_AsLong(value);
+        CHECK(temp != -1 || !PyErr_Occurred(), error)
+        CHECK_STRING(temp >= min && temp <= max, PyExc_OverflowError, "value out of range", error)
+    #else
+        long temp;
 
-    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
-    data = (char*)MALLOC(len);
+        value = PyNumber_Int(value);
+        CHECK(value, error)
+        CHECK_STRING(PyInt_Check(value), PyExc_ValueError, "value out of range", error)
+        temp = PyInt_AS_LONG(value);
+        CHECK_STRING(temp >= min && temp <= max, PyExc_OverflowError, "value out of range", error)
+    #endif
 
-    if (!data)
-    {
-        return ERR_OOM;
-    }
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.i = temp;
+    column_value->len = 0;
+    return 1;
 
-    read_bytes_data(pos, max, (uint8_t*)data, len);
-    column_value->value.data = data;
-    column_value->len = len;
-    return ERR_NONE;
+error:
+    Py_XDECREF(value);
+    return 0;
 }
 
-/* Reading helper function for small CharN columns (N <= 8). */
-static AvroErrorCode read_char_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value, int size)
+/* Mutator function for int columns. */
+static int set_int_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    Py_ssize_t len;
+    return set_int_column_sized(self, index, value, INT32_MIN, INT32_MAX);
+}
 
-    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
-
-    if (len > size)
-    {
-        return ERR_OVERFLOW;
-    }
-
-    read_bytes_data(pos, max, (uint8_t*)&column_value->value.c, len);
-    column_value->len = len;
-    return ERR_NONE;
-}
-
-/* Reading function for char1 columns. */
-static AvroErrorCode read_char1_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for int8 columns. */
+static int set_int8_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    return read_char_column_small(pos, max, column_value, 1);
+    return set_int_column_sized(self, index, value, INT8_MIN, INT8_MAX);
 }
 
-/* Reading function for char2 columns. */
-static AvroErrorCode read_char2_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for int16 columns. */
+static int set_int16_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    return read_char_column_small(pos, max, column_value, 2);
+    return set_int_column_sized(self, index, value, INT16_MIN, INT16_MAX);
 }
 
-/* Reading function for char4 columns. */
-static AvroErrorCode read_char4_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for ipv4 columns. The str object is created from the raw
+   value if the value is retrieved. */
+static int set_ipv4_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    return read_char_column_small(pos, max, column_value, 4);
+    PY_LONG_LONG ipv4;
+    ColumnValue* column_value;
+
+    CHECK(convert_ipv4_value(value, &ipv4), error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, NULL);
+    column_value = &(&self->column_values)[index];
+    column_value->value.l = ipv4;
+    column_value->len = 0;
+    return 1;
+
+error:
+    return 0;
 }
 
-/* Reading function for char8 columns. */
-static AvroErrorCode read_char8_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for long columns. */
+static int set_long_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    return read_char_column_small(pos, max, column_value, 8);
+    ColumnValue* column_value;
+
+    PY_LONG_LONG temp;
+
+    value = PyNumber_Long(value);
+    CHECK(value, error)
+    temp = PyLong_AsLongLong(value);
+    CHECK(temp != -1 || !PyErr_Occurred(), error)
+    CHECK_STRING(temp >= INT64_MIN && temp <= INT64_MAX, PyExc_OverflowError, "value out of range", error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.l = temp;
+    column_value->len = 0;
+    return 1;
+
+error:
+    Py_XDECREF(value);
+    return 0;
 }
 
-/* Reading helper function for large CharN columns (N > 8). */
-static AvroErrorCode read_char_column_large(uint8_t** pos, uint8_t* max, ColumnValue* column_value, int size)
+/* Mutator function for string columns. */
+static int set_string_column(Record* self, Py_ssize_t index, PyObject* value)
 {
     Py_ssize_t len;
     char* data;
+    ColumnValue* column_value;
 
-    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    #if PY_MAJOR_VERSION >= 3
+        PyObject* old_value;
 
-    if (len > size)
-    {
-        return ERR_OVERFLOW;
-    }
+        value = PyObject_Str(value);
+        CHECK(value, error)
+        data = PyUnicode_AsUTF8AndSize(value, &len);
+        CHECK(data, error)
+        column_value = &(&self->column_values)[index];
+        old_value = PyList_GET_ITEM(self->values, index);
 
-    data = (char*)MALLOC(len);
+        if (!old_value)
+        {
+            free(column_value->value.data);
+        }
+        else
+        {
+            Py_DECREF(old_value);
+        }
 
-    if (!data)
-    {
-        return ERR_OOM;
-    }
+        PyList_SET_ITEM(self->values, index, value);
+        column_value->value.data = data;
+    #else
+        PyObject* string = NULL;
 
-    read_bytes_data(pos, max, (uint8_t*)data, len);
-    column_value->value.data = data;
-    column_value->len = len;
-    return ERR_NONE;
-}
+        value = PyObject_Unicode(value);
+        CHECK(value, error)
+        string = PyUnicode_AsUTF8String(value);
+        CHECK(string, error)
+        len = PyString_GET_SIZE(string);
+        data = PyString_AS_STRING(string);
+        column_value = &(&self->column_values)[index];
 
-/* Reading function for char16 columns. */
-static AvroErrorCode read_char16_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return read_char_column_large(pos, max, column_value, 16);
-}
+        if (len != column_value->len)
+        {
+            char* temp = MALLOC(len);
+            CHECK_NONE(temp, PyExc_MemoryError, error)
+            free(column_value->value.data);
+            column_value->value.data = temp;
+        }
 
-/* Reading function for char32 columns. */
-static AvroErrorCode read_char32_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return read_char_column_large(pos, max, column_value, 32);
-}
+        memcpy(column_value->value.data, data, len);
+        Py_DECREF(string);
+        Py_XDECREF(PyList_GET_ITEM(self->values, index));
+        PyList_SET_ITEM(self->values, index, value);
+    #endif
 
-/* Reading function for char64 columns. */
-static AvroErrorCode read_char64_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return read_char_column_large(pos, max, column_value, 64);
-}
+    column_value->len = len;
+    return 1;
 
-/* Reading function for char128 columns. */
-static AvroErrorCode read_char128_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return read_char_column_large(pos, max, column_value, 128);
-}
+error:
+    #if PY_MAJOR_VERSION < 3
+        Py_XDECREF(string);
+    #endif
 
-/* Reading function for char256 columns. */
-static AvroErrorCode read_char256_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return read_char_column_large(pos, max, column_value, 256);
+    Py_XDECREF(value);
+    return 0;
 }
 
-/* Reading function for date columns. */
-static AvroErrorCode read_date_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for time columns. */
+static int set_time_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    Py_ssize_t len;
-    long year;
-    long month;
-    long day;
-    long date;
-
-    unsigned digits;
-
-    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
-    max = *pos + len;
-    skip_whitespace(pos, max, 0);
-    AVRO_RETURN_ERROR(read_digits(pos, max, 4, 4, 1000, 2900, &year, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 12, &month, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 31, &day, &digits))
-    skip_whitespace(pos, max, 0);
+    long time;
+    ColumnValue* column_value;
 
-    if (*pos != max)
+    if (PyTime_Check(value))
     {
-        return ERR_OVERFLOW;
+        encode_time(PyDateTime_TIME_GET_HOUR(value),
+                    PyDateTime_TIME_GET_MINUTE(value),
+                    PyDateTime_TIME_GET_SECOND(value),
+                    PyDateTime_TIME_GET_MICROSECOND(value) / 1000,
+                    &time);
+        Py_INCREF(value);
     }
-
-    if (!encode_date((int)year, (int)month, (int)day, &date))
+    else
     {
-        return ERR_OVERFLOW;
+        /* Strings and integers are converted; the time object is created
+           from the raw value if the value is retrieved. */
+
+        CHECK(convert_time_value(value, &time), error)
+        value = NULL;
     }
 
-    column_value->value.i = date;
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.i = time;
     column_value->len = 0;
-    return ERR_NONE;
+    return 1;
+
+error:
+    return 0;
 }
 
-/* Reading function for datetime columns. */
-static AvroErrorCode read_datetime_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Mutator function for timestamp columns. */
+static int set_timestamp_column(Record* self, Py_ssize_t index, PyObject* value)
 {
-    Py_ssize_t len;
-    long year;
-    long month;
-    long day;
-    long hour;
-    long minute;
-    long second;
-    long millisecond;
-    PY_LONG_LONG datetime;
-
-    unsigned digits;
-
-    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
-    max = *pos + len;
-    skip_whitespace(pos, max, 0);
-    AVRO_RETURN_ERROR(read_digits(pos, max, 4, 4, 1000, 2900, &year, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 12, &month, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 1, 31, &day, &digits))
-
-    if (*pos < max)
-    {
-        AVRO_RETURN_ERROR(skip_whitespace(pos, max, 1))
-    }
-
-    if (*pos == max)
-    {
-        if (!encode_datetime((int)year, (int)month, (int)day, 0, 0, 0, 0, &datetime))
-        {
-            return ERR_OVERFLOW;
-        }
+    ColumnValue* column_value;
 
-        column_value->value.l = datetime;
-        column_value->len = 0;
-        return ERR_NONE;
-    }
+    PY_LONG_LONG temp;
 
-    AVRO_RETURN_ERROR(read_digits(pos, max, 1, 2, 0, 23, &hour, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &minute, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &second, &digits))
+    value = PyNumber_Long(value);
+    CHECK(value, error)
+    temp = PyLong_AsLongLong(value);
+    CHECK(temp != -1 || !PyErr_Occurred(), error)
+    CHECK_STRING(temp >= MIN_EPOCH_MS && temp <= MAX_EPOCH_MS, PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+    Py_XDECREF(PyList_GET_ITEM(self->values, index));
+    PyList_SET_ITEM(self->values, index, value);
+    column_value = &(&self->column_values)[index];
+    column_value->value.l = epoch_ms_to_datetime(temp);
+    column_value->len = 0;
+    return 1;
 
-    if (*pos < max && **pos == '.')
-    {
-        ++*pos;
-        AVRO_RETURN_ERROR(read_digits(pos, max, 1, 6, 0, 999999, &millisecond, &digits))
+error:
+    Py_XDECREF(value);
+    return 0;
+}
 
-        if (digits < 3)
-        {
-            if (digits == 2)
-            {
-                millisecond *= 10;
-            }
-            else
-            {
-                millisecond *= 100;
-            }
+/* Column mutator function dispatch table. */
+static SetColumnFunc set_column[CDT_MAX] =
+{
+    set_bytes_column,    /* CDT_BYTES */
+    set_char1_column,    /* CDT_CHAR1 */
+    set_char2_column,    /* CDT_CHAR2 */
+    set_char4_column,    /* CDT_CHAR4 */
+    set_char8_column,    /* CDT_CHAR8 */
+    set_char16_column,   /* CDT_CHAR16 */
+    set_char32_column,   /* CDT_CHAR32 */
+    set_char64_column,   /* CDT_CHAR64 */
+    set_char128_column,  /* CDT_CHAR128 */
+    set_char256_column,  /* CDT_CHAR256 */
+    set_date_column,     /* CDT_DATE */
+    set_datetime_column, /* CDT_DATETIME */
+    set_decimal_column,  /* CDT_DECIMAL */
+    set_double_column,   /* CDT_DOUBLE */
+    set_float_column,    /* CDT_FLOAT */
+    set_int_column,      /* CDT_INT */
+    set_int8_column,     /* CDT_INT8 */
+    set_int16_column,    /* CDT_INT16 */
+    set_ipv4_column,     /* CDT_IPV4 */
+    set_long_column,     /* CDT_LONG */
+    set_string_column,   /* CDT_STRING */
+    set_time_column,     /* CDT_TIME */
+    set_timestamp_column /* CDT_TIMESTAMP */
+};
+
+/*----------------------------------------------------------------------------*/
+
+/* Record column clear functions. See description and notes at typedef for
+   ClearColumnFunc above. */
+
+/* Clear function for bytes columns. */
+static void clear_bytes_column(Record* self, Py_ssize_t index, int from_python)
+{
+    ColumnValue* column_value = &(&self->column_values)[index];
+
+    if (from_python)
+    {
+        PyObject* old_value = PyList_GET_ITEM(self->values, index);
+
+        if (!old_value)
+        {
+            free(column_value->value.data);
         }
-        else if (digits > 3)
+        else
         {
-            if (digits == 4)
-            {
-                millisecond /= 10;
-            }
-            else if (digits == 5)
-            {
-                millisecond /= 100;
-            }
-            else
-            {
-                millisecond /= 1000;
-            }
+            Py_DECREF(old_value);
         }
+
+        PyList_SET_ITEM(self->values, index, NULL);
     }
     else
     {
-        millisecond = 0;
+        free(column_value->value.data);
     }
 
-    skip_whitespace(pos, max, 0);
+    column_value->value.data = NULL;
+    column_value->len = - (&self->type->column_defs)[index].is_nullable;
+}
 
-    if (*pos != max)
-    {
-        return ERR_OVERFLOW;
-    }
+/* Clear function for non-variable length and small variable-length data types
+   that do not require an external buffer outside of the ColumnValue struct. */
+static void clear_simple_column(Record* self, Py_ssize_t index, int from_python)
+{
+    ColumnValue* column_value = &(&self->column_values)[index];
 
-    if (!encode_datetime((int)year, (int)month, (int)day, (int)hour, (int)minute, (int)second, (int)millisecond, &datetime))
+    if (from_python)
     {
-        return ERR_OVERFLOW;
+        Py_XDECREF(PyList_GET_ITEM(self->values, index));
+        PyList_SET_ITEM(self->values, index, NULL);
     }
 
-    column_value->value.l = datetime;
-    column_value->len = 0;
-    return ERR_NONE;
+    memset(&column_value->value, 0, sizeof(ColumnValueBase));
+    column_value->len = - (&self->type->column_defs)[index].is_nullable;
 }
 
-/* Reading function for double columns. */
-static AvroErrorCode read_double_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Clear function for string columns. */
+static void clear_string_column(Record* self, Py_ssize_t index, int from_python)
 {
-    AVRO_RETURN_ERROR(read_double(pos, max, &column_value->value.d))
-    column_value->len = 0;
-    return ERR_NONE;
+    #if PY_MAJOR_VERSION >= 3
+        clear_bytes_column(self, index, from_python);
+    #else
+        ColumnValue* column_value = &(&self->column_values)[index];
+
+        if (from_python)
+        {
+            Py_XDECREF(PyList_GET_ITEM(self->values, index));
+            PyList_SET_ITEM(self->values, index, NULL);
+        }
+
+        free((&self->column_values)[index].value.data);
+        column_value->value.data = NULL;
+        column_value->len = - (&self->type->column_defs)[index].is_nullable;
+    #endif
 }
 
-/* Reading function for float columns. */
-static AvroErrorCode read_float_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Column clear function dispatch table. */
+static ClearColumnFunc clear_column[] =
 {
-    AVRO_RETURN_ERROR(read_float(pos, max, &column_value->value.f))
-    column_value->len = 0;
-    return ERR_NONE;
-}
+    clear_bytes_column,  /* CDT_BYTES */
+    clear_simple_column, /* CDT_CHAR1 */
+    clear_simple_column, /* CDT_CHAR2 */
+    clear_simple_column, /* CDT_CHAR4 */
+    clear_simple_column, /* CDT_CHAR8 */
+    clear_string_column, /* CDT_CHAR16 */
+    clear_string_column, /* CDT_CHAR32 */
+    clear_string_column, /* CDT_CHAR64 */
+    clear_string_column, /* CDT_CHAR128 */
+    clear_string_column, /* CDT_CHAR256 */
+    clear_simple_column, /* CDT_DATE */
+    clear_simple_column, /* CDT_DATETIME */
+    clear_simple_column, /* CDT_DECIMAL */
+    clear_simple_column, /* CDT_DOUBLE */
+    clear_simple_column, /* CDT_FLOAT */
+    clear_simple_column, /* CDT_INT */
+    clear_simple_column, /* CDT_INT8 */
+    clear_simple_column, /* CDT_INT16 */
+    clear_simple_column, /* CDT_IPV4 */
+    clear_simple_column, /* CDT_LONG */
+    clear_string_column, /* CDT_STRING */
+    clear_simple_column, /* CDT_TIME */
+    clear_simple_column  /* CDT_TIMESTAMP */
+};
 
-/* Reading function for int columns. */
-static AvroErrorCode read_int_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/*----------------------------------------------------------------------------*/
+
+/* Record reading functions. */
+
+/* Function type for a function that reads a column value from an Avro-encoded
+   binary buffer into a ColumnValue struct as a raw value. All functions of
+   this type take these parameters:
+
+   pos: Pointer to a pointer to the start of the Avro-encoded binary data for
+        the value being read within the buffer. This will be updated to point
+        to the position immediately following the value data on return. If an
+        error occurs, this may point to an arbitrary location between the
+        initial value and max on return.
+
+   max: Pointer to the end of the buffer containing the Avro-encoded binary
+        value data (must be >= *pos, and may be beyond the end of the value
+        data). If this is reached before the value is completely read,
+        ERR_EOF is returned.
+
+   column_value: Pointer to the ColumnValue struct into which to read the
+                 value. The struct must not contain an existing value that
+                 should be freed.
+
+   An AvroErrorCode is returned indicating success (ERR_NONE) or failure. */
+typedef AvroErrorCode (*ReadColumnFunc)(uint8_t**, uint8_t*, ColumnValue*);
+
+/* Reading function for bytes columns. */
+static AvroErrorCode read_bytes_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
 {
-    AVRO_RETURN_ERROR(read_int(pos, max, &column_value->value.i))
-    column_value->len = 0;
+    Py_ssize_t len;
+    char* data;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    data = (char*)MALLOC(len);
+
+    if (!data)
+    {
+        return ERR_OOM;
+    }
+
+    read_bytes_data(pos, max, (uint8_t*)data, len);
+    column_value->value.data = data;
+    column_value->len = len;
     return ERR_NONE;
 }
 
-/* Reading helper function for small int columns (<= int16). */
-static AvroErrorCode read_int_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value, long min_value, long max_value)
+/* Reading helper function for small CharN columns (N <= 8). */
+static AvroErrorCode read_char_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value, int size)
 {
-    long value;
+    Py_ssize_t len;
 
-    AVRO_RETURN_ERROR(read_int(pos, max, &value))
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
 
-    if (value < min_value || value > max_value)
+    if (len > size)
     {
         return ERR_OVERFLOW;
     }
 
-    column_value->value.i = value;
-    column_value->len = 0;
+    read_bytes_data(pos, max, (uint8_t*)&column_value->value.c, len);
+    column_value->len = len;
     return ERR_NONE;
 }
 
-/* Reading function for int8 columns. */
-static AvroErrorCode read_int8_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Reading function for char1 columns. */
+static AvroErrorCode read_char1_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
 {
-    return read_int_column_small(pos, max, column_value, INT8_MIN, INT8_MAX);
+    return read_char_column_small(pos, max, column_value, 1);
 }
 
-/* Reading function for int16 columns. */
-static AvroErrorCode read_int16_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Reading function for char2 columns. */
+static AvroErrorCode read_char2_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
 {
-    return read_int_column_small(pos, max, column_value, INT16_MIN, INT16_MAX);
+    return read_char_column_small(pos, max, column_value, 2);
 }
 
-/* Reading function for long columns. */
-static AvroErrorCode read_long_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Reading function for char4 columns. */
+static AvroErrorCode read_char4_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
 {
-    AVRO_RETURN_ERROR(read_long(pos, max, &column_value->value.l))
-    column_value->len = 0;
-    return ERR_NONE;
+    return read_char_column_small(pos, max, column_value, 4);
 }
 
-/* Reading function for time columns. */
-static AvroErrorCode read_time_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Reading function for char8 columns. */
+static AvroErrorCode read_char8_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
 {
-    Py_ssize_t len;
-    long hour;
-    long minute;
-    long second;
-    long millisecond;
-    long time;
+    return read_char_column_small(pos, max, column_value, 8);
+}
 
-    unsigned digits;
+/* Reading helper function for large CharN columns (N > 8). */
+static AvroErrorCode read_char_column_large(uint8_t** pos, uint8_t* max, ColumnValue* column_value, int size)
+{
+    Py_ssize_t len;
+    char* data;
 
     AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
-    max = *pos + len;
-    skip_whitespace(pos, max, 0);
-    AVRO_RETURN_ERROR(read_digits(pos, max, 1, 2, 0, 23, &hour, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &minute, &digits))
-    AVRO_RETURN_ERROR(skip_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(read_digits(pos, max, 2, 2, 0, 59, &second, &digits))
 
-    if (*pos < max && **pos == '.')
+    if (len > size)
     {
-        ++*pos;
-        AVRO_RETURN_ERROR(read_digits(pos, max, 1, 3, 0, 999999, &millisecond, &digits));
-
-        if (digits < 3)
-        {
-            if (digits == 2)
-            {
-                millisecond *= 10;
-            }
-            else
-            {
-                millisecond *= 100;
-            }
-        }
+        return ERR_OVERFLOW;
     }
-    else
+
+    data = (char*)MALLOC(len);
+
+    if (!data)
     {
-        millisecond = 0;
+        return ERR_OOM;
     }
 
-    skip_whitespace(pos, max, 0);
+    read_bytes_data(pos, max, (uint8_t*)data, len);
+    column_value->value.data = data;
+    column_value->len = len;
+    return ERR_NONE;
+}
 
-    if (*pos != max)
+/* Reading function for char16 columns. */
+static AvroErrorCode read_char16_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_char_column_large(pos, max, column_value, 16);
+}
+
+/* Reading function for char32 columns. */
+static AvroErrorCode read_char32_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_char_column_large(pos, max, column_value, 32);
+}
+
+/* Reading function for char64 columns. */
+static AvroErrorCode read_char64_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_char_column_large(pos, max, column_value, 64);
+}
+
+/* Reading function for char128 columns. */
+static AvroErrorCode read_char128_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_char_column_large(pos, max, column_value, 128);
+}
+
+/* Reading function for char256 columns. */
+static AvroErrorCode read_char256_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_char_column_large(pos, max, column_value, 256);
+}
+
+/* Reading function for date columns. */
+static AvroErrorCode read_date_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    Py_ssize_t len;
+    long date;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    AVRO_RETURN_ERROR(parse_date(pos, *pos + len, &date))
+    column_value->value.i = date;
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for datetime columns. */
+static AvroErrorCode read_datetime_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    Py_ssize_t len;
+    PY_LONG_LONG datetime;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    AVRO_RETURN_ERROR(parse_datetime(pos, *pos + len, &datetime))
+    column_value->value.l = datetime;
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for decimal columns. */
+static AvroErrorCode read_decimal_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    Py_ssize_t len;
+    PY_LONG_LONG decimal;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    AVRO_RETURN_ERROR(parse_decimal(pos, *pos + len, &decimal))
+    column_value->value.l = decimal;
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for double columns. */
+static AvroErrorCode read_double_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    AVRO_RETURN_ERROR(read_double(pos, max, &column_value->value.d))
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for float columns. */
+static AvroErrorCode read_float_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    AVRO_RETURN_ERROR(read_float(pos, max, &column_value->value.f))
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for int columns. */
+static AvroErrorCode read_int_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    AVRO_RETURN_ERROR(read_int(pos, max, &column_value->value.i))
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading helper function for small int columns (<= int16). */
+static AvroErrorCode read_int_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value, long min_value, long max_value)
+{
+    long value;
+
+    AVRO_RETURN_ERROR(read_int(pos, max, &value))
+
+    if (value < min_value || value > max_value)
     {
         return ERR_OVERFLOW;
     }
 
-    encode_time((int)hour, (int)minute, (int)second, (int)millisecond, &time);
+    column_value->value.i = value;
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for int8 columns. */
+static AvroErrorCode read_int8_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_int_column_small(pos, max, column_value, INT8_MIN, INT8_MAX);
+}
+
+/* Reading function for int16 columns. */
+static AvroErrorCode read_int16_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return read_int_column_small(pos, max, column_value, INT16_MIN, INT16_MAX);
+}
+
+/* Reading function for ipv4 columns. */
+static AvroErrorCode read_ipv4_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    Py_ssize_t len;
+    PY_LONG_LONG ipv4;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    AVRO_RETURN_ERROR(parse_ipv4(pos, *pos + len, &ipv4))
+    column_value->value.l = ipv4;
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for long columns. */
+static AvroErrorCode read_long_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    AVRO_RETURN_ERROR(read_long(pos, max, &column_value->value.l))
+    column_value->len = 0;
+    return ERR_NONE;
+}
+
+/* Reading function for time columns. */
+static AvroErrorCode read_time_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    Py_ssize_t len;
+    long time;
+
+    AVRO_RETURN_ERROR(read_bytes_len(pos, max, &len))
+    AVRO_RETURN_ERROR(parse_time(pos, *pos + len, &time))
     column_value->value.i = time;
     column_value->len = 0;
     return ERR_NONE;
@@ -3921,11 +4541,13 @@ static ReadColumnFunc read_column[CDT_MAX] =
     read_char256_column,  /* CDT_CHAR256 */
     read_date_column,     /* CDT_DATE */
     read_datetime_column, /* CDT_DATETIME */
+    read_decimal_column,  /* CDT_DECIMAL */
     read_double_column,   /* CDT_DOUBLE */
     read_float_column,    /* CDT_FLOAT */
     read_int_column,      /* CDT_INT */
     read_int8_column,     /* CDT_INT8 */
     read_int16_column,    /* CDT_INT16 */
+    read_ipv4_column,     /* CDT_IPV4 */
     read_long_column,     /* CDT_LONG */
     read_bytes_column,    /* CDT_STRING */
     read_time_column,     /* CDT_TIME */
@@ -3940,398 +4562,1905 @@ AvroErrorCode read_record(uint8_t** pos, uint8_t* max, Record* record)
     ColumnDef* column_defs;
     ColumnValue* column_values;
 
-    Py_ssize_t i = 0;
-    AvroErrorCode error;
+    Py_ssize_t i = 0;
+    AvroErrorCode error;
+
+    record->size = 0;
+    column_count = Py_SIZE(record);
+    column_defs = &record->type->column_defs;
+    column_values = &record->column_values;
+
+    for (; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        ColumnValue* column_value = &column_values[i];
+
+        if (column_def->is_nullable)
+        {
+            PY_LONG_LONG is_null;
+
+            error = read_long(pos, max, &is_null);
+
+            if (error != ERR_NONE)
+            {
+                goto error;
+            }
+
+            if (is_null == 1)
+            {
+                column_value->len = -1;
+                continue;
+            }
+            else if (is_null != 0)
+            {
+                error = ERR_OVERFLOW;
+                goto error;
+            }
+        }
+
+        error = read_column[column_def->data_type](pos, max, column_value);
+
+        if (error != ERR_NONE)
+        {
+            goto error;
+        }
+    }
+
+    return ERR_NONE;
+
+error:
+    for (; i > 0; --i)
+    {
+        clear_column[(&record->type->column_defs)[i].data_type](record, i, 0);
+    }
+
+    return error;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Record size computing functions. */
+
+/* Function type for a function that calculates the size of the Avro-encoded
+   binary form of the value in a ColumnValue struct in bytes. */
+typedef Py_ssize_t (*SizeColumnFunc)(ColumnValue*);
+
+/* Sizing function for bytes and other variable-length columns. */
+static Py_ssize_t size_bytes_column(ColumnValue* column_value)
+{
+    return (Py_ssize_t)size_long(column_value->len) + column_value->len;
+}
+
+/* Sizing function for date columns. */
+static Py_ssize_t size_date_column(ColumnValue* column_value)
+{
+    return 11;
+}
+
+/* Sizing function for datetime columns. */
+static Py_ssize_t size_datetime_column(ColumnValue* column_value)
+{
+    return 24;
+}
+
+/* Sizing function for decimal columns. */
+static Py_ssize_t size_decimal_column(ColumnValue* column_value)
+{
+    char buffer[MAX_DECIMAL_STRING_LEN];
+
+    return 1 + format_decimal(column_value->value.l, buffer);
+}
+
+/* Sizing function for double columns. */
+static Py_ssize_t size_double_column(ColumnValue* column_value)
+{
+    return 8;
+}
+
+/* Sizing function for float columns. */
+static Py_ssize_t size_float_column(ColumnValue* column_value)
+{
+    return 4;
+}
+
+/* Sizing function for int columns. */
+static Py_ssize_t size_int_column(ColumnValue* column_value)
+{
+    return size_long(column_value->value.i);
+}
+
+/* Sizing function for ipv4 columns. */
+static Py_ssize_t size_ipv4_column(ColumnValue* column_value)
+{
+    char buffer[MAX_IPV4_STRING_LEN];
+
+    return 1 + format_ipv4(column_value->value.l, buffer);
+}
+
+/* Sizing function for long columns. */
+static Py_ssize_t size_long_column(ColumnValue* column_value)
+{
+    return size_long(column_value->value.l);
+}
+
+/* Sizing function for time columns. */
+static Py_ssize_t size_time_column(ColumnValue* column_value)
+{
+    return 13;
+}
+
+/* Sizing function for timestamp columns. */
+static Py_ssize_t size_timestamp_column(ColumnValue* column_value)
+{
+    return size_long(datetime_to_epoch_ms(column_value->value.l));
+}
+
+/* Column value sizing function dispatch table. */
+static SizeColumnFunc size_column[CDT_MAX] =
+{
+    size_bytes_column,    /* CDT_BYTES */
+    size_bytes_column,    /* CDT_CHAR1 */
+    size_bytes_column,    /* CDT_CHAR2 */
+    size_bytes_column,    /* CDT_CHAR4 */
+    size_bytes_column,    /* CDT_CHAR8 */
+    size_bytes_column,    /* CDT_CHAR16 */
+    size_bytes_column,    /* CDT_CHAR32 */
+    size_bytes_column,    /* CDT_CHAR64 */
+    size_bytes_column,    /* CDT_CHAR128 */
+    size_bytes_column,    /* CDT_CHAR256 */
+    size_date_column,     /* CDT_DATE */
+    size_datetime_column, /* CDT_DATETIME */
+    size_decimal_column,  /* CDT_DECIMAL */
+    size_double_column,   /* CDT_DOUBLE */
+    size_float_column,    /* CDT_FLOAT */
+    size_int_column,      /* CDT_INT */
+    size_int_column,      /* CDT_INT8 */
+    size_int_column,      /* CDT_INT16 */
+    size_ipv4_column,     /* CDT_IPV4 */
+    size_long_column,     /* CDT_LONG */
+    size_bytes_column,    /* CDT_STRING */
+    size_time_column,     /* CDT_TIME */
+    size_timestamp_column /* CDT_TIMESTAMP */
+};
+
+/* Internal function to compute the size in bytes of the Avro-encoded binary
+   form of a Record object. See description in header file. */
+Py_ssize_t size_record(Record* record)
+{
+    Py_ssize_t column_count;
+    ColumnDef* column_defs;
+    ColumnValue* column_values;
+    Py_ssize_t size = 0;
+
+    Py_ssize_t i;
+
+    if (record->size)
+    {
+        return record->size;
+    }
+
+    column_count = Py_SIZE(record);
+    column_defs = &record->type->column_defs;
+    column_values = &record->column_values;
+
+    for (i = 0; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        ColumnValue* column_value = &column_values[i];
+
+        if (column_def->is_nullable)
+        {
+            size += 1;
+
+            if (column_value->len < 0)
+            {
+                continue;
+            }
+        }
+
+        size += size_column[column_def->data_type](column_value);
+    }
+
+    record->size = size;
+    return size;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Record writing functions. */
+
+/* Function type for a function that writes a column value from a ColumnValue
+   struct in Avro-encoded binary form into a buffer. All functions of this type
+   take these parameters:
+
+   pos: Pointer to a pointer to the position within the buffer to write the
+        value. This will be updated on a successful write to point to the
+        position immediately following the value data on return. If an
+        error occurs, this may point to an arbitrary location between the
+        initial value and max on return.
+
+   max: Pointer to the end of the buffer (must be >= *pos). If this is reached
+        before the value data is completely written, ERR_EOF is returned.
+
+   column_value: Pointer to the ColumnValue struct from which to write the
+                 value.
+
+   An AvroErrorCode is returned indicating success (ERR_NONE) or failure. */
+typedef int (*WriteColumnFunc)(uint8_t**, uint8_t*, ColumnValue*);
+
+/* Writing function for bytes columns. */
+static int write_bytes_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_bytes(pos, max, (uint8_t*)column_value->value.data, column_value->len);
+}
+
+/* Writing function for small CharN columns (N <= 8). */
+static int write_char_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_bytes(pos, max, (uint8_t*)&column_value->value.c, column_value->len);
+}
+
+/* Writing function for date columns. */
+static int write_date_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    long date;
+
+    date = column_value->value.i;
+
+    if (date == 0)
+    {
+        date = DATE_DEFAULT;
+    }
+
+    AVRO_RETURN_ERROR(write_size(pos, max, 10))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 4, DATE_YEAR(date)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DATE_MONTH(date)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
+    return write_digits(pos, max, 2, DATE_DAY(date));
+}
+
+/* Writing function for datetime columns. */
+static int write_datetime_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    PY_LONG_LONG datetime;
+
+    datetime = column_value->value.l;
+
+    if (datetime == 0)
+    {
+        datetime = DT_DEFAULT;
+    }
+
+    AVRO_RETURN_ERROR(write_size(pos, max, 23))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 4, DT_YEAR(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_MONTH(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_DAY(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, ' '))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_HOUR(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_MINUTE(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_SEC(datetime)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '.'))
+    return write_digits(pos, max, 3, DT_MSEC(datetime));
+}
+
+/* Writing function for decimal columns. */
+static int write_decimal_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    char buffer[MAX_DECIMAL_STRING_LEN];
+
+    return write_bytes(pos, max, (uint8_t*)buffer, format_decimal(column_value->value.l, buffer));
+}
+
+/* Writing function for double columns. */
+static int write_double_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_double(pos, max, column_value->value.d);
+}
+
+/* Writing function for float columns. */
+static int write_float_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_float(pos, max, column_value->value.f);
+}
+
+/* Writing function for int columns. */
+static int write_int_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_int(pos, max, column_value->value.i);
+}
+
+/* Writing function for ipv4 columns. */
+static int write_ipv4_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    char buffer[MAX_IPV4_STRING_LEN];
+
+    return write_bytes(pos, max, (uint8_t*)buffer, format_ipv4(column_value->value.l, buffer));
+}
+
+/* Writing function for long columns. */
+static int write_long_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    return write_long(pos, max, column_value->value.l);
+}
+
+/* Writing function for time columns. */
+static int write_time_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    long time;
+
+    time = column_value->value.i;
+    AVRO_RETURN_ERROR(write_size(pos, max, 12))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_HOUR(time)))
+    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_MINUTE(time)))
+    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
+    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_SEC(time)))
+    AVRO_RETURN_ERROR(write_char(pos, max, '.'))
+    return write_digits(pos, max, 3, TIME_MSEC(time));
+}
+
+/* Writing function for timestamp columns. */
+static int write_timestamp_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+{
+    PY_LONG_LONG datetime = column_value->value.l;
+
+    if (datetime == 0)
+    {
+        datetime = DT_DEFAULT;
+    }
+
+    return write_long(pos, max, datetime_to_epoch_ms(datetime));
+}
+
+/* Column writing function dispatch table. */
+static WriteColumnFunc write_column[CDT_MAX] =
+{
+    write_bytes_column,      /* CDT_BYTES */
+    write_char_column_small, /* CDT_CHAR1 */
+    write_char_column_small, /* CDT_CHAR2 */
+    write_char_column_small, /* CDT_CHAR4 */
+    write_char_column_small, /* CDT_CHAR8 */
+    write_bytes_column,      /* CDT_CHAR16 */
+    write_bytes_column,      /* CDT_CHAR32 */
+    write_bytes_column,      /* CDT_CHAR64 */
+    write_bytes_column,      /* CDT_CHAR128 */
+    write_bytes_column,      /* CDT_CHAR256 */
+    write_date_column,       /* CDT_DATE */
+    write_datetime_column,   /* CDT_DATETIME */
+    write_decimal_column,    /* CDT_DECIMAL */
+    write_double_column,     /* CDT_DOUBLE */
+    write_float_column,      /* CDT_FLOAT */
+    write_int_column,        /* CDT_INT */
+    write_int_column,        /* CDT_INT8 */
+    write_int_column,        /* CDT_INT16 */
+    write_ipv4_column,       /* CDT_IPV4 */
+    write_long_column,       /* CDT_LONG */
+    write_bytes_column,      /* CDT_STRING */
+    write_time_column,       /* CDT_TIME */
+    write_timestamp_column   /* CDT_TIMESTAMP */
+};
+
+/* Internal function to write a Record object into a buffer in Avro-encoded
+   binary form. See description in header file. */
+AvroErrorCode write_record(uint8_t** pos, uint8_t* max, Record* record)
+{
+    Py_ssize_t column_count;
+    ColumnDef* column_defs;
+    ColumnValue* column_values;
+
+    Py_ssize_t i;
+
+    column_count = Py_SIZE(record);
+    column_defs = &record->type->column_defs;
+    column_values = &record->column_values;
+
+    for (i = 0; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        ColumnValue* column_value = &column_values[i];
+
+        if (column_def->is_nullable)
+        {
+            if (column_value->len < 0)
+            {
+                AVRO_RETURN_ERROR(write_long(pos, max, 1))
+                continue;
+            }
+            else
+            {
+                AVRO_RETURN_ERROR(write_long(pos, max, 0))
+            }
+        }
+
+        AVRO_RETURN_ERROR(write_column[column_def->data_type](pos, max, column_value))
+    }
+
+    return ERR_NONE;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Internal function to parse the ranges argument of the record decoding
+   methods (a BufferRange, an iterable of BufferRange objects, or NULL for the
+   entire buffer) and validate it against buffer. Returns an array of 2 *
+   count Py_ssize_t values containing the starts followed by the lengths of
+   the ranges, which must be freed with PyMem_Free, or NULL if an exception
+   occurred. Must be called holding the GIL. */
+static Py_ssize_t* parse_ranges(Py_buffer* buffer, PyObject* arg_ranges, Py_ssize_t* count)
+{
+    PyObject* ranges_seq = NULL;
+    Py_ssize_t* ranges = NULL;
+    Py_ssize_t i;
+
+    if (arg_ranges && !BufferRange_check(arg_ranges))
+    {
+        ranges_seq = PySequence_Fast(arg_ranges, "ranges must be BufferRange or iterable");
+        CHECK(ranges_seq, error)
+        *count = PySequence_Fast_GET_SIZE(ranges_seq);
+    }
+    else
+    {
+        *count = 1;
+    }
+
+    ranges = PyMem_New(Py_ssize_t, *count > 0 ? *count * 2 : 1);
+    CHECK_NONE(ranges, PyExc_MemoryError, error)
+
+    for (i = 0; i < *count; ++i)
+    {
+        PyObject* range = ranges_seq ? PySequence_Fast_GET_ITEM(ranges_seq, i) : arg_ranges;
+        Py_ssize_t start;
+        Py_ssize_t length;
+
+        if (range)
+        {
+            CHECK_STRING(BufferRange_check(range), PyExc_TypeError, "range must be BufferRange", error)
+            start = ((BufferRange*)range)->start;
+            CHECK_STRING(start >= 0 && start <= buffer->len, PyExc_ValueError, "start index out of range", error)
+            length = ((BufferRange*)range)->length;
+            CHECK_STRING(length >= 0 && start + length <= buffer->len, PyExc_ValueError, "length out of range", error)
+        }
+        else
+        {
+            start = 0;
+            length = buffer->len;
+        }
+
+        ranges[i] = start;
+        ranges[*count + i] = length;
+    }
+
+    Py_XDECREF(ranges_seq);
+    return ranges;
+
+error:
+    Py_XDECREF(ranges_seq);
+    PyMem_Free(ranges);
+    return NULL;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Routing key functions.
+
+   A routing key is built by concatenating fixed-size binary representations
+   of the values of the shard (or primary) key columns of a record, in native
+   byte order; the key is then hashed with MurmurHash3 to determine which
+   worker rank the record belongs to. The representations used here must
+   exactly match those produced by the _RecordKey class in
+   gpudb_multihead_io.py. */
+
+/* Seed used for all MurmurHash3 hashes of routing keys and string values. */
+#define ROUTING_HASH_SEED 10
+
+/* Size in bytes of the routing key representation of each column data type,
+   or 0 if columns of that data type cannot be part of a routing key. */
+static const Py_ssize_t key_column_size[CDT_MAX] =
+{
+    0,   /* CDT_BYTES */
+    1,   /* CDT_CHAR1 */
+    2,   /* CDT_CHAR2 */
+    4,   /* CDT_CHAR4 */
+    8,   /* CDT_CHAR8 */
+    16,  /* CDT_CHAR16 */
+    32,  /* CDT_CHAR32 */
+    64,  /* CDT_CHAR64 */
+    128, /* CDT_CHAR128 */
+    256, /* CDT_CHAR256 */
+    4,   /* CDT_DATE */
+    8,   /* CDT_DATETIME */
+    8,   /* CDT_DECIMAL */
+    8,   /* CDT_DOUBLE */
+    4,   /* CDT_FLOAT */
+    4,   /* CDT_INT */
+    1,   /* CDT_INT8 */
+    2,   /* CDT_INT16 */
+    4,   /* CDT_IPV4 */
+    8,   /* CDT_LONG */
+    8,   /* CDT_STRING */
+    4,   /* CDT_TIME */
+    8    /* CDT_TIMESTAMP */
+};
+
+/* Internal function to convert epoch milliseconds into the routing key
+   representation of a timestamp. This is a Kinetica datetime, but computed
+   using the same algorithm as the server uses when sharding (which is not
+   guaranteed to match epoch_ms_to_datetime in every field). The value must be
+   between MIN_EPOCH_MS and MAX_EPOCH_MS, so that all divisions below operate
+   on positive values. */
+static PY_LONG_LONG epoch_ms_to_key_timestamp(PY_LONG_LONG epoch_ms)
+{
+    static const PY_LONG_LONG MS_EPOCH_OFFSET = 62135596800000LL; /* 1/1/0001 */
+    static const int month_end_days[] = { 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334 };
+
+    PY_LONG_LONG ms = epoch_ms + MS_EPOCH_OFFSET;
+    PY_LONG_LONG days_since_1 = ms / 86400000;
+    PY_LONG_LONG quad_century = days_since_1 / 146097;
+    PY_LONG_LONG day_of_quad_century = days_since_1 - quad_century * 146097;
+    PY_LONG_LONG century_of_quad_century = day_of_quad_century / 36524;
+    PY_LONG_LONG day_of_century;
+    PY_LONG_LONG quad_year_of_century;
+    PY_LONG_LONG day_of_quad_year;
+    PY_LONG_LONG year_of_quad_year;
+    PY_LONG_LONG year;
+    int day_of_year;
+    int month;
+    int day;
+    int ly;
+
+    if (century_of_quad_century == 4)
+    {
+        century_of_quad_century = 3;
+    }
+
+    day_of_century = day_of_quad_century - century_of_quad_century * 36524;
+    quad_year_of_century = day_of_century / 1461;
+    day_of_quad_year = day_of_century - quad_year_of_century * 1461;
+    year_of_quad_year = day_of_quad_year / 365;
+
+    if (year_of_quad_year == 4)
+    {
+        year_of_quad_year = 3;
+    }
+
+    day_of_year = (int)(day_of_quad_year - year_of_quad_year * 365 + 1);
+    year = 400 * quad_century + 100 * century_of_quad_century + 4 * quad_year_of_century + year_of_quad_year + 1;
+    ly = (year % 400 == 0) ? 1 : ((year % 100 == 0) ? 0 : ((year % 4 == 0) ? 1 : 0));
+
+    day = day_of_year;
+
+    for (month = 1; month < 12; ++month)
+    {
+        int month_end = month_end_days[month - 1] + (month > 1 ? ly : 0);
+
+        if (day_of_year <= month_end)
+        {
+            break;
+        }
+    }
+
+    if (month > 1)
+    {
+        day -= month_end_days[month - 2] + (month > 2 ? ly : 0);
+    }
+
+    return ((year - 1900) << 53)
+           | ((PY_LONG_LONG)month << 49)
+           | ((PY_LONG_LONG)day << 44)
+           | (((ms / 3600000) % 24) << 39)
+           | (((ms / 60000) % 60) << 33)
+           | (((ms / 1000) % 60) << 27)
+           | ((ms % 1000) << 17)
+           | ((PY_LONG_LONG)day_of_year << 8)
+           | ((((ms / 86400000) + 1) % 7 + 1) << 5);
+}
+
+/* Internal function to parse a sequence of column indices identifying the
+   routing key columns of a record type. Returns an array of count column
+   indices, which must be freed with PyMem_Free, or NULL if an exception
+   occurred. The total size of the routing key is stored in key_size. Must be
+   called holding the GIL. */
+static Py_ssize_t* parse_key_columns(RecordType* type, PyObject* arg_columns, Py_ssize_t* count, Py_ssize_t* key_size)
+{
+    PyObject* columns_seq = NULL;
+    Py_ssize_t* columns = NULL;
+    Py_ssize_t column_count = Py_SIZE(type);
+    Py_ssize_t i;
+
+    columns_seq = PySequence_Fast(arg_columns, "columns must be iterable");
+    CHECK(columns_seq, error)
+    *count = PySequence_Fast_GET_SIZE(columns_seq);
+    CHECK_STRING(*count > 0, PyExc_ValueError, "at least one key column must be specified", error)
+    columns = PyMem_New(Py_ssize_t, *count);
+    CHECK_NONE(columns, PyExc_MemoryError, error)
+    *key_size = 0;
+
+    for (i = 0; i < *count; ++i)
+    {
+        Py_ssize_t column = PyNumber_AsSsize_t(PySequence_Fast_GET_ITEM(columns_seq, i), PyExc_IndexError);
+        Py_ssize_t size;
+
+        CHECK(column != -1 || !PyErr_Occurred(), error)
+        CHECK_STRING(column >= 0 && column < column_count, PyExc_IndexError, "column index out of range", error)
+        size = key_column_size[(&type->column_defs)[column].data_type];
+        CHECK_OBJECT(size > 0, PyExc_ValueError, format_string("column %zd cannot be part of a routing key", column), error)
+        columns[i] = column;
+        *key_size += size;
+    }
+
+    Py_DECREF(columns_seq);
+    return columns;
+
+error:
+    Py_XDECREF(columns_seq);
+    PyMem_Free(columns);
+    return NULL;
+}
+
+/* Internal function to write the routing key representation of a charN value
+   (N bytes, the characters in reverse order preceded by zero padding). Returns
+   the number of bytes written. */
+static Py_ssize_t write_key_char(uint8_t* pos, const uint8_t* data, Py_ssize_t len, Py_ssize_t size)
+{
+    Py_ssize_t char_count = 0;
+    Py_ssize_t written;
+    Py_ssize_t i;
+
+    /* Padding is based on the number of characters, not bytes, so count the
+       UTF-8 lead bytes. */
+
+    for (i = 0; i < len; ++i)
+    {
+        if ((data[i] & 0xC0) != 0x80)
+        {
+            ++char_count;
+        }
+    }
+
+    written = size - char_count;
+    memset(pos, 0, written);
+
+    /* Copy the characters in reverse order, keeping the bytes within each
+       multi-byte character in order. */
+
+    i = len;
+
+    while (i > 0)
+    {
+        Py_ssize_t end = i;
+
+        do
+        {
+            --i;
+        }
+        while (i > 0 && (data[i] & 0xC0) == 0x80);
+
+        memcpy(pos + written, data + i, end - i);
+        written += end - i;
+    }
+
+    return written;
+}
+
+/* Internal function to build the routing key of a record from the values of
+   the specified key columns (as returned by parse_key_columns) and compute its
+   routing hash. buffer must have room for at least 2 * key_size bytes. Returns
+   1 if successful, or 0 if the key would not fit into key_size bytes (which
+   can only happen for multi-byte characters in charN columns, and is treated
+   as an error by the Python implementation as well). May be called without
+   holding the GIL. */
+static int compute_routing_hash(Record* record, const Py_ssize_t* columns, Py_ssize_t count, Py_ssize_t key_size, uint8_t* buffer, PY_LONG_LONG* routing_hash)
+{
+    ColumnDef* column_defs = &record->type->column_defs;
+    ColumnValue* column_values = &record->column_values;
+    uint8_t* pos = buffer;
+    Py_ssize_t i;
+
+    uint64_t h1;
+    uint64_t h2;
+
+    for (i = 0; i < count; ++i)
+    {
+        ColumnDataType data_type = column_defs[columns[i]].data_type;
+        ColumnValue* column_value = &column_values[columns[i]];
+        Py_ssize_t size = key_column_size[data_type];
+
+        if ((pos - buffer) + size > key_size)
+        {
+            return 0;
+        }
+
+        if (column_value->len < 0)
+        {
+            memset(pos, 0, size);
+            pos += size;
+            continue;
+        }
+
+        switch (data_type)
+        {
+            case CDT_CHAR1:
+            case CDT_CHAR2:
+            case CDT_CHAR4:
+            case CDT_CHAR8:
+                pos += write_key_char(pos, (uint8_t*)&column_value->value.c[0], column_value->len, size);
+                break;
+
+            case CDT_CHAR16:
+            case CDT_CHAR32:
+            case CDT_CHAR64:
+            case CDT_CHAR128:
+            case CDT_CHAR256:
+                pos += write_key_char(pos, (uint8_t*)column_value->value.data, column_value->len, size);
+                break;
+
+            case CDT_DATE:
+            case CDT_INT:
+            case CDT_TIME:
+            {
+                int32_t value = (int32_t)column_value->value.i;
+
+                if (data_type == CDT_DATE && value == 0)
+                {
+                    value = DATE_DEFAULT;
+                }
+
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_DATETIME:
+            case CDT_DECIMAL:
+            case CDT_LONG:
+            {
+                int64_t value = (int64_t)column_value->value.l;
+
+                if (data_type == CDT_DATETIME && value == 0)
+                {
+                    value = DT_DEFAULT;
+                }
+
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_DOUBLE:
+                memcpy(pos, &column_value->value.d, sizeof(double));
+                pos += sizeof(double);
+                break;
+
+            case CDT_FLOAT:
+                memcpy(pos, &column_value->value.f, sizeof(float));
+                pos += sizeof(float);
+                break;
+
+            case CDT_INT8:
+            {
+                int8_t value = (int8_t)column_value->value.i;
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_INT16:
+            {
+                int16_t value = (int16_t)column_value->value.i;
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_IPV4:
+            {
+                uint32_t value = (uint32_t)column_value->value.l;
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_STRING:
+            {
+                int64_t value;
+
+                murmurhash3_x64_128((uint8_t*)column_value->value.data, column_value->len, ROUTING_HASH_SEED, &h1, &h2);
+                value = (int64_t)h1;
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            case CDT_TIMESTAMP:
+            {
+                PY_LONG_LONG datetime = column_value->value.l;
+                int64_t value;
+
+                if (datetime == 0)
+                {
+                    datetime = DT_DEFAULT;
+                }
+
+                value = (int64_t)epoch_ms_to_key_timestamp(datetime_to_epoch_ms(datetime));
+                memcpy(pos, &value, sizeof(value));
+                pos += sizeof(value);
+                break;
+            }
+
+            default:
+                return 0;
+        }
+    }
+
+    murmurhash3_x64_128(buffer, pos - buffer, ROUTING_HASH_SEED, &h1, &h2);
+    *routing_hash = (PY_LONG_LONG)h1;
+    return 1;
+}
+
+/* Internal function to compute the hash code of a routing key (used for
+   detecting duplicate keys) from its routing hash; equivalent to the Python
+   expression routing_hash ^ (routing_hash >> 32). */
+static PY_LONG_LONG routing_hash_code(PY_LONG_LONG routing_hash)
+{
+    /* Right shift of negative values is implementation defined in C, so
+       perform an arithmetic shift explicitly. */
+    PY_LONG_LONG shifted = routing_hash < 0 ? ~(~routing_hash >> 32) : routing_hash >> 32;
+    return routing_hash ^ shifted;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* Record forwarded methods. */
+
+/* Python Record.compute_key_hashes method. Builds the routing key of the
+   record from the values of the specified key columns and computes its
+   hashes. The results are identical to those of the pure Python routing key
+   implementation in gpudb_multihead_io.py.
+
+   Parameters:
+       columns (iterable of int)
+           The indices of the key columns, in key order.
+
+   Returns:
+       A tuple of two ints containing the routing hash (used to select the
+       worker rank for the record) and the hash code (used to detect
+       duplicate keys) of the key. */
+static PyObject* Record_compute_key_hashes(Record* self, PyObject* arg_columns)
+{
+    Py_ssize_t* columns = NULL;
+    uint8_t* buffer = NULL;
+
+    Py_ssize_t count;
+    Py_ssize_t key_size;
+
+    PY_LONG_LONG routing_hash;
+
+    columns = parse_key_columns(self->type, arg_columns, &count, &key_size);
+    CHECK(columns, error)
+    buffer = (uint8_t*)PyMem_Malloc(key_size * 2);
+    CHECK_NONE(buffer, PyExc_MemoryError, error)
+    CHECK_STRING(compute_routing_hash(self, columns, count, key_size, buffer, &routing_hash), PyExc_ValueError, "key values exceed routing key size", error)
+    PyMem_Free(buffer);
+    PyMem_Free(columns);
+    return Py_BuildValue("(LL)", routing_hash, routing_hash_code(routing_hash));
+
+error:
+    PyMem_Free(buffer);
+    PyMem_Free(columns);
+    return NULL;
+}
+
+/* Internal function implementing the RecordType.route_records and
+   RecordType.compute_key_hash_codes methods. Builds the routing keys of a
+   sequence of Record objects of the record type in a single pass, and returns
+   a list containing, for each record, either the entry of routing_table
+   selected by its routing hash or, if routing_table is NULL, its hash code. */
+static PyObject* _RecordType_process_keys(RecordType* self, PyObject* arg_records, PyObject* arg_columns, PyObject* arg_routing_table)
+{
+    PyObject* result = NULL;
+    PyObject* records_seq = NULL;
+    PyObject* routing_table_seq = NULL;
+    Py_ssize_t* columns = NULL;
+    uint8_t* buffer = NULL;
+
+    Py_ssize_t count;
+    Py_ssize_t column_count;
+    Py_ssize_t key_size;
+    Py_ssize_t routing_table_len = 0;
+    Py_ssize_t i;
+
+    records_seq = PySequence_Fast(arg_records, "records must be iterable");
+    CHECK(records_seq, error)
+    count = PySequence_Fast_GET_SIZE(records_seq);
+
+    if (arg_routing_table)
+    {
+        routing_table_seq = PySequence_Fast(arg_routing_table, "routing_table must be iterable");
+        CHECK(routing_table_seq, error)
+        routing_table_len = PySequence_Fast_GET_SIZE(routing_table_seq);
+        CHECK_STRING(routing_table_len > 0, PyExc_ValueError, "routing_table must not be empty", error)
+    }
+
+    columns = parse_key_columns(self, arg_columns, &column_count, &key_size);
+    CHECK(columns, error)
+    buffer = (uint8_t*)PyMem_Malloc(key_size * 2);
+    CHECK_NONE(buffer, PyExc_MemoryError, error)
+    result = PyList_New(count);
+    CHECK(result, error)
+
+    for (i = 0; i < count; ++i)
+    {
+        PyObject* record = PySequence_Fast_GET_ITEM(records_seq, i);
+        PY_LONG_LONG routing_hash;
+        PyObject* value;
+
+        CHECK_STRING(Record_check(record) && ((Record*)record)->type == self, PyExc_TypeError, "records must be Record objects of this record type", error)
+        CHECK_STRING(compute_routing_hash((Record*)record, columns, column_count, key_size, buffer, &routing_hash), PyExc_ValueError, "key values exceed routing key size", error)
+
+        if (routing_table_seq)
+        {
+            /* Equivalent to abs(routing_hash) % len(routing_table) in Python
+               (including for the most negative value). */
+            uint64_t magnitude = routing_hash < 0 ? (uint64_t)0 - (uint64_t)routing_hash : (uint64_t)routing_hash;
+            value = PySequence_Fast_GET_ITEM(routing_table_seq, (Py_ssize_t)(magnitude % (uint64_t)routing_table_len));
+            Py_INCREF(value);
+        }
+        else
+        {
+            value = PyLong_FromLongLong(routing_hash_code(routing_hash));
+            CHECK(value, error)
+        }
+
+        PyList_SET_ITEM(result, i, value);
+    }
+
+    PyMem_Free(buffer);
+    PyMem_Free(columns);
+    Py_XDECREF(routing_table_seq);
+    Py_DECREF(records_seq);
+    return result;
+
+error:
+    Py_XDECREF(result);
+    PyMem_Free(buffer);
+    PyMem_Free(columns);
+    Py_XDECREF(routing_table_seq);
+    Py_XDECREF(records_seq);
+    return NULL;
+}
+
+/* Python RecordType.compute_key_hash_codes method. Builds the routing keys of
+   a sequence of records from the values of the specified key columns and
+   computes their hash codes (used to detect duplicate keys), equivalent to
+   calling Record.compute_key_hashes on each record.
+
+   Parameters:
+       records (sequence of Record)
+           The records, which must be of this record type.
+
+       columns (iterable of int)
+           The indices of the key columns, in key order.
+
+   Returns:
+       A list of ints containing the hash codes of the keys of the records. */
+static PyObject* RecordType_compute_key_hash_codes(RecordType* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* arg_records;
+    PyObject* arg_columns;
+    static char* keywords[] = { "records", "columns", NULL };
+
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "OO", keywords, &arg_records, &arg_columns), error)
+    return _RecordType_process_keys(self, arg_records, arg_columns, NULL);
+
+error:
+    return NULL;
+}
+
+/* Python RecordType.route_records method. Builds the routing keys of a
+   sequence of records from the values of the specified key columns and
+   determines where each record is to be routed: the entry of the routing
+   table at the index given by the absolute value of the key's routing hash
+   modulo the length of the table.
+
+   Parameters:
+       records (sequence of Record)
+           The records, which must be of this record type.
+
+       columns (iterable of int)
+           The indices of the key columns, in key order.
+
+       routing_table (sequence)
+           The routing table (for example, the worker rank for each shard).
+
+   Returns:
+       A list containing the selected routing table entry for each record. */
+static PyObject* RecordType_route_records(RecordType* self, PyObject* args, PyObject* kwargs)
+{
+    PyObject* arg_records;
+    PyObject* arg_columns;
+    PyObject* arg_routing_table;
+    static char* keywords[] = { "records", "columns", "routing_table", NULL };
+
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "OOO", keywords, &arg_records, &arg_columns, &arg_routing_table), error)
+    return _RecordType_process_keys(self, arg_records, arg_columns, arg_routing_table);
+
+error:
+    return NULL;
+}
+
+/*----------------------------------------------------------------------------*/
+
+/* RecordType forwarded methods. */
+
+/* Python RecordType.decode_dynamic_records method. Decodes the records in the
+   Avro-encoded binary data returned by a dynamic schema endpoint. The records
+   must be of the correct record type.
+
+   Parameters:
+       buffer (buffer)
+           The buffer containing the Avro-encoded binary data returned by the
+           dynamic schema endpoint.
+
+       range (BufferRange, optional)
+           Range of bytes within the buffer containing the Avro-encoded binary
+           data. If not specified, the entire buffer is used. If the data does
+           not take up the entire range, any extra data is ignored.
+
+   Returns:
+       A list of decoded Record objects. */
+static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* args, PyObject* kwargs)
+{
+    Py_buffer buffer = { NULL };
+    PyObject* result = NULL;
+
+    PyObject* arg_range = NULL;
+    static char* keywords[] = { "buffer", "range", NULL };
+
+    Py_ssize_t column_count;
+    ColumnDef* column_defs;
+    Py_ssize_t count;
+
+    uint8_t* pos;
+    uint8_t* max;
+    Py_ssize_t block_count = 0;
+    Py_ssize_t i;
+    AvroErrorCode error;
+
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|O", keywords, &buffer, &arg_range), error)
+
+    if (arg_range)
+    {
+        Py_ssize_t start;
+        Py_ssize_t length;
+
+        CHECK_STRING(BufferRange_check(arg_range), PyExc_TypeError, "range must be BufferRange", error)
+        start = ((BufferRange*)arg_range)->start;
+        CHECK_STRING(start >= 0 && start <= buffer.len, PyExc_ValueError, "start index out of range", error)
+        pos = (uint8_t*)buffer.buf + start;
+        length = ((BufferRange*)arg_range)->length;
+        CHECK_STRING(length >= 0 && start + length <= buffer.len, PyExc_ValueError, "length out of range", error)
+        max = pos + length;
+    }
+    else
+    {
+        pos = (uint8_t*)buffer.buf;
+        max = pos + buffer.len;
+    }
+
+    column_count = Py_SIZE(self);
+    column_defs = &self->column_defs;
+
+    CHECK(handle_read_error(read_size(&pos, max, &block_count)), error)
+    count = (block_count >= 0) ? block_count : -block_count;
+
+    /* Create all the Record objects that will be read into first, since this
+       equires holding the GIL. Once created, the GIL can be released for the
+       actual decoding process. */
+
+    result = PyList_New(count);
+    CHECK(result, error)
+
+    for (i = 0; i < count; ++i)
+    {
+        PyObject* record = Record_create(self);
+        CHECK(record, error)
+        PyList_SET_ITEM(result, i, record);
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+
+    /* Dynamic schema responses encode data column-wise as arrays of values,
+       so loop through the columns first. */
+
+    for (i = 0; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        Py_ssize_t j = 0;
+
+        /* Read the size of the first block of the column array, unless this
+           is the first column, in which case the size was already read above
+           to determine the number of Records to create. */
+
+        if (i != 0)
+        {
+            error = read_size(&pos, max, &block_count);
+
+            if (error != ERR_NONE)
+            {
+                Py_BLOCK_THREADS
+                CHECK(handle_read_error(error), error)
+            }
+        }
+
+        while (1)
+        {
+            if (block_count == 0)
+            {
+                break;
+            }
+
+            if (block_count < 0)
+            {
+                PY_LONG_LONG size;
+
+                error = read_long(&pos, max, &size);
+
+                if (error != ERR_NONE)
+                {
+                    Py_BLOCK_THREADS
+                    CHECK(handle_read_error(error), error)
+                }
+
+                block_count = -block_count;
+            }
+
+            if (j + block_count > count)
+            {
+                /* The Avro data is in multiple array blocks, and the number of
+                   array items in the current block exceeds the number of
+                   Records created earlier. If this is the first column,
+                   more Records must be created; if this is a subsequent
+                   column, this is an error condition. In either case, the GIL
+                   must be reacquired temporarily. */
+
+                PyObject* temp;
+                Py_ssize_t k;
+
+                Py_BLOCK_THREADS
+
+                CHECK_OBJECT(i == 0, PyExc_ValueError, format_string("column %zd has too many values", i), error)
+
+                count = j + block_count;
+                temp = PyList_New(count);
+                CHECK(temp, error)
+
+                for (k = 0; k < j; ++k)
+                {
+                    PyList_SET_ITEM(temp, k, PyList_GET_ITEM(result, k));
+                    PyList_SET_ITEM(result, k, NULL);
+                }
+
+                Py_DECREF(result);
+                result = temp;
+
+                for (k = j; k < count; ++k)
+                {
+                    PyObject* record = Record_create(self);
+                    CHECK(record, error)
+                    PyList_SET_ITEM(result, k, record);
+                }
+
+                Py_UNBLOCK_THREADS
+            }
+
+            /* Now loop through each row in the column and read the value for
+               the row into the appropriate column in the corresponding
+               Record. */
+
+            while (block_count > 0)
+            {
+                ColumnValue* column_value = &(&((Record*)PyList_GET_ITEM(result, j))->column_values)[i];
+
+                if (column_def->is_nullable)
+                {
+                    PY_LONG_LONG is_null;
+
+                    error = read_long(&pos, max, &is_null);
+
+                    if (error != ERR_NONE)
+                    {
+                        Py_BLOCK_THREADS
+                        CHECK(handle_read_error(error), error)
+                    }
+
+                    if (is_null == 1)
+                    {
+                        column_value->len = -1;
+                        ++j;
+                        --block_count;
+                        continue;
+                    }
+                    else if (is_null != 0)
+                    {
+                        Py_BLOCK_THREADS
+                        CHECK(handle_read_error(ERR_OVERFLOW), error)
+                    }
+                }
+
+                error = read_column[column_def->data_type](&pos, max, column_value);
+
+                if (error != ERR_NONE)
+                {
+                    Py_BLOCK_THREADS
+                    CHECK(handle_read_error(error), error)
+                }
+
+                ++j;
+                --block_count;
+            }
+
+            /* Read the size of the next block of the column array. The size
+               is checked at the top of the loop. */
+
+            error = read_size(&pos, max, &block_count);
+
+            if (error != ERR_NONE)
+            {
+                Py_BLOCK_THREADS
+                CHECK(handle_read_error(error), error)
+            }
+        }
+
+        /* Make sure a value was read for every Record. */
+
+        if (j != count)
+        {
+            Py_BLOCK_THREADS
+            CHECK_OBJECT(0, PyExc_ValueError, format_string("column %zd has too few values", i), error)
+        }
+    }
+
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buffer);
+    return result;
+
+error:
+    if (buffer.buf)
+    {
+        PyBuffer_Release(&buffer);
+    }
+
+    Py_XDECREF(result);
+    return NULL;
+}
+
+/* Python RecordType.decode_records method. Decodes one or more Avro-encoded
+   binary records in a buffer. The records must be of the correct record type.
+
+   Parameters:
+       buffer (buffer)
+           The buffer containing the Avro-encoded binary records.
+
+       ranges (BufferRange or iterable of BufferRange, optional)
+           The ranges of bytes within the buffer corresponding to each
+           Avro-encoded binary record to be decoded. If only one record is
+           present in the buffer, a single BufferRange can be passed. If not
+           specified, it is assumed that the buffer contains a single record to
+           decode.
+
+   Returns:
+       A list of decoded Record objects. */
+static PyObject* RecordType_decode_records(RecordType* self, PyObject* args, PyObject* kwargs)
+{
+    Py_buffer buffer = { NULL };
+    Py_ssize_t* ranges = NULL;
+    PyObject* result = NULL;
+
+    PyObject* arg_ranges = NULL;
+    static char* keywords[] = { "buffer", "ranges", NULL };
+
+    Py_ssize_t count;
+    Py_ssize_t* starts;
+    Py_ssize_t* lengths;
+
+    Py_ssize_t i;
 
-    record->size = 0;
-    column_count = Py_SIZE(record);
-    column_defs = &record->type->column_defs;
-    column_values = &record->column_values;
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|O", keywords, &buffer, &arg_ranges), error)
+    ranges = parse_ranges(&buffer, arg_ranges, &count);
+    CHECK(ranges, error)
+    starts = ranges;
+    lengths = &ranges[count];
 
-    for (; i < column_count; ++i)
-    {
-        ColumnDef* column_def = &column_defs[i];
-        ColumnValue* column_value = &column_values[i];
+    /* Create all the Record objects that will be read into first, since this
+       requires holding the GIL. Once created, the GIL can be released for the
+       actual decoding process. */
 
-        if (column_def->is_nullable)
-        {
-            PY_LONG_LONG is_null;
+    result = PyList_New(count);
+    CHECK(result, error)
 
-            error = read_long(pos, max, &is_null);
+    for (i = 0; i < count; ++i)
+    {
+        PyObject* record = Record_create(self);
+        CHECK(record, error)
+        PyList_SET_ITEM(result, i, record);
+    }
 
-            if (error != ERR_NONE)
-            {
-                goto error;
-            }
+    Py_BEGIN_ALLOW_THREADS
 
-            if (is_null == 1)
-            {
-                column_value->len = -1;
-                continue;
-            }
-            else if (is_null != 0)
-            {
-                error = ERR_OVERFLOW;
-                goto error;
-            }
-        }
+    /* Read each record. */
 
-        error = read_column[column_def->data_type](pos, max, column_value);
+    for (i = 0; i < count; ++i)
+    {
+        uint8_t* pos = (uint8_t*)buffer.buf + starts[i];
+        uint8_t* max = pos + lengths[i];
+        AvroErrorCode error = read_record(&pos, max, (Record*)PyList_GET_ITEM(result, i));
 
         if (error != ERR_NONE)
         {
-            goto error;
+            Py_BLOCK_THREADS
+            CHECK(handle_read_error(error), error)
         }
     }
 
-    return ERR_NONE;
+    Py_END_ALLOW_THREADS
+
+    PyBuffer_Release(&buffer);
+    PyMem_Free(ranges);
+    return result;
 
 error:
-    for (; i > 0; --i)
+    if (buffer.buf)
     {
-        clear_column[(&record->type->column_defs)[i].data_type](record, i, 0);
+        PyBuffer_Release(&buffer);
     }
 
-    return error;
+    PyMem_Free(ranges);
+    Py_XDECREF(result);
+    return NULL;
 }
 
 /*----------------------------------------------------------------------------*/
 
-/* Record size computing functions. */
+/* Columnar decoding. Instead of creating a Record object per row, the values
+   of each column are decoded directly into a single typed buffer (for
+   numeric, date and time data types) or into an array of raw values that are
+   converted into a list of Python objects once decoding is complete (for
+   bytes, string and charN data types). Nullable columns additionally get a
+   buffer of null flags, one byte per row. */
 
-/* Function type for a function that calculates the size of the Avro-encoded
-   binary form of the value in a ColumnValue struct in bytes. */
-typedef Py_ssize_t (*SizeColumnFunc)(ColumnValue*);
+/* ColumnarColumn: struct holding the decoding state of one column. */
 
-/* Sizing function for bytes and other variable-length columns. */
-static Py_ssize_t size_bytes_column(ColumnValue* column_value)
+typedef struct
 {
-    return (Py_ssize_t)size_long(column_value->len) + column_value->len;
-}
+    /* The data type of the column. */
+    ColumnDataType data_type;
 
-/* Sizing function for date columns. */
-static Py_ssize_t size_date_column(ColumnValue* column_value)
-{
-    return 11;
-}
+    /* Typed value buffer for fixed-width data types, or NULL. Points into a
+       bytearray object owned by the result. */
+    char* data;
 
-/* Sizing function for datetime columns. */
-static Py_ssize_t size_datetime_column(ColumnValue* column_value)
-{
-    return 24;
-}
+    /* Raw values for variable-length data types, or NULL. Owned by the
+       ColumnarColumn until converted into Python objects. */
+    ColumnValue* values;
+
+    /* Null flags (1 = null) for nullable columns, or NULL. Points into a
+       bytearray object owned by the result. */
+    char* nulls;
+}
+ColumnarColumn;
+
+/* Array typecodes (as used by the struct and array modules) and item sizes
+   of the typed value buffers for each data type, or 0 for data types that are
+   returned as lists of Python objects. Dates are returned as days since the
+   epoch, datetimes and timestamps as milliseconds since the epoch, and times
+   as milliseconds since midnight. */
+static const char columnar_typecodes[CDT_MAX] =
+{
+    0,   /* CDT_BYTES */
+    0,   /* CDT_CHAR1 */
+    0,   /* CDT_CHAR2 */
+    0,   /* CDT_CHAR4 */
+    0,   /* CDT_CHAR8 */
+    0,   /* CDT_CHAR16 */
+    0,   /* CDT_CHAR32 */
+    0,   /* CDT_CHAR64 */
+    0,   /* CDT_CHAR128 */
+    0,   /* CDT_CHAR256 */
+    'q', /* CDT_DATE */
+    'q', /* CDT_DATETIME */
+    0,   /* CDT_DECIMAL */
+    'd', /* CDT_DOUBLE */
+    'f', /* CDT_FLOAT */
+    'i', /* CDT_INT */
+    'b', /* CDT_INT8 */
+    'h', /* CDT_INT16 */
+    0,   /* CDT_IPV4 */
+    'q', /* CDT_LONG */
+    0,   /* CDT_STRING */
+    'q', /* CDT_TIME */
+    'q'  /* CDT_TIMESTAMP */
+};
 
-/* Sizing function for double columns. */
-static Py_ssize_t size_double_column(ColumnValue* column_value)
-{
-    return 8;
-}
+static const Py_ssize_t columnar_item_sizes[CDT_MAX] =
+{
+    0,                    /* CDT_BYTES */
+    0,                    /* CDT_CHAR1 */
+    0,                    /* CDT_CHAR2 */
+    0,                    /* CDT_CHAR4 */
+    0,                    /* CDT_CHAR8 */
+    0,                    /* CDT_CHAR16 */
+    0,                    /* CDT_CHAR32 */
+    0,                    /* CDT_CHAR64 */
+    0,                    /* CDT_CHAR128 */
+    0,                    /* CDT_CHAR256 */
+    sizeof(int64_t),      /* CDT_DATE */
+    sizeof(int64_t),      /* CDT_DATETIME */
+    0,                    /* CDT_DECIMAL */
+    sizeof(double),       /* CDT_DOUBLE */
+    sizeof(float),        /* CDT_FLOAT */
+    sizeof(int),          /* CDT_INT */
+    sizeof(signed char),  /* CDT_INT8 */
+    sizeof(short),        /* CDT_INT16 */
+    0,                    /* CDT_IPV4 */
+    sizeof(PY_LONG_LONG), /* CDT_LONG */
+    0,                    /* CDT_STRING */
+    sizeof(int64_t),      /* CDT_TIME */
+    sizeof(int64_t)       /* CDT_TIMESTAMP */
+};
 
-/* Sizing function for float columns. */
-static Py_ssize_t size_float_column(ColumnValue* column_value)
+/* Internal function that returns whether a ColumnValue of the specified data
+   type holds its value in an external buffer that must be freed. */
+static int has_external_data(ColumnDataType data_type)
 {
-    return 4;
+    return data_type == CDT_BYTES
+           || data_type == CDT_STRING
+           || (data_type >= CDT_CHAR16 && data_type <= CDT_CHAR256);
 }
 
-/* Sizing function for int columns. */
-static Py_ssize_t size_int_column(ColumnValue* column_value)
+/* Internal function to store a raw value read by a ReadColumnFunc (or a null
+   value, if len is -1) into row index of a ColumnarColumn. Ownership of any
+   buffer in the ColumnValue is transferred to the ColumnarColumn. May be
+   called without holding the GIL. */
+static void store_columnar_value(ColumnarColumn* column, Py_ssize_t index, ColumnValue* column_value)
 {
-    return size_long(column_value->value.i);
-}
+    int64_t value;
 
-/* Sizing function for long columns. */
-static Py_ssize_t size_long_column(ColumnValue* column_value)
-{
-    return size_long(column_value->value.l);
-}
+    if (column->nulls)
+    {
+        column->nulls[index] = (char)(column_value->len == -1);
+    }
 
-/* Sizing function for time columns. */
-static Py_ssize_t size_time_column(ColumnValue* column_value)
-{
-    return 13;
-}
+    if (column->values)
+    {
+        column->values[index] = *column_value;
+        return;
+    }
 
-/* Sizing function for timestamp columns. */
-static Py_ssize_t size_timestamp_column(ColumnValue* column_value)
-{
-    return size_long(datetime_to_epoch_ms(column_value->value.l));
-}
+    if (column_value->len == -1)
+    {
+        memset(column->data + index * columnar_item_sizes[column->data_type], 0, columnar_item_sizes[column->data_type]);
+        return;
+    }
 
-/* Column value sizing function dispatch table. */
-static SizeColumnFunc size_column[CDT_MAX] =
-{
-    size_bytes_column,    /* CDT_BYTES */
-    size_bytes_column,    /* CDT_CHAR1 */
-    size_bytes_column,    /* CDT_CHAR2 */
-    size_bytes_column,    /* CDT_CHAR4 */
-    size_bytes_column,    /* CDT_CHAR8 */
-    size_bytes_column,    /* CDT_CHAR16 */
-    size_bytes_column,    /* CDT_CHAR32 */
-    size_bytes_column,    /* CDT_CHAR64 */
-    size_bytes_column,    /* CDT_CHAR128 */
-    size_bytes_column,    /* CDT_CHAR256 */
-    size_date_column,     /* CDT_DATE */
-    size_datetime_column, /* CDT_DATETIME */
-    size_double_column,   /* CDT_DOUBLE */
-    size_float_column,    /* CDT_FLOAT */
-    size_int_column,      /* CDT_INT */
-    size_int_column,      /* CDT_INT8 */
-    size_int_column,      /* CDT_INT16 */
-    size_long_column,     /* CDT_LONG */
-    size_bytes_column,    /* CDT_STRING */
-    size_time_column,     /* CDT_TIME */
-    size_timestamp_column /* CDT_TIMESTAMP */
-};
+    switch (column->data_type)
+    {
+        case CDT_DATE:
+        {
+            PY_LONG_LONG datetime;
+            long date = column_value->value.i;
 
-/* Internal function to compute the size in bytes of the Avro-encoded binary
-   form of a Record object. See description in header file. */
-Py_ssize_t size_record(Record* record)
-{
-    Py_ssize_t column_count;
-    ColumnDef* column_defs;
-    ColumnValue* column_values;
-    Py_ssize_t size = 0;
+            encode_datetime(DATE_YEAR(date), DATE_MONTH(date), DATE_DAY(date), 0, 0, 0, 0, &datetime);
+            value = datetime_to_epoch_ms(datetime) / 86400000;
+            memcpy(column->data + index * sizeof(int64_t), &value, sizeof(int64_t));
+            break;
+        }
+
+        case CDT_DATETIME:
+        case CDT_TIMESTAMP:
+            value = datetime_to_epoch_ms(column_value->value.l);
+            memcpy(column->data + index * sizeof(int64_t), &value, sizeof(int64_t));
+            break;
+
+        case CDT_TIME:
+        {
+            long time = column_value->value.i;
+
+            value = ((int64_t)TIME_HOUR(time) * 3600000)
+                    + ((int64_t)TIME_MINUTE(time) * 60000)
+                    + ((int64_t)TIME_SEC(time) * 1000)
+                    + TIME_MSEC(time);
+            memcpy(column->data + index * sizeof(int64_t), &value, sizeof(int64_t));
+            break;
+        }
+
+        case CDT_DOUBLE:
+            ((double*)column->data)[index] = column_value->value.d;
+            break;
+
+        case CDT_FLOAT:
+            ((float*)column->data)[index] = column_value->value.f;
+            break;
+
+        case CDT_INT:
+            ((int*)column->data)[index] = (int)column_value->value.i;
+            break;
+
+        case CDT_INT8:
+            ((signed char*)column->data)[index] = (signed char)column_value->value.i;
+            break;
+
+        case CDT_INT16:
+            ((short*)column->data)[index] = (short)column_value->value.i;
+            break;
 
+        case CDT_LONG:
+            ((PY_LONG_LONG*)column->data)[index] = column_value->value.l;
+            break;
+
+        default:
+            break;
+    }
+}
+
+/* Internal function to free the raw values held by an array of
+   ColumnarColumn structs, and the array itself. Safe to call without holding
+   the GIL only if no values have been converted yet. */
+static void free_columnar_columns(ColumnarColumn* columns, Py_ssize_t column_count, Py_ssize_t count)
+{
     Py_ssize_t i;
+    Py_ssize_t j;
 
-    if (record->size)
+    if (!columns)
     {
-        return record->size;
+        return;
     }
 
-    column_count = Py_SIZE(record);
-    column_defs = &record->type->column_defs;
-    column_values = &record->column_values;
-
     for (i = 0; i < column_count; ++i)
     {
-        ColumnDef* column_def = &column_defs[i];
-        ColumnValue* column_value = &column_values[i];
+        ColumnarColumn* column = &columns[i];
 
-        if (column_def->is_nullable)
+        if (!column->values)
         {
-            size += 1;
+            continue;
+        }
 
-            if (column_value->len < 0)
+        if (has_external_data(column->data_type))
+        {
+            for (j = 0; j < count; ++j)
             {
-                continue;
+                if (column->values[j].len >= 0)
+                {
+                    free(column->values[j].value.data);
+                }
             }
         }
 
-        size += size_column[column_def->data_type](column_value);
+        PyMem_Free(column->values);
     }
 
-    record->size = size;
-    return size;
+    PyMem_Free(columns);
 }
 
-/*----------------------------------------------------------------------------*/
+/* Internal function to create the result list for a columnar decode of count
+   rows of the specified record type, and an array of ColumnarColumn structs
+   pointing to its buffers. The result contains one (values, typecode, nulls)
+   tuple per column, where values is a bytearray (for fixed-width types) or a
+   list to be populated later, typecode is a str (or None for lists), and
+   nulls is a bytearray or None. Must be called holding the GIL. */
+static PyObject* create_columnar_result(RecordType* type, Py_ssize_t count, ColumnarColumn** columns)
+{
+    Py_ssize_t column_count = Py_SIZE(type);
+    ColumnDef* column_defs = &type->column_defs;
+    PyObject* result = NULL;
+    Py_ssize_t i;
+    Py_ssize_t j;
 
-/* Record writing functions. */
+    *columns = PyMem_New(ColumnarColumn, column_count);
+    CHECK_NONE(*columns, PyExc_MemoryError, error)
+    memset(*columns, 0, sizeof(ColumnarColumn) * column_count);
 
-/* Function type for a function that writes a column value from a ColumnValue
-   struct in Avro-encoded binary form into a buffer. All functions of this type
-   take these parameters:
+    result = PyList_New(column_count);
+    CHECK(result, error)
 
-   pos: Pointer to a pointer to the position within the buffer to write the
-        value. This will be updated on a successful write to point to the
-        position immediately following the value data on return. If an
-        error occurs, this may point to an arbitrary location between the
-        initial value and max on return.
+    for (i = 0; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        ColumnarColumn* column = &(*columns)[i];
+        PyObject* values;
+        PyObject* typecode;
+        PyObject* nulls;
+        PyObject* entry;
 
-   max: Pointer to the end of the buffer (must be >= *pos). If this is reached
-        before the value data is completely written, ERR_EOF is returned.
+        column->data_type = column_def->data_type;
 
-   column_value: Pointer to the ColumnValue struct from which to write the
-                 value.
+        if (columnar_typecodes[column_def->data_type])
+        {
+            values = PyByteArray_FromStringAndSize(NULL, count * columnar_item_sizes[column_def->data_type]);
+            CHECK(values, error)
+            column->data = PyByteArray_AS_STRING(values);
+            typecode = format_string("%c", columnar_typecodes[column_def->data_type]);
 
-   An AvroErrorCode is returned indicating success (ERR_NONE) or failure. */
-typedef int (*WriteColumnFunc)(uint8_t**, uint8_t*, ColumnValue*);
+            if (!typecode)
+            {
+                Py_DECREF(values);
+                goto error;
+            }
+        }
+        else
+        {
+            values = PyList_New(count);
+            CHECK(values, error)
+            column->values = PyMem_New(ColumnValue, count > 0 ? count : 1);
 
-/* Writing function for bytes columns. */
-static int write_bytes_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_bytes(pos, max, (uint8_t*)column_value->value.data, column_value->len);
-}
+            if (!column->values)
+            {
+                Py_DECREF(values);
+                PyErr_NoMemory();
+                goto error;
+            }
 
-/* Writing function for small CharN columns (N <= 8). */
-static int write_char_column_small(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_bytes(pos, max, (uint8_t*)&column_value->value.c, column_value->len);
-}
+            for (j = 0; j < count; ++j)
+            {
+                column->values[j].len = -1;
+            }
+
+            Py_INCREF(Py_None);
+            typecode = Py_None;
+        }
+
+        if (column_def->is_nullable)
+        {
+            nulls = PyByteArray_FromStringAndSize(NULL, count);
 
-/* Writing function for date columns. */
-static int write_date_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    long date;
+            if (!nulls)
+            {
+                Py_DECREF(values);
+                Py_DECREF(typecode);
+                goto error;
+            }
 
-    date = column_value->value.i;
+            column->nulls = PyByteArray_AS_STRING(nulls);
+        }
+        else
+        {
+            Py_INCREF(Py_None);
+            nulls = Py_None;
+        }
 
-    if (date == 0)
-    {
-        date = DATE_DEFAULT;
+        entry = PyTuple_Pack(3, values, typecode, nulls);
+        Py_DECREF(values);
+        Py_DECREF(typecode);
+        Py_DECREF(nulls);
+        CHECK(entry, error)
+        PyList_SET_ITEM(result, i, entry);
     }
 
-    AVRO_RETURN_ERROR(write_size(pos, max, 10))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 4, DATE_YEAR(date)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DATE_MONTH(date)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
-    return write_digits(pos, max, 2, DATE_DAY(date));
+    return result;
+
+error:
+    Py_XDECREF(result);
+    free_columnar_columns(*columns, column_count, 0);
+    *columns = NULL;
+    return NULL;
 }
 
-/* Writing function for datetime columns. */
-static int write_datetime_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
+/* Internal function to convert the raw values of the variable-length columns
+   of a columnar decode into Python objects in the result lists, then free
+   the ColumnarColumn structs. Must be called holding the GIL. Returns 1 if
+   successful, or 0 if an exception occurred (in which case the columns are
+   still freed). */
+static int finish_columnar_result(PyObject* result, ColumnarColumn* columns, Py_ssize_t column_count, Py_ssize_t count)
 {
-    PY_LONG_LONG datetime;
-
-    datetime = column_value->value.l;
+    Py_ssize_t i;
+    Py_ssize_t j;
 
-    if (datetime == 0)
+    for (i = 0; i < column_count; ++i)
     {
-        datetime = DT_DEFAULT;
-    }
+        ColumnarColumn* column = &columns[i];
+        PyObject* values;
 
-    AVRO_RETURN_ERROR(write_size(pos, max, 23))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 4, DT_YEAR(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_MONTH(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '-'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_DAY(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, ' '))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_HOUR(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_MINUTE(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, DT_SEC(datetime)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '.'))
-    return write_digits(pos, max, 3, DT_MSEC(datetime));
-}
+        if (!column->values)
+        {
+            continue;
+        }
 
-/* Writing function for double columns. */
-static int write_double_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_double(pos, max, column_value->value.d);
-}
+        values = PyTuple_GET_ITEM(PyList_GET_ITEM(result, i), 0);
 
-/* Writing function for float columns. */
-static int write_float_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_float(pos, max, column_value->value.f);
-}
+        for (j = 0; j < count; ++j)
+        {
+            ColumnValue* column_value = &column->values[j];
+            PyObject* value;
 
-/* Writing function for int columns. */
-static int write_int_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_int(pos, max, column_value->value.i);
-}
+            if (column_value->len == -1)
+            {
+                Py_INCREF(Py_None);
+                PyList_SET_ITEM(values, j, Py_None);
+                continue;
+            }
 
-/* Writing function for long columns. */
-static int write_long_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    return write_long(pos, max, column_value->value.l);
-}
+            switch (column->data_type)
+            {
+                case CDT_BYTES:
+                    #if PY_MAJOR_VERSION >= 3
+                        value = PyBytes_FromStringAndSize(column_value->value.data, column_value->len);
+                    #else
+                        value = PyString_FromStringAndSize(column_value->value.data, column_value->len);
+                    #endif
+                    break;
+
+                case CDT_CHAR1:
+                case CDT_CHAR2:
+                case CDT_CHAR4:
+                case CDT_CHAR8:
+                    value = PyUnicode_FromStringAndSize(&column_value->value.c[0], column_value->len);
+                    break;
+
+                case CDT_DECIMAL:
+                case CDT_IPV4:
+                    value = get_column[column->data_type](column_value);
+                    break;
+
+                default:
+                    value = PyUnicode_FromStringAndSize(column_value->value.data, column_value->len);
+                    break;
+            }
 
-/* Writing function for time columns. */
-static int write_time_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    long time;
+            if (has_external_data(column->data_type))
+            {
+                free(column_value->value.data);
+            }
 
-    time = column_value->value.i;
-    AVRO_RETURN_ERROR(write_size(pos, max, 12))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_HOUR(time)))
-    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_MINUTE(time)))
-    AVRO_RETURN_ERROR(write_char(pos, max, ':'))
-    AVRO_RETURN_ERROR(write_digits(pos, max, 2, TIME_SEC(time)))
-    AVRO_RETURN_ERROR(write_char(pos, max, '.'))
-    return write_digits(pos, max, 3, TIME_MSEC(time));
+            column_value->len = -1;
+            CHECK(value, error)
+            PyList_SET_ITEM(values, j, value);
+        }
+    }
+
+    free_columnar_columns(columns, column_count, count);
+    return 1;
+
+error:
+    free_columnar_columns(columns, column_count, count);
+    return 0;
 }
 
-/* Writing function for timestamp columns. */
-static int write_timestamp_column(uint8_t** pos, uint8_t* max, ColumnValue* column_value)
-{
-    PY_LONG_LONG datetime = column_value->value.l;
+/* Python RecordType.decode_records_columnar method. Decodes one or more
+   Avro-encoded binary records in a buffer into column arrays, without
+   creating a Record object per row. The records must be of the correct
+   record type.
 
-    if (datetime == 0)
-    {
-        datetime = DT_DEFAULT;
-    }
+   Parameters:
+       buffer (buffer)
+           The buffer containing the Avro-encoded binary records.
 
-    return write_long(pos, max, datetime_to_epoch_ms(datetime));
-}
+       ranges (BufferRange or iterable of BufferRange, optional)
+           As for RecordType.decode_records.
 
-/* Column writing function dispatch table. */
-static WriteColumnFunc write_column[CDT_MAX] =
+   Returns:
+       A list containing one (values, typecode, nulls) tuple per column. For
+       numeric, date, datetime, time and timestamp columns, values is a
+       bytearray of native typed values in the format given by typecode (an
+       array module typecode); dates are days since the epoch, datetimes and
+       timestamps milliseconds since the epoch, and times milliseconds since
+       midnight. For other columns, values is a list of Python objects and
+       typecode is None. For nullable columns, nulls is a bytearray with one
+       byte per row (1 if the value is null); otherwise it is None. */
+static PyObject* RecordType_decode_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs)
 {
-    write_bytes_column,      /* CDT_BYTES */
-    write_char_column_small, /* CDT_CHAR1 */
-    write_char_column_small, /* CDT_CHAR2 */
-    write_char_column_small, /* CDT_CHAR4 */
-    write_char_column_small, /* CDT_CHAR8 */
-    write_bytes_column,      /* CDT_CHAR16 */
-    write_bytes_column,      /* CDT_CHAR32 */
-    write_bytes_column,      /* CDT_CHAR64 */
-    write_bytes_column,      /* CDT_CHAR128 */
-    write_bytes_column,      /* CDT_CHAR256 */
-    write_date_column,       /* CDT_DATE */
-    write_datetime_column,   /* CDT_DATETIME */
-    write_double_column,     /* CDT_DOUBLE */
-    write_float_column,      /* CDT_FLOAT */
-    write_int_column,        /* CDT_INT */
-    write_int_column,        /* CDT_INT8 */
-    write_int_column,        /* CDT_INT16 */
-    write_long_column,       /* CDT_LONG */
-    write_bytes_column,      /* CDT_STRING */
-    write_time_column,       /* CDT_TIME */
-    write_timestamp_column   /* CDT_TIMESTAMP */
-};
+    Py_buffer buffer = { NULL };
+    Py_ssize_t* ranges = NULL;
+    ColumnarColumn* columns = NULL;
+    PyObject* result = NULL;
+
+    PyObject* arg_ranges = NULL;
+    static char* keywords[] = { "buffer", "ranges", NULL };
 
-/* Internal function to write a Record object into a buffer in Avro-encoded
-   binary form. See description in header file. */
-AvroErrorCode write_record(uint8_t** pos, uint8_t* max, Record* record)
-{
     Py_ssize_t column_count;
     ColumnDef* column_defs;
-    ColumnValue* column_values;
+    Py_ssize_t count;
+    Py_ssize_t* starts;
+    Py_ssize_t* lengths;
 
     Py_ssize_t i;
+    Py_ssize_t j;
+    AvroErrorCode error = ERR_NONE;
 
-    column_count = Py_SIZE(record);
-    column_defs = &record->type->column_defs;
-    column_values = &record->column_values;
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|O", keywords, &buffer, &arg_ranges), error)
+    ranges = parse_ranges(&buffer, arg_ranges, &count);
+    CHECK(ranges, error)
+    starts = ranges;
+    lengths = &ranges[count];
 
-    for (i = 0; i < column_count; ++i)
+    column_count = Py_SIZE(self);
+    column_defs = &self->column_defs;
+
+    result = create_columnar_result(self, count, &columns);
+    CHECK(result, error)
+
+    Py_BEGIN_ALLOW_THREADS
+
+    for (i = 0; i < count && error == ERR_NONE; ++i)
     {
-        ColumnDef* column_def = &column_defs[i];
-        ColumnValue* column_value = &column_values[i];
+        uint8_t* pos = (uint8_t*)buffer.buf + starts[i];
+        uint8_t* max = pos + lengths[i];
 
-        if (column_def->is_nullable)
+        for (j = 0; j < column_count; ++j)
         {
-            if (column_value->len < 0)
+            ColumnDef* column_def = &column_defs[j];
+            ColumnValue column_value;
+
+            column_value.len = -1;
+
+            if (column_def->is_nullable)
             {
-                AVRO_RETURN_ERROR(write_long(pos, max, 1))
-                continue;
+                PY_LONG_LONG is_null;
+
+                error = read_long(&pos, max, &is_null);
+
+                if (error != ERR_NONE)
+                {
+                    break;
+                }
+
+                if (is_null != 0 && is_null != 1)
+                {
+                    error = ERR_OVERFLOW;
+                    break;
+                }
+
+                if (is_null == 1)
+                {
+                    store_columnar_value(&columns[j], i, &column_value);
+                    continue;
+                }
             }
-            else
+
+            error = read_column[column_def->data_type](&pos, max, &column_value);
+
+            if (error != ERR_NONE)
             {
-                AVRO_RETURN_ERROR(write_long(pos, max, 0))
+                break;
             }
-        }
 
-        AVRO_RETURN_ERROR(write_column[column_def->data_type](pos, max, column_value))
+            store_columnar_value(&columns[j], i, &column_value);
+        }
     }
 
-    return ERR_NONE;
-}
+    Py_END_ALLOW_THREADS
 
-/*----------------------------------------------------------------------------*/
+    CHECK(handle_read_error(error), error)
 
-/* RecordType forwarded methods. */
+    PyMem_Free(ranges);
+    ranges = NULL;
+    CHECK(finish_columnar_result(result, columns, column_count, count), error_finished)
 
-/* Python RecordType.decode_dynamic_records method. Decodes the records in the
-   Avro-encoded binary data returned by a dynamic schema endpoint. The records
-   must be of the correct record type.
+    PyBuffer_Release(&buffer);
+    return result;
+
+error:
+    free_columnar_columns(columns, Py_SIZE(self), count);
+
+error_finished:
+    if (buffer.buf)
+    {
+        PyBuffer_Release(&buffer);
+    }
+
+    PyMem_Free(ranges);
+    Py_XDECREF(result);
+    return NULL;
+}
+
+/* Python RecordType.decode_dynamic_records_columnar method. Decodes the
+   column arrays in the Avro-encoded binary data returned by a dynamic schema
+   endpoint, without creating a Record object per row. The records must be of
+   the correct record type.
 
    Parameters:
        buffer (buffer)
@@ -4339,15 +6468,16 @@ AvroErrorCode write_record(uint8_t** pos, uint8_t* max, Record* record)
            dynamic schema endpoint.
 
        range (BufferRange, optional)
-           Range of bytes within the buffer containing the Avro-encoded binary
-           data. If not specified, the entire buffer is used. If the data does
-           not take up the entire range, any extra data is ignored.
+           As for RecordType.decode_dynamic_records.
 
    Returns:
-       A list of decoded Record objects. */
-static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* args, PyObject* kwargs)
+       A list containing one (values, typecode, nulls) tuple per column, as
+       for RecordType.decode_records_columnar. */
+static PyObject* RecordType_decode_dynamic_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs)
 {
     Py_buffer buffer = { NULL };
+    ColumnValue* values = NULL;
+    ColumnarColumn* columns = NULL;
     PyObject* result = NULL;
 
     PyObject* arg_range = NULL;
@@ -4361,7 +6491,8 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
     uint8_t* max;
     Py_ssize_t block_count = 0;
     Py_ssize_t i;
-    AvroErrorCode error;
+    Py_ssize_t j;
+    AvroErrorCode error = ERR_NONE;
 
     CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|O", keywords, &buffer, &arg_range), error)
 
@@ -4383,59 +6514,39 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
         pos = (uint8_t*)buffer.buf;
         max = pos + buffer.len;
     }
-
     column_count = Py_SIZE(self);
     column_defs = &self->column_defs;
 
     CHECK(handle_read_error(read_size(&pos, max, &block_count)), error)
     count = (block_count >= 0) ? block_count : -block_count;
 
-    /* Create all the Record objects that will be read into first, since this
-       equires holding the GIL. Once created, the GIL can be released for the
-       actual decoding process. */
+    /* The raw values of all columns are read into a single array, one column
+       after another, with count entries per column. Only the first column can
+       increase count (see below), in which case the array is resized before
+       any subsequent column has been read. */
 
-    result = PyList_New(count);
-    CHECK(result, error)
+    values = PyMem_New(ColumnValue, column_count * count > 0 ? column_count * count : 1);
+    CHECK_NONE(values, PyExc_MemoryError, error)
 
-    for (i = 0; i < count; ++i)
+    for (i = 0; i < column_count * count; ++i)
     {
-        PyObject* record = Record_create(self);
-        CHECK(record, error)
-        PyList_SET_ITEM(result, i, record);
+        values[i].len = -1;
     }
 
     Py_BEGIN_ALLOW_THREADS
 
-    /* Dynamic schema responses encode data column-wise as arrays of values,
-       so loop through the columns first. */
-
-    for (i = 0; i < column_count; ++i)
+    for (i = 0; i < column_count && error == ERR_NONE; ++i)
     {
         ColumnDef* column_def = &column_defs[i];
-        Py_ssize_t j = 0;
-
-        /* Read the size of the first block of the column array, unless this
-           is the first column, in which case the size was already read above
-           to determine the number of Records to create. */
+        j = 0;
 
         if (i != 0)
-        {
-            error = read_size(&pos, max, &block_count);
-
-            if (error != ERR_NONE)
-            {
-                Py_BLOCK_THREADS
-                CHECK(handle_read_error(error), error)
-            }
+        {
+            error = read_size(&pos, max, &block_count);
         }
 
-        while (1)
+        while (error == ERR_NONE && block_count != 0)
         {
-            if (block_count == 0)
-            {
-                break;
-            }
-
             if (block_count < 0)
             {
                 PY_LONG_LONG size;
@@ -4444,8 +6555,7 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
 
                 if (error != ERR_NONE)
                 {
-                    Py_BLOCK_THREADS
-                    CHECK(handle_read_error(error), error)
+                    break;
                 }
 
                 block_count = -block_count;
@@ -4455,48 +6565,35 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
             {
                 /* The Avro data is in multiple array blocks, and the number of
                    array items in the current block exceeds the number of
-                   Records created earlier. If this is the first column,
-                   more Records must be created; if this is a subsequent
-                   column, this is an error condition. In either case, the GIL
-                   must be reacquired temporarily. */
+                   values allocated earlier. If this is the first column, the
+                   array must be resized; if this is a subsequent column, this
+                   is an error condition. In either case, the GIL must be
+                   reacquired temporarily. */
 
-                PyObject* temp;
+                ColumnValue* temp;
                 Py_ssize_t k;
 
                 Py_BLOCK_THREADS
 
                 CHECK_OBJECT(i == 0, PyExc_ValueError, format_string("column %zd has too many values", i), error)
 
+                temp = values;
+                PyMem_Resize(temp, ColumnValue, column_count * (j + block_count));
+                CHECK_NONE(temp, PyExc_MemoryError, error)
+                values = temp;
                 count = j + block_count;
-                temp = PyList_New(count);
-                CHECK(temp, error)
-
-                for (k = 0; k < j; ++k)
-                {
-                    PyList_SET_ITEM(temp, k, PyList_GET_ITEM(result, k));
-                    PyList_SET_ITEM(result, k, NULL);
-                }
-
-                Py_DECREF(result);
-                result = temp;
 
-                for (k = j; k < count; ++k)
+                for (k = j; k < column_count * count; ++k)
                 {
-                    PyObject* record = Record_create(self);
-                    CHECK(record, error)
-                    PyList_SET_ITEM(result, k, record);
+                    values[k].len = -1;
                 }
 
                 Py_UNBLOCK_THREADS
             }
 
-            /* Now loop through each row in the column and read the value for
-               the row into the appropriate column in the corresponding
-               Record. */
-
             while (block_count > 0)
             {
-                ColumnValue* column_value = &(&((Record*)PyList_GET_ITEM(result, j))->column_values)[i];
+                ColumnValue* column_value = &values[i * count + j];
 
                 if (column_def->is_nullable)
                 {
@@ -4506,51 +6603,44 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
 
                     if (error != ERR_NONE)
                     {
-                        Py_BLOCK_THREADS
-                        CHECK(handle_read_error(error), error)
+                        break;
+                    }
+
+                    if (is_null != 0 && is_null != 1)
+                    {
+                        error = ERR_OVERFLOW;
+                        break;
                     }
 
                     if (is_null == 1)
                     {
-                        column_value->len = -1;
                         ++j;
                         --block_count;
                         continue;
                     }
-                    else if (is_null != 0)
-                    {
-                        Py_BLOCK_THREADS
-                        CHECK(handle_read_error(ERR_OVERFLOW), error)
-                    }
                 }
 
                 error = read_column[column_def->data_type](&pos, max, column_value);
 
                 if (error != ERR_NONE)
                 {
-                    Py_BLOCK_THREADS
-                    CHECK(handle_read_error(error), error)
+                    column_value->len = -1;
+                    break;
                 }
 
                 ++j;
                 --block_count;
             }
 
-            /* Read the size of the next block of the column array. The size
-               is checked at the top of the loop. */
-
-            error = read_size(&pos, max, &block_count);
-
-            if (error != ERR_NONE)
+            if (error == ERR_NONE)
             {
-                Py_BLOCK_THREADS
-                CHECK(handle_read_error(error), error)
+                error = read_size(&pos, max, &block_count);
             }
         }
 
-        /* Make sure a value was read for every Record. */
+        /* Make sure a value was read for every row. */
 
-        if (j != count)
+        if (error == ERR_NONE && j != count)
         {
             Py_BLOCK_THREADS
             CHECK_OBJECT(0, PyExc_ValueError, format_string("column %zd has too few values", i), error)
@@ -4559,10 +6649,53 @@ static PyObject* RecordType_decode_dynamic_records(RecordType* self, PyObject* a
 
     Py_END_ALLOW_THREADS
 
+    CHECK(handle_read_error(error), error)
+
+    /* Move the raw values into the columnar result. Ownership of any external
+       buffers is transferred to the ColumnarColumn structs. */
+
+    result = create_columnar_result(self, count, &columns);
+    CHECK(result, error)
+
+    Py_BEGIN_ALLOW_THREADS
+
+    for (i = 0; i < column_count; ++i)
+    {
+        for (j = 0; j < count; ++j)
+        {
+            store_columnar_value(&columns[i], j, &values[i * count + j]);
+        }
+    }
+
+    Py_END_ALLOW_THREADS
+
+    PyMem_Free(values);
+    values = NULL;
+    CHECK(finish_columnar_result(result, columns, column_count, count), error)
+
     PyBuffer_Release(&buffer);
     return result;
 
 error:
+    if (values)
+    {
+        for (i = 0; i < column_count; ++i)
+        {
+            if (has_external_data(column_defs[i].data_type))
+            {
+                for (j = 0; j < count; ++j)
+                {
+                    if (values[i * count + j].len >= 0)
+                    {
+                        free(values[i * count + j].value.data);
+                    }
+                }
+            }
+        }
+
+        PyMem_Free(values);
+    }
+
     if (buffer.buf)
     {
         PyBuffer_Release(&buffer);
@@ -4572,146 +6705,313 @@ error:
     return NULL;
 }
 
-/* Python RecordType.decode_records method. Decodes one or more Avro-encoded
-   binary records in a buffer. The records must be of the correct record type.
+/* Internal function to check whether a buffer holds values in the typed value
+   layout used for a data type by the columnar methods (see columnar_typecodes
+   and columnar_item_sizes), in native byte order. Integer data types accept
+   any signed integer format of the correct size. */
+static int is_columnar_buffer(Py_buffer* view, ColumnDataType data_type)
+{
+    static const int one = 1;
+    const char* format = view->format ? view->format : "B";
+    char typecode = columnar_typecodes[data_type];
 
-   Parameters:
-       buffer (buffer)
-           The buffer containing the Avro-encoded binary records.
+    if (view->ndim != 1 || view->itemsize != columnar_item_sizes[data_type])
+    {
+        return 0;
+    }
 
-       ranges (BufferRange or iterable of BufferRange, optional)
-           The ranges of bytes within the buffer corresponding to each
-           Avro-encoded binary record to be decoded. If only one record is
-           present in the buffer, a single BufferRange can be passed. If not
-           specified, it is assumed that the buffer contains a single record to
-           decode.
+    if (*format == '@' || *format == '=')
+    {
+        ++format;
+    }
+    else if (*format == '<' || *format == '>' || *format == '!')
+    {
+        if ((*format == '<') != (*(const char*)&one == 1))
+        {
+            return 0;
+        }
+
+        ++format;
+    }
+
+    if (format[0] == '\0' || format[1] != '\0')
+    {
+        return 0;
+    }
+
+    if (typecode == 'd' || typecode == 'f')
+    {
+        return format[0] == typecode;
+    }
+
+    return strchr("bhilq", format[0]) != NULL;
+}
+
+/* Internal function to set the raw value of a column in a Record from the
+   typed value at row index of a buffer in the columnar layout. Returns 1 if
+   successful, or 0 if an exception occurred. */
+static int set_columnar_value(Record* record, Py_ssize_t index, Py_buffer* view, Py_ssize_t row)
+{
+    ColumnDataType data_type = (&record->type->column_defs)[index].data_type;
+    ColumnValue* column_value = &(&record->column_values)[index];
+    char* item = (char*)view->buf + row * view->itemsize;
+    PY_LONG_LONG value = 0;
+
+    switch (data_type)
+    {
+        case CDT_DOUBLE:
+            memcpy(&column_value->value.d, item, sizeof(double));
+            column_value->len = 0;
+            return 1;
+
+        case CDT_FLOAT:
+            memcpy(&column_value->value.f, item, sizeof(float));
+            column_value->len = 0;
+            return 1;
+
+        default:
+            break;
+    }
+
+    switch (view->itemsize)
+    {
+        case 1: value = *(signed char*)item; break;
+        case 2: { short v; memcpy(&v, item, sizeof(short)); value = v; break; }
+        case 4: { int32_t v; memcpy(&v, item, sizeof(int32_t)); value = v; break; }
+        default: memcpy(&value, item, sizeof(PY_LONG_LONG)); break;
+    }
+
+    switch (data_type)
+    {
+        case CDT_DATE:
+        {
+            PY_LONG_LONG datetime;
+            long date;
+
+            CHECK_STRING(value >= MIN_EPOCH_MS / 86400000 && value <= MAX_EPOCH_MS / 86400000, PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+            datetime = epoch_ms_to_datetime(value * 86400000);
+            encode_date((int)DT_YEAR(datetime), (int)DT_MONTH(datetime), (int)DT_DAY(datetime), &date);
+            column_value->value.i = date;
+            break;
+        }
+
+        case CDT_DATETIME:
+        case CDT_TIMESTAMP:
+            CHECK_STRING(value >= MIN_EPOCH_MS && value <= MAX_EPOCH_MS, PyExc_ValueError, "value out of range, must be between 1/1/1000 and 12/31/2900", error)
+            column_value->value.l = epoch_ms_to_datetime(value);
+            break;
+
+        case CDT_TIME:
+        {
+            long time;
+
+            CHECK_STRING(value >= 0 && value < 86400000, PyExc_ValueError, "value out of range, must be between 00:00:00.000 and 23:59:59.999", error)
+            encode_time((int)(value / 3600000), (int)(value / 60000 % 60), (int)(value / 1000 % 60), (int)(value % 1000), &time);
+            column_value->value.i = time;
+            break;
+        }
+
+        case CDT_LONG:
+            column_value->value.l = value;
+            break;
+
+        default:
+            column_value->value.i = (long)value;
+            break;
+    }
+
+    column_value->len = 0;
+    return 1;
+
+error:
+    return 0;
+}
+
+/* Python RecordType.encode_records_columnar method. Encodes records of this
+   record type given as column arrays into Avro binary form, without creating
+   a Record object per row.
+
+   Parameters:
+       columns (sequence)
+           One entry per column of the record type, in order. For numeric,
+           date, datetime, time and timestamp columns, this may be a
+           contiguous one-dimensional buffer (such as a NumPy array or
+           array.array) of typed values as returned by
+           RecordType.decode_records_columnar; otherwise it must be a sequence
+           of Python values as accepted by Record.
+
+       nulls (sequence, optional)
+           One entry per column, each either None or a buffer containing one
+           byte per row that is nonzero if the value in that row is null.
 
    Returns:
-       A list of decoded Record objects. */
-static PyObject* RecordType_decode_records(RecordType* self, PyObject* args, PyObject* kwargs)
+       A list containing one bytes object (str in Python 2) per row with the
+       Avro-encoded binary record. */
+static PyObject* RecordType_encode_records_columnar(RecordType* self, PyObject* args, PyObject* kwargs)
 {
-    Py_buffer buffer = { NULL };
-    PyObject* ranges_seq = NULL;
-    Py_ssize_t* ranges = NULL;
     PyObject* result = NULL;
+    PyObject* column_seq = NULL;
+    PyObject* null_seq = NULL;
+    Record* record = NULL;
+    Py_buffer* views = NULL;
+    Py_buffer* null_views = NULL;
+    PyObject** values = NULL;
 
-    PyObject* arg_ranges = NULL;
-    static char* keywords[] = { "buffer", "ranges", NULL };
+    PyObject* arg_columns;
+    PyObject* arg_nulls = NULL;
+    static char* keywords[] = { "columns", "nulls", NULL };
 
-    Py_ssize_t count;
-    Py_ssize_t* starts;
-    Py_ssize_t* lengths;
+    Py_ssize_t column_count;
+    ColumnDef* column_defs;
+    Py_ssize_t count = -1;
 
     Py_ssize_t i;
+    Py_ssize_t j;
 
-    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "s*|O", keywords, &buffer, &arg_ranges), error)
+    CHECK(PyArg_ParseTupleAndKeywords(args, kwargs, "O|O", keywords, &arg_columns, &arg_nulls), error)
+
+    column_count = Py_SIZE(self);
+    column_defs = &self->column_defs;
 
-    if (arg_ranges)
+    column_seq = PySequence_Fast(arg_columns, "columns must be iterable");
+    CHECK(column_seq, error)
+    CHECK_OBJECT(PySequence_Fast_GET_SIZE(column_seq) == column_count, PyExc_ValueError, format_string("columns must contain %zd items", column_count), error)
+
+    if (arg_nulls && arg_nulls != Py_None)
+    {
+        null_seq = PySequence_Fast(arg_nulls, "nulls must be iterable");
+        CHECK(null_seq, error)
+        CHECK_OBJECT(PySequence_Fast_GET_SIZE(null_seq) == column_count, PyExc_ValueError, format_string("nulls must contain %zd items", column_count), error)
+    }
+
+    views = PyMem_New(Py_buffer, column_count > 0 ? column_count : 1);
+    CHECK_NONE(views, PyExc_MemoryError, error)
+    null_views = PyMem_New(Py_buffer, column_count > 0 ? column_count : 1);
+    CHECK_NONE(null_views, PyExc_MemoryError, error)
+    values = PyMem_New(PyObject*, column_count > 0 ? column_count : 1);
+    CHECK_NONE(values, PyExc_MemoryError, error)
+
+    for (i = 0; i < column_count; ++i)
     {
-        if (BufferRange_check(arg_ranges))
+        views[i].obj = NULL;
+        null_views[i].obj = NULL;
+        values[i] = NULL;
+    }
+
+    /* Get a typed buffer (for fixed-width data types given as buffers) or a
+       fast sequence of Python values for each column, and a buffer of null
+       flags for each column that has them. */
+
+    for (i = 0; i < column_count; ++i)
+    {
+        ColumnDef* column_def = &column_defs[i];
+        PyObject* column = PySequence_Fast_GET_ITEM(column_seq, i);
+        Py_ssize_t column_size;
+
+        if (columnar_typecodes[column_def->data_type] && PyObject_CheckBuffer(column))
         {
-            Py_ssize_t start;
-            Py_ssize_t length;
-
-            start = ((BufferRange*)arg_ranges)->start;
-            CHECK_STRING(start >= 0 && start <= buffer.len, PyExc_ValueError, "start index out of range", error)
-            length = ((BufferRange*)arg_ranges)->length;
-            CHECK_STRING(length >= 0 && start + length <= buffer.len, PyExc_ValueError, "length out of range", error)
-            count = 1;
-            ranges = PyMem_New(Py_ssize_t, 2);
-            CHECK_NONE(ranges, PyExc_MemoryError, error)
-            starts = ranges;
-            *starts = start;
-            lengths = &ranges[1];
-            *lengths = length;
+            CHECK(PyObject_GetBuffer(column, &views[i], PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0, error)
+            CHECK_OBJECT(is_columnar_buffer(&views[i], column_def->data_type), PyExc_TypeError, format_string("column %zd buffer must contain %c values", i, columnar_typecodes[column_def->data_type]), error)
+            column_size = views[i].shape[0];
         }
         else
         {
-            ranges_seq = PySequence_Fast(arg_ranges, "ranges must be BufferRange or iterable");
-            CHECK(ranges_seq, error)
-            count = PySequence_Fast_GET_SIZE(ranges_seq);
-            ranges = PyMem_New(Py_ssize_t, count * 2);
-            CHECK_NONE(ranges, PyExc_MemoryError, error)
-            starts = ranges;
-            lengths = &ranges[count];
-
-            for (i = 0; i < count; ++i)
-            {
-                PyObject* range;
-                Py_ssize_t start;
-                Py_ssize_t length;
-
-                range = PySequence_Fast_GET_ITEM(ranges_seq, i);
-                CHECK_STRING(BufferRange_check(range), PyExc_TypeError, "range must be BufferRange", error)
-                start = ((BufferRange*)range)->start;
-                CHECK_STRING(start >= 0 && start <= buffer.len, PyExc_ValueError, "start index out of range", error)
-                length = ((BufferRange*)range)->length;
-                CHECK_STRING(length >= 0 && start + length <= buffer.len, PyExc_ValueError, "length out of range", error)
-                starts[i] = start;
-                lengths[i] = length;
-            }
+            values[i] = PySequence_Fast(column, "column must be buffer or iterable");
+            CHECK(values[i], error)
+            column_size = PySequence_Fast_GET_SIZE(values[i]);
+        }
+
+        if (count == -1)
+        {
+            count = column_size;
+        }
 
-            Py_CLEAR(ranges_seq);
+        CHECK_OBJECT(column_size == count, PyExc_ValueError, format_string("column %zd has %zd values, expected %zd", i, column_size, count), error)
+
+        if (null_seq && PySequence_Fast_GET_ITEM(null_seq, i) != Py_None)
+        {
+            CHECK(PyObject_GetBuffer(PySequence_Fast_GET_ITEM(null_seq, i), &null_views[i], PyBUF_SIMPLE) == 0, error)
+            CHECK_OBJECT(null_views[i].len == count, PyExc_ValueError, format_string("column %zd nulls has %zd values, expected %zd", i, null_views[i].len, count), error)
         }
     }
-    else
+
+    if (count == -1)
     {
-        count = 1;
-        ranges = PyMem_New(Py_ssize_t, 2);
-        CHECK_NONE(ranges, PyExc_MemoryError, error)
-        starts = ranges;
-        *starts = 0;
-        lengths = &ranges[1];
-        *lengths = buffer.len;
+        count = 0;
     }
 
-    /* Create all the Record objects that will be read into first, since this
-       requires holding the GIL. Once created, the GIL can be released for the
-       actual decoding process. */
+    /* Encode each row by setting the values of a single scratch Record and
+       encoding it. */
 
+    record = (Record*)Record_create(self);
+    CHECK(record, error)
     result = PyList_New(count);
     CHECK(result, error)
 
-    for (i = 0; i < count; ++i)
+    for (j = 0; j < count; ++j)
     {
-        PyObject* record = Record_create(self);
-        CHECK(record, error)
-        PyList_SET_ITEM(result, i, record);
-    }
-
-    Py_BEGIN_ALLOW_THREADS
+        PyObject* encoded;
 
-    /* Read each record. */
-
-    for (i = 0; i < count; ++i)
-    {
-        uint8_t* pos = (uint8_t*)buffer.buf + starts[i];
-        uint8_t* max = pos + lengths[i];
-        AvroErrorCode error = read_record(&pos, max, (Record*)PyList_GET_ITEM(result, i));
+        record->size = 0;
 
-        if (error != ERR_NONE)
+        for (i = 0; i < column_count; ++i)
         {
-            Py_BLOCK_THREADS
-            CHECK(handle_read_error(error), error)
+            if (null_views[i].obj && ((char*)null_views[i].buf)[j])
+            {
+                CHECK(_Record_set_value(record, i, Py_None) == 0, error)
+            }
+            else if (views[i].obj)
+            {
+                if (!set_columnar_value(record, i, &views[i], j))
+                {
+                    prefix_exception(((RecordColumn*)PyList_GET_ITEM(self->columns, i))->name);
+                    goto error;
+                }
+            }
+            else
+            {
+                CHECK(_Record_set_value(record, i, PySequence_Fast_GET_ITEM(values[i], j)) == 0, error)
+            }
         }
-    }
 
-    Py_END_ALLOW_THREADS
+        encoded = Record_encode(record, NULL);
+        CHECK(encoded, error)
+        PyList_SET_ITEM(result, j, encoded);
+    }
 
-    PyBuffer_Release(&buffer);
-    PyMem_Free(ranges);
-    return result;
+    Py_DECREF(record);
+    record = NULL;
+    goto cleanup;
 
 error:
-    if (buffer.buf)
+    Py_CLEAR(result);
+    Py_XDECREF(record);
+
+cleanup:
+    if (views)
     {
-        PyBuffer_Release(&buffer);
+        for (i = 0; i < column_count; ++i)
+        {
+            if (views[i].obj)
+            {
+                PyBuffer_Release(&views[i]);
+            }
+
+            if (null_views[i].obj)
+            {
+                PyBuffer_Release(&null_views[i]);
+            }
+
+            Py_XDECREF(values[i]);
+        }
     }
 
-    Py_XDECREF(ranges_seq);
-    PyMem_Free(ranges);
-    Py_XDECREF(result);
-    return NULL;
+    PyMem_Free(views);
+    PyMem_Free(null_views);
+    PyMem_Free(values);
+    Py_XDECREF(column_seq);
+    Py_XDECREF(null_seq);
+    return result;
 }
 
 /*----------------------------------------------------------------------------*/
@@ -4732,11 +7032,13 @@ static char* column_data_type_names[CDT_MAX] =
     "char256",
     "date",
     "datetime",
+    "decimal",
     "double",
     "float",
     "int",
     "int8",
     "int16",
+    "ipv4",
     "long",
     "string",
     "time",
@@ -30,11 +30,13 @@ typedef enum
     CDT_CHAR256,   /* str (Python 3) or unicode (Python 2) */
     CDT_DATE,      /* datetime.date */
     CDT_DATETIME,  /* datetime.datetime */
+    CDT_DECIMAL,   /* decimal.Decimal */
     CDT_DOUBLE,    /* float */
     CDT_FLOAT,     /* float */
     CDT_INT,       /* int */
     CDT_INT8,      /* int */
     CDT_INT16,     /* int */
+    CDT_IPV4,      /* str (Python 3) or unicode (Python 2) */
     CDT_LONG,      /* int (Python 3) or long (Python 2) */
     CDT_STRING,    /* str (Python 3) or unicode (Python 2) */
     CDT_TIME,      /* datetime.time */
@@ -90,8 +92,10 @@ typedef union
        Kinetica date and time formats are used. */
     long i;
 
-    /* Used for datetime, long and timestamp columns. For datetime, Kinetica
-       datetime format is used. */
+    /* Used for datetime, decimal, ipv4, long and timestamp columns. For
+       datetime, Kinetica datetime format is used. For decimal, the value is
+       scaled by 10000 (four fractional digits). For ipv4, the address is
+       stored as an unsigned 32-bit value. */
     PY_LONG_LONG l;
 }
 ColumnValueBase;
@@ -74,6 +74,7 @@ c_avro_module = Extension( "gpudb.protocol",
                                       "protocol/bufferrange.c",
                                       "protocol/common.c",
                                       "protocol/dt.c",
+                                      "protocol/murmurhash3.c",
                                       "protocol/protocol.c",
                                       "protocol/record.c",
                                       "protocol/schema.c"] )
@@ -0,0 +1,123 @@
+"""Fixtures shared by the tests."""
+import threading
+import time
+
+try:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+except ImportError:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+
+import pytest
+
+
+class FakeServer( ThreadingMixIn, HTTPServer ):
+    """Keep-alive HTTP server that keeps the paths, headers and bodies
+    (which may be sent with chunked transfer encoding) of the requests it
+    receives.  The requests numbered in *drop_requests* get their connection
+    dropped after being read; the others are answered after *delay* seconds
+    with *response*, or else with "ok" sent in *num_pieces* pieces
+    *piece_delay* seconds apart.  A callable *response* is called with the
+    path and body of each request, and returns the response to send.
+    """
+    daemon_threads = True
+
+    def __init__( self, drop_requests = (), delay = 0,
+                  num_pieces = 1, piece_delay = 0, response = None ):
+        HTTPServer.__init__( self, ( "127.0.0.1", 0 ), FakeHandler )
+        self.drop_requests = set( drop_requests )
+        self.delay         = delay
+        self.num_pieces    = num_pieces
+        self.piece_delay   = piece_delay
+        self.response      = response
+        self.paths         = []
+        self.headers       = []
+        self.bodies        = []
+        self.num_active    = 0
+        self.max_active    = 0
+        self.lock          = threading.Lock()
+        self.thread        = threading.Thread( target = self.serve_forever )
+        self.thread.daemon = True
+        self.thread.start()
+
+    @property
+    def port( self ):
+        return self.server_address[ 1 ]
+
+    def stop( self ):
+        self.shutdown()
+        self.server_close()
+# end class FakeServer
+
+
+class FakeHandler( BaseHTTPRequestHandler ):
+    protocol_version = "HTTP/1.1"
+
+    def log_message( self, *args ):
+        pass
+
+    def read_body( self ):
+        if (self.headers.get( "Transfer-Encoding" ) != "chunked"):
+            return self.rfile.read( int( self.headers[ "Content-Length" ] ) )
+
+        chunks = []
+        while True:
+            size = int( self.rfile.readline(), 16 )
+            chunk = self.rfile.read( size + 2 ) # along with the ending CRLF
+            if not size:
+                return b"".join( chunks )
+            chunks.append( chunk[ : size ] )
+    # end read_body
+
+    def do_POST( self ):
+        body = self.read_body()
+        server = self.server
+        with server.lock:
+            server.paths.append( self.path )
+            server.headers.append( self.headers )
+            server.bodies.append( body )
+            is_dropped = (len( server.paths ) in server.drop_requests)
+            server.num_active += 1
+            server.max_active = max( server.max_active, server.num_active )
+
+        time.sleep( server.delay )
+        with server.lock:
+            server.num_active -= 1
+
+        if is_dropped:
+            self.close_connection = True
+            return
+
+        pieces = [ b"ok" ] * server.num_pieces
+        if callable( server.response ):
+            pieces = [ server.response( self.path, body ) ]
+        elif server.response is not None:
+            pieces = [ server.response ]
+
+        self.send_response( 200 )
+        self.send_header( "Content-Length", str( sum( len( piece ) for piece in pieces ) ) )
+        self.end_headers()
+        try:
+            for piece in pieces:
+                self.wfile.write( piece )
+                self.wfile.flush()
+                time.sleep( server.piece_delay )
+        except (IOError, OSError):
+            self.close_connection = True
+# end class FakeHandler
+
+
+@pytest.fixture
+def make_server():
+    """Returns a function starting a :class:`FakeServer` with the given
+    keyword arguments; the servers are stopped after the test."""
+    servers = []
+    def make( **kwargs ):
+        server = FakeServer( **kwargs )
+        servers.append( server )
+        return server
+    yield make
+    for server in servers:
+        server.stop()
+# end make_server
@@ -0,0 +1,98 @@
+"""Tests for the asyncio client, against a fake server."""
+import asyncio
+import threading
+import time
+
+from gpudb import Record, RecordColumn, RecordType
+from gpudb.gpudb import GPUdb, _Util
+from gpudb.gpudb_async import AsyncGPUdb
+from gpudb.protocol import Schema
+
+
+RECORD_TYPE = RecordType( "async_test", [ RecordColumn( "i", "int" ),
+                                          RecordColumn( "s", "string" ) ] )
+
+RESPONSE_SCHEMA = Schema( "record", [ ( "status", "string" ), ( "message", "string" ),
+                                      ( "data_type", "string" ), ( "data", "bytes" ),
+                                      ( "data_str", "string" ) ] )
+
+
+def get_insert_schemas():
+    return GPUdb( host = "127.0.0.1", port = 1,
+                  no_init_db_contact = True ).gpudb_schemas[ "/insert/records" ]
+# end get_insert_schemas
+
+
+def make_insert_server( make_server, **kwargs ):
+    """Starts a server answering /insert/records requests."""
+    data = get_insert_schemas()[ "RSP_SCHEMA" ].encode( { "record_ids": [],
+                                                          "count_inserted": 2,
+                                                          "count_updated": 0 } )
+    response = RESPONSE_SCHEMA.encode( { "status": "OK", "message": "",
+                                         "data_type": "insert_records_response",
+                                         "data": data, "data_str": "" } )
+    return make_server( response = response, **kwargs )
+# end make_insert_server
+
+
+def run( coroutine ):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete( coroutine )
+    finally:
+        loop.close()
+# end run
+
+
+def make_records( rows ):
+    records = []
+    for row in rows:
+        record = Record( RECORD_TYPE )
+        for ( name, value ) in row.items():
+            record[ name ] = value
+        records.append( record )
+    return records
+# end make_records
+
+
+def test_insert_records_round_trip( make_server, monkeypatch ):
+    server = make_insert_server( make_server )
+    db = AsyncGPUdb( host = "127.0.0.1", port = server.port )
+
+    # The rows are converted to records off the event loop
+    convert = _Util.convert_binary_data_to_cext_records
+    convert_threads = []
+    def convert_and_record_thread( *args ):
+        convert_threads.append( threading.current_thread() )
+        return convert( *args )
+    monkeypatch.setattr( _Util, "convert_binary_data_to_cext_records",
+                         staticmethod( convert_and_record_thread ) )
+
+    rows = [ { "i": 1, "s": "a" }, { "i": 2, "s": "b" } ]
+    response = run( db.insert_records( "async_test", rows, record_type = RECORD_TYPE ) )
+
+    assert response.count_inserted == 2
+    assert response.status_info[ "status" ] == "OK"
+    assert server.paths == [ "/insert/records" ]
+    request = get_insert_schemas()[ "REQ_SCHEMA" ].decode( server.bodies[ 0 ] )
+    assert request[ "table_name" ] == "async_test"
+    assert request[ "list" ] == [ record.encode() for record in make_records( rows ) ]
+    assert convert_threads and (threading.main_thread() not in convert_threads)
+
+
+def test_concurrent_requests_share_the_event_loop( make_server ):
+    server = make_insert_server( make_server, delay = 0.2 )
+    db = AsyncGPUdb( host = "127.0.0.1", port = server.port )
+    records = make_records( [ { "i": 1, "s": "a" } ] )
+
+    async def insert_concurrently():
+        return await asyncio.gather( *[ db.insert_records( "async_test", records )
+                                        for _ in range( 3 ) ] )
+    # end insert_concurrently
+
+    start = time.time()
+    responses = run( insert_concurrently() )
+
+    assert [ response.count_inserted for response in responses ] == [ 2, 2, 2 ]
+    assert server.max_active == 3
+    assert (time.time() - start) < 0.5
@@ -0,0 +1,73 @@
+"""Tests for releasing the resources held by a client."""
+import threading
+
+from gpudb.gpudb import GPUdb
+
+
+def make_db( servers, **kwargs ):
+    return GPUdb( host = [ "127.0.0.1" ] * len( servers ),
+                  port = [ server.port for server in servers ],
+                  no_init_db_contact = True, **kwargs )
+# end make_db
+
+
+def is_alive( threads ):
+    return [ thread for thread in threads if thread.is_alive() ]
+# end is_alive
+
+
+def test_replaced_decode_pool_is_joined( make_server ):
+    db = make_db( [ make_server() ] )
+
+    small_pool = db._GPUdb__get_decode_thread_pool( 2 )
+    threads = list( small_pool._pool )
+    assert db._GPUdb__get_decode_thread_pool( 4 ) is not small_pool
+    assert is_alive( threads ) == []
+
+    # Smaller requests keep the larger pool
+    assert db._GPUdb__get_decode_thread_pool( 3 ) is db._decode_thread_pool
+    db.close()
+
+
+def test_close_releases_threads_and_connections( make_server ):
+    # The first host is slow for the read to be hedged
+    servers = [ make_server( delay = 0.5 ), make_server() ]
+    db = make_db( servers, health_check_interval = None )
+
+    decode_threads = list( db._GPUdb__get_decode_thread_pool( 2 )._pool )
+    assert db._GPUdb__post_hedged( [ 0, 1 ], {}, b"body", "/show/table",
+                                   0.05, None )[ 0 ] == b"ok"
+    hedge_threads = list( db._hedge_scheduler._pool._pool )
+
+    db.close()
+
+    assert is_alive( decode_threads + hedge_threads ) == []
+    for conn_token in db._conn_tokens:
+        for pool in conn_token._pools.values():
+            assert pool._num_open == 0
+
+    # Still usable afterwards
+    assert db._GPUdb__post_hedged( [ 0, 1 ], {}, b"body", "/show/table",
+                                   1, None )[ 0 ] == b"ok"
+    db.close()
+
+
+def test_close_stops_health_checks( make_server ):
+    servers = [ make_server(), make_server() ]
+    other_threads = set( threading.enumerate() )
+    db = make_db( servers, health_check_interval = 0.01 )
+    health_threads = [ thread for thread in threading.enumerate()
+                       if ( (thread.name == "GPUdbHealthCheck")
+                            and (thread not in other_threads) ) ]
+    assert health_threads
+
+    db.close()
+    for thread in health_threads:
+        thread.join( 1 )
+    assert is_alive( health_threads ) == []
+
+
+def test_context_manager_closes( make_server ):
+    with make_db( [ make_server() ] ) as db:
+        threads = list( db._GPUdb__get_decode_thread_pool( 2 )._pool )
+    assert is_alive( threads ) == []
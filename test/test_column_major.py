@@ -0,0 +1,85 @@
+"""Tests for decoding binary records into column-major data."""
+import collections
+import datetime
+
+from gpudb import Record, RecordColumn, RecordType
+from gpudb.gpudb import _Util
+from gpudb.protocol import BufferRange
+
+
+RECORD_TYPE = RecordType( "column_major",
+                          [ RecordColumn( "i", "int" ),
+                            RecordColumn( "d", "date" ),
+                            RecordColumn( "s", "string", [ "nullable" ] ) ] )
+
+
+def encode( rows ):
+    encoded_records = []
+    for (i, d, s) in rows:
+        record = Record( RECORD_TYPE )
+        record[ "i" ] = i
+        record[ "d" ] = d
+        record[ "s" ] = s
+        encoded_records.append( record.encode() )
+    # end loop
+
+    ranges = []
+    start = 0
+    for encoded_record in encoded_records:
+        ranges.append( BufferRange( start, len( encoded_record ) ) )
+        start += len( encoded_record )
+    return ( b"".join( encoded_records ), ranges )
+# end encode
+
+
+def decode( rows, **kwargs ):
+    ( data, ranges ) = encode( rows )
+    columns = RECORD_TYPE.decode_records_columnar( data, ranges )
+    return _Util.convert_cext_columns_to_column_major( RECORD_TYPE, columns, **kwargs )
+# end decode
+
+
+def test_lists_by_default():
+    columns = decode( [ ( 1, "2019-03-04", "a" ), ( 2, "2019-03-05", None ) ] )
+    assert columns == collections.OrderedDict( [ ( "i", [ 1, 2 ] ),
+                                                 ( "d", [ "2019-03-04", "2019-03-05" ] ),
+                                                 ( "s", [ "a", None ] ) ] )
+
+
+def test_no_records_as_lists_is_an_empty_list():
+    assert decode( [] ) == []
+
+
+def get_records( rows, monkeypatch, **kwargs ):
+    """Calls get_records_and_decode on a client whose server returns the
+    given rows."""
+    # The columns must not be NumPy arrays unless asked for, NumPy or not
+    import gpudb.gpudb
+    monkeypatch.setattr( gpudb.gpudb, "have_numpy", True )
+
+    ( data, ranges ) = encode( rows )
+    db = gpudb.gpudb.GPUdb( host = "127.0.0.1", port = 1, no_init_db_contact = True )
+    db._GPUdb__post_then_get_cext_raw = lambda *args: (
+        { "status_info": { "status": "OK" }, "type_name": "column_major",
+          "records_binary": ranges, "records_json": [] }, data )
+
+    return db.get_records_and_decode( "column_major", record_type = RECORD_TYPE,
+                                      get_column_major = True, **kwargs ).records
+# end get_records
+
+
+def test_get_records_returns_lists_by_default( monkeypatch ):
+    columns = get_records( [ ( 1, "2019-03-04", None ) ], monkeypatch )
+    assert columns == collections.OrderedDict( [ ( "i", [ 1 ] ),
+                                                 ( "d", [ "2019-03-04" ] ),
+                                                 ( "s", [ None ] ) ] )
+
+
+def test_get_records_without_records_returns_an_empty_list( monkeypatch ):
+    assert get_records( [], monkeypatch ) == []
+
+
+def test_get_records_keeps_python_objects_when_asked( monkeypatch ):
+    columns = get_records( [ ( 1, "2019-03-04", None ) ], monkeypatch,
+                           force_primitive_return_types = False )
+    assert columns[ "d" ] == [ datetime.date( 2019, 3, 4 ) ]
@@ -0,0 +1,180 @@
+"""Tests for inserting records given as column-major data."""
+import pytest
+
+from gpudb import Record, RecordColumn, RecordType
+from gpudb.gpudb import GPUdb, GPUdbTable
+from gpudb.protocol import Schema
+
+
+RECORD_TYPE = RecordType( "columnar", [ RecordColumn( "i", "int" ),
+                                        RecordColumn( "s", "string" ) ] )
+
+RESPONSE_SCHEMA = Schema( "record", [ ( "status", "string" ), ( "message", "string" ),
+                                      ( "data_type", "string" ), ( "data", "bytes" ),
+                                      ( "data_str", "string" ) ] )
+
+
+def make_db( server = None ):
+    return GPUdb( host = "127.0.0.1", port = server.port if server else 1,
+                  no_init_db_contact = True )
+# end make_db
+
+
+def make_insert_server( make_server ):
+    """Starts a server answering /insert/records requests."""
+    schemas = make_db().gpudb_schemas[ "/insert/records" ]
+    data = schemas[ "RSP_SCHEMA" ].encode( { "record_ids": [], "count_inserted": 1,
+                                             "count_updated": 0 } )
+    response = RESPONSE_SCHEMA.encode( { "status": "OK", "message": "",
+                                         "data_type": "insert_records_response",
+                                         "data": data, "data_str": "" } )
+    return make_server( response = response )
+# end make_insert_server
+
+
+def get_inserted_list( server, index = 0 ):
+    """Returns the encoded records of the given /insert/records request."""
+    schemas = make_db().gpudb_schemas[ "/insert/records" ]
+    return schemas[ "REQ_SCHEMA" ].decode( server.bodies[ index ] )[ "list" ]
+# end get_inserted_list
+
+
+def make_records( record_type, rows ):
+    records = []
+    for row in rows:
+        record = Record( record_type )
+        for ( name, value ) in row.items():
+            record[ name ] = value
+        records.append( record )
+    return records
+# end make_records
+
+
+class FakeIngestor( object ):
+    """Stands in for the multi-head ingestor of a table, recording how many
+    requests the server had got when it was flushed."""
+
+    def __init__( self, server ):
+        self.server  = server
+        self.flushes = []
+
+    def flush( self ):
+        self.flushes.append( len( self.server.paths ) )
+# end class FakeIngestor
+
+
+def test_table_inserts_columns_through_the_head_node_after_flushing( make_server ):
+    server = make_insert_server( make_server )
+
+    table = GPUdbTable.__new__( GPUdbTable )
+    table.name        = "columnar"
+    table.db          = make_db( server )
+    table.record_type = RECORD_TYPE
+    table._multihead_ingestor = FakeIngestor( server )
+    table._flush_multi_head_ingest_per_insertion = True
+
+    table.insert_records_columnar( { "i": [ 1, 2, 3 ], "s": [ "a", "b", "c" ] } )
+
+    assert table._multihead_ingestor.flushes == [ 0 ]
+    assert server.paths == [ "/insert/records" ]
+    rows = [ { "i": 1, "s": "a" }, { "i": 2, "s": "b" }, { "i": 3, "s": "c" } ]
+    assert get_inserted_list( server ) == [ record.encode() for record
+                                            in make_records( RECORD_TYPE, rows ) ]
+
+
+NULLABLE_TYPE = RecordType( "columnar_nullable",
+                            [ RecordColumn( "i",  "int",    [ "nullable" ] ),
+                              RecordColumn( "l",  "long" ),
+                              RecordColumn( "x",  "double", [ "nullable" ] ),
+                              RecordColumn( "s",  "string", [ "nullable" ] ),
+                              RecordColumn( "d",  "date",   [ "nullable" ] ),
+                              RecordColumn( "dt", "datetime" ),
+                              RecordColumn( "t",  "time",   [ "nullable" ] ) ] )
+
+NULLABLE_ROWS = [ { "i": 1,    "l": -5, "x": 1.5,  "s": "a",  "d": "2019-03-04",
+                    "dt": "2019-03-04 05:06:07.123", "t": "05:06:07.123" },
+                  { "i": None, "l": 0,  "x": None, "s": None, "d": None,
+                    "dt": "1970-01-01 00:00:00.000", "t": None },
+                  { "i": -7,   "l": 2 ** 40, "x": -2.0, "s": "", "d": "1969-12-31",
+                    "dt": "2900-12-31 23:59:59.999", "t": "23:59:59.999" } ]
+
+
+def get_columns( rows ):
+    return dict( ( name, [ row[ name ] for row in rows ] ) for name in rows[ 0 ] )
+# end get_columns
+
+
+def insert_both_ways( make_server, data, null_masks = None, rows = NULLABLE_ROWS ):
+    """Inserts the given columns, and the given rows as records; returns the
+    encoded records of both requests."""
+    server = make_insert_server( make_server )
+    db = make_db( server )
+
+    db.insert_records_columnar( "columnar_nullable", data, null_masks,
+                                record_type = NULLABLE_TYPE )
+    db.insert_records( "columnar_nullable", make_records( NULLABLE_TYPE, rows ) )
+
+    assert server.paths == [ "/insert/records" ] * 2
+    return ( get_inserted_list( server, 0 ), get_inserted_list( server, 1 ) )
+# end insert_both_ways
+
+
+def test_columns_are_encoded_as_records_are( make_server ):
+    ( columnar, records ) = insert_both_ways( make_server, get_columns( NULLABLE_ROWS ) )
+    assert columnar == records
+
+
+def test_null_masks_override_the_values( make_server ):
+    # The values given in the masked rows are ignored
+    data = get_columns( NULLABLE_ROWS )
+    data[ "i" ] = [ 1, 0, -7 ]
+    data[ "x" ] = [ 1.5, 0.0, -2.0 ]
+    data[ "s" ] = [ "a", "ignored", "" ]
+    data[ "d" ] = [ "2019-03-04", "2019-01-01", "1969-12-31" ]
+    null_masks = dict( ( name, [ False, True, False ] ) for name in [ "i", "x", "s", "d", "t" ] )
+
+    ( columnar, records ) = insert_both_ways( make_server, data, null_masks )
+    assert columnar == records
+
+
+def test_numpy_columns_are_encoded_as_records_are( make_server ):
+    numpy = pytest.importorskip( "numpy" )
+
+    data = { "i":  numpy.ma.masked_array( [ 1, 0, -7 ], mask = [ False, True, False ],
+                                          dtype = numpy.int32 ),
+             "l":  numpy.array( [ -5, 0, 2 ** 40 ], dtype = numpy.int64 ),
+             "x":  numpy.ma.masked_array( [ 1.5, 0.0, -2.0 ], mask = [ False, True, False ] ),
+             "s":  [ "a", None, "" ],
+             "d":  numpy.array( [ "2019-03-04", "NaT", "1969-12-31" ], dtype = "datetime64[D]" ),
+             "dt": numpy.array( [ "2019-03-04T05:06:07.123", "1970-01-01T00:00:00.000",
+                                  "2900-12-31T23:59:59.999" ], dtype = "datetime64[ms]" ),
+             "t":  numpy.array( [ 5 * 3600000 + 6 * 60000 + 7123, 0,
+                                  24 * 3600000 - 1 ], dtype = "timedelta64[ms]" ) }
+    null_masks = { "d": [ False, True, False ], "t": numpy.array( [ False, True, False ] ) }
+
+    ( columnar, records ) = insert_both_ways( make_server, data, null_masks )
+    assert columnar == records
+
+
+def test_numpy_datetimes_are_converted_to_the_column_unit( make_server ):
+    numpy = pytest.importorskip( "numpy" )
+
+    # Datetimes of a finer unit than the column's are truncated, and time
+    # deltas of a coarser unit are scaled
+    data = get_columns( NULLABLE_ROWS )
+    data[ "d" ]  = numpy.array( [ "2019-03-04T12:00", "NaT", "1969-12-31T23:59" ],
+                                dtype = "datetime64[m]" )
+    data[ "dt" ] = numpy.array( [ "2019-03-04T05:06:07.123456", "1970-01-01T00:00:00",
+                                  "2900-12-31T23:59:59.999999" ], dtype = "datetime64[us]" )
+    data[ "t" ]  = numpy.ma.masked_array( numpy.array( [ 5 * 3600 + 6 * 60 + 7, 0,
+                                                         23 * 3600 + 59 * 60 + 59 ],
+                                                       dtype = "timedelta64[s]" ),
+                                          mask = [ False, True, False ] )
+    null_masks = { "d": [ False, True, False ] }
+    rows = [ dict( row ) for row in NULLABLE_ROWS ]
+    rows[ 0 ][ "t" ] = "05:06:07"
+    rows[ 2 ][ "t" ] = "23:59:59"
+    rows[ 2 ][ "dt" ] = "2900-12-31 23:59:59.999"
+
+    ( columnar, records ) = insert_both_ways( make_server, data, null_masks, rows )
+    assert columnar == records
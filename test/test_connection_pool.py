@@ -0,0 +1,112 @@
+"""Tests for the pooled keep-alive connections used to POST to the server."""
+import socket
+import threading
+
+import pytest
+
+from gpudb.gpudb import GPUdb, GPUdbConnectionException, _GPUdbUnsentRequestException
+
+
+def post( server, endpoint, max_connections_per_host = 10 ):
+    db = GPUdb( host = "127.0.0.1", port = server.port,
+                no_init_db_contact = True,
+                max_connections_per_host = max_connections_per_host )
+    return db, lambda: db._GPUdb__post_and_get( db._conn_tokens[ 0 ],
+                                                server.port,
+                                                {}, b"body", endpoint, None )
+# end post
+
+
+def test_reuses_connections( make_server ):
+    server = make_server()
+    ( db, send ) = post( server, "/show/table" )
+    for _ in range( 3 ):
+        assert send()[ 0 ] == b"ok"
+
+    pool = db._conn_tokens[ 0 ].get_connection_pool( server.port, 10, 60 )
+    assert pool._num_open == 1
+
+
+def test_read_only_request_is_resent_when_dropped( make_server ):
+    server = make_server( drop_requests = [ 2 ] )
+    ( db, send ) = post( server, "/show/table" )
+    send()
+    assert send()[ 0 ] == b"ok"
+    assert server.paths == [ "/show/table" ] * 3
+
+
+def test_write_request_is_not_resent_when_dropped( make_server ):
+    server = make_server( drop_requests = [ 2 ] )
+    ( db, send ) = post( server, "/insert/records" )
+    send()
+    with pytest.raises( GPUdbConnectionException ):
+        send()
+    assert server.paths == [ "/insert/records" ] * 2
+
+    # The dropped connection no longer counts against the limit
+    assert send()[ 0 ] == b"ok"
+
+
+def test_idle_connection_closed_by_server_is_not_reused( make_server ):
+    server = make_server()
+    ( db, send ) = post( server, "/insert/records" )
+    send()
+
+    pool = db._conn_tokens[ 0 ].get_connection_pool( server.port, 10, 60 )
+    ( conn, last_used ) = pool._idle[ 0 ]
+    conn.sock.shutdown( 0 ) # looks the same as the server closing it
+
+    assert send()[ 0 ] == b"ok"
+    assert server.paths == [ "/insert/records" ] * 2
+
+
+def test_connections_per_host_are_limited( make_server ):
+    server = make_server( delay = 0.2 )
+    ( db, send ) = post( server, "/show/table", max_connections_per_host = 2 )
+
+    threads = [ threading.Thread( target = send ) for _ in range( 6 ) ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len( server.paths ) == 6
+    assert server.max_active == 2
+
+
+def get_closed_port():
+    """Returns a port nothing listens to."""
+    sock = socket.socket()
+    sock.bind( ( "127.0.0.1", 0 ) )
+    port = sock.getsockname()[ 1 ]
+    sock.close()
+    return port
+# end get_closed_port
+
+
+def post_to_all( ports ):
+    db = GPUdb( host = [ "127.0.0.1" ] * len( ports ), port = ports,
+                no_init_db_contact = True )
+    return db._GPUdb__post_to_gpudb_read( b"body", "/insert/records" )
+# end post_to_all
+
+
+def test_requests_that_could_not_be_sent_are_told_apart( make_server ):
+    with pytest.raises( _GPUdbUnsentRequestException ):
+        post_to_all( [ get_closed_port() ] )
+    with pytest.raises( _GPUdbUnsentRequestException ):
+        post_to_all( [ get_closed_port(), get_closed_port() ] )
+
+    # Dropped after being sent, so it may have been applied
+    server = make_server( drop_requests = [ 1 ] )
+    with pytest.raises( GPUdbConnectionException ) as e:
+        post_to_all( [ server.port ] )
+    assert not isinstance( e.value, _GPUdbUnsentRequestException )
+
+
+def test_request_sent_to_any_host_may_have_been_applied( make_server ):
+    server = make_server( drop_requests = [ 1 ] )
+    with pytest.raises( GPUdbConnectionException ) as e:
+        post_to_all( [ server.port, get_closed_port() ] )
+    assert not isinstance( e.value, _GPUdbUnsentRequestException )
+    assert server.paths == [ "/insert/records" ]
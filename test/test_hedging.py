@@ -0,0 +1,85 @@
+"""Tests for hedging slow reads by also sending them to a second host."""
+import threading
+import time
+
+import pytest
+
+from gpudb.gpudb import GPUdb, GPUdbConnectionException
+
+
+@pytest.fixture
+def make_db():
+    dbs = []
+    def make( servers ):
+        db = GPUdb( host = [ "127.0.0.1" ] * len( servers ),
+                    port = [ server.port for server in servers ],
+                    no_init_db_contact = True )
+        dbs.append( db )
+        return db
+    yield make
+    for db in dbs:
+        db.close()
+# end make_db
+
+
+def post_hedged( db, hedge_delay ):
+    return db._GPUdb__post_hedged( list( range( len( db._conn_tokens ) ) ),
+                                   {}, b"body", "/show/table", hedge_delay, None )[ 0 ]
+# end post_hedged
+
+
+def test_fast_reads_are_not_hedged_nor_get_a_thread( make_server, make_db, monkeypatch ):
+    servers = [ make_server(), make_server() ]
+    db = make_db( servers )
+
+    # Threads started by the client, not by the servers
+    server_threads = [ server.thread for server in servers ]
+    started = []
+    thread_start = threading.Thread.start
+    def start( thread ):
+        if threading.current_thread() not in server_threads:
+            started.append( thread.name )
+        thread_start( thread )
+    monkeypatch.setattr( threading.Thread, "start", start )
+
+    for _ in range( 20 ):
+        assert post_hedged( db, 1 ) == b"ok"
+
+    assert len( servers[ 0 ].paths ) == 20
+    assert servers[ 1 ].paths == []
+    assert started == [ "GPUdbHedgeScheduler" ]
+
+
+def test_slow_read_is_answered_by_the_hedge( make_server, make_db ):
+    servers = [ make_server( delay = 2 ), make_server() ]
+    db = make_db( servers )
+
+    start = time.time()
+    assert post_hedged( db, 0.1 ) == b"ok"
+    assert (time.time() - start) < 1
+    assert len( servers[ 1 ].paths ) == 1
+
+    # The slow request has been cancelled, so its connection is let go of
+    pool = db._conn_tokens[ 0 ].get_connection_pool( servers[ 0 ].port, 10, 60 )
+    deadline = time.time() + 1
+    while ( (pool._num_open > 0) and (time.time() < deadline) ):
+        time.sleep( 0.01 )
+    assert pool._num_open == 0
+
+
+def test_failed_read_fails_over( make_server, make_db ):
+    servers = [ make_server( drop_requests = [ 1 ] ), make_server( delay = 0.2 ),
+                make_server() ]
+    db = make_db( servers )
+
+    # Dropped by the first host before the hedge is due
+    assert post_hedged( db, 1 ) == b"ok"
+    assert servers[ 1 ].paths == [ "/show/table" ]
+
+
+def test_failed_reads_raise( make_server, make_db ):
+    servers = [ make_server( drop_requests = [ 1 ] ), make_server( drop_requests = [ 1 ] ) ]
+    db = make_db( servers )
+
+    with pytest.raises( GPUdbConnectionException ):
+        post_hedged( db, 0.05 )
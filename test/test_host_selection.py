@@ -0,0 +1,111 @@
+"""Tests for routing requests by the latency and health of the hosts."""
+import threading
+import time
+
+from gpudb.gpudb import GPUdb, _HostSelector
+from gpudb.protocol import Schema
+
+
+RESPONSE_SCHEMA = Schema( "record", [ ( "status", "string" ), ( "message", "string" ),
+                                      ( "data_type", "string" ), ( "data", "bytes" ),
+                                      ( "data_str", "string" ) ] )
+
+
+def make_db( servers, **kwargs ):
+    return GPUdb( host = [ "127.0.0.1" ] * len( servers ),
+                  port = [ server.port for server in servers ],
+                  no_init_db_contact = True, **kwargs )
+# end make_db
+
+
+def make_status_response( status ):
+    return RESPONSE_SCHEMA.encode( { "status": status, "message": "status " + status,
+                                     "data_type": "none", "data": b"", "data_str": "" } )
+# end make_status_response
+
+
+def post( db, endpoint = "/show/table" ):
+    return db._GPUdb__post_to_gpudb_read( b"body", endpoint )[ 0 ]
+# end post
+
+
+def wait_until( condition, timeout = 5 ):
+    deadline = time.time() + timeout
+    while ( (not condition()) and (time.time() < deadline) ):
+        time.sleep( 0.01 )
+    return condition()
+# end wait_until
+
+
+def test_health_checks_are_opt_in( make_server ):
+    servers = [ make_server(), make_server() ]
+    other_threads = set( threading.enumerate() )
+    db = make_db( servers )
+
+    assert db.health_check_interval is None
+    assert not [ thread for thread in threading.enumerate()
+                 if ( (thread.name == "GPUdbHealthCheck")
+                      and (thread not in other_threads) ) ]
+    db.close()
+
+
+def test_reads_go_to_the_fastest_host( make_server ):
+    servers = [ make_server( delay = 0.1 ), make_server() ]
+    db = make_db( servers )
+
+    # Each host is measured once, then the fastest one is used
+    for _ in range( 5 ):
+        assert post( db ) == b"ok"
+    assert len( servers[ 0 ].paths ) == 1
+    assert len( servers[ 1 ].paths ) == 4
+    db.close()
+
+
+def test_writes_stick_to_the_current_host( make_server ):
+    servers = [ make_server( delay = 0.05 ), make_server() ]
+    db = make_db( servers )
+    for _ in range( 3 ):
+        post( db )
+
+    for _ in range( 3 ):
+        assert post( db, "/insert/records" ) == b"ok"
+    assert servers[ 0 ].paths.count( "/insert/records" ) == 3
+    assert "/insert/records" not in servers[ 1 ].paths
+    db.close()
+
+
+def test_failing_host_is_skipped_until_it_recovers( make_server, monkeypatch ):
+    monkeypatch.setattr( _HostSelector, "_CIRCUIT_OPEN_TIME", 0.2 )
+    threshold = _HostSelector._FAILURE_THRESHOLD
+    servers = [ make_server( drop_requests = range( 1, threshold + 1 ) ), make_server() ]
+    db = make_db( servers )
+
+    # Failed reads go to the other host, until the failing one is skipped
+    for _ in range( threshold + 2 ):
+        assert post( db ) == b"ok"
+    assert len( servers[ 0 ].paths ) == threshold
+    assert len( servers[ 1 ].paths ) == threshold + 2
+
+    # Once the circuit has been open for long enough, a trial request is let
+    # through, and the host is used again when it succeeds
+    time.sleep( 0.25 )
+    assert post( db ) == b"ok"
+    assert len( servers[ 0 ].paths ) == threshold + 1
+    assert db._host_selector._open_until[ 0 ] is None
+    db.close()
+
+
+def test_hosts_reporting_errors_are_unhealthy( make_server ):
+    servers = [ make_server( response = make_status_response( "ERROR" ) ),
+                make_server( response = make_status_response( "OK" ) ) ]
+    db = make_db( servers, health_check_interval = 0.01 )
+    selector = db._host_selector
+
+    assert wait_until( lambda: selector._open_until[ 0 ] is not None )
+    assert selector._open_until[ 1 ] is None
+
+    # Reads avoid the unhealthy host
+    post( db )
+    assert "/show/table" in servers[ 1 ].paths
+    assert "/show/table" not in servers[ 0 ].paths
+    db.close()
@@ -0,0 +1,374 @@
+"""Tests for GPUdbIngestor, against fake workers that record the batches
+they are sent."""
+import gc
+import threading
+import time
+
+import pytest
+
+from gpudb.gpudb import ( GPUdb, GPUdbConnectionException, GPUdbRecordColumn,
+                          GPUdbRecordType, _GPUdbUnsentRequestException )
+from gpudb.gpudb_multihead_io import GPUdbIngestor, GPUdbWorkerList, InsertionException
+
+
+RECORD_TYPE = GPUdbRecordType( [ GPUdbRecordColumn( "k", "int", [ "shard_key" ] ),
+                                 GPUdbRecordColumn( "v", "string" ) ],
+                               label = "ingest_test" )
+
+
+class FakeWorker( object ):
+    """Stands in for the insert_records endpoint of a worker.  A failing
+    worker returns an error with the given message, or raises *error* if
+    given."""
+
+    def __init__( self, delay = 0, fail = False, message = "insert failed",
+                  error = None ):
+        self.delay      = delay
+        self.fail       = fail
+        self.message    = message
+        self.error      = error
+        self.batches    = []
+        self.intervals  = []
+        self.num_active = 0
+        self.max_active = 0
+        self.lock       = threading.Lock()
+
+    def insert_records( self, table_name, data, options ):
+        with self.lock:
+            self.num_active += 1
+            self.max_active = max( self.max_active, self.num_active )
+
+        start = time.time()
+        time.sleep( self.delay )
+
+        with self.lock:
+            self.num_active -= 1
+            self.batches.append( [ record[ "k" ] for record in data ] )
+            self.intervals.append( ( start, time.time() ) )
+
+        if self.fail:
+            if self.error is not None:
+                raise self.error
+            return { "status_info": { "status": "ERROR", "message": self.message } }
+        return { "status_info": { "status": "OK", "message": "" },
+                 "count_inserted": len( data ), "count_updated": 0 }
+# end class FakeWorker
+
+
+class FakeShards( object ):
+    """Stands in for the admin_show_shards endpoint; the shards are spread
+    over the given ranks (1-based), until moved."""
+
+    def __init__( self, ranks ):
+        self.version   = 1
+        self.ranks     = ranks
+        self.num_calls = 0
+
+    def move( self, ranks ):
+        self.version += 1
+        self.ranks    = ranks
+
+    def admin_show_shards( self ):
+        self.num_calls += 1
+        return { "status_info": { "status": "OK", "message": "" },
+                 "version": self.version, "rank": self.ranks * (64 // len( self.ranks )) }
+# end class FakeShards
+
+
+def make_ingestor( fake_workers, batch_size, shards = None, **kwargs ):
+    """Makes an ingestor inserting into the given fake workers; records are
+    routed to them as per the given fake shards, if any."""
+    db = GPUdb( host = "127.0.0.1", port = 1, no_init_db_contact = True )
+    if shards is not None:
+        db.admin_show_shards = shards.admin_show_shards
+
+    workers = GPUdbWorkerList.__new__( GPUdbWorkerList )
+    workers.worker_urls = [ "127.0.0.1:%d" % (i + 2) for i in range( len( fake_workers ) ) ]
+    workers._is_multihead_enabled = (shards is not None)
+
+    ingestor = GPUdbIngestor( db, "ingest_test", RECORD_TYPE, batch_size,
+                              workers = workers, **kwargs )
+    for (worker, fake) in zip( ingestor.worker_queues, fake_workers ):
+        worker.get_gpudb().insert_records = fake.insert_records
+    return ingestor
+# end make_ingestor
+
+
+def wait_until( condition, timeout = 5 ):
+    deadline = time.time() + timeout
+    while ( (not condition()) and (time.time() < deadline) ):
+        time.sleep( 0.01 )
+    return condition()
+# end wait_until
+
+
+def test_linger_flushes_are_serialized_with_inserts():
+    fake = FakeWorker( delay = 0.01 )
+    ingestor = make_ingestor( [ fake ], batch_size = 5, linger_time = 0.005 )
+
+    for k in range( 100 ):
+        ingestor.insert_record( { "k": k, "v": "x" } )
+        time.sleep( 0.001 )
+    ingestor.close()
+
+    assert fake.max_active == 1
+    assert [ k for batch in fake.batches for k in batch ] == list( range( 100 ) )
+
+
+def test_linger_flush_failures_are_raised_by_the_next_insert():
+    fake = FakeWorker( fail = True )
+    ingestor = make_ingestor( [ fake ], batch_size = 5, linger_time = 0.01 )
+
+    ingestor.insert_record( { "k": 1, "v": "x" } )
+    assert wait_until( lambda: fake.batches )
+    time.sleep( 0.05 )
+
+    with pytest.raises( InsertionException ) as e:
+        ingestor.insert_records( [ { "k": 2, "v": "x" } ] )
+    assert [ record[ "k" ] for record in e.value.get_records() ] == [ 1, 2 ]
+
+    # Reported once only
+    fake.fail = False
+    ingestor.insert_record( { "k": 3, "v": "x" } )
+    ingestor.close()
+    assert fake.batches[ -1 ] == [ 3 ]
+
+
+def get_threads( ingestor ):
+    """Returns the threads of the ingestor, creating its flush thread pool."""
+    pool = ingestor._GPUdbIngestor__get_flush_thread_pool()
+    threads = list( pool._pool ) + list( ingestor._sender_threads )
+    if ingestor._linger_thread is not None:
+        threads.append( ingestor._linger_thread )
+    return threads
+# end get_threads
+
+
+@pytest.mark.parametrize( "is_async", [ False, True ] )
+def test_dropped_ingestor_releases_its_threads( is_async ):
+    fake = FakeWorker()
+    ingestor = make_ingestor( [ fake ], batch_size = 5, linger_time = 0.01,
+                              flush_threads = 2, is_async = is_async )
+    ingestor.insert_record( { "k": 1, "v": "x" } )
+    assert wait_until( lambda: fake.batches )
+
+    threads = get_threads( ingestor )
+    assert ingestor._linger_thread in threads
+    assert (len( ingestor._sender_threads ) == (1 if is_async else 0))
+
+    del ingestor
+    gc.collect()
+    assert wait_until( lambda: not any( thread.is_alive() for thread in threads ) )
+
+
+def test_context_manager_flushes_and_releases_threads():
+    fake = FakeWorker()
+    with make_ingestor( [ fake ], batch_size = 5, linger_time = 1,
+                        flush_threads = 2 ) as ingestor:
+        ingestor.insert_record( { "k": 1, "v": "x" } )
+        threads = get_threads( ingestor )
+
+    assert fake.batches == [ [ 1 ] ]
+    assert not any( thread.is_alive() for thread in threads )
+
+
+def insert_moved_batch( first_worker ):
+    """Inserts a batch into the first worker, the shards having been moved to
+    the second one in the meantime; returns the shards, the second worker
+    and the error raised, if any."""
+    shards = FakeShards( [ 1 ] )
+    second_worker = FakeWorker()
+    ingestor = make_ingestor( [ first_worker, second_worker ], batch_size = 2,
+                              shards = shards )
+    shards.move( [ 2 ] )
+
+    error = None
+    try:
+        ingestor.insert_records( [ { "k": 1, "v": "x" }, { "k": 2, "v": "x" } ] )
+    except Exception as e:
+        error = e
+
+    first_worker.fail = False
+    ingestor.close()
+    return ( shards, second_worker, error )
+# end insert_moved_batch
+
+
+@pytest.mark.parametrize( "message", [ "Shard 3 is not on this rank", "Rank not ready" ] )
+def test_rejected_records_are_rerouted_after_the_shards_moved( message ):
+    first_worker = FakeWorker( fail = True, message = message )
+    ( shards, second_worker, error ) = insert_moved_batch( first_worker )
+
+    assert error is None
+    assert shards.num_calls > 1
+    assert second_worker.batches == [ [ 1, 2 ] ]
+
+
+def test_rejected_records_are_not_resent_if_the_shards_did_not_move():
+    shards = FakeShards( [ 1, 2 ] )
+    fakes = [ FakeWorker( fail = True, message = "Shard key mismatch" ), FakeWorker() ]
+    ingestor = make_ingestor( fakes, batch_size = 1000, shards = shards )
+    ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 20 ) ] )
+
+    with pytest.raises( InsertionException ):
+        ingestor.flush()
+    assert shards.num_calls == 2
+    assert len( fakes[ 0 ].batches ) == 1
+    assert len( fakes[ 1 ].batches ) == 1
+
+    fakes[ 0 ].fail = False
+    ingestor.close()
+
+
+def test_unsent_records_are_rerouted():
+    first_worker = FakeWorker( fail = True,
+                               error = _GPUdbUnsentRequestException( "Connection refused" ) )
+    ( shards, second_worker, error ) = insert_moved_batch( first_worker )
+
+    assert error is None
+    assert shards.num_calls > 1
+    assert second_worker.batches == [ [ 1, 2 ] ]
+
+
+def test_dropped_requests_neither_refresh_shards_nor_resend():
+    first_worker = FakeWorker( fail = True,
+                               error = GPUdbConnectionException( "Connection reset" ) )
+    ( shards, second_worker, error ) = insert_moved_batch( first_worker )
+
+    assert isinstance( error, GPUdbConnectionException )
+    assert shards.num_calls == 1
+    assert second_worker.batches == []
+
+
+def get_max_overlap( fake_workers ):
+    """Returns the maximum number of the workers' inserts that overlapped."""
+    events = sorted( [ (start, 1) for fake in fake_workers for (start, end) in fake.intervals ]
+                     + [ (end, -1) for fake in fake_workers for (start, end) in fake.intervals ] )
+    overlap = max_overlap = 0
+    for (at, change) in events:
+        overlap += change
+        max_overlap = max( max_overlap, overlap )
+    return max_overlap
+# end get_max_overlap
+
+
+def test_worker_queues_are_flushed_in_parallel():
+    fakes = [ FakeWorker( delay = 0.1 ) for _ in range( 4 ) ]
+    ingestor = make_ingestor( fakes, batch_size = 1000, flush_threads = 2,
+                              shards = FakeShards( [ 1, 2, 3, 4 ] ) )
+
+    ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 200 ) ] )
+    ingestor.flush()
+    ingestor.close()
+
+    assert all( (len( fake.batches ) == 1) for fake in fakes )
+    assert sorted( k for fake in fakes for k in fake.batches[ 0 ] ) == list( range( 200 ) )
+    assert get_max_overlap( fakes ) == 2
+
+
+def test_failed_worker_queue_does_not_stop_the_others():
+    fakes = [ FakeWorker( delay = 0.01 ), FakeWorker( fail = True ), FakeWorker() ]
+    ingestor = make_ingestor( fakes, batch_size = 1000, flush_threads = 3,
+                              shards = FakeShards( [ 1, 2, 3 ] ) )
+    ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 90 ) ] )
+
+    with pytest.raises( InsertionException ) as e:
+        ingestor.flush()
+    assert ( sorted( record[ "k" ] for record in e.value.get_records() )
+             == sorted( fakes[ 1 ].batches[ 0 ] ) )
+    assert fakes[ 0 ].batches and fakes[ 2 ].batches
+
+    fakes[ 1 ].fail = False
+    ingestor.close()
+
+
+def test_async_futures_report_each_batch():
+    fakes = [ FakeWorker(), FakeWorker( fail = True ) ]
+    ingestor = make_ingestor( fakes, batch_size = 10, flush_threads = 2, is_async = True,
+                              shards = FakeShards( [ 1, 2 ] ) )
+    futures = ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 100 ) ] )
+    assert futures
+
+    with pytest.raises( InsertionException ) as e:
+        ingestor.flush()
+
+    # Every batch of the failing worker is reported by flush(), including
+    # the partial ones it sent off
+    failed_keys = sorted( record[ "k" ] for record in e.value.get_records() )
+    assert failed_keys == sorted( k for batch in fakes[ 1 ].batches for k in batch )
+    assert ( sorted( failed_keys + [ k for batch in fakes[ 0 ].batches for k in batch ] )
+             == list( range( 100 ) ) )
+
+    for future in futures:
+        assert future.done()
+        keys = [ record[ "k" ] for record in future.get_records() ]
+        if (keys in fakes[ 0 ].batches):
+            assert future.exception() is None
+            assert future.result() == { "count_inserted": len( keys ), "count_updated": 0 }
+        else:
+            assert isinstance( future.exception(), InsertionException )
+            with pytest.raises( InsertionException ):
+                future.result()
+    # end loop
+
+    fakes[ 1 ].fail = False
+    ingestor.close()
+
+
+def test_async_callbacks_run_once_per_batch():
+    fake = FakeWorker( delay = 0.05 )
+    ingestor = make_ingestor( [ fake ], batch_size = 5, is_async = True )
+    futures = ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 20 ) ] )
+
+    called = []
+    for future in futures:
+        future.add_done_callback( called.append )
+    ingestor.flush()
+
+    assert sorted( map( id, called ) ) == sorted( map( id, futures ) )
+
+    # Called right away once done
+    late = []
+    futures[ 0 ].add_done_callback( late.append )
+    assert late == [ futures[ 0 ] ]
+    ingestor.close()
+
+
+def test_async_max_queued_records_blocks_the_caller():
+    ingestor = None
+    queued_counts = []
+
+    class CountingWorker( FakeWorker ):
+        def insert_records( self, table_name, data, options ):
+            queued_counts.append( ingestor._queued_records_count )
+            return FakeWorker.insert_records( self, table_name, data, options )
+    # end class CountingWorker
+
+    fake = CountingWorker( delay = 0.05 )
+    ingestor = make_ingestor( [ fake ], batch_size = 10, is_async = True,
+                              max_queued_records = 20 )
+
+    start = time.time()
+    futures = ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 60 ) ] )
+
+    # Only two batches may wait at a time, so the caller waited for (at
+    # least) the first four to be inserted
+    assert (time.time() - start) >= 0.15
+    assert (len( futures ) == 6)
+    ingestor.flush()
+    ingestor.close()
+
+    assert max( queued_counts ) <= 20
+    assert [ k for batch in fake.batches for k in batch ] == list( range( 60 ) )
+
+
+def test_async_batches_larger_than_the_bound_are_let_through_one_at_a_time():
+    fake = FakeWorker( delay = 0.01 )
+    ingestor = make_ingestor( [ fake ], batch_size = 30, is_async = True,
+                              max_queued_records = 20 )
+    ingestor.insert_records( [ { "k": k, "v": "x" } for k in range( 90 ) ] )
+    ingestor.flush()
+    ingestor.close()
+
+    assert fake.max_active == 1
+    assert [ len( batch ) for batch in fake.batches ] == [ 30, 30, 30 ]
@@ -0,0 +1,188 @@
+"""Tests for calling endpoints asynchronously, as jobs polled from a fake
+server."""
+import threading
+import time
+
+import pytest
+
+from gpudb.gpudb import C, GPUdb, GPUdbException, GPUdbJob, _GPUdbJobPoller
+from gpudb.protocol import Schema
+
+
+RESPONSE_SCHEMA = Schema( "record", [ ( "status", "string" ), ( "message", "string" ),
+                                      ( "data_type", "string" ), ( "data", "bytes" ),
+                                      ( "data_str", "string" ) ] )
+
+SCHEMAS = GPUdb( host = "127.0.0.1", port = 1, no_init_db_contact = True ).gpudb_schemas
+
+
+class FakeJobs( object ):
+    """Stands in for the job endpoints of a server: each job created is
+    reported as running for the given number of polls of /get/job (forever
+    if None), then as done, or failed with *error* if given.  Jobs cancelled
+    with /admin/alter/jobs are reported as such on their next poll.
+    """
+
+    def __init__( self, num_running_polls = 3, error = None ):
+        self.num_running_polls = num_running_polls
+        self.error      = error
+        self.lock       = threading.Lock()
+        self.requests   = {} # by job ID
+        self.poll_times = {} # by job ID
+        self.cancelled  = set()
+
+    def __call__( self, path, body ):
+        request = SCHEMAS[ path ][ "REQ_SCHEMA" ].decode( body )
+        with self.lock:
+            if (path == "/create/job"):
+                job_id = len( self.requests ) + 1
+                self.requests[ job_id ] = request
+                self.poll_times[ job_id ] = []
+                response = { "job_id": job_id }
+            elif (path == "/get/job"):
+                response = self.get_job( request[ "job_id" ] )
+            else: # /admin/alter/jobs
+                self.cancelled.update( request[ "job_ids" ] )
+                response = { "job_ids": request[ "job_ids" ], "action": request[ "action" ],
+                             "status": [ "OK" ] * len( request[ "job_ids" ] ) }
+
+        data = SCHEMAS[ path ][ "RSP_SCHEMA" ].encode( response )
+        return RESPONSE_SCHEMA.encode( { "status": "OK", "message": "",
+                                         "data_type": path[ 1 : ].replace( "/", "_" ) + "_response",
+                                         "data": data, "data_str": "" } )
+    # end __call__
+
+    def get_job( self, job_id ):
+        self.poll_times[ job_id ].append( time.time() )
+        request = self.requests[ job_id ]
+        num_polls = len( self.poll_times[ job_id ] )
+
+        response = { "endpoint": request[ "endpoint" ], "job_status": "RUNNING",
+                     "running": True, "progress": 0, "successful": False,
+                     "response_encoding": "binary", "job_response": b"",
+                     "job_response_str": "", "status_map": {} }
+        if job_id in self.cancelled:
+            response.update( job_status = C._job_cancelled, running = False )
+        elif ( (self.num_running_polls is None) or (num_polls <= self.num_running_polls) ):
+            pass
+        elif self.error is not None:
+            response.update( job_status = C._job_error, running = False,
+                             status_map = { C._job_error_msg: self.error } )
+        else:
+            table_request = SCHEMAS[ request[ "endpoint" ] ][ "REQ_SCHEMA" ].decode( request[ "data" ] )
+            job_response = { "table_name": table_request[ "table_name" ] }
+            response.update( job_status = "DONE", running = False, successful = True,
+                             progress = 100,
+                             job_response = SCHEMAS[ request[ "endpoint" ] ][ "RSP_SCHEMA" ].encode( job_response ) )
+        return response
+    # end get_job
+# end class FakeJobs
+
+
+def make_db( make_server, jobs ):
+    server = make_server( response = jobs )
+    return GPUdb( host = "127.0.0.1", port = server.port, no_init_db_contact = True )
+# end make_db
+
+
+def submit_clear_table( db, table_name = "jobs_test" ):
+    return db.submit_job( "clear_table", { "table_name": table_name, "authorization": "" } )
+# end submit_clear_table
+
+
+def test_jobs_are_polled_until_done( make_server ):
+    jobs = FakeJobs( num_running_polls = 3 )
+    db = make_db( make_server, jobs )
+
+    job = submit_clear_table( db )
+    response = job.result( timeout = 5 )
+
+    assert job.done()
+    assert response[ "table_name" ] == "jobs_test"
+    assert response[ "status_info" ][ "status" ] == "OK"
+    assert jobs.requests[ job.job_id ][ "endpoint" ] == "/clear/table"
+    assert len( jobs.poll_times[ job.job_id ] ) == 4
+    db.close()
+
+
+def test_poll_interval_grows_while_the_job_is_running( make_server ):
+    jobs = FakeJobs( num_running_polls = 4 )
+    db = make_db( make_server, jobs )
+
+    job = submit_clear_table( db )
+    job.result( timeout = 5 )
+
+    times = jobs.poll_times[ job.job_id ]
+    intervals = [ (later - earlier) for ( earlier, later ) in zip( times, times[ 1 : ] ) ]
+    assert len( intervals ) == 4
+    for ( i, interval ) in enumerate( intervals ):
+        assert interval >= (_GPUdbJobPoller._MIN_POLL_INTERVAL * (2 ** (i + 1))) * 0.9
+    assert intervals[ -1 ] > (1.5 * intervals[ -2 ])
+    db.close()
+
+
+def test_poll_interval_is_capped():
+    poll_times = []
+    def poll():
+        poll_times.append( time.time() )
+        return { "done": True } if (len( poll_times ) > 6) else None
+    # end poll
+
+    poller = _GPUdbJobPoller( max_poll_interval = 0.04 )
+    job = GPUdbJob( None, 1, "/clear/table", poll )
+    poller.add( job )
+
+    assert job.result( timeout = 5 ) == { "done": True }
+    intervals = [ (later - earlier) for ( earlier, later ) in zip( poll_times, poll_times[ 1 : ] ) ]
+    assert max( intervals ) < 0.04 + 0.03
+
+
+def test_many_jobs_share_one_poller_thread( make_server ):
+    jobs = FakeJobs( num_running_polls = 5 )
+    db = make_db( make_server, jobs )
+
+    callback_threads = []
+    submitted = []
+    for i in range( 10 ):
+        job = submit_clear_table( db, "jobs_test_%d" % i )
+        job.add_done_callback( lambda job: callback_threads.append( threading.current_thread() ) )
+        submitted.append( job )
+
+    responses = [ job.result( timeout = 5 ) for job in submitted ]
+
+    assert [ response[ "table_name" ] for response in responses ] == [ "jobs_test_%d" % i
+                                                                       for i in range( 10 ) ]
+    assert len( callback_threads ) == 10
+    assert len( set( callback_threads ) ) == 1
+    assert callback_threads[ 0 ].name == "GPUdbJobPoller"
+    db.close()
+
+
+def test_cancelled_jobs_raise( make_server ):
+    jobs = FakeJobs( num_running_polls = None )
+    db = make_db( make_server, jobs )
+
+    job = submit_clear_table( db )
+    assert not job.done()
+    assert job.cancel()
+
+    with pytest.raises( GPUdbException ) as error:
+        job.result( timeout = 5 )
+    assert "cancelled" in str( error.value )
+    assert jobs.cancelled == { job.job_id }
+
+    # Done jobs cannot be cancelled again
+    assert not job.cancel()
+    db.close()
+
+
+def test_failed_jobs_raise_the_server_error( make_server ):
+    jobs = FakeJobs( num_running_polls = 1, error = "Table not found" )
+    db = make_db( make_server, jobs )
+
+    job = submit_clear_table( db )
+
+    assert "Table not found" in str( job.exception( timeout = 5 ) )
+    with pytest.raises( GPUdbException ):
+        job.result()
+    db.close()
@@ -0,0 +1,116 @@
+"""Tests for the iterators that prefetch pages of records on background
+threads.
+"""
+import gc
+import threading
+import time
+
+import pytest
+
+from gpudb import AttrDict, GPUdbException, GPUdbTable, GPUdbTableStreamIterator
+from gpudb import MultiHeadScanIterator
+
+
+class FakePagedDB( object ):
+    """Serves /get/records pages of consecutive integers."""
+
+    def __init__( self, num_records, fail_at_offset = None ):
+        self.num_records    = num_records
+        self.fail_at_offset = fail_at_offset
+
+    def get_records_and_decode( self, table_name, offset, limit, **kwargs ):
+        if (offset == self.fail_at_offset):
+            return AttrDict( { "status_info": { "status": "ERROR",
+                                                "message": "fetch failed" } } )
+
+        end = min( offset + limit, self.num_records )
+        return AttrDict( { "status_info": { "status": "OK" },
+                           "records": list( range( offset, end ) ),
+                           "has_more_records": (end < self.num_records) } )
+# end class FakePagedDB
+
+
+def make_table( db ):
+    table = GPUdbTable.__new__( GPUdbTable )
+    table.db   = db
+    table.name = "stream_test"
+    return table
+# end make_table
+
+
+def wait_for_threads( expected, timeout = 5 ):
+    """Waits until at most *expected* threads are alive, and returns the
+    number of threads alive."""
+    deadline = time.time() + timeout
+    while ( (threading.active_count() > expected)
+            and (time.time() < deadline) ):
+        time.sleep( 0.05 )
+    return threading.active_count()
+# end wait_for_threads
+
+
+def test_returns_all_records():
+    records = GPUdbTableStreamIterator( make_table( FakePagedDB( 95 ) ),
+                                        page_size = 10 )
+    assert list( records ) == list( range( 95 ) )
+
+
+def test_raises_fetch_errors():
+    records = GPUdbTableStreamIterator( make_table( FakePagedDB( 95, fail_at_offset = 20 ) ),
+                                        page_size = 10 )
+    with pytest.raises( GPUdbException ):
+        list( records )
+
+
+def test_abandoned_iterators_stop_their_threads():
+    baseline = wait_for_threads( 1, timeout = 0.5 )
+
+    for _ in range( 5 ):
+        records = GPUdbTableStreamIterator( make_table( FakePagedDB( 10000 ) ),
+                                            page_size = 10, prefetch_depth = 1 )
+        for record in records:
+            if (record == 3):
+                break
+    del records
+    gc.collect()
+
+    assert wait_for_threads( baseline ) <= baseline
+
+
+def test_context_manager_closes():
+    baseline = wait_for_threads( 1, timeout = 0.5 )
+
+    with GPUdbTableStreamIterator( make_table( FakePagedDB( 10000 ) ),
+                                   page_size = 10, prefetch_depth = 1 ) as records:
+        assert next( records ) == 0
+
+    with pytest.raises( StopIteration ):
+        next( records )
+    assert wait_for_threads( baseline ) <= baseline
+
+
+def test_multihead_scan_returns_all_records_of_all_ranks():
+    workers = [ FakePagedDB( n ) for n in ( 35, 0, 12 ) ]
+    records = MultiHeadScanIterator( workers, "stream_test", None, page_size = 10 )
+    assert sorted( records ) == sorted( list( range( 35 ) ) + list( range( 12 ) ) )
+
+
+def test_multihead_scan_raises_fetch_errors():
+    workers = [ FakePagedDB( 35 ), FakePagedDB( 10000, fail_at_offset = 10 ) ]
+    records = MultiHeadScanIterator( workers, "stream_test", None, page_size = 10 )
+    with pytest.raises( GPUdbException ):
+        list( records )
+
+
+def test_abandoned_multihead_scans_stop_their_threads():
+    baseline = wait_for_threads( 1, timeout = 0.5 )
+
+    for _ in range( 5 ):
+        workers = [ FakePagedDB( 10000 ) for i in range( 3 ) ]
+        records = MultiHeadScanIterator( workers, "stream_test", None,
+                                         page_size = 10, prefetch_depth = 1 )
+        next( records )
+    del records
+    gc.collect()
+
+    assert wait_for_threads( baseline ) <= baseline
@@ -0,0 +1,102 @@
+"""Tests for parsing date, datetime and time strings given as Record values
+in the c-extension.
+"""
+import datetime
+
+import pytest
+
+from gpudb import Record, RecordColumn, RecordType
+
+
+RECORD_TYPE = RecordType( "datetime_parsing",
+                          [ RecordColumn( "d",  "date" ),
+                            RecordColumn( "dt", "datetime" ),
+                            RecordColumn( "t",  "time" ) ] )
+
+
+def set_value( column, value ):
+    record = Record( RECORD_TYPE )
+    record[ column ] = value
+    return record
+# end set_value
+
+
+@pytest.mark.parametrize( "value, expected", [
+    ( "2019-03-04",   datetime.date( 2019, 3, 4 ) ),
+    ( " 2019-03-04 ", datetime.date( 2019, 3, 4 ) ),
+] )
+def test_valid_dates( value, expected ):
+    assert set_value( "d", value )[ "d" ] == expected
+
+
+@pytest.mark.parametrize( "value", [
+    "2019-003-04",
+    "2019-03-004",
+    "02019-03-04",
+    "2019-3-04",
+    "2019-13-04",
+] )
+def test_invalid_dates( value ):
+    with pytest.raises( Exception ):
+        set_value( "d", value )
+
+
+@pytest.mark.parametrize( "value, expected", [
+    ( "2019-03-04",              datetime.datetime( 2019, 3, 4 ) ),
+    ( "2019-03-04 05:06:07",     datetime.datetime( 2019, 3, 4, 5, 6, 7 ) ),
+    ( "2019-03-04 5:06:07",      datetime.datetime( 2019, 3, 4, 5, 6, 7 ) ),
+    ( "2019-03-04 05:06:07.1",   datetime.datetime( 2019, 3, 4, 5, 6, 7, 100000 ) ),
+    ( "2019-03-04 05:06:07.12",  datetime.datetime( 2019, 3, 4, 5, 6, 7, 120000 ) ),
+    ( "2019-03-04 05:06:07.123", datetime.datetime( 2019, 3, 4, 5, 6, 7, 123000 ) ),
+] )
+def test_valid_datetimes( value, expected ):
+    assert set_value( "dt", value )[ "dt" ] == expected
+
+
+@pytest.mark.parametrize( "value", [
+    "2019-03-04 05:06:007",
+    "2019-03-04 05:006:07",
+    "2019-03-04 005:06:07",
+    "2019-03-04 05:06:07.1234",
+    "2019-03-04 05:06:07.",
+    "2019-03-04 24:00:00",
+] )
+def test_invalid_datetimes( value ):
+    with pytest.raises( Exception ):
+        set_value( "dt", value )
+
+
+@pytest.mark.parametrize( "value, expected", [
+    ( "05:06:07",     datetime.time( 5, 6, 7 ) ),
+    ( "5:06:07",      datetime.time( 5, 6, 7 ) ),
+    ( "05:06:07.1",   datetime.time( 5, 6, 7, 100000 ) ),
+    ( "05:06:07.123", datetime.time( 5, 6, 7, 123000 ) ),
+    ( "23:59:59.999", datetime.time( 23, 59, 59, 999000 ) ),
+] )
+def test_valid_times( value, expected ):
+    assert set_value( "t", value )[ "t" ] == expected
+
+
+@pytest.mark.parametrize( "value", [
+    "05:06:07.1234",
+    "23:59:59.9999",
+    "05:059:07",
+    "05:06:059",
+    "005:06:07",
+    "24:00:00",
+] )
+def test_invalid_times( value ):
+    with pytest.raises( Exception ):
+        set_value( "t", value )
+
+
+def test_boundary_values_round_trip():
+    record = Record( RECORD_TYPE )
+    record[ "d" ]  = "2900-12-31"
+    record[ "dt" ] = "2019-03-04 23:59:59.999"
+    record[ "t" ]  = "23:59:59.999"
+
+    decoded = RECORD_TYPE.decode_records( record.encode() )[ 0 ]
+    assert decoded[ "d" ]  == datetime.date( 2900, 12, 31 )
+    assert decoded[ "dt" ] == datetime.datetime( 2019, 3, 4, 23, 59, 59, 999000 )
+    assert decoded[ "t" ]  == datetime.time( 23, 59, 59, 999000 )
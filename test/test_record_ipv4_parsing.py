@@ -0,0 +1,27 @@
+"""Tests for parsing ipv4 strings given as Record values in the c-extension.
+"""
+import pytest
+
+from gpudb import Record, RecordColumn, RecordType
+
+
+RECORD_TYPE = RecordType( "ipv4_parsing", [ RecordColumn( "ip", "ipv4" ) ] )
+
+
+def set_value( value ):
+    record = Record( RECORD_TYPE )
+    record[ "ip" ] = value
+    return record
+# end set_value
+
+
+@pytest.mark.parametrize( "value", [ "1.2.3.0255", "1.2.3.256", "1.2.3" ] )
+def test_invalid_ipv4( value ):
+    with pytest.raises( Exception ):
+        set_value( value )
+
+
+@pytest.mark.parametrize( "value", [ "0.0.0.0", "10.1.2.3", "255.255.255.255" ] )
+def test_valid_ipv4_round_trip( value ):
+    decoded = RECORD_TYPE.decode_records( set_value( value ).encode() )[ 0 ]
+    assert decoded[ "ip" ] == value
@@ -0,0 +1,73 @@
+"""Tests for building and hashing the shard keys of records natively, against
+the pure python implementation."""
+import collections
+import random
+
+import pytest
+
+import gpudb.gpudb_multihead_io as multihead_io
+from gpudb.gpudb import GPUdbRecordColumn, GPUdbRecordType, Record
+from gpudb.gpudb_multihead_io import _RecordKeyBuilder
+from gpudb.protocol import hash64
+
+import pymmh3 # from the packages directory
+
+
+RECORD_TYPE = GPUdbRecordType( [ GPUdbRecordColumn( "i", "int", [ "shard_key" ] ),
+                                 GPUdbRecordColumn( "l", "long", [ "shard_key", "timestamp" ] ),
+                                 GPUdbRecordColumn( "c", "string", [ "shard_key", "char8" ] ),
+                                 GPUdbRecordColumn( "d", "string", [ "shard_key", "date" ] ),
+                                 GPUdbRecordColumn( "x", "double" ) ],
+                               label = "keys_test" )
+
+VALUES = [ collections.OrderedDict( [ ( "i", -5 ), ( "l", 1500000000000 ),
+                                      ( "c", "abc" ), ( "d", "2019-03-04" ),
+                                      ( "x", 1.5 ) ] ),
+           collections.OrderedDict( [ ( "i", 2 ** 31 - 1 ), ( "l", 0 ),
+                                      ( "c", "" ), ( "d", "1000-01-01" ),
+                                      ( "x", 0.0 ) ] ),
+           collections.OrderedDict( [ ( "i", 0 ), ( "l", -1 ),
+                                      ( "c", "abcdefgh" ), ( "d", "2900-12-31" ),
+                                      ( "x", -2.0 ) ] ) ]
+
+
+def make_record( values ):
+    record = Record( RECORD_TYPE.record_type )
+    for ( name, value ) in values.items():
+        record[ name ] = value
+    return record
+# end make_record
+
+
+def test_native_hash64_matches_pymmh3():
+    rng = random.Random( 42 )
+    for length in range( 0, 65 ):
+        key = bytes( bytearray( rng.randrange( 256 ) for _ in range( length ) ) )
+        for seed in [ 0, 10, 0xdeadbeef ]:
+            assert hash64( key, seed = seed ) == pymmh3.hash64( key, seed = seed )
+
+
+@pytest.mark.parametrize( "values", VALUES )
+def test_native_keys_match_pure_python_keys( values, monkeypatch ):
+    builder = _RecordKeyBuilder( RECORD_TYPE )
+    native_key = builder.build( make_record( values ) )
+
+    # Built by the python implementation, and hashed by pymmh3
+    monkeypatch.setattr( multihead_io, "hash64", pymmh3.hash64 )
+    python_key = builder.build( values )
+
+    assert native_key.hash_code == python_key.hash_code
+    assert native_key.route( list( range( 8 ) ) ) == python_key.route( list( range( 8 ) ) )
+
+
+def test_keys_are_built_in_python_without_native_support( monkeypatch ):
+    native_keys = [ _RecordKeyBuilder( RECORD_TYPE ).build( make_record( values ) )
+                    for values in VALUES ]
+
+    monkeypatch.setattr( multihead_io, "_have_native_keys", False )
+    builder = _RecordKeyBuilder( RECORD_TYPE )
+    records = [ make_record( values ) for values in VALUES ]
+
+    assert builder.build_hash_codes( records ) is None
+    assert ( [ builder.build( record ).hash_code for record in records ]
+             == [ key.hash_code for key in native_keys ] )
@@ -0,0 +1,176 @@
+"""Tests for RecordRetriever, routing to fake workers as per fake shards."""
+import gc
+import re
+import time
+
+import pytest
+
+import gpudb.gpudb_multihead_io as multihead_io
+from gpudb.gpudb import GPUdb, GPUdbException, GPUdbRecordColumn, GPUdbRecordType
+from gpudb.gpudb_multihead_io import GPUdbWorkerList, RecordRetriever
+
+
+RECORD_TYPE = GPUdbRecordType( [ GPUdbRecordColumn( "k", "int", [ "shard_key" ] ),
+                                 GPUdbRecordColumn( "v", "string" ) ],
+                               label = "retrieve_test" )
+
+
+class FakeWorker( object ):
+    """Stands in for the get_records endpoint of a worker holding the given
+    records; a failing worker returns an error instead."""
+
+    def __init__( self, records = (), fail = False ):
+        self.records  = list( records )
+        self.fail     = fail
+        self.requests = []
+
+    def get_records_and_decode( self, table_name, limit, options, record_type ):
+        keys = [ int( k ) for k in re.findall( r"\(k = (-?\d+)\)", options[ "expression" ] ) ]
+        self.requests.append( keys )
+        if self.fail:
+            return { "status_info": { "status": "ERROR", "message": "Shard not on this rank" } }
+        return { "status_info": { "status": "OK", "message": "" },
+                 "records": [ record for record in self.records if record[ "k" ] in keys ] }
+# end class FakeWorker
+
+
+class FakeShards( object ):
+    """Stands in for the admin_show_shards endpoint; the shards are spread
+    over the given ranks (1-based), until moved."""
+
+    def __init__( self, ranks ):
+        self.version = 1
+        self.ranks   = ranks
+
+    def move( self, ranks ):
+        self.version += 1
+        self.ranks    = ranks
+
+    def admin_show_shards( self ):
+        return { "status_info": { "status": "OK", "message": "" },
+                 "version": self.version, "rank": self.ranks * (64 // len( self.ranks )) }
+# end class FakeShards
+
+
+def make_worker_list( num_workers ):
+    workers = GPUdbWorkerList.__new__( GPUdbWorkerList )
+    workers.worker_urls = [ "127.0.0.1:%d" % (i + 2) for i in range( num_workers ) ]
+    workers._is_multihead_enabled = True
+    return workers
+# end make_worker_list
+
+
+def make_retriever( num_workers, shards, fake_workers = () ):
+    """Makes a retriever routing to the given number of workers as per the
+    given fake shards; lookups go to the given fake workers, if any."""
+    db = GPUdb( host = "127.0.0.1", port = 1, no_init_db_contact = True )
+    db.admin_show_shards = shards.admin_show_shards
+    retriever = RecordRetriever( db, "retrieve_test", RECORD_TYPE,
+                                 workers = make_worker_list( num_workers ) )
+    for (worker, fake) in zip( retriever.worker_queues, fake_workers ):
+        worker.get_gpudb().get_records_and_decode = fake.get_records_and_decode
+    return retriever
+# end make_retriever
+
+
+def make_records( keys ):
+    return [ { "k": k, "v": "value %d" % k } for k in keys ]
+# end make_records
+
+
+def get_thread_pool( retriever ):
+    return retriever._RecordRetriever__get_thread_pool()
+# end get_thread_pool
+
+
+def wait_until( condition, timeout = 5 ):
+    deadline = time.time() + timeout
+    while ( (not condition()) and (time.time() < deadline) ):
+        time.sleep( 0.01 )
+    return condition()
+# end wait_until
+
+
+def test_dropped_retriever_releases_its_threads():
+    retriever = make_retriever( 2, FakeShards( [ 1, 2 ] ) )
+    threads = list( get_thread_pool( retriever )._pool )
+    assert len( threads ) == 2
+
+    del retriever
+    gc.collect()
+    assert wait_until( lambda: not any( thread.is_alive() for thread in threads ) )
+
+
+def test_context_manager_releases_threads():
+    with make_retriever( 2, FakeShards( [ 1, 2 ] ) ) as retriever:
+        threads = list( get_thread_pool( retriever )._pool )
+
+    assert not any( thread.is_alive() for thread in threads )
+    with pytest.raises( GPUdbException ):
+        get_thread_pool( retriever )
+
+
+def test_thread_pool_grows_with_added_ranks( monkeypatch ):
+    shards = FakeShards( [ 1, 2 ] )
+    workers = make_worker_list( 2 )
+    monkeypatch.setattr( multihead_io, "GPUdbWorkerList", lambda gpudb: workers )
+
+    db = GPUdb( host = "127.0.0.1", port = 1, no_init_db_contact = True )
+    db.admin_show_shards = shards.admin_show_shards
+    with RecordRetriever( db, "retrieve_test", RECORD_TYPE ) as retriever:
+        old_threads = list( get_thread_pool( retriever )._pool )
+
+        workers.worker_urls = make_worker_list( 3 ).worker_urls
+        shards.move( [ 1, 2, 3 ] )
+        assert retriever._RecordRetriever__update_routing( 1 )
+
+        assert len( get_thread_pool( retriever )._pool ) == 3
+        assert wait_until( lambda: not any( thread.is_alive() for thread in old_threads ) )
+
+
+def test_records_are_returned_in_the_order_of_the_keys():
+    records = make_records( range( 20 ) )
+    fakes = [ FakeWorker( records ), FakeWorker( records ) ]
+    with make_retriever( 2, FakeShards( [ 1, 2 ] ), fakes ) as retriever:
+        keys = [ 7, 3, 99, 12, 3, 0 ]
+        results = retriever.get_records_by_keys( [ [ k ] for k in keys ] )
+
+    assert results == [ ( make_records( [ k ] ) if (k < 20) else [] ) for k in keys ]
+    assert all( fake.requests for fake in fakes )
+
+
+def test_keys_are_split_into_requests():
+    fake = FakeWorker( make_records( range( 25 ) ) )
+    with make_retriever( 1, FakeShards( [ 1 ] ), [ fake ] ) as retriever:
+        results = retriever.get_records_by_keys( [ { "k": k } for k in range( 25 ) ],
+                                                 keys_per_request = 10 )
+
+    assert [ len( keys ) for keys in fake.requests ] == [ 10, 10, 5 ]
+    assert results == [ make_records( [ k ] ) for k in range( 25 ) ]
+
+
+def test_records_are_matched_to_keys_whose_hash_codes_collide( monkeypatch ):
+    monkeypatch.setattr( multihead_io, "hash64", lambda key, seed = 0: ( 0, 0 ) )
+    fake = FakeWorker( make_records( range( 5 ) ) )
+    with make_retriever( 1, FakeShards( [ 1 ] ), [ fake ] ) as retriever:
+        results = retriever.get_records_by_keys( [ [ k ] for k in range( 5 ) ] )
+
+    assert results == [ make_records( [ k ] ) for k in range( 5 ) ]
+
+
+def test_keys_are_looked_up_again_after_the_shards_moved():
+    shards = FakeShards( [ 1 ] )
+    fakes = [ FakeWorker( fail = True ), FakeWorker( make_records( range( 10 ) ) ) ]
+    with make_retriever( 2, shards, fakes ) as retriever:
+        shards.move( [ 2 ] )
+        results = retriever.get_records_by_keys( [ [ k ] for k in range( 10 ) ] )
+
+    assert results == [ make_records( [ k ] ) for k in range( 10 ) ]
+    assert sorted( fakes[ 0 ].requests[ 0 ] ) == list( range( 10 ) )
+
+
+def test_failed_lookups_are_raised_when_the_shards_did_not_move():
+    fakes = [ FakeWorker( fail = True ) ]
+    with make_retriever( 1, FakeShards( [ 1 ] ), fakes ) as retriever:
+        with pytest.raises( GPUdbException ):
+            retriever.get_records_by_keys( [ [ 1 ] ] )
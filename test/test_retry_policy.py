@@ -0,0 +1,101 @@
+"""Tests for retrying requests as per the retry policy, and for the deadline
+bounding them."""
+import time
+
+import pytest
+
+from gpudb.gpudb import ( GPUdb, GPUdbConnectionException, GPUdbRetryPolicy,
+                          _GPUdbUnsentRequestException )
+
+
+def make_db( server, num_hosts = 1, **kwargs ):
+    return GPUdb( host = [ "127.0.0.1" ] * num_hosts, port = server.port,
+                  no_init_db_contact = True, **kwargs )
+# end make_db
+
+
+def post( db, endpoint = "/show/table" ):
+    return db._GPUdb__post_to_gpudb_read( b"body", endpoint )[ 0 ]
+# end post
+
+
+def test_dropped_request_is_retried( make_server ):
+    server = make_server( drop_requests = [ 1 ] )
+    db = make_db( server, retry_policy = GPUdbRetryPolicy( initial_backoff = 0 ) )
+
+    assert post( db ) == b"ok"
+    assert len( server.paths ) == 2
+
+
+def test_dropped_write_is_not_resent( make_server ):
+    server = make_server( drop_requests = [ 1 ] )
+    db = make_db( server, retry_policy = GPUdbRetryPolicy( initial_backoff = 0 ) )
+
+    with pytest.raises( GPUdbConnectionException ):
+        post( db, "/insert/records" )
+    assert server.paths == [ "/insert/records" ]
+
+
+def test_only_unsent_writes_are_retryable():
+    policy = GPUdbRetryPolicy()
+    unsent = _GPUdbUnsentRequestException( "refused" )
+    dropped = GPUdbConnectionException( "reset" )
+
+    assert policy.is_retryable( unsent, "/insert/records" )
+    assert not policy.is_retryable( dropped, "/insert/records" )
+    assert policy.is_retryable( dropped, "/show/table" )
+    assert policy.is_retryable( dropped, "/get/records" )
+    assert not policy.is_retryable( dropped )
+
+
+def test_dropped_host_manager_request_is_not_resent( make_server ):
+    server = make_server( drop_requests = [ 1 ] )
+    db = make_db( server, host_manager_port = server.port,
+                  retry_policy = GPUdbRetryPolicy( initial_backoff = 0 ) )
+
+    # Not sent again, even to a host manager port looked up from the head node
+    with pytest.raises( GPUdbConnectionException ):
+        db._GPUdb__post_to_hm_read( b"body", "/admin/offline" )
+    assert server.paths == [ "/admin/offline" ]
+
+
+def test_expired_host_manager_request_is_given_up_on( make_server ):
+    server = make_server( delay = 1 )
+    db = make_db( server, host_manager_port = server.port,
+                  retry_policy = GPUdbRetryPolicy( deadline = 0.3 ) )
+
+    start = time.time()
+    with pytest.raises( GPUdbConnectionException ):
+        db._GPUdb__post_to_hm_read( b"body", "/admin/offline" )
+    assert (time.time() - start) < 0.6
+    assert server.paths == [ "/admin/offline" ]
+
+
+def test_deadline_bounds_all_hosts( make_server ):
+    server = make_server( delay = 1 )
+    db = make_db( server, num_hosts = 3,
+                  retry_policy = GPUdbRetryPolicy( deadline = 0.3 ) )
+
+    start = time.time()
+    with pytest.raises( GPUdbConnectionException ):
+        post( db )
+    assert (time.time() - start) < 0.6
+
+
+def test_deadline_bounds_reading_the_response( make_server ):
+    # Every piece arrives well within the socket timeout
+    server = make_server( num_pieces = 20, piece_delay = 0.05 )
+    db = make_db( server, timeout = 0.5,
+                  retry_policy = GPUdbRetryPolicy( deadline = 0.3 ) )
+
+    start = time.time()
+    with pytest.raises( GPUdbConnectionException ):
+        post( db )
+    assert (time.time() - start) < 0.6
+
+
+def test_deadline_leaves_room_for_fast_requests( make_server ):
+    server = make_server( num_pieces = 3, piece_delay = 0.01 )
+    db = make_db( server, retry_policy = GPUdbRetryPolicy( deadline = 5 ) )
+
+    assert post( db ) == b"ok" * 3
@@ -0,0 +1,120 @@
+"""Tests for streaming /insert/records requests in chunks."""
+import json
+
+import pytest
+
+from gpudb import Record, RecordColumn, RecordType
+from gpudb.gpudb import GPUdb, GPUdbConnectionException, GPUdbRetryPolicy
+from gpudb.protocol import Schema
+
+
+RECORD_TYPE = RecordType( "streamed", [ RecordColumn( "i", "int" ),
+                                        RecordColumn( "s", "string" ) ] )
+
+RESPONSE_SCHEMA = Schema( "record", [ ( "status", "string" ), ( "message", "string" ),
+                                      ( "data_type", "string" ), ( "data", "bytes" ),
+                                      ( "data_str", "string" ) ] )
+
+
+def make_records( num_records, length = 20 ):
+    records = []
+    for i in range( num_records ):
+        record = Record( RECORD_TYPE )
+        record[ "i" ] = i
+        record[ "s" ] = "x" * length
+        records.append( record )
+    return records
+# end make_records
+
+
+def make_db( server = None, **kwargs ):
+    return GPUdb( host = "127.0.0.1", port = server.port if server else 1,
+                  no_init_db_contact = True, **kwargs )
+# end make_db
+
+
+def make_insert_server( make_server, **kwargs ):
+    """Starts a server answering /insert/records requests."""
+    schemas = make_db().gpudb_schemas[ "/insert/records" ]
+    data = schemas[ "RSP_SCHEMA" ].encode( { "record_ids": [], "count_inserted": 1,
+                                             "count_updated": 0 } )
+    response = RESPONSE_SCHEMA.encode( { "status": "OK", "message": "",
+                                         "data_type": "insert_records_response",
+                                         "data": data, "data_str": "" } )
+    return make_server( response = response, **kwargs )
+# end make_insert_server
+
+
+def decode_request( body ):
+    return make_db().gpudb_schemas[ "/insert/records" ][ "REQ_SCHEMA" ].decode( body )
+# end decode_request
+
+
+def get_array_blocks( db, records ):
+    obj = { "table_name": "t", "list_encoding": "binary", "options": {},
+            "list": ( RECORD_TYPE, records ), "list_str": [] }
+    chunks = list( db._GPUdb__get_insert_records_chunks( obj, True ) )
+
+    # Drop the table name, the terminating empty blocks and the tail
+    return chunks[ 1 : -3 ]
+# end get_array_blocks
+
+
+def test_blocks_start_small_and_track_the_chunk_size():
+    db = make_db( insert_chunk_size = 512 )
+    record_size = len( make_records( 1 )[ 0 ].encode() )
+
+    blocks = get_array_blocks( db, make_records( 1000 ) )
+    assert len( blocks[ 0 ] ) < 2 * record_size
+    assert max( len( block ) for block in blocks ) <= 512 + record_size
+    assert all( (len( block ) > 400) for block in blocks[ 10 : -1 ] )
+
+
+def test_records_larger_than_the_chunk_size_make_one_block_each():
+    db = make_db( insert_chunk_size = 16 )
+    blocks = get_array_blocks( db, make_records( 5, length = 100 ) )
+    assert len( blocks ) == 5
+
+
+@pytest.mark.parametrize( "get_data,kwargs", [
+    ( lambda: make_records( 300 ), {} ),
+    ( lambda: [ record.encode() for record in make_records( 300 ) ], {} ),
+    ( lambda: [ json.dumps( { "i": i, "s": "x" } ) for i in range( 300 ) ],
+      { "list_encoding": "json" } ),
+    ( lambda: [], {} ) ] )
+def test_streamed_requests_match_one_piece_requests( make_server, get_data, kwargs ):
+    bodies = []
+    for insert_chunk_size in [ None, 256 ]:
+        server = make_insert_server( make_server )
+        db = make_db( server, insert_chunk_size = insert_chunk_size )
+        response = db.insert_records( "t", get_data(), options = { "a": "b" }, **kwargs )
+        assert response[ "count_inserted" ] == 1
+        assert ( server.headers[ 0 ].get( "Transfer-Encoding" )
+                 == ("chunked" if insert_chunk_size else None) )
+        bodies.append( server.bodies[ 0 ] )
+    # end loop
+
+    ( one_piece, streamed ) = [ decode_request( body ) for body in bodies ]
+    assert streamed == one_piece
+    assert streamed[ "table_name" ] == "t"
+
+
+class RetryInsertsPolicy( GPUdbRetryPolicy ):
+    """Also retries inserts whose response got lost, as for tables with a
+    primary key."""
+    def is_retryable( self, error, endpoint = None ):
+        return isinstance( error, GPUdbConnectionException )
+# end class RetryInsertsPolicy
+
+
+def test_retried_streams_are_encoded_again( make_server ):
+    server = make_insert_server( make_server, drop_requests = [ 1 ] )
+    db = make_db( server, insert_chunk_size = 256,
+                  retry_policy = RetryInsertsPolicy( initial_backoff = 0 ) )
+    records = make_records( 100 )
+
+    assert db.insert_records( "t", records )[ "count_inserted" ] == 1
+    assert len( server.bodies ) == 2
+    assert server.bodies[ 0 ] == server.bodies[ 1 ]
+    assert decode_request( server.bodies[ 1 ] )[ "list" ] == [ record.encode()
+                                                               for record in records ]